@@ -624,6 +624,24 @@ class OrderAdmin(DjangoObjectActions, admin.ModelAdmin):
         )
 
 
+@admin.register(models.OrderSideEffect)
+class OrderSideEffectAdmin(admin.ModelAdmin):
+    """Admin class for the OrderSideEffect model"""
+
+    list_display = ("id", "created_on", "order", "effect", "state", "attempts")
+    list_filter = ["effect", "state"]
+    readonly_fields = (
+        "order",
+        "effect",
+        "payload",
+        "idempotency_key",
+        "attempts",
+        "last_error",
+        "executed_on",
+    )
+    search_fields = ["order__id", "idempotency_key"]
+
+
 @admin.register(models.BatchOrder)
 class BatchOrderAdmin(DjangoObjectActions, admin.ModelAdmin):
     """Admin class for the Batch Order model"""
@@ -29,7 +29,12 @@ from rest_framework.response import Response
 from sentry_sdk import capture_exception
 
 from joanie.core import enums, filters, models, serializers
-from joanie.core.api.base import NestedGenericViewSet, SerializerPerActionMixin
+from joanie.core.api.base import (
+    BulkCreateUpdateMixin,
+    NestedGenericViewSet,
+    SerializerPerActionMixin,
+    extend_bulk_schema,
+)
 from joanie.core.authentication import SessionAuthenticationWithAuthenticateHeader
 from joanie.core.exceptions import CertificateGenerationError
 from joanie.core.tasks import (
@@ -139,7 +144,8 @@ class CourseViewSet(viewsets.ModelViewSet):
         return self.serializer_class
 
 
-class CourseRunViewSet(viewsets.ModelViewSet):
+@extend_bulk_schema(serializers.AdminCourseRunSerializer)
+class CourseRunViewSet(BulkCreateUpdateMixin, viewsets.ModelViewSet):
     """
     Admin CourseRun ViewSet
     """
@@ -638,8 +644,10 @@ class OfferingViewSet(viewsets.ModelViewSet):
         return Response(status=HTTPStatus.OK)
 
 
+@extend_bulk_schema(serializers.AdminOfferingRuleCreateSerializer)
 class NestedOfferingRuleViewSet(
     SerializerPerActionMixin,
+    BulkCreateUpdateMixin,
     viewsets.ModelViewSet,
     NestedGenericViewSet,
 ):
@@ -653,6 +661,7 @@ class NestedOfferingRuleViewSet(
         "create": serializers.AdminOfferingRuleCreateSerializer,
         "update": serializers.AdminOfferingRuleUpdateSerializer,
         "partial_update": serializers.AdminOfferingRuleUpdateSerializer,
+        "bulk": serializers.AdminOfferingRuleCreateSerializer,
     }
     default_serializer_class = serializers.AdminOfferingRuleSerializer
     queryset = models.OfferingRule.objects.all().select_related(
@@ -674,6 +683,14 @@ class NestedOfferingRuleViewSet(
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=HTTPStatus.CREATED, headers=headers)
 
+    def get_bulk_data(self, request):
+        """Bind all the offering rules to the offering of the URL."""
+        data = request.data
+        for item in data if isinstance(data, list) else []:
+            if isinstance(item, dict):
+                item["offering"] = self.kwargs.get("offering_id")
+        return data
+
 
 class NestedOfferingDeepLinkViewSet(viewsets.ModelViewSet, NestedGenericViewSet):
     """Admin Offering Deep Link ViewSet"""
@@ -1253,7 +1270,8 @@ class DiscountViewSet(viewsets.ModelViewSet):
     filterset_class = filters.DiscountAdminFilterSet
 
 
-class VoucherViewSet(viewsets.ModelViewSet):
+@extend_bulk_schema(serializers.AdminVoucherSerializer)
+class VoucherViewSet(BulkCreateUpdateMixin, viewsets.ModelViewSet):
     """Admin Voucher Viewset"""
 
     authentication_classes = [SessionAuthenticationWithAuthenticateHeader]
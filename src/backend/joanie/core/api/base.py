@@ -1,6 +1,16 @@
 """Base API classes for the Joanie project."""
 
+from http import HTTPStatus
+
+from django.db import transaction
+
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from parler.models import TranslatableModel
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from joanie.core.serializers.base import BulkListSerializer
 
 
 class NestedGenericViewSet(viewsets.GenericViewSet):
@@ -73,3 +83,86 @@ class SerializerPerActionMixin:
         Return the serializer class to use depending on the action.
         """
         return self.serializer_classes.get(self.action, self.default_serializer_class)
+
+
+def extend_bulk_schema(serializer_class):
+    """
+    Document the `bulk` route of a viewset using the `BulkCreateUpdateMixin`: it
+    receives and returns lists of items serialized with the given serializer class.
+    """
+    return extend_schema_view(
+        bulk=[
+            extend_schema(
+                methods=["POST"],
+                request=serializer_class(many=True),
+                responses={HTTPStatus.CREATED: serializer_class(many=True)},
+            ),
+            extend_schema(
+                methods=["PUT"],
+                request=serializer_class(many=True),
+                responses={HTTPStatus.OK: serializer_class(many=True)},
+            ),
+            extend_schema(
+                methods=["PATCH"],
+                request=serializer_class(many=True, partial=True),
+                responses={HTTPStatus.OK: serializer_class(many=True)},
+            ),
+        ]
+    )
+
+
+class BulkCreateUpdateMixin:
+    """
+    A mixin to create or update many instances in a single request through the
+    `bulk` route of a viewset. Items are created with a POST request and updated with
+    a PUT or PATCH request, each item providing the id of the instance it updates.
+
+    Items are written through a `BulkListSerializer` of the serializer of the `bulk`
+    action, up to `bulk_max_size` items per request. The viewset should be decorated
+    with `extend_bulk_schema` to document it.
+    """
+
+    bulk_max_size = 100
+
+    def get_bulk_data(self, request):
+        """Return the list of items to create or update."""
+        return request.data
+
+    def get_bulk_serializer(self, *args, partial=False, **kwargs):
+        """
+        Return a `BulkListSerializer` of the serializer of the `bulk` action to
+        validate and write the items.
+        """
+        context = self.get_serializer_context()
+        return BulkListSerializer(
+            *args,
+            child=self.get_serializer_class()(context=context, partial=partial),
+            context=context,
+            partial=partial,
+            max_length=self.bulk_max_size,
+            **kwargs,
+        )
+
+    @action(detail=False, methods=["post", "put", "patch"], pagination_class=None)
+    def bulk(self, request, *args, **kwargs):
+        """Create or update all the items of the request at once."""
+        data = self.get_bulk_data(request)
+
+        if request.method == "POST":
+            serializer = self.get_bulk_serializer(data=data)
+        else:
+            queryset = self.get_queryset()
+            if issubclass(queryset.model, TranslatableModel):
+                queryset = queryset.prefetch_related("translations")
+            serializer = self.get_bulk_serializer(
+                queryset, data=data, partial=request.method == "PATCH"
+            )
+
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+
+        return Response(
+            serializer.data,
+            status=HTTPStatus.CREATED if request.method == "POST" else HTTPStatus.OK,
+        )
@@ -4,11 +4,13 @@ Client API endpoints
 
 # pylint: disable=too-many-ancestors, too-many-lines, too-many-branches
 # ruff: noqa: PLR0911,PLR0912
+import hashlib
 import io
 import logging
 import uuid
 from http import HTTPStatus
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files.storage import storages
 from django.db import transaction
@@ -47,6 +49,7 @@ from joanie.core.utils.batch_order import (
     send_mail_invitation_link,
     validate_success_payment,
 )
+from joanie.core.utils.cache import two_tier_cache
 from joanie.core.utils.discount import calculate_price
 from joanie.core.utils.offering import get_deep_link, get_serialized_course_runs
 from joanie.core.utils.order import (
@@ -56,7 +59,6 @@ from joanie.core.utils.order import (
 from joanie.core.utils.organization import get_least_active_organization
 from joanie.core.utils.payment_schedule import generate as generate_payment_schedule
 from joanie.core.utils.signature import check_signature
-from joanie.payment import enums as payment_enums
 from joanie.payment import get_payment_backend
 from joanie.payment.models import CreditCard, Invoice
 
@@ -271,6 +273,27 @@ class OfferingViewSet(
         """
         offering = self.get_object()
 
+        # If voucher code is passed, retrieve the query parameter
+        voucher_code = self._get_voucher_code(request)
+        price = self._get_price(offering, voucher_code)
+        # Get the discount value if one is set
+        discount, skip_contract_inputs = self._get_discount(offering, voucher_code)
+
+        # The payment plan only changes with the offering, its price, its discount
+        # and the day it is computed so it is cached accordingly. The price and the
+        # discount are hashed as their text (e.g. "€") is not a valid cache key.
+        pricing = hashlib.sha256(
+            f"{price}-{discount}-{skip_contract_inputs}".encode("utf-8")
+        ).hexdigest()
+        cache_key = (
+            f"{offering.get_cache_key(prefix='payment-plan')}"
+            f"-{offering.product.updated_on.timestamp():.6f}"
+            f"-{pricing}-{timezone.localdate().isoformat()}"
+        )
+        payment_plan = two_tier_cache.get(cache_key)
+        if payment_plan is not None:
+            return Response(payment_plan, HTTPStatus.OK)
+
         if offering.product.type == enums.PRODUCT_TYPE_CERTIFICATE:
             instance = offering.course
         else:
@@ -278,11 +301,6 @@ class OfferingViewSet(
         course_run_dates = instance.get_equivalent_course_run_dates(
             ignore_archived=True
         )
-        # If voucher code is passed, retrieve the query parameter
-        voucher_code = self._get_voucher_code(request)
-        price = self._get_price(offering, voucher_code)
-        # Get the discount value if one is set
-        discount, skip_contract_inputs = self._get_discount(offering, voucher_code)
 
         serializer = self.get_serializer(
             data={
@@ -299,6 +317,9 @@ class OfferingViewSet(
             }
         )
         serializer.is_valid(raise_exception=True)
+        two_tier_cache.set(
+            cache_key, serializer.data, settings.JOANIE_PAYMENT_PLAN_CACHE_TTL
+        )
 
         return Response(serializer.data, HTTPStatus.OK)
 
@@ -640,13 +661,10 @@ class OrderViewSet(
                 status=HTTPStatus.NOT_FOUND,
             )
 
-        context = invoice.get_document_context()
-        invoice_pdf_bytes = issuers.generate_document(
-            name=payment_enums.INVOICE_TYPE_INVOICE, context=context
-        )
-
-        response = HttpResponse(
-            invoice_pdf_bytes, content_type="application/pdf", status=HTTPStatus.OK
+        response = FileResponse(
+            invoice.get_document(),
+            content_type="application/pdf",
+            status=HTTPStatus.OK,
         )
         response["Content-Disposition"] = (
             f"attachment; filename={invoice.reference}.pdf;"
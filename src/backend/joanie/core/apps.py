@@ -1,7 +1,7 @@
 """Joanie Core application"""
 
 from django.apps import AppConfig
-from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.utils.translation import gettext_lazy as _
 
 
@@ -17,6 +17,41 @@ class CoreConfig(AppConfig):
         """Register signals."""
         from joanie.core import models, signals
 
+        # Stored equivalent course runs of products must be computed again before
+        # course runs are synchronized
+        post_save.connect(
+            signals.on_change_product_equivalent_course_run,
+            sender=models.CourseRun,
+            dispatch_uid="save_course_run_equivalent_course_run",
+        )
+        post_delete.connect(
+            signals.on_change_product_equivalent_course_run,
+            sender=models.CourseRun,
+            dispatch_uid="delete_course_run_equivalent_course_run",
+        )
+        post_save.connect(
+            signals.on_change_product_equivalent_course_run,
+            sender=models.ProductTargetCourseRelation,
+            dispatch_uid="save_product_target_course_relation_equivalent_course_run",
+        )
+        post_delete.connect(
+            signals.on_change_product_equivalent_course_run,
+            sender=models.ProductTargetCourseRelation,
+            dispatch_uid="delete_product_target_course_relation_equivalent_course_run",
+        )
+        m2m_changed.connect(
+            signals.on_change_product_equivalent_course_run_relations,
+            sender=models.Product.target_courses.through,
+            dispatch_uid="m2m_changed_product_target_courses_equivalent_course_run",
+        )
+        m2m_changed.connect(
+            signals.on_change_product_equivalent_course_run_relations,
+            sender=models.ProductTargetCourseRelation.course_runs.through,
+            dispatch_uid=(
+                "m2m_changed_product_target_course_relation_course_runs"
+                "_equivalent_course_run"
+            ),
+        )
         post_save.connect(
             signals.on_save_course_run,
             sender=models.CourseRun,
@@ -52,4 +87,34 @@ class CoreConfig(AppConfig):
             sender=models.ProductTargetCourseRelation.course_runs.through,
             dispatch_uid="m2m_changed_product_target_course_relation_course_runs",
         )
+        m2m_changed.connect(
+            signals.on_change_order_offering_rules,
+            sender=models.Order.offering_rules.through,
+            dispatch_uid="m2m_changed_order_offering_rules",
+        )
+        post_save.connect(
+            signals.on_save_order_target_course_relation,
+            sender=models.OrderTargetCourseRelation,
+            dispatch_uid="save_order_target_course_relation",
+        )
+        post_delete.connect(
+            signals.on_delete_order_target_course_relation,
+            sender=models.OrderTargetCourseRelation,
+            dispatch_uid="delete_order_target_course_relation",
+        )
+        m2m_changed.connect(
+            signals.on_change_order_enrollment_entitlements,
+            sender=models.Order.target_courses.through,
+            dispatch_uid="m2m_changed_order_target_courses",
+        )
+        m2m_changed.connect(
+            signals.on_change_order_enrollment_entitlements,
+            sender=models.OrderTargetCourseRelation.course_runs.through,
+            dispatch_uid="m2m_changed_order_target_course_relation_course_runs",
+        )
+        pre_delete.connect(
+            signals.on_delete_order,
+            sender=models.Order,
+            dispatch_uid="delete_order",
+        )
         return super().ready()
@@ -125,6 +125,18 @@ ORDER_STATES_BINDING = (
     ORDER_STATE_PENDING,
     ORDER_STATE_NO_PAYMENT,
 )
+# Orders in these states use a seat of their offering rules, reserved from checkout
+# so an order can not be rejected for lack of seats once paid or signed
+ORDER_STATES_USING_SEAT = (
+    ORDER_STATE_ASSIGNED,
+    ORDER_STATE_TO_SAVE_PAYMENT_METHOD,
+    ORDER_STATE_TO_SIGN,
+    ORDER_STATE_SIGNING,
+    *ORDER_STATES_BINDING,
+    ORDER_STATE_TO_OWN,
+)
+# Orders in these states are counted in the number of orders of their organization
+ORDER_STATES_COUNTED_FOR_ORGANIZATION = (*ORDER_STATES_BINDING, ORDER_STATE_TO_OWN)
 MIN_ORDER_TOTAL_AMOUNT = 0.0
 ORDER_INACTIVE_STATES = (
     ORDER_STATE_CANCELED,
@@ -311,3 +323,35 @@ BATCH_ORDER_PAYMENT_METHOD_CHOICES = (
 # For Quotes of batch orders
 QUOTE_DEFAULT = "quote_default"
 QUOTE_NAME_CHOICES = ((QUOTE_DEFAULT, _("Quote Default")),)
+
+# Side effects of order transitions executed by workers
+ORDER_SIDE_EFFECT_SEND_SUBSCRIPTION_CONFIRMATION = "send_subscription_confirmation"
+ORDER_SIDE_EFFECT_DEBIT_INSTALLMENT = "debit_installment"
+ORDER_SIDE_EFFECT_SET_ENROLLMENTS = "set_enrollments"
+ORDER_SIDE_EFFECT_ENROLL_USER = "enroll_user"
+ORDER_SIDE_EFFECT_UNENROLL_USER = "unenroll_user"
+ORDER_SIDE_EFFECT_DELETE_CREDIT_CARD = "delete_credit_card"
+
+ORDER_SIDE_EFFECT_CHOICES = (
+    (
+        ORDER_SIDE_EFFECT_SEND_SUBSCRIPTION_CONFIRMATION,
+        _("Send subscription confirmation"),
+    ),
+    (ORDER_SIDE_EFFECT_DEBIT_INSTALLMENT, _("Debit installment")),
+    (ORDER_SIDE_EFFECT_SET_ENROLLMENTS, _("Set enrollments")),
+    (ORDER_SIDE_EFFECT_ENROLL_USER, _("Enroll user")),
+    (ORDER_SIDE_EFFECT_UNENROLL_USER, _("Unenroll user")),
+    (ORDER_SIDE_EFFECT_DELETE_CREDIT_CARD, _("Delete credit card")),
+)
+
+ORDER_SIDE_EFFECT_STATE_PENDING = "pending"
+ORDER_SIDE_EFFECT_STATE_IN_PROGRESS = "in_progress"
+ORDER_SIDE_EFFECT_STATE_DONE = "done"
+ORDER_SIDE_EFFECT_STATE_FAILED = "failed"
+
+ORDER_SIDE_EFFECT_STATE_CHOICES = (
+    (ORDER_SIDE_EFFECT_STATE_PENDING, _("Pending")),
+    (ORDER_SIDE_EFFECT_STATE_IN_PROGRESS, _("In progress")),
+    (ORDER_SIDE_EFFECT_STATE_DONE, _("Done")),
+    (ORDER_SIDE_EFFECT_STATE_FAILED, _("Failed")),
+)
@@ -7,13 +7,13 @@ from typing import List
 from django.conf import settings
 from django.db.models import Q
 from django.forms import fields
-from django.utils import timezone as django_timezone
 
 from django_filters import rest_framework as filters
 
 from joanie.core import enums, models
 from joanie.core.filters.base import MultipleValueFilter
 from joanie.core.utils import get_default_currency_symbol
+from joanie.core.utils.search import search
 
 from .enrollment import EnrollmentAdminFilterSet  # pylint: disable=unused-import
 from .skill import SkillAdminFilterSet  # pylint: disable=unused-import
@@ -36,9 +36,7 @@ class OrganizationAdminFilterSet(filters.FilterSet):
         """
         Filter the resource through "query" query parameter.
         """
-        return queryset.filter(
-            Q(code__icontains=value) | Q(translations__title__icontains=value)
-        ).distinct()
+        return queryset.filter(pk__in=search(models.Organization, value))
 
 
 class ProductAdminFilterSet(filters.FilterSet):
@@ -59,7 +57,7 @@ class ProductAdminFilterSet(filters.FilterSet):
         Filter resource by looking for title which contains provided value in
         "query" query parameter.
         """
-        return queryset.filter(translations__title__icontains=value).distinct()
+        return queryset.filter(pk__in=search(models.Product, value))
 
 
 class CourseRunAdminFilterSet(filters.FilterSet):
@@ -102,49 +100,9 @@ class CourseRunAdminFilterSet(filters.FilterSet):
         Filter resource by looking for states that match the one provided
         in the "state" parameter
         """
-        now = django_timezone.now()
-        if value == models.CourseState.ONGOING_OPEN:
-            queryset = queryset.filter(
-                start__lte=now,
-                end__gt=now,
-                enrollment_start__lte=now,
-                enrollment_end__gt=now,
-            )
-        elif value == models.CourseState.FUTURE_OPEN:
-            queryset = queryset.filter(
-                start__gt=now, enrollment_start__lte=now, enrollment_end__gt=now
-            )
-        elif value == models.CourseState.ARCHIVED_OPEN:
-            queryset = queryset.filter(
-                end__lte=now,
-                enrollment_start__lte=now,
-                enrollment_end__gt=now,
-            )
-        elif value == models.CourseState.FUTURE_NOT_YET_OPEN:
-            queryset = queryset.filter(
-                start__gt=now,
-                enrollment_start__gt=now,
-            )
-        elif value == models.CourseState.FUTURE_CLOSED:
-            queryset = queryset.filter(start__gt=now, enrollment_end__lte=now)
-        elif value == models.CourseState.ONGOING_CLOSED:
-            queryset = queryset.filter(
-                Q(enrollment_end__lte=now) | Q(enrollment_start__gt=now),
-                start__lte=now,
-                end__gt=now,
-            )
-        elif value == models.CourseState.ARCHIVED_CLOSED:
-            queryset = queryset.filter(
-                Q(enrollment_end__lte=now) | Q(enrollment_start__gt=now),
-                end__lte=now,
-            )
-        elif value == models.CourseState.TO_BE_SCHEDULED:
-            queryset = queryset.filter(
-                Q(start__isnull=True) | Q(enrollment_start__isnull=True)
-            )
-        elif value != "":
-            queryset = queryset.none()
-        return queryset
+        if value not in models.CourseState.STATE_TEXTS:
+            return queryset.none()
+        return queryset.annotate_state_priority().filter(state_priority=value)
 
 
 class CourseAdminFilterSet(filters.FilterSet):
@@ -169,9 +127,7 @@ class CourseAdminFilterSet(filters.FilterSet):
         Filter resource by looking for code, title which contains provided value in
         "query" query parameter.
         """
-        return queryset.filter(
-            Q(code__icontains=value) | Q(translations__title__icontains=value)
-        ).distinct()
+        return queryset.filter(pk__in=search(models.Course, value))
 
 
 class CertificateDefinitionAdminFilterSet(filters.FilterSet):
@@ -259,12 +215,7 @@ class UserAdminFilterSet(filters.FilterSet):
         contains provided value in "query" query parameter.
         """
 
-        return queryset.filter(
-            Q(username__icontains=value)
-            | Q(first_name__icontains=value)
-            | Q(last_name__icontains=value)
-            | Q(email__icontains=value)
-        ).distinct()
+        return queryset.filter(pk__in=search(models.User, value))
 
 
 class OrderAdminFilterSet(filters.FilterSet):
@@ -321,17 +272,12 @@ class OrderAdminFilterSet(filters.FilterSet):
         """
 
         return queryset.filter(
-            Q(course__translations__title__icontains=value)
-            | Q(course__code__icontains=value)
-            | Q(organization__translations__title__icontains=value)
-            | Q(organization__code__icontains=value)
-            | Q(product__translations__title__icontains=value)
-            | Q(owner__email__icontains=value)
-            | Q(owner__username__icontains=value)
-            | Q(owner__first_name__icontains=value)
-            | Q(owner__last_name__icontains=value)
-            | Q(voucher__code__icontains=value)
-        ).distinct()
+            Q(course__in=search(models.Course, value))
+            | Q(organization__in=search(models.Organization, value))
+            | Q(product__in=search(models.Product, value))
+            | Q(owner__in=search(models.User, value))
+            | Q(voucher__in=search(models.Voucher, value))
+        )
 
 
 class BatchOrderAdminFilterSet(filters.FilterSet):
@@ -386,20 +332,13 @@ class BatchOrderAdminFilterSet(filters.FilterSet):
         organization title | code, and owner fields (username, email, first/last name).
         """
 
-        return (
-            queryset.filter(
-                Q(company_name__icontains=value)
-                | Q(relation__course__translations__title__icontains=value)
-                | Q(relation__course__code__icontains=value)
-                | Q(organization__translations__title__icontains=value)
-                | Q(organization__code__icontains=value)
-                | Q(relation__product__translations__title__icontains=value)
-                | Q(owner__email__icontains=value)
-                | Q(owner__username__icontains=value)
-                | Q(owner__first_name__icontains=value)
-                | Q(owner__last_name__icontains=value)
-            )
-        ).distinct()
+        return queryset.filter(
+            Q(company_name__icontains=value)
+            | Q(relation__course__in=search(models.Course, value))
+            | Q(organization__in=search(models.Organization, value))
+            | Q(relation__product__in=search(models.Product, value))
+            | Q(owner__in=search(models.User, value))
+        )
 
 
 class DiscountAdminFilterSet(filters.FilterSet):
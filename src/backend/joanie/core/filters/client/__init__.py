@@ -9,6 +9,7 @@ from django.db.models import Q
 from django_filters import rest_framework as filters
 
 from joanie.core import enums, models
+from joanie.core.utils.search import search
 
 from .certificate import CertificateViewSetFilter  # pylint: disable=unused-import
 from .enrollment import EnrollmentViewSetFilter  # pylint: disable=unused-import
@@ -47,7 +48,7 @@ class OrderViewSetFilter(filters.FilterSet):
         """
         Filter resource by product title
         """
-        return queryset.filter(product__translations__title__icontains=value).distinct()
+        return queryset.filter(product__in=search(models.Product, value))
 
 
 class ProductViewSetFilter(filters.FilterSet):
@@ -102,9 +103,7 @@ class CourseViewSetFilter(filters.FilterSet):
         """
         Filter courses by looking for course title or course code
         """
-        course_title_query = Q(translations__title__icontains=value)
-        course_code_query = Q(code__icontains=value)
-        combined_query = course_title_query | course_code_query
+        combined_query = Q(pk__in=search(models.Course, value))
 
         if organization_id := self.request.resolver_match.kwargs.get("organization_id"):
             organization_filter = Q(organizations__in=[organization_id])
@@ -278,12 +277,7 @@ class NestedBatchOrderSeatsViewSetFilter(filters.FilterSet):
         Filter resource by looking for owner username, first_name, last_name and email which
         contains provided value in "query" query parameter.
         """
-        return queryset.filter(
-            Q(owner__username__icontains=value)
-            | Q(owner__first_name__icontains=value)
-            | Q(owner__last_name__icontains=value)
-            | Q(owner__email__icontains=value)
-        ).distinct()
+        return queryset.filter(owner__in=search(models.User, value))
 
 
 class OfferingViewSetFilter(filters.FilterSet):
@@ -311,9 +305,11 @@ class OfferingViewSetFilter(filters.FilterSet):
         Filter offering by looking for product title | course code | organization
         title.
         """
-        product_title_query = Q(product__translations__title__icontains=value)
+        product_title_query = Q(product__in=search(models.Product, value))
         organization_title_query = Q(
-            organizations__translations__title__icontains=value
+            organizations__in=models.Organization.objects.filter(
+                translations__title__icontains=value
+            ).values("pk")
         )
         course_code_query = Q(course__code__icontains=value)
         combined_query = (
@@ -2,23 +2,28 @@
 
 import logging
 from contextlib import suppress
+from functools import partial
 
 from django.apps import apps
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.utils import timezone
 
 from sentry_sdk import capture_exception
 from viewflow import fsm
 
 from joanie.core import enums
+from joanie.core.tasks.order_side_effects import (
+    ORDER_SIDE_EFFECTS,
+    execute_order_side_effects,
+)
 from joanie.core.utils.payment_schedule import (
     has_installment_paid,
     has_installments_to_debit,
     has_only_refunded_or_canceled_installments,
     is_installment_to_debit,
 )
-from joanie.payment import get_payment_backend
-from joanie.payment.backends.base import BasePaymentBackend
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +35,7 @@ class OrderFlow:
 
     def __init__(self, instance):
         self.instance = instance
+        self._recorded_side_effects = False
 
     @state.setter()
     def _set_order_state(self, value):
@@ -346,10 +352,18 @@ class OrderFlow:
                 return
 
     @state.on_success()
-    # ruff: noqa: PLR0912
     def _post_transition_success(self, descriptor, source, target, **kwargs):  # pylint: disable=unused-argument, too-many-branches
         """Post transition actions"""
         self.instance.save()
+        # Side effects of a transition are recorded once, even if the transition is
+        # applied twice, e.g. on concurrent notifications of the payment provider. The
+        # number of paid installments distinguishes an order going through the same
+        # transition again after the payment of another installment.
+        paid_installments_count = sum(
+            installment["state"] == enums.PAYMENT_STATE_PAID
+            for installment in self.instance.payment_schedule or []
+        )
+        transition_key = f"{source}:{target}:{paid_installments_count:d}"
         # When an order's subscription is confirmed, we send an email to the user about the
         # confirmation
         if (
@@ -357,9 +371,10 @@ class OrderFlow:
             in [enums.ORDER_STATE_TO_SAVE_PAYMENT_METHOD, enums.ORDER_STATE_SIGNING]
             and target == enums.ORDER_STATE_PENDING
         ):
-            # pylint: disable=protected-access
-            # ruff : noqa : SLF001
-            BasePaymentBackend._send_mail_subscription_success(order=self.instance)
+            self._apply_side_effect(
+                enums.ORDER_SIDE_EFFECT_SEND_SUBSCRIPTION_CONFIRMATION,
+                idempotency_key=transition_key,
+            )
 
         if (
             not source == enums.ORDER_STATE_TO_OWN
@@ -388,11 +403,10 @@ class OrderFlow:
                     if is_installment_to_debit(installment)
                 ),
             )
-            payment_backend = get_payment_backend()
-            payment_backend.create_zero_click_payment(
-                order=self.instance,
-                credit_card_token=self.instance.credit_card.token,
-                installment=installment,
+            self._apply_side_effect(
+                enums.ORDER_SIDE_EFFECT_DEBIT_INSTALLMENT,
+                installment_id=installment["id"],
+                idempotency_key=installment["id"],
             )
 
         # When an order is completed, if the user was previously enrolled for free in any of the
@@ -408,10 +422,10 @@ class OrderFlow:
             and target
             in [enums.ORDER_STATE_PENDING_PAYMENT, enums.ORDER_STATE_COMPLETED]
         ) or target == enums.ORDER_STATE_CANCELED:
-            for enrollment in self.instance.get_target_enrollments(
-                is_active=True
-            ).select_related("course_run", "user"):
-                enrollment.set()
+            self._apply_side_effect(
+                enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS,
+                idempotency_key=transition_key,
+            )
 
         # Enroll user if the order is assigned, pending or no payment and the target is
         # completed or pending payment.
@@ -433,12 +447,10 @@ class OrderFlow:
             and target
             in [enums.ORDER_STATE_PENDING_PAYMENT, enums.ORDER_STATE_COMPLETED]
         ):
-            try:
-                # ruff : noqa : BLE001
-                # pylint: disable=broad-exception-caught
-                self.instance.enroll_user_to_course_run()
-            except Exception as error:
-                capture_exception(error)
+            self._apply_side_effect(
+                enums.ORDER_SIDE_EFFECT_ENROLL_USER,
+                idempotency_key=transition_key,
+            )
 
         if self.instance.payment_schedule and target in [
             enums.ORDER_STATE_CANCELED,
@@ -447,7 +459,10 @@ class OrderFlow:
             self.instance.cancel_remaining_installments()
 
         if self.instance.owner and target == enums.ORDER_STATE_CANCELED:
-            self.instance.unenroll_user_from_course_runs()
+            self._apply_side_effect(
+                enums.ORDER_SIDE_EFFECT_UNENROLL_USER,
+                idempotency_key=transition_key,
+            )
 
         # A 100% voucher was created specifically for this order and must not be
         # reusable once the order is canceled, to prevent it from being applied
@@ -467,11 +482,14 @@ class OrderFlow:
             enums.ORDER_STATE_CANCELED,
         ]:
             # delete card
-            credit_card = self.instance.credit_card
+            credit_card_id = self.instance.credit_card_id
             self.instance.credit_card = None
             self.instance.save()
-            if not credit_card.orders.exists():
-                credit_card.delete()
+            self._apply_side_effect(
+                enums.ORDER_SIDE_EFFECT_DELETE_CREDIT_CARD,
+                credit_card_id=credit_card_id,
+                idempotency_key=credit_card_id,
+            )
 
         # Reset offering cache if its representation is impacted by changes
         # on related orders
@@ -485,3 +503,35 @@ class OrderFlow:
             CourseProductRelation.objects.filter(
                 product_id=self.instance.product_id, course_id=course_id
             ).update(updated_on=timezone.now())
+
+        self._dispatch_side_effects()
+
+    def _apply_side_effect(self, effect, idempotency_key="", **payload):
+        """
+        Execute a side effect of a transition right away or, if the outbox is enabled,
+        record it to be executed by a worker once the transaction is committed.
+        A side effect is recorded only once per order and idempotency key.
+        """
+        if not settings.JOANIE_ORDER_SIDE_EFFECTS_OUTBOX:
+            ORDER_SIDE_EFFECTS[effect](self.instance, **payload)
+            return
+
+        OrderSideEffect = apps.get_model("core", "OrderSideEffect")  # pylint: disable=invalid-name
+        _side_effect, created = OrderSideEffect.objects.get_or_create(
+            idempotency_key=f"{self.instance.id}:{effect}:{idempotency_key}",
+            defaults={"order": self.instance, "effect": effect, "payload": payload},
+        )
+        self._recorded_side_effects |= created
+
+    def _dispatch_side_effects(self):
+        """
+        Request the execution of the recorded side effects once the transaction is
+        committed.
+        """
+        if not self._recorded_side_effects:
+            return
+
+        self._recorded_side_effects = False
+        transaction.on_commit(
+            partial(execute_order_side_effects.delay, str(self.instance.id))
+        )
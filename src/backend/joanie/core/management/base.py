@@ -0,0 +1,62 @@
+"""Base classes for management commands of the core app."""
+
+import logging
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+
+class ReconcileCommand(BaseCommand):
+    """
+    Base command to recompute values stored to avoid computing them on read and fix
+    the ones which drifted, e.g. after objects have been updated directly in the
+    database.
+
+    Subclasses define the objects to reconcile and how to reconcile one of them, each
+    object being reconciled in its own transaction. Objects can be restricted to a
+    list of ids with the option defined by `option_strings`.
+    """
+
+    # Option strings of the argument restricting objects to reconcile to a list of ids
+    option_strings = ()
+    # Singular and plural names of the objects to reconcile
+    verbose_name = None
+    verbose_name_plural = None
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            *self.option_strings,
+            dest="ids",
+            nargs="+",
+            help=f"Accept a single or a list of {self.verbose_name} id to reconcile.",
+        )
+
+    def get_queryset(self):
+        """Return the objects to reconcile."""
+        raise NotImplementedError
+
+    def reconcile(self, instance):
+        """
+        Reconcile the values stored for the object, within a transaction, and return a
+        message describing the values fixed or None if nothing drifted.
+        """
+        raise NotImplementedError
+
+    def handle(self, *args, **options):
+        """Reconcile objects one by one and report the ones which drifted."""
+        queryset = self.get_queryset()
+        if options["ids"]:
+            queryset = queryset.filter(pk__in=options["ids"])
+
+        nb_reconciled = 0
+        for instance in queryset.iterator():
+            with transaction.atomic():
+                message = self.reconcile(instance)
+
+            if message:
+                nb_reconciled += 1
+                self.stdout.write(message)
+
+        logging.getLogger(self.__module__).info(
+            "%d %s have been reconciled.", nb_reconciled, self.verbose_name_plural
+        )
@@ -0,0 +1,89 @@
+"""Management command to regenerate payment schedules of orders in bulk."""
+
+import logging
+
+from django.core.management import BaseCommand, CommandError
+
+from joanie.core import enums, models
+from joanie.core.utils.order import generate_payment_schedules
+
+logger = logging.getLogger("joanie.core.generate_payment_schedules")
+
+
+class Command(BaseCommand):
+    """
+    A command to regenerate payment schedules of orders in bulk, e.g. after the dates
+    of course runs changed.
+    Only binding orders for which no installment has been processed yet are updated.
+
+    Orders must be restricted to a list of courses (-c), products (-p) or orders (-o).
+    With the --dry-run option, changes are displayed but not saved.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c",
+            "--courses",
+            "--course",
+            nargs="+",
+            help="Accept a single or a list of course code to restrict orders to.",
+        )
+        parser.add_argument(
+            "-p",
+            "--products",
+            "--product",
+            nargs="+",
+            help="Accept a single or a list of product id to restrict orders to.",
+        )
+        parser.add_argument(
+            "-o",
+            "--orders",
+            "--order",
+            nargs="+",
+            help="Accept a single or a list of order id to restrict orders to.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Display payment schedule changes without saving them.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Regenerate payment schedules of the selected orders and display the changes.
+        """
+        filters = {}
+        if options["orders"]:
+            filters["id__in"] = options["orders"]
+        if options["courses"]:
+            filters["course__code__in"] = options["courses"]
+        if options["products"]:
+            filters["product__id__in"] = options["products"]
+        if not filters:
+            raise CommandError(
+                "You must restrict orders to courses, products or orders."
+            )
+
+        result = generate_payment_schedules(
+            models.Order.objects.filter(
+                state__in=enums.ORDER_STATES_BINDING, **filters
+            ),
+            dry_run=options["dry_run"],
+        )
+
+        for order_id, change in result["changes"].items():
+            self.stdout.write(f"Order {order_id}:")
+            for label, payment_schedule in change.items():
+                installments = ", ".join(
+                    f"{installment['due_date']}: {installment['amount']}"
+                    for installment in payment_schedule
+                )
+                self.stdout.write(f"  {label}: {installments or '-'}")
+
+        logger.info(
+            "%d payment schedules %s.",
+            len(result["changes"]),
+            "would be updated" if options["dry_run"] else "have been updated",
+        )
@@ -0,0 +1,39 @@
+"""Management command to process side effects of order transitions left pending."""
+
+import logging
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from joanie.core.tasks.order_side_effects import dispatch_pending_order_side_effects
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    A command to request the execution of side effects of order transitions which are
+    still pending a while after they have been recorded, e.g. because the worker or
+    the broker was unavailable when their transaction was committed.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=10,
+            help="Only process side effects pending for more than this number of minutes.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Request the execution of pending side effects per order.
+        """
+        logger.info("Starting processing of pending order side effects.")
+        orders_count = dispatch_pending_order_side_effects(
+            timezone.now() - timedelta(minutes=options["minutes"])
+        )
+        logger.info("Found %s orders with pending side effects.", orders_count)
@@ -0,0 +1,37 @@
+"""Management command to reconcile the enrollment entitlements of orders."""
+
+from django.db.models import Q
+
+from joanie.core import enums, models
+from joanie.core.management.base import ReconcileCommand
+
+
+class Command(ReconcileCommand):
+    """
+    A command to compute the enrollment entitlements granted by orders and fix the
+    entitlements stored for each order if they drifted, e.g. after orders have been
+    updated directly in the database.
+
+    Orders can be restricted to a list of orders (-o).
+    """
+
+    help = __doc__
+    option_strings = ("-o", "--orders", "--order")
+    verbose_name = "order"
+    verbose_name_plural = "orders"
+
+    def get_queryset(self):
+        """Return orders allowing enrollment or having stored entitlements."""
+        return models.Order.objects.filter(
+            Q(state__in=enums.ORDER_STATE_ALLOW_ENROLLMENT)
+            | Q(
+                pk__in=models.EnrollmentEntitlement.objects.values("order_id"),
+            )
+        ).only("pk", "state", "owner")
+
+    def reconcile(self, instance):
+        """Reconcile the enrollment entitlements of the order."""
+        if not models.EnrollmentEntitlement.objects.reconcile(instance):
+            return None
+
+        return f"Order {instance.pk}: enrollment entitlements reconciled"
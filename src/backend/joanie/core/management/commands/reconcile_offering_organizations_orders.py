@@ -0,0 +1,38 @@
+"""Management command to reconcile the number of orders of organizations on offerings."""
+
+from joanie.core import models
+from joanie.core.management.base import ReconcileCommand
+
+
+class Command(ReconcileCommand):
+    """
+    A command to count the binding orders of offerings per organization and fix the
+    number of orders stored for each organization if it drifted, e.g. after orders
+    have been updated directly in the database.
+
+    Offerings can be restricted to a list of offerings (-o).
+    """
+
+    help = __doc__
+    option_strings = ("-o", "--offerings", "--offering")
+    verbose_name = "offering"
+    verbose_name_plural = "offerings"
+
+    def get_queryset(self):
+        return models.CourseProductRelation.objects.only("product", "course")
+
+    def reconcile(self, instance):
+        """
+        Reconcile the number of orders of organizations on the offering, its counters
+        being locked while its orders are counted.
+        """
+        organization_ids = models.OfferingOrganizationOrderCount.objects.reconcile(
+            instance
+        )
+        if not organization_ids:
+            return None
+
+        return (
+            f"Offering {instance.pk}: {len(organization_ids)} "
+            "organization order counts reconciled"
+        )
@@ -0,0 +1,41 @@
+"""Management command to reconcile the number of used seats of offering rules."""
+
+from joanie.core import models
+from joanie.core.management.base import ReconcileCommand
+
+
+class Command(ReconcileCommand):
+    """
+    A command to count the seats used by orders of offering rules and fix the number
+    of used seats stored on offering rules if it drifted, e.g. after orders have been
+    updated directly in the database.
+
+    Offering rules can be restricted to a list of offering rules (-r).
+    """
+
+    help = __doc__
+    option_strings = ("-r", "--offering-rules", "--offering-rule")
+    verbose_name = "offering rule"
+    verbose_name_plural = "offering rules"
+
+    def get_queryset(self):
+        return models.OfferingRule.objects.only("pk")
+
+    def reconcile(self, instance):
+        """
+        Reconcile the number of used seats of the offering rule, locked while its
+        orders are counted.
+        """
+        offering_rule = (
+            models.OfferingRule.objects.select_for_update(of=("self",))
+            .select_related("course_product_relation")
+            .get(pk=instance.pk)
+        )
+        previous_nb_used_seats = offering_rule.reconcile_used_seats()
+        if previous_nb_used_seats == offering_rule.nb_used_seats:
+            return None
+
+        return (
+            f"Offering rule {offering_rule.pk}: "
+            f"{previous_nb_used_seats} -> {offering_rule.nb_used_seats} used seats"
+        )
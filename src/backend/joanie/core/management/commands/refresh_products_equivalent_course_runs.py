@@ -0,0 +1,43 @@
+"""Management command to store the equivalent course runs of products."""
+
+import logging
+
+from django.core.management import BaseCommand
+
+from joanie.core import enums, models
+
+logger = logging.getLogger("joanie.core.refresh_products_equivalent_course_runs")
+
+
+class Command(BaseCommand):
+    """
+    A command to compute the equivalent course runs of products from their target
+    course runs and store them, e.g. to store the ones of existing products or to
+    fix them after course runs have been updated directly in the database.
+
+    Products can be restricted to a list of products (-p).
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-p",
+            "--products",
+            "--product",
+            nargs="+",
+            help="Accept a single or a list of product id to refresh.",
+        )
+
+    def handle(self, *args, **options):
+        """Compute and store the equivalent course runs of products one by one."""
+        products = models.Product.objects.exclude(type=enums.PRODUCT_TYPE_CERTIFICATE)
+        if options["products"]:
+            products = products.filter(pk__in=options["products"])
+
+        models.ProductEquivalentCourseRun.objects.refresh_products(products)
+
+        logger.info(
+            "Equivalent course runs of %d products have been refreshed.",
+            products.count(),
+        )
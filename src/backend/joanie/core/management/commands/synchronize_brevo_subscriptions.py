@@ -16,9 +16,19 @@ class Command(BaseCommand):
 
     help = __doc__
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help=(
+                "Restart the synchronization from the first contact instead of "
+                "resuming an interrupted one."
+            ),
+        )
+
     def handle(self, *args, **options):
         """
         Synchronize brevo subscriptions.
         """
         logger.info("Synchronizing brevo subscriptions")
-        synchronize_brevo_subscriptions.delay()
+        synchronize_brevo_subscriptions.delay(restart=options["restart"])
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:13
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0096_alter_offeringdeeplink_deep_link'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderSideEffect',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='primary key for the record as UUID', primary_key=True, serialize=False, verbose_name='id')),
+                ('created_on', models.DateTimeField(auto_now_add=True, help_text='date and time at which a record was created', verbose_name='created on')),
+                ('updated_on', models.DateTimeField(auto_now=True, help_text='date and time at which a record was last updated', verbose_name='updated on')),
+                ('effect', models.CharField(choices=[('send_subscription_confirmation', 'Send subscription confirmation'), ('debit_installment', 'Debit installment'), ('set_enrollments', 'Set enrollments'), ('enroll_user', 'Enroll user'), ('unenroll_user', 'Unenroll user'), ('delete_credit_card', 'Delete credit card')], max_length=50, verbose_name='effect')),
+                ('payload', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Arguments of the side effect', verbose_name='payload')),
+                ('idempotency_key', models.CharField(max_length=255, unique=True, verbose_name='idempotency key')),
+                ('state', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In progress'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=20, verbose_name='state')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='attempts')),
+                ('last_error', models.TextField(blank=True, verbose_name='last error')),
+                ('executed_on', models.DateTimeField(blank=True, null=True, verbose_name='executed on')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='side_effects', to='core.order', verbose_name='order')),
+            ],
+            options={
+                'verbose_name': 'Order side effect',
+                'verbose_name_plural': 'Order side effects',
+                'db_table': 'joanie_order_side_effect',
+                'ordering': ['created_on'],
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+from django.db import migrations, models
+from django.db.models import Q
+
+ORDER_STATES_USING_SEAT = [
+    "assigned",
+    "to_save_payment_method",
+    "to_sign",
+    "signing",
+    "completed",
+    "pending_payment",
+    "failed_payment",
+    "pending",
+    "no_payment",
+    "to_own",
+]
+
+
+def backfill_nb_used_seats(apps, schema_editor):
+    """Count the seats used by orders of existing offering rules."""
+    OfferingRule = apps.get_model("core", "OfferingRule")
+
+    for offering_rule in OfferingRule.objects.filter(
+        orders__isnull=False
+    ).distinct().select_related("course_product_relation"):
+        course_id = offering_rule.course_product_relation.course_id
+        product_id = offering_rule.course_product_relation.product_id
+        nb_used_seats = offering_rule.orders.filter(
+            Q(course_id=course_id) | Q(enrollment__course_run__course_id=course_id),
+            product_id=product_id,
+            state__in=ORDER_STATES_USING_SEAT,
+        ).count()
+        OfferingRule.objects.filter(pk=offering_rule.pk).update(
+            nb_used_seats=nb_used_seats
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0097_ordersideeffect'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offeringrule',
+            name='nb_used_seats',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='The number of orders using a seat of the offering rule, updated on order state transitions', verbose_name='Number of used seats'),
+        ),
+        migrations.RunPython(
+            backfill_nb_used_seats,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,87 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+ORDER_STATES_COUNTED_FOR_ORGANIZATION = [
+    "completed",
+    "pending_payment",
+    "failed_payment",
+    "pending",
+    "no_payment",
+    "to_own",
+]
+
+
+def backfill_offering_organization_order_counts(apps, schema_editor):
+    """Count the binding orders of existing offerings per organization."""
+    CourseProductRelation = apps.get_model("core", "CourseProductRelation")
+    OfferingOrganizationOrderCount = apps.get_model(
+        "core", "OfferingOrganizationOrderCount"
+    )
+    Order = apps.get_model("core", "Order")
+
+    offering_ids = {
+        (product_id, course_id): offering_id
+        for offering_id, product_id, course_id in CourseProductRelation.objects.values_list(
+            "id", "product_id", "course_id"
+        )
+    }
+    nb_orders = (
+        Order.objects.filter(
+            course__isnull=False,
+            organization__isnull=False,
+            state__in=ORDER_STATES_COUNTED_FOR_ORGANIZATION,
+        )
+        .values_list("product_id", "course_id", "organization_id")
+        .annotate(nb_orders=Count("id"))
+        .order_by()
+    )
+    OfferingOrganizationOrderCount.objects.bulk_create(
+        [
+            OfferingOrganizationOrderCount(
+                offering_id=offering_ids[(product_id, course_id)],
+                organization_id=organization_id,
+                nb_orders=count,
+            )
+            for product_id, course_id, organization_id, count in nb_orders
+            if (product_id, course_id) in offering_ids
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0098_offeringrule_nb_used_seats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferingOrganizationOrderCount',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='primary key for the record as UUID', primary_key=True, serialize=False, verbose_name='id')),
+                ('created_on', models.DateTimeField(auto_now_add=True, help_text='date and time at which a record was created', verbose_name='created on')),
+                ('updated_on', models.DateTimeField(auto_now=True, help_text='date and time at which a record was last updated', verbose_name='updated on')),
+                ('nb_orders', models.PositiveIntegerField(default=0, help_text='The number of binding orders of the offering', verbose_name='number of orders')),
+                ('offering', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='organization_order_counts', to='core.courseproductrelation', verbose_name='offering')),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offering_order_counts', to='core.organization', verbose_name='organization')),
+            ],
+            options={
+                'verbose_name': 'Offering organization order count',
+                'verbose_name_plural': 'Offering organization order counts',
+                'db_table': 'joanie_offering_organization_order_count',
+                'ordering': ['-created_on'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='offeringorganizationordercount',
+            constraint=models.UniqueConstraint(fields=('offering', 'organization'), name='unique_offering_organization_order_count'),
+        ),
+        migrations.RunPython(
+            backfill_offering_organization_order_counts,
+            migrations.RunPython.noop,
+        ),
+    ]
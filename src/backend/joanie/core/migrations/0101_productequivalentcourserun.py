@@ -0,0 +1,82 @@
+import itertools
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max, Min, Q
+
+
+def backfill_product_equivalent_course_runs(apps, schema_editor):
+    """Store the equivalent course run of existing products from their course runs."""
+    CourseRun = apps.get_model("core", "CourseRun")
+    Product = apps.get_model("core", "Product")
+    ProductEquivalentCourseRun = apps.get_model("core", "ProductEquivalentCourseRun")
+    ProductTargetCourseRelation = apps.get_model("core", "ProductTargetCourseRelation")
+
+    equivalent_course_runs = []
+    for product in Product.objects.exclude(type="certificate").iterator():
+        relations = ProductTargetCourseRelation.objects.filter(product=product)
+        relations_with_course_runs = relations.filter(
+            course_runs__isnull=False
+        ).only("pk")
+        course_runs = CourseRun.objects.filter(
+            Q(product_relations__in=relations_with_course_runs)
+            | Q(
+                course__in=relations.exclude(
+                    pk__in=relations_with_course_runs
+                ).values("course")
+            )
+        )
+        dates = course_runs.aggregate(
+            start=Min("start"),
+            end=Max("end"),
+            enrollment_start=Max("enrollment_start"),
+            enrollment_end=Min("enrollment_end"),
+        )
+        languages = course_runs.values_list("languages", flat=True).distinct()
+        equivalent_course_runs.append(
+            ProductEquivalentCourseRun(
+                product=product,
+                **dates,
+                languages=sorted(set(itertools.chain.from_iterable(languages))),
+                is_graded=relations.filter(is_graded=True).exists(),
+            )
+        )
+
+    ProductEquivalentCourseRun.objects.bulk_create(
+        equivalent_course_runs, batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0100_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductEquivalentCourseRun',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='primary key for the record as UUID', primary_key=True, serialize=False, verbose_name='id')),
+                ('created_on', models.DateTimeField(auto_now_add=True, help_text='date and time at which a record was created', verbose_name='created on')),
+                ('updated_on', models.DateTimeField(auto_now=True, help_text='date and time at which a record was last updated', verbose_name='updated on')),
+                ('start', models.DateTimeField(blank=True, null=True, verbose_name='start')),
+                ('end', models.DateTimeField(blank=True, null=True, verbose_name='end')),
+                ('enrollment_start', models.DateTimeField(blank=True, null=True, verbose_name='enrollment start')),
+                ('enrollment_end', models.DateTimeField(blank=True, null=True, verbose_name='enrollment end')),
+                ('languages', models.JSONField(blank=True, default=list, help_text='Distinct languages of the target course runs', verbose_name='languages')),
+                ('is_graded', models.BooleanField(default=False, help_text='Whether a target course is taken into account for certification', verbose_name='is graded')),
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='equivalent_course_run', to='core.product', verbose_name='product')),
+            ],
+            options={
+                'verbose_name': 'Product equivalent course run',
+                'verbose_name_plural': 'Product equivalent course runs',
+                'db_table': 'joanie_product_equivalent_course_run',
+            },
+        ),
+        migrations.RunPython(
+            backfill_product_equivalent_course_runs,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,73 @@
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+ORDER_STATE_ALLOW_ENROLLMENT = [
+    "completed",
+    "pending_payment",
+    "failed_payment",
+]
+
+
+def backfill_enrollment_entitlements(apps, schema_editor):
+    """Store the enrollment entitlements of existing orders allowing enrollment."""
+    EnrollmentEntitlement = apps.get_model("core", "EnrollmentEntitlement")
+    OrderTargetCourseRelation = apps.get_model("core", "OrderTargetCourseRelation")
+
+    relations = (
+        OrderTargetCourseRelation.objects.filter(
+            order__state__in=ORDER_STATE_ALLOW_ENROLLMENT,
+            order__owner__isnull=False,
+        )
+        .select_related("order")
+        .prefetch_related("course_runs")
+    )
+    entitlements = []
+    for relation in relations.iterator(chunk_size=1000):
+        entitlements.extend(
+            EnrollmentEntitlement(
+                order_id=relation.order_id,
+                user_id=relation.order.owner_id,
+                course_id=relation.course_id,
+                course_run=course_run,
+            )
+            for course_run in relation.course_runs.all() or [None]
+        )
+        if len(entitlements) >= 1000:
+            EnrollmentEntitlement.objects.bulk_create(entitlements)
+            entitlements = []
+    EnrollmentEntitlement.objects.bulk_create(entitlements)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0101_productequivalentcourserun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnrollmentEntitlement',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='primary key for the record as UUID', primary_key=True, serialize=False, verbose_name='id')),
+                ('created_on', models.DateTimeField(auto_now_add=True, help_text='date and time at which a record was created', verbose_name='created on')),
+                ('updated_on', models.DateTimeField(auto_now=True, help_text='date and time at which a record was last updated', verbose_name='updated on')),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollment_entitlements', to='core.course', verbose_name='course')),
+                ('course_run', models.ForeignKey(blank=True, help_text='Leave empty if all the course runs of the course are entitled.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='enrollment_entitlements', to='core.courserun', verbose_name='course run')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollment_entitlements', to='core.order', verbose_name='order')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollment_entitlements', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'Enrollment entitlement',
+                'verbose_name_plural': 'Enrollment entitlements',
+                'db_table': 'joanie_enrollment_entitlement',
+                'indexes': [models.Index(fields=['user', 'course'], name='enrollment_entitlement_idx')],
+            },
+        ),
+        migrations.RunPython(
+            backfill_enrollment_entitlements,
+            migrations.RunPython.noop,
+        ),
+    ]
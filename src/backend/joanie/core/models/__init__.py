@@ -7,6 +7,7 @@ from .certifications import *
 from .contracts import *
 from .course_wishes import *
 from .courses import *
+from .order_side_effects import *
 from .products import *
 from .quotes import *
 from .site import *
@@ -20,6 +20,7 @@ from joanie.core.utils import normalize_phone_number
 from joanie.core.utils.newsletter.subscription import (
     set_commercial_newsletter_subscription,
 )
+from joanie.core.utils.search import trigram_index
 
 logger = logging.getLogger(__name__)
 
@@ -53,10 +54,18 @@ class User(BaseModel, auth_models.AbstractUser):
         default=False,
     )
 
+    search_fields = ["username", "first_name", "last_name", "email"]
+
     class Meta:
         db_table = "joanie_user"
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = [
+            trigram_index("username", "user_username_trgm_idx"),
+            trigram_index("first_name", "user_first_name_trgm_idx"),
+            trigram_index("last_name", "user_last_name_trgm_idx"),
+            trigram_index("email", "user_email_trgm_idx"),
+        ]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
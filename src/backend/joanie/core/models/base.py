@@ -10,12 +10,12 @@ import uuid
 from itertools import chain
 
 from django.conf import settings
-from django.core.cache import cache
 from django.db import models
 from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 from joanie.core.utils import file_checksum
+from joanie.core.utils.cache import two_tier_cache
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +82,7 @@ class BaseModel(models.Model):
         """
         Clear the instance cache for all languages.
         """
+        cache_keys = []
         for language, _ in settings.LANGUAGES:
             cache_key = self.get_cache_key(language=language)
             logger.debug(
@@ -89,7 +90,7 @@ class BaseModel(models.Model):
                 self.__class__.__name__,
                 cache_key,
             )
-            cache.delete(cache_key)
+            cache_keys.append(cache_key)
 
             for serializer_name in self.cached_serializers:
                 serializer_cache_key = self.get_cache_key(
@@ -101,7 +102,9 @@ class BaseModel(models.Model):
                     serializer_name,
                     serializer_cache_key,
                 )
-                cache.delete(serializer_cache_key)
+                cache_keys.append(serializer_cache_key)
+
+        two_tier_cache.delete_many(cache_keys)
 
     def to_dict(self):
         """Return a dictionary representation of the model."""
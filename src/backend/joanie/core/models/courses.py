@@ -12,10 +12,10 @@ from typing import TypedDict
 from django.apps import apps
 from django.conf import settings
 from django.contrib.sites.models import Site
-from django.core.cache import cache
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import models
 from django.db.models import Q
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django.utils.functional import lazy
 from django.utils.text import capfirst
@@ -24,6 +24,7 @@ from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from easy_thumbnails.fields import ThumbnailerImageField
 from parler import models as parler_models
+from parler.managers import TranslatableManager, TranslatableQuerySet
 from rest_framework.reverse import reverse
 from url_normalize import url_normalize
 
@@ -33,10 +34,12 @@ from joanie.core.models.accounts import User
 from joanie.core.models.base import BaseModel
 from joanie.core.models.contracts import Contract
 from joanie.core.utils import normalize_phone_number, payment_schedule, webhooks
+from joanie.core.utils.cache import two_tier_cache
 from joanie.core.utils.course_run.aggregate_course_runs_dates import (
     aggregate_course_runs_dates,
 )
 from joanie.core.utils.discount import calculate_price
+from joanie.core.utils.search import trigram_index
 from joanie.lms_handler import LMSHandler
 from joanie.signature.backends import get_signature_backend
 
@@ -179,7 +182,8 @@ class Organization(parler_models.TranslatableModel, BaseModel):
 
     code = models.CharField(_("code"), unique=True, db_index=True, max_length=100)
     translations = parler_models.TranslatedFields(
-        title=models.CharField(_("title"), max_length=255)
+        title=models.CharField(_("title"), max_length=255),
+        meta={"indexes": [trigram_index("title", "organization_title_trgm_idx")]},
     )
     representative = models.CharField(
         _("representative"),
@@ -259,11 +263,14 @@ class Organization(parler_models.TranslatableModel, BaseModel):
         """
         self.offerings = value
 
+    search_fields = ["code", "translations__title"]
+
     class Meta:
         db_table = "joanie_organization"
         verbose_name = _("Organization")
         verbose_name_plural = _("Organizations")
         ordering = ["-created_on"]
+        indexes = [trigram_index("code", "organization_code_trgm_idx")]
         constraints = [
             models.CheckConstraint(
                 check=(
@@ -510,7 +517,8 @@ class Course(parler_models.TranslatableModel, BaseModel):
     code = models.CharField(_("code"), max_length=100, unique=True, db_index=True)
     cover = ThumbnailerImageField(_("cover"), blank=True)
     translations = parler_models.TranslatedFields(
-        title=models.CharField(_("title"), max_length=255)
+        title=models.CharField(_("title"), max_length=255),
+        meta={"indexes": [trigram_index("title", "course_title_trgm_idx")]},
     )
     organizations = models.ManyToManyField(
         to=Organization,
@@ -547,11 +555,14 @@ class Course(parler_models.TranslatableModel, BaseModel):
         """
         self.offerings = value
 
+    search_fields = ["code", "translations__title"]
+
     class Meta:
         db_table = "joanie_course"
         ordering = ("code",)
         verbose_name = _("Course")
         verbose_name_plural = _("Courses")
+        indexes = [trigram_index("code", "course_code_trgm_idx")]
 
     def __str__(self):
         return self.safe_translation_getter("title", any_language=True)
@@ -864,6 +875,15 @@ class CourseProductRelation(BaseModel):
             timezone.localdate(), start_date.date()
         )
 
+    def get_active_offering_rules(self):
+        """
+        Return the active offering rules of the offering, using them if they were
+        prefetched in the `active_offering_rules` attribute.
+        """
+        if (offering_rules := getattr(self, "active_offering_rules", None)) is not None:
+            return offering_rules
+        return self.offering_rules.filter(is_active=True)
+
     @property
     def rules(self):
         """
@@ -871,7 +891,7 @@ class CourseProductRelation(BaseModel):
         """
         offering_rule_found = None
         offering_rule_is_blocking = False
-        for offering_rule in self.offering_rules.filter(is_active=True):
+        for offering_rule in self.get_active_offering_rules():
             if not offering_rule.is_enabled:
                 continue
             no_seats = offering_rule.available_seats == 0
@@ -943,6 +963,123 @@ class CourseProductRelation(BaseModel):
         return self.organization_links.filter(is_active=True).exists()
 
 
+class OfferingOrganizationOrderCountManager(models.Manager):
+    """Custom manager for the OfferingOrganizationOrderCount model."""
+
+    def update_nb_orders(self, delta, product_id, course_id, organization_id):
+        """
+        Shift the number of orders of an organization on the offering of a product
+        and a course. The counter is created if it does not exist yet then updated
+        in the database to not lose concurrent updates.
+        """
+        offering_id = (
+            CourseProductRelation.objects.filter(
+                product_id=product_id, course_id=course_id
+            )
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if offering_id is None:
+            return
+
+        if delta > 0:
+            _counter, created = self.get_or_create(
+                offering_id=offering_id,
+                organization_id=organization_id,
+                defaults={"nb_orders": delta},
+            )
+            if created:
+                return
+
+        self.filter(offering_id=offering_id, organization_id=organization_id).update(
+            nb_orders=Greatest(models.F("nb_orders") + delta, 0),
+            updated_on=timezone.now(),
+        )
+
+    def reconcile(self, offering):
+        """
+        Count the orders of each organization of an offering and fix the stored
+        counters if they drifted, locking them if called within a transaction.
+        Return the list of organization ids whose counter has been fixed.
+        """
+        Order = apps.get_model("core", "Order")  # pylint: disable=invalid-name
+        nb_orders_per_organization = dict(
+            Order.objects.filter(
+                product_id=offering.product_id,
+                course_id=offering.course_id,
+                organization__isnull=False,
+                state__in=enums.ORDER_STATES_COUNTED_FOR_ORGANIZATION,
+            )
+            .values_list("organization_id")
+            .annotate(nb_orders=models.Count("pk"))
+            .order_by()
+        )
+        stored_nb_orders = dict(
+            self.select_for_update()
+            .filter(offering=offering)
+            .values_list("organization_id", "nb_orders")
+        )
+
+        reconciled_organization_ids = []
+        for organization_id in set(nb_orders_per_organization) | set(stored_nb_orders):
+            nb_orders = nb_orders_per_organization.get(organization_id, 0)
+            if stored_nb_orders.get(organization_id, 0) == nb_orders:
+                continue
+            self.update_or_create(
+                offering=offering,
+                organization_id=organization_id,
+                defaults={"nb_orders": nb_orders},
+            )
+            reconciled_organization_ids.append(organization_id)
+
+        return reconciled_organization_ids
+
+
+class OfferingOrganizationOrderCount(BaseModel):
+    """
+    OfferingOrganizationOrderCount stores the number of binding orders of an
+    offering per organization selling it, updated on order state transitions.
+
+    It allows to assign new orders to the least active organization of an offering
+    without counting all its orders.
+    """
+
+    offering = models.ForeignKey(
+        to=CourseProductRelation,
+        verbose_name=_("offering"),
+        related_name="organization_order_counts",
+        on_delete=models.CASCADE,
+    )
+    organization = models.ForeignKey(
+        to=Organization,
+        verbose_name=_("organization"),
+        related_name="offering_order_counts",
+        on_delete=models.CASCADE,
+    )
+    nb_orders = models.PositiveIntegerField(
+        _("number of orders"),
+        default=0,
+        help_text=_("The number of binding orders of the offering"),
+    )
+
+    objects = OfferingOrganizationOrderCountManager()
+
+    class Meta:
+        db_table = "joanie_offering_organization_order_count"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["offering", "organization"],
+                name="unique_offering_organization_order_count",
+            )
+        ]
+        verbose_name = _("Offering organization order count")
+        verbose_name_plural = _("Offering organization order counts")
+        ordering = ["-created_on"]
+
+    def __str__(self):
+        return f"{self.organization} on {self.offering}: {self.nb_orders} orders"
+
+
 class OfferingDeepLink(BaseModel):
     """
     OfferingDeepLink represents external links that allows a learner to subscribe to a course
@@ -1024,12 +1161,79 @@ class OfferingDeepLink(BaseModel):
         return super().delete(using=using, keep_parents=keep_parents)
 
 
+class CourseRunQuerySet(TranslatableQuerySet):
+    """Custom queryset for the CourseRun model."""
+
+    @staticmethod
+    def get_state_priority():
+        """
+        Return an expression computing in the database the priority of the state
+        of course runs at the current time, following the rules of
+        `CourseRun.compute_state`.
+        """
+        now = timezone.now()
+        is_ongoing = Q(end__isnull=True) | Q(end__gt=now)
+        is_enrollment_open = Q(enrollment_end__isnull=True) | Q(enrollment_end__gt=now)
+        return models.Case(
+            models.When(
+                Q(start__isnull=True) | Q(enrollment_start__isnull=True),
+                then=models.Value(CourseState.TO_BE_SCHEDULED),
+            ),
+            models.When(
+                is_ongoing & is_enrollment_open,
+                start__lt=now,
+                enrollment_start__lte=now,
+                then=models.Value(CourseState.ONGOING_OPEN),
+            ),
+            models.When(
+                is_ongoing,
+                start__lt=now,
+                then=models.Value(CourseState.ONGOING_CLOSED),
+            ),
+            models.When(
+                is_enrollment_open,
+                start__lt=now,
+                enrollment_start__lt=now,
+                then=models.Value(CourseState.ARCHIVED_OPEN),
+            ),
+            models.When(
+                start__lt=now,
+                then=models.Value(CourseState.ARCHIVED_CLOSED),
+            ),
+            models.When(
+                enrollment_start__gt=now,
+                then=models.Value(CourseState.FUTURE_NOT_YET_OPEN),
+            ),
+            models.When(
+                is_enrollment_open,
+                then=models.Value(CourseState.FUTURE_OPEN),
+            ),
+            default=models.Value(CourseState.FUTURE_CLOSED),
+            output_field=models.PositiveSmallIntegerField(),
+        )
+
+    def annotate_state_priority(self):
+        """
+        Annotate course runs with the priority of their state at the current time
+        to filter or sort them by state in the database.
+        """
+        return self.annotate(state_priority=self.get_state_priority())
+
+    def exclude_archived(self):
+        """Exclude course runs which are archived at the current time."""
+        return self.alias(state_priority=self.get_state_priority()).exclude(
+            state_priority__in=[CourseState.ARCHIVED_OPEN, CourseState.ARCHIVED_CLOSED]
+        )
+
+
 class CourseRun(parler_models.TranslatableModel, BaseModel):
     """
     Course run represents and records the occurrence of a course between a start
     and an end date.
     """
 
+    objects = TranslatableManager.from_queryset(CourseRunQuerySet)()
+
     course = models.ForeignKey(
         to=Course,
         on_delete=models.PROTECT,
@@ -1073,6 +1277,12 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
         verbose_name_plural = _("Course runs")
         ordering = ["-created_on"]
 
+    def __init__(self, *args, **kwargs):
+        """Initiate CourseRun object"""
+        super().__init__(*args, **kwargs)
+        # Course stored in database, to check if it changed when the course run is saved
+        self._stored_course_id = self.__dict__.get("course_id")
+
     def __str__(self):
         return (
             f"{self.safe_translation_getter('title', any_language=True)} "
@@ -1087,12 +1297,9 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
 
         return f"https://{site.domain:s}{resource_path:s}"
 
-    def get_serialized(self, visibility=None, certifying=True, product=None):
-        """
-        Return data for the course run that will be sent to the remote web hooks.
-        Course run visibility can be forced via the eponym argument.
-        """
-
+    @staticmethod
+    def _validate_serialization_visibility(visibility):
+        """Raise a ValueError if the visibility is not a catalog visibility."""
         if (
             visibility is not None
             and visibility not in enums.CATALOG_VISIBILITY_CHOICES
@@ -1102,34 +1309,192 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
                 f"of {enums.CATALOG_VISIBILITY_CHOICES} or None"
             )
 
+    def get_serialized(
+        self, visibility=None, certifying=True, product=None, offering=None
+    ):
+        """
+        Return data for the course run that will be sent to the remote web hooks.
+        Course run visibility can be forced via the eponym argument.
+
+        The offering relating the course run course to the product can be passed
+        when it is already known to avoid looking it up again.
+        """
+        self._validate_serialization_visibility(visibility)
+
+        rules = {}
+        if product:
+            if offering is None:
+                try:
+                    offering = CourseProductRelation.objects.get(
+                        course=self.course, product=product
+                    )
+                except CourseProductRelation.DoesNotExist:
+                    offering = None
+            if offering:
+                rules = offering.rules
+
+        certificate_offer = None
+        has_grade = False
+        if certifying:
+            certificate_offer = self.get_certificate_offer()
+        elif product:
+            has_grade = product.target_course_relations.filter(is_graded=True).exists()
+        else:
+            has_grade = self.is_gradable
+
+        return self.build_serialized(
+            visibility=visibility,
+            certifying=certifying,
+            product=product,
+            offering=offering,
+            rules=rules,
+            certificate_offer=certificate_offer,
+            has_grade=has_grade,
+        )
+
+    # pylint: disable=too-many-locals
+    @classmethod
+    def get_serialized_bulk(
+        cls, course_runs_products, visibility=None, certifying=True
+    ):
+        """
+        Return the data sent to the remote web hooks for many (course run, product)
+        pairs, product being optional, as `get_serialized` would for each of them.
+
+        Offerings, their active rules, certificate prices of courses and gradedness of
+        products are resolved for all pairs at once so the number of queries does not
+        depend on the number of pairs. Offering rules are evaluated once per offering.
+        """
+        cls._validate_serialization_visibility(visibility)
+
+        course_runs_products = list(course_runs_products)
+        if not course_runs_products:
+            return []
+
+        # Make sure the course of each course run is loaded
+        if missing_course_ids := {
+            course_run.course_id
+            for course_run, _product in course_runs_products
+            if not cls.course.is_cached(course_run)
+        }:
+            courses = Course.objects.in_bulk(missing_course_ids)
+            for course_run, _product in course_runs_products:
+                if not cls.course.is_cached(course_run):
+                    course_run.course = courses[course_run.course_id]
+
+        course_ids = {course_run.course_id for course_run, _ in course_runs_products}
+        product_ids = {
+            product.id for _course_run, product in course_runs_products if product
+        }
+
+        offerings = {}
+        if product_ids:
+            OfferingRule = apps.get_model("core", "OfferingRule")  # pylint: disable=invalid-name
+            offerings = {
+                (offering.course_id, offering.product_id): offering
+                for offering in CourseProductRelation.objects.filter(
+                    course_id__in=course_ids, product_id__in=product_ids
+                )
+                .select_related("course", "product")
+                .prefetch_related(
+                    models.Prefetch(
+                        "offering_rules",
+                        queryset=OfferingRule.objects.filter(
+                            is_active=True
+                        ).select_related("discount"),
+                        to_attr="active_offering_rules",
+                    )
+                )
+            }
+
+        max_certificate_prices = {}
+        graded_product_ids = set()
+        if certifying:
+            max_certificate_prices = dict(
+                CourseProductRelation.objects.filter(
+                    course_id__in=course_ids,
+                    product__type=enums.PRODUCT_TYPE_CERTIFICATE,
+                )
+                .order_by()
+                .values("course_id")
+                .annotate(max_price=models.Max("product__price"))
+                .values_list("course_id", "max_price")
+            )
+        elif product_ids:
+            ProductTargetCourseRelation = apps.get_model(  # pylint: disable=invalid-name
+                "core", "ProductTargetCourseRelation"
+            )
+            graded_product_ids = set(
+                ProductTargetCourseRelation.objects.filter(
+                    product_id__in=product_ids, is_graded=True
+                ).values_list("product_id", flat=True)
+            )
+
+        rules_by_offering = {}
+        serialized_course_runs = []
+        for course_run, product in course_runs_products:
+            offering = None
+            rules = {}
+            if product:
+                offering = offerings.get((course_run.course_id, product.id))
+                if offering:
+                    if offering.id not in rules_by_offering:
+                        rules_by_offering[offering.id] = offering.rules
+                    rules = rules_by_offering[offering.id]
+
+            serialized_course_runs.append(
+                course_run.build_serialized(
+                    visibility=visibility,
+                    certifying=certifying,
+                    product=product,
+                    offering=offering,
+                    rules=rules,
+                    certificate_offer=cls._get_certificate_offer_for_price(
+                        max_certificate_prices.get(course_run.course_id)
+                    ),
+                    has_grade=product.id in graded_product_ids
+                    if product
+                    else course_run.is_gradable,
+                )
+            )
+
+        return serialized_course_runs
+
+    # pylint: disable=too-many-arguments
+    def build_serialized(  # noqa: PLR0913
+        self,
+        *,
+        visibility,
+        certifying,
+        product,
+        offering,
+        rules,
+        certificate_offer,
+        has_grade,
+    ):
+        """
+        Build the data sent to the remote web hooks from already resolved offering,
+        rules, certificate offer and gradedness.
+        """
         price = None
         discounted_price = None
         discount = None
         certificate_price = None
         certificate_discounted_price = None
         certificate_discount = None
-        offering = None
         resource_link = self.uri
 
         if product:
             logger.debug("[SYNC] product: %s", product)
             price = product.price
-
-            try:
-                offering = CourseProductRelation.objects.get(
-                    course=self.course, product=product
-                )
-            except CourseProductRelation.DoesNotExist:
-                offering = None
             logger.debug("[SYNC] offering: %s", offering)
-            if offering and offering.rules.get("discounted_price"):
-                discounted_price = offering.rules.get("discounted_price")
+            if rules.get("discounted_price"):
+                discounted_price = rules.get("discounted_price")
                 logger.debug("[SYNC] discounted_price: %s", discounted_price)
-                discount = offering.rules.get("discount")
+                discount = rules.get("discount")
                 logger.debug("[SYNC] discount: %s", discount)
 
         if certifying:
-            certificate_offer = self.get_certificate_offer()
             certificate_price = price
             certificate_discounted_price = discounted_price
             certificate_discount = discount
@@ -1137,15 +1502,8 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
             discounted_price = None
             discount = None
         else:
-            if product:
-                has_grade = product.target_course_relations.filter(
-                    is_graded=True
-                ).exists()
-
-                if offering:
-                    resource_link = offering.uri
-            else:
-                has_grade = self.is_gradable
+            if product and offering:
+                resource_link = offering.uri
             certificate_offer = enums.COURSE_OFFER_PAID if has_grade else None
 
         logger.debug(
@@ -1184,15 +1542,12 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
             "start": self.start.isoformat() if self.start else None,
         }
 
-    def get_certificate_offer(self):
+    @staticmethod
+    def _get_certificate_offer_for_price(max_product_price):
         """
-        Return certificate offer if the related course has a certificate product.
-        According to the product price, the offer is set to 'paid' or 'free'.
+        Return the certificate offer matching the highest price of the certificate
+        products of a course.
         """
-        max_product_price = self.course.products.filter(
-            type=enums.PRODUCT_TYPE_CERTIFICATE
-        ).aggregate(models.Max("price"))["price__max"]
-
         if max_product_price is None:
             return None
 
@@ -1202,6 +1557,17 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
             else enums.COURSE_OFFER_FREE
         )
 
+    def get_certificate_offer(self):
+        """
+        Return certificate offer if the related course has a certificate product.
+        According to the product price, the offer is set to 'paid' or 'free'.
+        """
+        max_product_price = self.course.products.filter(
+            type=enums.PRODUCT_TYPE_CERTIFICATE
+        ).aggregate(models.Max("price"))["price__max"]
+
+        return self._get_certificate_offer_for_price(max_product_price)
+
     # pylint: disable=invalid-name
     def get_equivalent_serialized_course_runs_for_related_products(
         self, visibility=None
@@ -1229,6 +1595,8 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
         passed in argument.
 
         A static method not using the instance allows to call it with an Elasticsearch result.
+        To filter or sort course runs by state, use `CourseRunQuerySet` methods instead
+        to compute it in the database.
         """
         if not start or not enrollment_start:
             return CourseState(CourseState.TO_BE_SCHEDULED)
@@ -1282,7 +1650,8 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
         # If the course run is updating and the course field has changed ...
         if self.created_on:
             old_course_id = (
-                CourseRun.objects.only("course_id").get(pk=self.pk).course_id
+                self._stored_course_id
+                or CourseRun.objects.only("course_id").get(pk=self.pk).course_id
             )
             if old_course_id != self.course_id:
                 # ... Check the course run instance does not rely on product/order relations
@@ -1303,6 +1672,13 @@ class CourseRun(parler_models.TranslatableModel, BaseModel):
         """Enforce validation each time an instance is saved."""
         self.full_clean()
         super().save(*args, **kwargs)
+        self._stored_course_id = self.course_id
+
+    def refresh_from_db(self, *args, fields=None, **kwargs):
+        """Keep track of the course stored in database once reloaded."""
+        super().refresh_from_db(*args, fields=fields, **kwargs)
+        if fields is None or "course" in fields or "course_id" in fields:
+            self._stored_course_id = self.__dict__.get("course_id")
 
     def delete(self, using=None):
         """
@@ -1383,6 +1759,9 @@ class Enrollment(BaseModel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.last_is_active = self.is_active
+        # Whether an order entitles the user to enroll to the course run, set in advance
+        # when the entitlements of many enrollments are validated at once
+        self.is_entitled = None
 
     def __str__(self):
         active = _("active") if self.is_active else _("inactive")
@@ -1402,7 +1781,7 @@ class Enrollment(BaseModel):
 
     def get_grade(self):
         """Retrieve the grade from the related LMS then store result in cache."""
-        grade = cache.get(self.grade_cache_key)
+        grade = two_tier_cache.get(self.grade_cache_key)
 
         if grade is None:
             lms = LMSHandler.select_lms(self.course_run.resource_link)
@@ -1421,7 +1800,7 @@ class Enrollment(BaseModel):
                 except exceptions.GradeError:
                     pass
                 else:
-                    cache.set(
+                    two_tier_cache.set(
                         self.grade_cache_key,
                         grade,
                         settings.JOANIE_ENROLLMENT_GRADE_CACHE_TTL,
@@ -1459,43 +1838,13 @@ class Enrollment(BaseModel):
                 )
                 raise ValidationError({"was_created_by_order": [message]})
             if self.course_run.course.targeted_by_products.exists():
-                validated_user_orders = self.user.orders.filter(
-                    (
-                        models.Q(
-                            offerings__course_runs__isnull=True,
-                            target_courses__course_runs=self.course_run,
-                        )
-                        | models.Q(offerings__course_runs=self.course_run)
-                    ),
-                    (
-                        models.Q(
-                            product__contract_definition_order__isnull=False,
-                            contract__student_signed_on__isnull=False,
-                        )
-                        | models.Q(
-                            product__contract_definition_order__isnull=True,
-                        )
-                        | models.Q(
-                            product__contract_definition_batch_order__isnull=False,
-                            batch_order__payment_method=enums.BATCH_ORDER_WITH_PURCHASE_ORDER,
-                        )
-                        | models.Q(
-                            product__contract_definition_batch_order__isnull=False,
-                            batch_order__contract__student_signed_on__isnull=False,
-                            batch_order__payment_method__in=[
-                                enums.BATCH_ORDER_WITH_CARD_PAYMENT,
-                                enums.BATCH_ORDER_WITH_BANK_TRANSFER,
-                            ],
-                        )
-                        | models.Q(
-                            product__contract_definition_order__isnull=False,
-                            voucher__discount__rate=1,
-                            batch_order__isnull=True,
-                        )
-                    ),
-                    state__in=enums.ORDER_STATE_ALLOW_ENROLLMENT,
-                )
-                if validated_user_orders.count() == 0:
+                is_entitled = self.is_entitled
+                if is_entitled is None:
+                    entitlements = self.user.enrollment_entitlements  # pylint: disable=no-member
+                    is_entitled = self.course_run_id in (
+                        entitlements.get_entitled_course_run_ids([self.course_run])
+                    )
+                if not is_entitled:
                     message = _(
                         f'Course run "{self.course_run.id!s}" '
                         "requires a valid order to enroll."
@@ -1555,6 +1904,8 @@ class Enrollment(BaseModel):
         with LMS if needed.
         """
         self.full_clean()
+        # The entitlement set in advance is only valid for this validation
+        self.is_entitled = None
         is_creating = self.created_on is None
 
         super().save(*args, **kwargs)
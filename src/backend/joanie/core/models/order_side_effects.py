@@ -0,0 +1,64 @@
+"""
+Declare and configure the outbox of side effects of order transitions
+"""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from joanie.core import enums
+from joanie.core.models.base import BaseModel
+
+
+class OrderSideEffect(BaseModel):
+    """
+    OrderSideEffect records, within the transaction of an order transition, a side
+    effect of this transition (email, payment, LMS enrollment...) to be executed by a
+    worker once the transaction is committed.
+
+    The idempotency key ensures a side effect is recorded only once and its state
+    ensures it is executed only once, even if its execution is requested several times.
+    """
+
+    order = models.ForeignKey(
+        to="Order",
+        verbose_name=_("order"),
+        related_name="side_effects",
+        on_delete=models.CASCADE,
+    )
+    effect = models.CharField(
+        _("effect"),
+        max_length=50,
+        choices=enums.ORDER_SIDE_EFFECT_CHOICES,
+    )
+    payload = models.JSONField(
+        _("payload"),
+        help_text=_("Arguments of the side effect"),
+        default=dict,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+    )
+    idempotency_key = models.CharField(
+        _("idempotency key"),
+        max_length=255,
+        unique=True,
+    )
+    state = models.CharField(
+        _("state"),
+        max_length=20,
+        choices=enums.ORDER_SIDE_EFFECT_STATE_CHOICES,
+        default=enums.ORDER_SIDE_EFFECT_STATE_PENDING,
+        db_index=True,
+    )
+    attempts = models.PositiveSmallIntegerField(_("attempts"), default=0)
+    last_error = models.TextField(_("last error"), blank=True)
+    executed_on = models.DateTimeField(_("executed on"), null=True, blank=True)
+
+    class Meta:
+        db_table = "joanie_order_side_effect"
+        verbose_name = _("Order side effect")
+        verbose_name_plural = _("Order side effects")
+        ordering = ["created_on"]
+
+    def __str__(self):
+        return f"{self.get_effect_display()} for order {self.order_id}"
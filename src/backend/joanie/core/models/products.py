@@ -5,7 +5,7 @@ Declare and configure the models for the product / order part
 import itertools
 import logging
 import uuid
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import timedelta
 from decimal import Decimal
 from typing import TypedDict
@@ -15,7 +15,7 @@ from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied, ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import IntegrityError, connection, models, transaction
 from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.crypto import get_random_string
@@ -50,6 +50,7 @@ from joanie.core.models.courses import (
     CourseRun,
     CourseState,
     Enrollment,
+    OfferingOrganizationOrderCount,
     Organization,
 )
 from joanie.core.models.quotes import Quote
@@ -73,6 +74,7 @@ from joanie.core.utils.course_run.aggregate_course_runs_dates import (
 )
 from joanie.core.utils.discount import calculate_price
 from joanie.core.utils.payment_schedule import generate as generate_payment_schedule
+from joanie.core.utils.search import trigram_index
 from joanie.signature.backends import get_signature_backend
 
 logger = logging.getLogger(__name__)
@@ -105,6 +107,7 @@ class Product(parler_models.TranslatableModel, BaseModel):
         description=models.CharField(_("description"), max_length=500, blank=True),
         instructions=models.TextField(_("instructions"), blank=True),
         call_to_action=models.CharField(_("call to action"), max_length=255),
+        meta={"indexes": [trigram_index("title", "product_title_trgm_idx")]},
     )
     target_courses = models.ManyToManyField(
         to=Course,
@@ -190,6 +193,8 @@ class Product(parler_models.TranslatableModel, BaseModel):
         """
         self.offerings = value
 
+    search_fields = ["translations__title"]
+
     class Meta:
         db_table = "joanie_product"
         verbose_name = _("Product")
@@ -231,7 +236,9 @@ class Product(parler_models.TranslatableModel, BaseModel):
             )
         )
 
-    def get_equivalent_course_run_data(self, visibility=None):
+    def get_equivalent_course_run_data(
+        self, visibility=None, equivalent_course_run=None
+    ):
         """
         Return data for the virtual course run equivalent to this product when, taking
         into account all course runs targeted by the product if any.
@@ -245,11 +252,17 @@ class Product(parler_models.TranslatableModel, BaseModel):
 
         If a product has no target courses or no related course runs, it will still return
         an equivalent course run with null dates and hidden visibility.
+
+        The stored equivalent course run of the product can be passed if it has already
+        been retrieved.
         """
         if self.type == enums.PRODUCT_TYPE_CERTIFICATE:
             return None
 
-        dates = self.get_equivalent_course_run_dates()
+        equivalent_course_run = (
+            equivalent_course_run or self.get_equivalent_course_run()
+        )
+        dates = equivalent_course_run.dates
 
         logger.debug(
             "[SYNC] Calculating equivalent course run data for product %s", self.pk
@@ -260,22 +273,28 @@ class Product(parler_models.TranslatableModel, BaseModel):
         return {
             "catalog_visibility": visibility
             or (enums.COURSE_AND_SEARCH if any(dates.values()) else enums.HIDDEN),
-            "languages": self.get_equivalent_course_run_languages(),
+            "languages": equivalent_course_run.languages,
             # Get dates from aggregate
-            **self.get_equivalent_course_run_offer(),
+            **self.get_equivalent_course_run_offer(equivalent_course_run),
             **{
                 key: value.isoformat() if value else None
                 for key, value in dates.items()
             },
         }
 
+    def get_equivalent_course_run(self):
+        """
+        Return the stored equivalent course run of the product, or compute it without
+        storing it if it does not exist yet or has been invalidated.
+        """
+        equivalent_course_run = ProductEquivalentCourseRun.objects.filter(
+            product=self
+        ).first()
+        return equivalent_course_run or ProductEquivalentCourseRun.objects.compute(self)
+
     def get_equivalent_course_run_languages(self):
         """Return a list of distinct languages available in alphabetical order."""
-        languages = self.target_course_runs.values_list(
-            "languages", flat=True
-        ).distinct()
-        # Go through a set for uniqueness of each language then return an ordered list
-        return sorted(set(itertools.chain.from_iterable(languages)))
+        return self.get_equivalent_course_run().languages
 
     def get_equivalent_course_run_dates(self, ignore_archived=False):
         """
@@ -286,12 +305,15 @@ class Product(parler_models.TranslatableModel, BaseModel):
         - enrollment_start: Pick the latest enrollment start date
         - enrollment_end: Pick the earliest enrollment end date
         """
+        if not ignore_archived:
+            return self.get_equivalent_course_run().dates
+
         return aggregate_course_runs_dates(
             self.target_course_runs,
             ignore_archived=ignore_archived,
         )
 
-    def get_equivalent_course_run_offer(self):
+    def get_equivalent_course_run_offer(self, equivalent_course_run=None):
         """
         Return the offer properties for the equivalent course run.
         If the product is a certificate, we bind offer information into
@@ -315,7 +337,9 @@ class Product(parler_models.TranslatableModel, BaseModel):
         }
 
         if self.type != enums.PRODUCT_TYPE_CERTIFICATE:
-            is_graded = self.target_course_relations.filter(is_graded=True).exists()
+            is_graded = (
+                equivalent_course_run or self.get_equivalent_course_run()
+            ).is_graded
             properties["certificate_offer"] = (
                 enums.COURSE_OFFER_PAID if is_graded else None
             )
@@ -335,9 +359,21 @@ class Product(parler_models.TranslatableModel, BaseModel):
             therefore be hidden.
         """
         equivalent_course_runs = []
+        products = list(products)
+        # Read the equivalent course runs of all the products at once
+        stored_equivalent_course_runs = (
+            ProductEquivalentCourseRun.objects.get_for_products(
+                [
+                    product
+                    for product in products
+                    if product.type != enums.PRODUCT_TYPE_CERTIFICATE
+                ]
+            )
+        )
         for product in products:
             course_run_data = product.get_equivalent_course_run_data(
-                visibility=visibility
+                visibility=visibility,
+                equivalent_course_run=stored_equivalent_course_runs.get(product.pk),
             )
 
             # Ignore products of type certificate
@@ -372,7 +408,7 @@ class Product(parler_models.TranslatableModel, BaseModel):
             synchronizing a product that does not have anymore course runs and should
             therefore be hidden.
         """
-        serialized_course_runs = []
+        course_runs_products = []
         now = timezone.now()
 
         for product in products:
@@ -380,16 +416,17 @@ class Product(parler_models.TranslatableModel, BaseModel):
                 continue
 
             courses = courses or product.courses.all()
-            course_runs = CourseRun.objects.filter(course__in=courses, end__gt=now)
+            course_runs = CourseRun.objects.filter(
+                course__in=courses, end__gt=now
+            ).select_related("course")
 
-            serialized_course_runs.extend(
-                [
-                    course_run.get_serialized(certifying=certifying, product=product)
-                    for course_run in course_runs
-                ]
+            course_runs_products.extend(
+                (course_run, product) for course_run in course_runs
             )
 
-        return serialized_course_runs
+        return CourseRun.get_serialized_bulk(
+            course_runs_products, certifying=certifying
+        )
 
     @property
     def state(self) -> str:
@@ -486,6 +523,157 @@ class ProductTargetCourseRelation(BaseModel):
         webhooks.synchronize_course_runs(serialized_course_runs)
 
 
+# Attribute of the database connection holding the ids of the products of which the
+# equivalent course run must be stored once the current transaction is committed
+PENDING_REFRESH_ATTRIBUTE = "product_equivalent_course_runs_pending_refresh"
+
+
+class ProductEquivalentCourseRunManager(models.Manager):
+    """Custom manager for the ProductEquivalentCourseRun model."""
+
+    def compute(self, product):
+        """
+        Compute the equivalent course run of a product from its target course runs
+        without storing it.
+        """
+        target_course_runs = product.target_course_runs
+        languages = target_course_runs.values_list("languages", flat=True).distinct()
+        return self.model(
+            product=product,
+            **aggregate_course_runs_dates(target_course_runs),
+            # Go through a set for uniqueness of each language then store an
+            # ordered list
+            languages=sorted(set(itertools.chain.from_iterable(languages))),
+            is_graded=product.target_course_relations.filter(is_graded=True).exists(),
+        )
+
+    def refresh(self, product):
+        """Compute the equivalent course run of a product and store it."""
+        equivalent_course_run = self.compute(product)
+        equivalent_course_run, _created = self.update_or_create(
+            product=product,
+            defaults={
+                **equivalent_course_run.dates,
+                "languages": equivalent_course_run.languages,
+                "is_graded": equivalent_course_run.is_graded,
+            },
+        )
+        return equivalent_course_run
+
+    def refresh_products(self, products):
+        """Compute the equivalent course runs of a queryset of products and store them."""
+        for product in products.distinct():
+            self.refresh(product)
+
+    def invalidate(self, products):
+        """
+        Delete the equivalent course runs of a queryset of products, which are then
+        computed on read, and store them again once the current transaction is
+        committed for the products that still exist.
+
+        Products invalidated several times during a transaction are only refreshed
+        once. The products pending a refresh are held by the database connection
+        until the transaction is committed.
+        """
+        pending_product_ids = getattr(connection, PENDING_REFRESH_ATTRIBUTE, None)
+        if pending_product_ids is None or not connection.in_atomic_block:
+            pending_product_ids = set()
+            setattr(connection, PENDING_REFRESH_ATTRIBUTE, pending_product_ids)
+
+        product_ids = (
+            set(products.values_list("pk", flat=True).distinct()) - pending_product_ids
+        )
+        if product_ids:
+            self.filter(product_id__in=product_ids).delete()
+            pending_product_ids.update(product_ids)
+        # Planned for each change as a callback planned within a savepoint is dropped
+        # if the savepoint is rolled back
+        transaction.on_commit(lambda: self.refresh_pending(pending_product_ids))
+
+    def refresh_pending(self, pending_product_ids):
+        """
+        Store the equivalent course runs of the products pending a refresh, unless
+        they have already been refreshed by a previous callback of the transaction.
+        """
+        if getattr(connection, PENDING_REFRESH_ATTRIBUTE, None) is not (
+            pending_product_ids
+        ):
+            return
+        setattr(connection, PENDING_REFRESH_ATTRIBUTE, None)
+        self.refresh_products(Product.objects.filter(pk__in=pending_product_ids))
+
+    def get_for_products(self, products):
+        """
+        Return the equivalent course runs of many products indexed by product id,
+        reading the stored ones in one query and computing the missing ones without
+        storing them.
+        """
+        equivalent_course_runs = {
+            equivalent_course_run.product_id: equivalent_course_run
+            for equivalent_course_run in self.filter(product__in=products)
+        }
+        for product in products:
+            if product.pk not in equivalent_course_runs:
+                equivalent_course_runs[product.pk] = self.compute(product)
+        return equivalent_course_runs
+
+
+class ProductEquivalentCourseRun(BaseModel):
+    """
+    ProductEquivalentCourseRun stores the aggregates of the course runs targeted by a
+    product (dates, languages and gradedness) used to describe the virtual course run
+    equivalent to the product.
+
+    It is computed again each time a target course relation of the product changes,
+    and once the transaction is committed when one of its course runs changes. Reads
+    never store it: a missing one is computed on the fly.
+    """
+
+    product = models.OneToOneField(
+        to=Product,
+        verbose_name=_("product"),
+        related_name="equivalent_course_run",
+        on_delete=models.CASCADE,
+    )
+    start = models.DateTimeField(_("start"), blank=True, null=True)
+    end = models.DateTimeField(_("end"), blank=True, null=True)
+    enrollment_start = models.DateTimeField(
+        _("enrollment start"), blank=True, null=True
+    )
+    enrollment_end = models.DateTimeField(_("enrollment end"), blank=True, null=True)
+    languages = models.JSONField(
+        _("languages"),
+        help_text=_("Distinct languages of the target course runs"),
+        default=list,
+        blank=True,
+    )
+    is_graded = models.BooleanField(
+        _("is graded"),
+        help_text=_("Whether a target course is taken into account for certification"),
+        default=False,
+    )
+
+    objects = ProductEquivalentCourseRunManager()
+
+    class Meta:
+        db_table = "joanie_product_equivalent_course_run"
+        verbose_name = _("Product equivalent course run")
+        verbose_name_plural = _("Product equivalent course runs")
+
+    def __str__(self):
+        return f"Equivalent course run of {self.product}"
+
+    @property
+    def dates(self):
+        """Return the dates of the equivalent course run."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "enrollment_start": self.enrollment_start,
+            "enrollment_end": self.enrollment_end,
+        }
+
+
 class OrderGroupManager(models.Manager):
     """Custom manager for the OrderGroup model."""
 
@@ -732,6 +920,68 @@ class OfferingRuleManager(TranslatableManager):
             )
         )
 
+    def reserve_seats(self, nb_seats=1, **filters):
+        """
+        Use seats of the offering rules matching the filters. Seats of offering rules
+        limited in seats are only used if enough are still available, which is checked
+        by the UPDATE itself so concurrent orders can not use the same last seat.
+
+        Return False if an offering rule has not enough seats left. Seats used on the
+        other offering rules must then be released by rolling back the transaction.
+        """
+        offering_rule_ids = list(
+            super().get_queryset().filter(**filters).values_list("pk", flat=True)
+        )
+        if not offering_rule_ids:
+            return True
+
+        # Filter on the updated rows only, without join, so PostgreSQL checks the
+        # number of used seats again once a concurrent update is committed
+        nb_reserved = (
+            super()
+            .get_queryset()
+            .filter(
+                models.Q(nb_seats__isnull=True)
+                | models.Q(nb_used_seats__lte=models.F("nb_seats") - nb_seats),
+                pk__in=offering_rule_ids,
+            )
+            .update(
+                nb_used_seats=models.F("nb_used_seats") + nb_seats,
+                updated_on=timezone.now(),
+            )
+        )
+        return nb_reserved == len(offering_rule_ids)
+
+    def release_seats(self, nb_seats=1, **filters):
+        """
+        Release seats of the offering rules matching the filters. An offering rule
+        using less seats than released has drifted, it is left untouched and logged
+        to be fixed with the reconcile_offering_rules_seats command.
+        """
+        offering_rule_ids = list(
+            super().get_queryset().filter(**filters).values_list("pk", flat=True)
+        )
+        if not offering_rule_ids:
+            return
+
+        nb_released = (
+            super()
+            .get_queryset()
+            .filter(nb_used_seats__gte=nb_seats, pk__in=offering_rule_ids)
+            .update(
+                nb_used_seats=models.F("nb_used_seats") - nb_seats,
+                updated_on=timezone.now(),
+            )
+        )
+        if nb_released < len(offering_rule_ids):
+            logger.error(
+                "Number of used seats drifted on some of the offering rules %s, "
+                "run the reconcile_offering_rules_seats command to fix it.",
+                ", ".join(
+                    str(offering_rule_id) for offering_rule_id in offering_rule_ids
+                ),
+            )
+
 
 class OfferingRule(parler_models.TranslatableModel, BaseModel):
     """
@@ -750,6 +1000,15 @@ class OfferingRule(parler_models.TranslatableModel, BaseModel):
         null=True,
         blank=True,
     )
+    nb_used_seats = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("Number of used seats"),
+        help_text=_(
+            "The number of orders using a seat of the offering rule, "
+            "updated on order state transitions"
+        ),
+    )
     course_product_relation = models.ForeignKey(
         to=CourseProductRelation,
         verbose_name=_("course product relation"),
@@ -843,6 +1102,26 @@ class OfferingRule(parler_models.TranslatableModel, BaseModel):
             state=enums.ORDER_STATE_TO_OWN,
         ).count()
 
+    def reconcile_used_seats(self):
+        """
+        Count the seats used by orders related to this offering rule and fix the
+        number of used seats if it drifted. Return the previous number of used seats.
+        """
+        previous_nb_used_seats = self.nb_used_seats
+        self.nb_used_seats = self.orders.filter(
+            models.Q(course_id=self.course_product_relation.course_id)
+            | models.Q(
+                enrollment__course_run__course_id=self.course_product_relation.course_id
+            ),
+            product_id=self.course_product_relation.product_id,
+            state__in=enums.ORDER_STATES_USING_SEAT,
+        ).count()
+        if self.nb_used_seats != previous_nb_used_seats:
+            OfferingRule.objects.filter(pk=self.pk).update(
+                nb_used_seats=self.nb_used_seats, updated_on=timezone.now()
+            )
+        return previous_nb_used_seats
+
     @property
     def can_edit(self):
         """Return True if the offering rule can be edited."""
@@ -850,12 +1129,16 @@ class OfferingRule(parler_models.TranslatableModel, BaseModel):
 
     @property
     def available_seats(self) -> int | None:
-        """Return the number of available seats on the offering rule, or None if unlimited."""
+        """
+        Return the number of available seats on the offering rule, or None if unlimited.
+        It relies on the number of used seats loaded with the offering rule, which
+        orders update in the database: use `refresh_from_db(fields=["nb_used_seats"])`
+        to read it again.
+        """
         if self.nb_seats is None:
             return None
 
-        used_seats = self.get_nb_binding_orders() + self.get_nb_to_own_orders()
-        return self.nb_seats - used_seats
+        return self.nb_seats - self.nb_used_seats
 
     @property
     def is_enabled(self):
@@ -893,7 +1176,22 @@ class OfferingRule(parler_models.TranslatableModel, BaseModel):
             self.course_product_relation_id,
         )
         self.course_product_relation.clear_cache()
-        return super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if self._state.adding or (
+            update_fields is not None and "nb_used_seats" not in update_fields
+        ):
+            return super().save(*args, **kwargs)
+
+        # The number of used seats is updated in the database by orders, reload it
+        # with the row locked so a value outdated meanwhile is not written back
+        with transaction.atomic():
+            self.nb_used_seats = (
+                OfferingRule.objects.select_for_update()
+                .values_list("nb_used_seats", flat=True)
+                .get(pk=self.pk)
+            )
+            return super().save(*args, **kwargs)
 
     def delete(self, using=None):
         """
@@ -1192,10 +1490,16 @@ class Order(BaseModel):
         verbose_name_plural = _("Orders")
         ordering = ["-created_on"]
 
+    # Fields of which changes update the number of used seats of offering rules, the
+    # number of orders of organizations on offerings and enrollment entitlements
+    TRACKED_FIELDS = ("state", "organization", "course", "product", "owner")
+
     def __init__(self, *args, **kwargs):
         """Initiate Order object"""
         super().__init__(*args, **kwargs)
         self.flow = OrderFlow(self)
+        # Values stored in database, to detect changes when the order is saved
+        self._stored_values = self._get_tracked_values()
 
     def __str__(self):
         return f"Order {self.product} for user {self.owner}"
@@ -1357,9 +1661,150 @@ class Order(BaseModel):
         super().clean()
 
     def save(self, *args, **kwargs):
-        """Call full clean before saving instance."""
+        """
+        Call full clean before saving instance then update the number of used seats
+        of its offering rules if the order started or stopped using a seat, the
+        number of orders of its organization on the offering if it started or stopped
+        being counted, and the enrollment entitlements of its owner if it started or
+        stopped allowing enrollment.
+
+        An order starts using a seat once assigned at checkout. It can not if one of
+        its offering rules has no seat left, a ValidationError is raised and the order
+        is not saved.
+        """
         self.full_clean()
-        super().save(*args, **kwargs)
+        stored_values = (
+            dict.fromkeys(self.TRACKED_FIELDS)
+            if self._state.adding
+            else self._stored_values
+        )
+        values = self._get_tracked_values(
+            update_fields=kwargs.get("update_fields"), default=stored_values
+        )
+        used_seats_delta = self._get_used_seats_delta(stored_values, values)
+
+        if used_seats_delta > 0:
+            # The order only starts using a seat if its offering rules have some left
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                if not OfferingRule.objects.reserve_seats(orders=self):
+                    self.state = stored_values["state"]
+                    raise ValidationError(
+                        {
+                            "offering_rule": [
+                                _(
+                                    "Maximum number of orders reached for product "
+                                    "%(product)s"
+                                )
+                                % {"product": self.product.title}
+                            ]
+                        }
+                    )
+        else:
+            super().save(*args, **kwargs)
+            if used_seats_delta < 0:
+                OfferingRule.objects.release_seats(orders=self)
+
+        self._update_organization_order_count(stored_values, values)
+        self._update_enrollment_entitlements(stored_values, values)
+        self._stored_values = values
+
+    def refresh_from_db(self, *args, fields=None, **kwargs):
+        """Keep track of the values stored in database once reloaded."""
+        super().refresh_from_db(*args, fields=fields, **kwargs)
+        self._stored_values = self._get_tracked_values(
+            update_fields=fields, default=self._stored_values
+        )
+
+    def _get_tracked_values(self, update_fields=None, default=None):
+        """
+        Return the values of the fields tracked to detect changes of the order.
+
+        Only values loaded on the instance are read so deferred fields are not fetched
+        from the database. If `update_fields` is set, values of other fields are taken
+        from `default`.
+        """
+        values = {}
+        for name in self.TRACKED_FIELDS:
+            attname = self._meta.get_field(name).attname
+            if update_fields is None or {name, attname}.intersection(update_fields):
+                values[name] = self.__dict__.get(attname)
+            else:
+                values[name] = default[name]
+        return values
+
+    @staticmethod
+    def _get_used_seats_delta(stored_values, values):
+        """
+        Return 1 if the order starts using a seat of its offering rules, -1 if it stops
+        using it and 0 otherwise.
+        """
+        if not stored_values["state"] or not values["state"]:
+            return 0
+        was_using_seat = stored_values["state"] in enums.ORDER_STATES_USING_SEAT
+        is_using_seat = values["state"] in enums.ORDER_STATES_USING_SEAT
+        return int(is_using_seat) - int(was_using_seat)
+
+    @staticmethod
+    def _get_organization_order_count(values):
+        """
+        Return the (product, course, organization) ids for which an order with these
+        values is counted in the number of orders of the organization on the offering,
+        or None if it is not counted.
+        """
+        organization_order_count = (
+            values["product"],
+            values["course"],
+            values["organization"],
+        )
+        if values[
+            "state"
+        ] not in enums.ORDER_STATES_COUNTED_FOR_ORGANIZATION or not all(
+            organization_order_count
+        ):
+            return None
+        return organization_order_count
+
+    def _update_organization_order_count(self, stored_values, values):
+        """
+        Move the order from the counter it was stored in to the counter it belongs to
+        now, if they differ.
+        """
+        stored_organization_order_count = self._get_organization_order_count(
+            stored_values
+        )
+        organization_order_count = self._get_organization_order_count(values)
+        if organization_order_count == stored_organization_order_count:
+            return
+
+        if stored_organization_order_count is not None:
+            OfferingOrganizationOrderCount.objects.update_nb_orders(
+                -1, *stored_organization_order_count
+            )
+        if organization_order_count is not None:
+            OfferingOrganizationOrderCount.objects.update_nb_orders(
+                1, *organization_order_count
+            )
+
+    @staticmethod
+    def _get_entitled_owner_id(values):
+        """
+        Return the id of the owner an order with these values entitles to enroll to
+        its target course runs, or None if it does not allow enrollment.
+        """
+        if values["state"] not in enums.ORDER_STATE_ALLOW_ENROLLMENT:
+            return None
+        return values["owner"]
+
+    def _update_enrollment_entitlements(self, stored_values, values):
+        """
+        Refresh the enrollment entitlements of the order if it started or stopped
+        allowing enrollment, or if its owner changed meanwhile.
+        """
+        if self._get_entitled_owner_id(values) != self._get_entitled_owner_id(
+            stored_values
+        ):
+            EnrollmentEntitlement.objects.refresh(self)
 
     def get_discounted_price(self):
         """
@@ -1473,21 +1918,31 @@ class Order(BaseModel):
             | models.Q(nb_specific_course_runs=0, nb_open_course_runs=1)
         )
 
-        for course_relation in offerings_with_one_course_run:
-            open_course_run_id = (
-                course_relation.open_specific_course_run_id
-                if course_relation.nb_open_specific_course_runs == 1
-                else course_relation.open_course_run_id
+        open_course_run_ids = [
+            course_relation.open_specific_course_run_id
+            if course_relation.nb_open_specific_course_runs == 1
+            else course_relation.open_course_run_id
+            for course_relation in offerings_with_one_course_run
+        ]
+        course_runs = CourseRun.objects.select_related("course").in_bulk(
+            open_course_run_ids
+        )
+        # Validate entitlements of all the enrollments at once
+        entitlements = self.owner.enrollment_entitlements  # pylint: disable=no-member
+        entitled_course_run_ids = entitlements.get_entitled_course_run_ids(
+            course_runs.values()
+        )
+        enrollments = {
+            enrollment.course_run_id: enrollment
+            for enrollment in Enrollment.objects.filter(
+                course_run__in=open_course_run_ids, user=self.owner
             )
+        }
+
+        for open_course_run_id in open_course_run_ids:
             # The user should not be enrolled in another opened course run of the same course.
-            course_run = CourseRun.objects.get(id=open_course_run_id)
-            if course_run.can_enroll(self.owner):
-                enrollment, _ = Enrollment.objects.get_or_create(
-                    course_run_id=open_course_run_id,
-                    user=self.owner,
-                    defaults={"was_created_by_order": True, "is_active": True},
-                )
-            else:
+            course_run = course_runs[open_course_run_id]
+            if not course_run.can_enroll(self.owner):
                 raise ValidationError(
                     _(
                         f"Cannot automatically enroll the user {self.owner.id} in the course"
@@ -1495,9 +1950,34 @@ class Order(BaseModel):
                         " already an active enrollment on that course on an opened course run."
                     )
                 )
-            if not enrollment.is_active:
-                enrollment.is_active = True
-                enrollment.save()
+            is_entitled = open_course_run_id in entitled_course_run_ids
+            enrollment = enrollments.get(open_course_run_id)
+            if enrollment is None:
+                enrollment = Enrollment(
+                    course_run=course_run,
+                    user=self.owner,
+                    was_created_by_order=True,
+                    is_active=True,
+                )
+                enrollment.is_entitled = is_entitled
+                try:
+                    with transaction.atomic():
+                        enrollment.save()
+                    continue
+                except (IntegrityError, ValidationError):
+                    # As get_or_create, fall back to the enrollment created since
+                    # enrollments of the user were fetched, if any
+                    enrollment = Enrollment.objects.filter(
+                        course_run=course_run, user=self.owner
+                    ).first()
+                    if enrollment is None:
+                        raise
+
+            if enrollment.is_active:
+                continue
+            enrollment.is_active = True
+            enrollment.is_entitled = is_entitled
+            enrollment.save()
 
     def unenroll_user_from_course_runs(self):
         """
@@ -1655,10 +2135,6 @@ class Order(BaseModel):
             user=user,
             order=self.contract.order,
         )
-        context_with_images = embed_images_in_context(context)
-        file_bytes = issuers.generate_document(
-            name=contract_definition.name, context=context_with_images
-        )
 
         was_already_submitted = (
             self.contract.submitted_for_signature_on
@@ -1679,7 +2155,12 @@ class Order(BaseModel):
         # 2- the contract was submitted for signature but the user did not sign it in time
         #    before expiration of the signature workflow
         # 3- the contract context has changed since it was last submitted for signature
+        # The document is only rendered in these cases.
         if should_be_resubmitted or not was_already_submitted:
+            file_bytes = issuers.generate_document(
+                name=contract_definition.name,
+                context=embed_images_in_context(context),
+            )
             now = timezone.now()
             course_code = (
                 self.course.code
@@ -2014,6 +2495,176 @@ class OrderTargetCourseRelation(BaseModel):
         super().save(*args, **kwargs)
 
 
+class EnrollmentEntitlementManager(models.Manager):
+    """Custom manager for the EnrollmentEntitlement model."""
+
+    def build(self, order):
+        """
+        Return the unsaved enrollment entitlements an order grants in its current
+        state: one per target course run of each of its target courses, or one for
+        the whole course if the target course is not restricted to some course runs.
+        """
+        if order.state not in enums.ORDER_STATE_ALLOW_ENROLLMENT or not order.owner_id:
+            return []
+
+        relations = OrderTargetCourseRelation.objects.filter(
+            order=order
+        ).prefetch_related(
+            models.Prefetch("course_runs", queryset=CourseRun.objects.only("pk"))
+        )
+        return [
+            EnrollmentEntitlement(
+                order=order,
+                user_id=order.owner_id,
+                course_id=relation.course_id,
+                course_run=course_run,
+            )
+            for relation in relations
+            for course_run in relation.course_runs.all() or [None]
+        ]
+
+    def refresh(self, order):
+        """Replace the enrollment entitlements of an order by the ones it grants."""
+        self.filter(order=order).delete()
+        return self.bulk_create(self.build(order))
+
+    def reconcile(self, order):
+        """
+        Compute the enrollment entitlements of an order and replace the stored ones
+        if they drifted. Return True if they have been replaced.
+        """
+        entitlements = self.build(order)
+        stored_entitlements = self.filter(order=order).values_list(
+            "user_id", "course_id", "course_run_id"
+        )
+        if Counter(stored_entitlements) == Counter(
+            (entitlement.user_id, entitlement.course_id, entitlement.course_run_id)
+            for entitlement in entitlements
+        ):
+            return False
+
+        self.filter(order=order).delete()
+        self.bulk_create(entitlements)
+        return True
+
+    def get_entitled_course_run_ids(self, course_runs):
+        """
+        Return the ids of the course runs, among the ones given, to which enrollment
+        is granted by a valid order, in one query whatever the number of course runs.
+
+        Entitlements only project the target course runs of orders, the contract,
+        batch order and voucher conditions making an order valid are still checked
+        by joining them, as they change without the order being saved (e.g. when a
+        contract is signed).
+
+        It is meant to be called from the related manager of a user
+        (e.g. `user.enrollment_entitlements.get_entitled_course_run_ids(...)`).
+        """
+        course_runs = list(course_runs)
+        entitlements = self.filter(
+            (
+                models.Q(
+                    order__product__contract_definition_order__isnull=False,
+                    order__contract__student_signed_on__isnull=False,
+                )
+                | models.Q(
+                    order__product__contract_definition_order__isnull=True,
+                )
+                | models.Q(
+                    order__product__contract_definition_batch_order__isnull=False,
+                    order__batch_order__payment_method=enums.BATCH_ORDER_WITH_PURCHASE_ORDER,
+                )
+                | models.Q(
+                    order__product__contract_definition_batch_order__isnull=False,
+                    order__batch_order__contract__student_signed_on__isnull=False,
+                    order__batch_order__payment_method__in=[
+                        enums.BATCH_ORDER_WITH_CARD_PAYMENT,
+                        enums.BATCH_ORDER_WITH_BANK_TRANSFER,
+                    ],
+                )
+                | models.Q(
+                    order__product__contract_definition_order__isnull=False,
+                    order__voucher__discount__rate=1,
+                    order__batch_order__isnull=True,
+                )
+            ),
+            course__in={course_run.course_id for course_run in course_runs},
+            order__state__in=enums.ORDER_STATE_ALLOW_ENROLLMENT,
+        ).values_list("course_id", "course_run_id")
+
+        entitled_course_ids = set()
+        entitled_course_run_ids = set()
+        for course_id, course_run_id in entitlements:
+            if course_run_id is None:
+                entitled_course_ids.add(course_id)
+            else:
+                entitled_course_run_ids.add(course_run_id)
+
+        return {
+            course_run.pk
+            for course_run in course_runs
+            if course_run.course_id in entitled_course_ids
+            or course_run.pk in entitled_course_run_ids
+        }
+
+
+class EnrollmentEntitlement(BaseModel):
+    """
+    EnrollmentEntitlement stores the course runs to which an order allowing enrollment
+    entitles its owner to enroll, so enrollments are validated without going through
+    the target courses and course runs of all the orders of the user.
+
+    Entitlements of an order are refreshed each time it starts or stops allowing
+    enrollment and each time its target courses or target course runs change.
+    """
+
+    order = models.ForeignKey(
+        to=Order,
+        verbose_name=_("order"),
+        related_name="enrollment_entitlements",
+        on_delete=models.CASCADE,
+    )
+    user = models.ForeignKey(
+        to=User,
+        verbose_name=_("user"),
+        related_name="enrollment_entitlements",
+        on_delete=models.CASCADE,
+    )
+    course = models.ForeignKey(
+        to=Course,
+        verbose_name=_("course"),
+        related_name="enrollment_entitlements",
+        on_delete=models.CASCADE,
+    )
+    course_run = models.ForeignKey(
+        to=CourseRun,
+        verbose_name=_("course run"),
+        help_text=_("Leave empty if all the course runs of the course are entitled."),
+        related_name="enrollment_entitlements",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+    )
+
+    objects = EnrollmentEntitlementManager()
+
+    class Meta:
+        db_table = "joanie_enrollment_entitlement"
+        verbose_name = _("Enrollment entitlement")
+        verbose_name_plural = _("Enrollment entitlements")
+        indexes = [
+            models.Index(
+                fields=["user", "course"],
+                name="enrollment_entitlement_idx",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.user} entitled to {self.course_run or self.course} by {self.order}"
+        )
+
+
 class BatchOrderAvailableActions(TypedDict):
     """
     Type for the available actions for a batch order.
@@ -2038,6 +2689,7 @@ class BatchOrder(BaseModel):
         verbose_name = _("batch order")
         verbose_name_plural = _("batch orders")
         ordering = ["-created_on"]
+        indexes = [trigram_index("company_name", "batch_order_company_trgm_idx")]
         constraints = [
             models.CheckConstraint(
                 check=models.Q(
@@ -2429,10 +3081,6 @@ class BatchOrder(BaseModel):
             contract_definition=contract_definition,
             batch_order=self,
         )
-        context_with_images = embed_images_in_context(context)
-        file_bytes = issuers.generate_document(
-            name=contract_definition.name, context=context_with_images
-        )
 
         was_already_submitted = (
             self.contract.submitted_for_signature_on
@@ -2451,6 +3099,10 @@ class BatchOrder(BaseModel):
             )
 
         if should_be_resubmitted or not was_already_submitted:
+            file_bytes = issuers.generate_document(
+                name=contract_definition.name,
+                context=embed_images_in_context(context),
+            )
             now = timezone.now()
             reference, checksum = backend_signature.submit_for_signature(
                 title=f"{now.strftime('%Y-%m-%d')}_{self.relation.course.code}_{self.pk}",
@@ -2995,11 +3647,14 @@ class Voucher(BaseModel):
     by a user to get a discount or access to a product.
     """
 
+    search_fields = ["code"]
+
     class Meta:
         db_table = "joanie_voucher"
         verbose_name = _("Voucher")
         verbose_name_plural = _("Vouchers")
         ordering = ["created_on"]
+        indexes = [trigram_index("code", "voucher_code_trgm_idx")]
 
     code = models.CharField(
         _("code"),
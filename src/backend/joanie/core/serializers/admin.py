@@ -2,9 +2,11 @@
 # pylint: disable=too-many-lines
 """Admin serializers for Joanie Core app."""
 
+import uuid
 from decimal import Decimal as D
 
 from django.conf import settings
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
 import waffle
@@ -21,6 +23,11 @@ from joanie.core.serializers.fields import (
 )
 from joanie.core.utils import get_default_currency_symbol
 from joanie.core.utils.batch_order import get_active_offering_rule
+from joanie.core.utils.catalog_synchronization import (
+    record_changes,
+    record_course_runs_changes,
+)
+from joanie.core.utils.offering import get_serialized_course_runs
 from joanie.core.utils.order import get_course_run_session
 from joanie.core.utils.organization import get_least_active_organization
 from joanie.payment import models as payment_models
@@ -607,6 +614,76 @@ class AdminOfferingRuleCreateSerializer(AdminOfferingRuleUpdateSerializer):
 
         return super().create(validated_data)
 
+    def bulk_prepare(self, validated_data, initial_data):
+        """
+        Attach discounts to offering rules written in bulk with a single query and
+        give new offering rules the next positions of their offering.
+        """
+        is_update = self.parent.instance is not None
+        discount_ids = set()
+        for initial_item in initial_data:
+            try:
+                discount_ids.add(uuid.UUID(str(initial_item.get("discount_id"))))
+            except ValueError:
+                continue
+        discounts = models.Discount.objects.in_bulk(discount_ids)
+
+        errors = [{} for _item in validated_data]
+        for index, (item, initial_item) in enumerate(
+            zip(validated_data, initial_data, strict=True)
+        ):
+            if discount_id := initial_item.get("discount_id"):
+                try:
+                    item["discount"] = discounts[uuid.UUID(str(discount_id))]
+                except (KeyError, ValueError):
+                    errors[index]["discount_id"] = [
+                        _("Resource %s does not exist.") % discount_id
+                    ]
+            elif is_update:
+                item["discount"] = None
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        if is_update:
+            return
+
+        positions = dict(
+            models.OfferingRule.objects.filter(
+                course_product_relation__in={
+                    item["course_product_relation"] for item in validated_data
+                }
+            )
+            .values_list("course_product_relation")
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+        for item in validated_data:
+            offering_id = item["course_product_relation"].pk
+            item["position"] = positions.get(offering_id, 0)
+            positions[offering_id] = item["position"] + 1
+
+    def bulk_post_save(self, instances):
+        """
+        Record course runs of the offerings of offering rules written in bulk to be
+        synchronized all together once the transaction is committed.
+        """
+        offerings = {
+            instance.course_product_relation_id: instance.course_product_relation
+            for instance in instances
+        }
+        serialized_course_runs = []
+        for offering in offerings.values():
+            visibility = None
+            if offering.product.type == enums.PRODUCT_TYPE_CREDENTIAL:
+                visibility = enums.COURSE_AND_SEARCH
+            serialized_course_runs.extend(
+                get_serialized_course_runs(offering, visibility=visibility) or []
+            )
+            offering.clear_cache()
+
+        if serialized_course_runs:
+            record_changes(serialized_course_runs=serialized_course_runs)
+
 
 class AdminCourseNestedSerializer(serializers.ModelSerializer):
     """Serializer for Course model nested in product."""
@@ -930,6 +1007,13 @@ class AdminCourseRunSerializer(AdminCourseRunLightSerializer):
 
         return validated_data
 
+    def bulk_post_save(self, instances):
+        """
+        Invalidate what depends on course runs created or updated in bulk, then record
+        them to be synchronized all together once the transaction is committed.
+        """
+        record_course_runs_changes(instances)
+
 
 class AdminTargetCourseSerializer(serializers.ModelSerializer):
     """
@@ -2,46 +2,149 @@
 
 import csv
 import logging
+import uuid
+from collections import defaultdict
 
 from django.conf import settings
-from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
+from parler.models import TranslatableModel
 from rest_framework import serializers
+from rest_framework.serializers import (
+    LIST_SERIALIZER_KWARGS,
+    LIST_SERIALIZER_KWARGS_REMOVE,
+)
+from rest_framework.validators import UniqueValidator
 
 from joanie.core.utils import Echo
+from joanie.core.utils.cache import two_tier_cache
 
 logger = logging.getLogger(__name__)
 
 
+class CachedListSerializer(serializers.ListSerializer):
+    """
+    A ListSerializer that fetches the cached representations of all the items of
+    the list at once and only serializes the items missing from the cache.
+    """
+
+    def to_representation(self, data):
+        """
+        Retrieve cached representations of the items with a single cache call then
+        serialize and cache the missing ones with another single cache call.
+        """
+        iterable = list(
+            data.all() if isinstance(data, models.manager.BaseManager) else data
+        )
+        cache_keys = [self.child.get_cache_key(instance) for instance in iterable]
+        cached_representations = two_tier_cache.get_many(cache_keys)
+
+        representations = []
+        missing_representations = {}
+        for cache_key, instance in zip(cache_keys, iterable, strict=True):
+            representation = cached_representations.get(cache_key)
+            if representation is None:
+                representation = self.child.to_uncached_representation(instance)
+                missing_representations[cache_key] = representation
+            representations.append(representation)
+
+        cache_ttl = self.child.get_cache_ttl()
+        if missing_representations:
+            two_tier_cache.set_many(missing_representations, cache_ttl)
+
+        logger.debug(
+            "Cache hits for %s: %s/%s (cache_ttl=%s)",
+            self.child.__class__.__name__,
+            len(representations) - len(missing_representations),
+            len(representations),
+            cache_ttl,
+        )
+
+        return representations
+
+    def update(self, instance, validated_data):
+        """
+        Only there to avoid a NotImplementedError.
+        """
+        return instance
+
+
 class CachedModelSerializer(serializers.ModelSerializer):
     """
     A ModelSerializer that caches the serialized data.
+
+    Unless another `list_serializer_class` is declared in its Meta, lists are
+    serialized with a CachedListSerializer.
     """
 
-    def to_representation(self, instance):
+    @classmethod
+    def many_init(cls, *args, **kwargs):
         """
-        Cache the serializer representation for the current instance.
+        Use a CachedListSerializer to serialize lists by default.
         """
-        cache_key = instance.get_cache_key(
+        if hasattr(getattr(cls, "Meta", None), "list_serializer_class"):
+            return super().many_init(*args, **kwargs)
+
+        list_kwargs = {}
+        for key in LIST_SERIALIZER_KWARGS_REMOVE:
+            value = kwargs.pop(key, None)
+            if value is not None:
+                list_kwargs[key] = value
+        list_kwargs["child"] = cls(*args, **kwargs)
+        list_kwargs.update(
+            {
+                key: value
+                for key, value in kwargs.items()
+                if key in LIST_SERIALIZER_KWARGS
+            }
+        )
+        return CachedListSerializer(*args, **list_kwargs)
+
+    def get_cache_key(self, instance):
+        """
+        Return the cache key of the representation of the instance.
+        """
+        return instance.get_cache_key(
             is_language_sensitive=True,
             prefix=self.__class__.__name__,
         )
-        representation = cache.get(cache_key)
+
+    def get_cache_ttl(self):
+        """
+        Return the lifetime of cached representations.
+        """
+        return getattr(
+            self.Meta,  # pylint: disable=no-member
+            "cache_ttl",
+            settings.JOANIE_SERIALIZER_DEFAULT_CACHE_TTL,
+        )
+
+    def to_uncached_representation(self, instance):
+        """
+        Serialize the instance without looking into the cache.
+        """
+        return super().to_representation(instance)
+
+    def to_representation(self, instance):
+        """
+        Cache the serializer representation for the current instance.
+        """
+        cache_key = self.get_cache_key(instance)
+        representation = two_tier_cache.get(cache_key)
 
         if representation is None:
-            representation = super().to_representation(instance)
-            cache_ttl = getattr(
-                self.Meta,  # pylint: disable=no-member
-                "cache_ttl",
-                settings.JOANIE_SERIALIZER_DEFAULT_CACHE_TTL,
-            )
+            representation = self.to_uncached_representation(instance)
+            cache_ttl = self.get_cache_ttl()
             logger.debug(
                 "Setting cache for %s: %s (cache_ttl=%s)",
                 self.__class__.__name__,
                 cache_key,
                 cache_ttl,
             )
-            cache.set(cache_key, representation, cache_ttl)
+            two_tier_cache.set(cache_key, representation, cache_ttl)
         else:
             logger.debug(
                 "Cache hit for %s: %s (cache_ttl=%s)",
@@ -93,3 +196,227 @@ class CSVExportListSerializer(serializers.ListSerializer):
         for obj in self.instance:
             row = self.child.to_representation(obj)
             yield writer.writerow(row.values())
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    A ListSerializer to create or update many instances in a single request.
+
+    Items are validated one by one, except for the uniqueness of their fields which
+    is checked with a single query per unique field for the whole list. Instances are
+    then cleaned and written with a query per table. As no signal is sent for them,
+    the child serializer can implement:
+    - `bulk_prepare(validated_data, initial_data)` to complete the validated data of
+      all items at once before instances are built or updated,
+    - `bulk_post_save(instances)` to run the side effects of saving instances once
+      for all of them.
+
+    To update instances, the serializer must be instantiated with the queryset of
+    the instances that can be updated and each item must provide the id of its
+    instance. Instances of all items are fetched at once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.instances_by_id = None
+        self.validated_instances = []
+
+    @property
+    def model(self):
+        """Return the model of the child serializer."""
+        return self.child.Meta.model
+
+    def to_internal_value(self, data):
+        """
+        Remove unique validators of the child fields, the uniqueness of all items
+        being checked at once after they are validated.
+
+        Errors are raised from here rather than from `validate`, so they are reported
+        per item instead of being wrapped into non field errors.
+        """
+        self.instances_by_id = None
+        self.validated_instances = []
+        for field in self.child.fields.values():
+            field.validators = [
+                validator
+                for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        return self.validate_unique_fields(super().to_internal_value(data))
+
+    def get_instances_by_id(self):
+        """
+        Fetch the instances updated by the items at once, items of which the id is
+        invalid being reported when they are validated.
+        """
+        instance_ids = []
+        for item in self.initial_data:
+            try:
+                instance_ids.append(uuid.UUID(str(item["id"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return {
+            str(instance.pk): instance
+            for instance in self.instance.filter(pk__in=instance_ids)
+        }
+
+    def run_child_validation(self, data):
+        """Validate an item against the instance it updates, if any."""
+        instance = None
+        # Items which are not dictionaries are rejected by the child serializer
+        if self.instance is not None and isinstance(data, dict):
+            try:
+                instance_id = serializers.UUIDField().run_validation(
+                    data.get("id", serializers.empty)
+                )
+            except serializers.ValidationError as error:
+                raise serializers.ValidationError({"id": error.detail}) from error
+
+            if self.instances_by_id is None:
+                self.instances_by_id = self.get_instances_by_id()
+            # Pop the instance so it can not be updated twice
+            instance = self.instances_by_id.pop(str(instance_id), None)
+            if instance is None:
+                raise serializers.ValidationError(
+                    {"id": [_("A single item is expected for each resource.")]}
+                )
+
+        self.child.instance = instance
+        self.child.initial_data = data
+        validated_data = super().run_child_validation(data)
+        self.validated_instances.append(instance)
+        return validated_data
+
+    def validate_unique_fields(self, attrs):
+        """
+        Check that values of unique fields are neither duplicated among items nor
+        already used by other instances.
+        """
+        errors = [{} for _item in attrs]
+        for field in self.model._meta.fields:  # noqa: SLF001
+            if not field.unique or field.primary_key:
+                continue
+
+            indexes = defaultdict(list)
+            for index, item in enumerate(attrs):
+                if item.get(field.name) is not None:
+                    indexes[item[field.name]].append(index)
+            if not indexes:
+                continue
+
+            owners = dict(
+                self.model.objects.filter(**{f"{field.name}__in": indexes}).values_list(
+                    field.name, "pk"
+                )
+            )
+            message = _("%(model)s with this %(field)s already exists.") % {
+                "model": self.model._meta.verbose_name,  # noqa: SLF001
+                "field": field.verbose_name,
+            }
+            for value, value_indexes in indexes.items():
+                owner = owners.get(value)
+                for index in value_indexes:
+                    instance = self.validated_instances[index]
+                    if len(value_indexes) > 1 or (
+                        owner is not None and (instance is None or owner != instance.pk)
+                    ):
+                        errors[index][field.name] = [message]
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return attrs
+
+    def clean_instances(self, instances):
+        """
+        Clean all the instances, related instances already fetched during validation
+        being not looked up again.
+        """
+        errors = []
+        for instance in instances:
+            try:
+                instance.full_clean(
+                    exclude=[
+                        field.name
+                        for field in self.model._meta.concrete_fields  # noqa: SLF001
+                        if field.is_relation and field.is_cached(instance)
+                    ],
+                    validate_unique=False,
+                )
+            except DjangoValidationError as error:
+                errors.append(error.message_dict)
+            else:
+                errors.append({})
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+    def get_translated_instances(self, instances, validated_data):
+        """Return the instances of which translated fields are given."""
+        if not issubclass(self.model, TranslatableModel):
+            return []
+
+        # pylint: disable=protected-access
+        translated_fields = set(
+            self.model._parler_meta.get_translated_fields()  # noqa: SLF001
+        )
+        return [
+            instance
+            for instance, item in zip(instances, validated_data, strict=True)
+            if translated_fields.intersection(item)
+        ]
+
+    def create(self, validated_data):
+        """Create all the instances and their translations at once."""
+        if hasattr(self.child, "bulk_prepare"):
+            self.child.bulk_prepare(validated_data, self.initial_data)
+
+        instances = [self.model(**item) for item in validated_data]
+        self.clean_instances(instances)
+        self.model.objects.bulk_create(instances)
+
+        translations = []
+        for instance in self.get_translated_instances(instances, validated_data):
+            translation = instance.get_translation(instance.get_current_language())
+            translation.master = instance
+            translations.append(translation)
+        if translations:
+            type(translations[0]).objects.bulk_create(translations)
+
+        if hasattr(self.child, "bulk_post_save"):
+            self.child.bulk_post_save(instances)
+
+        return instances
+
+    def update(self, instance, validated_data):
+        """Update all the instances at once, only writing the given fields."""
+        if hasattr(self.child, "bulk_prepare"):
+            self.child.bulk_prepare(validated_data, self.initial_data)
+
+        instances = self.validated_instances
+        concrete_fields = {
+            field.name
+            for field in self.model._meta.concrete_fields  # noqa: SLF001
+            if not field.primary_key
+        }
+        update_fields = {"updated_on"}
+        now = timezone.now()
+        for item_instance, item in zip(instances, validated_data, strict=True):
+            for attr, value in item.items():
+                setattr(item_instance, attr, value)
+            update_fields.update(concrete_fields.intersection(item))
+            item_instance.updated_on = now
+
+        self.clean_instances(instances)
+        self.model.objects.bulk_update(instances, list(update_fields))
+
+        # Translations are saved through parler to keep its cache up to date
+        for translated_instance in self.get_translated_instances(
+            instances, validated_data
+        ):
+            translated_instance.save_translations()
+
+        if hasattr(self.child, "bulk_post_save"):
+            self.child.bulk_post_save(instances)
+
+        return instances
@@ -1502,6 +1502,8 @@ class OrderSerializer(serializers.ModelSerializer):
             filters.update({"organizations": organization_id})
         offering = models.CourseProductRelation.objects.get(**filters)
 
+        # Seats are reserved when the order is assigned, it is then rejected if an
+        # offering rule has no seat left in the meantime
         offering_rules = models.OfferingRule.objects.find_actives(
             offering_id=offering.id
         )
@@ -1521,14 +1523,9 @@ class OrderSerializer(serializers.ModelSerializer):
                     validated_data["offering_rules"].append(offering_rule)
 
         if seats_limitation and not seats_limitation.discount:
-            raise serializers.ValidationError(
-                {
-                    "offering_rule": [
-                        "Maximum number of orders reached for "
-                        f"product {validated_data['product'].title:s}"
-                    ]
-                }
-            )
+            # Link the order to the offering rule with no seat left so the seat
+            # reservation rejects it, unless a seat has been released meanwhile
+            validated_data.setdefault("offering_rules", []).append(seats_limitation)
 
         return super().create(validated_data)
 
@@ -4,16 +4,116 @@ Helpers that can be useful throughout Joanie's core app
 
 import logging
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db.models.signals import post_delete
 
 from joanie.core import enums, models
 from joanie.core.utils import webhooks
+from joanie.core.utils.catalog_synchronization import record_changes
 from joanie.core.utils.offering import get_serialized_course_runs
 from joanie.core.utils.product import synchronize_product_course_runs
 
 logger = logging.getLogger(__name__)
 
 
+def is_synchronization_debounced():
+    """
+    Return True if catalog changes should be recorded and synchronized once the
+    current transaction is committed instead of right away.
+    """
+    return settings.JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE
+
+
+def synchronize_serialized_course_runs(serialized_course_runs):
+    """
+    Synchronize course runs serialized before a change, right away or with the
+    pending debounced synchronization.
+    """
+    logger.debug("[SYNC] %s", serialized_course_runs)
+    if is_synchronization_debounced():
+        record_changes(serialized_course_runs=serialized_course_runs)
+    else:
+        webhooks.synchronize_course_runs(serialized_course_runs)
+
+
+def record_target_course_runs_changes(action, instance, pk_set):
+    """
+    Record products to synchronize when course runs of a product / target course
+    relation changed.
+    """
+    if isinstance(instance, models.ProductTargetCourseRelation):
+        product_ids = [instance.product_id]
+    elif action in ["post_add", "post_remove"]:
+        product_ids = models.Product.objects.filter(
+            target_course_relations__in=pk_set
+        ).values_list("pk", flat=True)
+    else:
+        product_ids = models.Product.objects.filter(
+            target_courses__course_runs=instance
+        ).values_list("pk", flat=True)
+    record_changes(product_ids=product_ids)
+
+
+def on_change_product_equivalent_course_run(instance, signal, **kwargs):
+    """
+    Compute again the equivalent course run stored for products targeting the course
+    run or the product / target course relation being saved or deleted.
+    """
+    if isinstance(instance, models.CourseRun):
+        products = models.Product.objects.filter(target_courses=instance.course_id)
+    else:
+        products = models.Product.objects.filter(pk=instance.product_id)
+
+    # The product itself may be being deleted and course runs are saved many times in
+    # a row (e.g. when synchronized from the LMS), equivalent course runs are then
+    # computed again once the transaction is committed
+    if signal == post_delete or isinstance(instance, models.CourseRun):
+        models.ProductEquivalentCourseRun.objects.invalidate(products)
+    else:
+        models.ProductEquivalentCourseRun.objects.refresh_products(products)
+
+
+def on_change_product_equivalent_course_run_relations(
+    action, instance, pk_set, **kwargs
+):
+    """
+    Compute again the equivalent course run stored for products of which target
+    courses or target course runs are changed.
+    """
+    if action not in ["post_add", "post_remove", "pre_clear", "post_clear"]:
+        return
+
+    if action == "pre_clear":
+        # Relations are already deleted on post clear so products losing the relations
+        # of a course or a course run are found now and their equivalent course run is
+        # computed again once the transaction is committed
+        if isinstance(instance, models.Course):
+            models.ProductEquivalentCourseRun.objects.invalidate(
+                models.Product.objects.filter(target_courses=instance)
+            )
+        elif isinstance(instance, models.CourseRun):
+            models.ProductEquivalentCourseRun.objects.invalidate(
+                models.Product.objects.filter(
+                    target_course_relations__course_runs=instance
+                )
+            )
+        return
+
+    if isinstance(instance, models.Product):
+        products = models.Product.objects.filter(pk=instance.pk)
+    elif isinstance(instance, models.ProductTargetCourseRelation):
+        products = models.Product.objects.filter(pk=instance.product_id)
+    elif action == "post_clear":
+        return
+    elif isinstance(instance, models.Course):
+        products = models.Product.objects.filter(pk__in=pk_set)
+    else:
+        products = models.Product.objects.filter(target_course_relations__in=pk_set)
+
+    models.ProductEquivalentCourseRun.objects.refresh_products(products)
+
+
 def on_change_course_runs_to_product_target_course_relation(
     action, instance, pk_set, **kwargs
 ):
@@ -52,6 +152,11 @@ def on_change_course_runs_to_product_target_course_relation(
                 )
 
     # Webhooks synchronization
+    elif action in ["post_add", "post_remove", "post_clear"] and (
+        is_synchronization_debounced()
+    ):
+        record_target_course_runs_changes(action, instance, pk_set)
+
     elif action in ["post_add", "post_remove", "post_clear"]:
         if isinstance(instance, models.ProductTargetCourseRelation):
             serialized_course_runs = (
@@ -85,11 +190,17 @@ def on_change_course_runs_to_product_target_course_relation(
 
 def on_save_course_run(instance, **kwargs):
     """Synchronize the course run and products related to the course run being saved."""
+    if is_synchronization_debounced():
+        record_changes(course_run_ids=[instance.pk])
+        for offering in instance.course.offerings.all():
+            offering.clear_cache()
+        return
+
     # Synchronize the course run itself
     if products := instance.course.products.all():
-        serialized_course_runs = [
-            instance.get_serialized(product=product) for product in products
-        ]
+        serialized_course_runs = models.CourseRun.get_serialized_bulk(
+            [(instance, product) for product in products]
+        )
     else:
         logger.debug("[SYNC] No products linked to this course run")
         serialized_course_runs = [instance.get_serialized()]
@@ -109,6 +220,11 @@ def on_save_product_target_course_relation(instance, **kwargs):
     """
     Synchronize products related to the product target course relation being saved.
     """
+    if is_synchronization_debounced():
+        record_changes(product_ids=[instance.product_id])
+        instance.clear_cache()
+        return
+
     serialized_course_runs = (
         models.Product.get_equivalent_serialized_course_runs_for_products(
             [instance.product]
@@ -123,6 +239,21 @@ def on_save_product_target_course_relation(instance, **kwargs):
 # ruff: noqa: PLR0912
 def on_change_offering(action, instance, pk_set, **kwargs):
     """Synchronize products related to the course/product offering being changed."""
+    if action == "post_add" and is_synchronization_debounced():
+        if isinstance(instance, models.Course):
+            # Products are only synchronized for the course they are added to
+            record_changes(
+                offering_ids=models.CourseProductRelation.objects.filter(
+                    course=instance, product__in=pk_set
+                ).values_list("pk", flat=True)
+            )
+        elif isinstance(instance, models.Product):
+            record_changes(product_ids=[instance.pk])
+        else:
+            return
+        instance.clear_cache()
+        return
+
     if isinstance(instance, models.Course):
         if action == "post_add":
             serialized_course_runs = (
@@ -199,8 +330,7 @@ def on_change_offering(action, instance, pk_set, **kwargs):
     else:
         return
 
-    logger.debug("[SYNC] %s", serialized_course_runs)
-    webhooks.synchronize_course_runs(serialized_course_runs)
+    synchronize_serialized_course_runs(serialized_course_runs)
     instance.clear_cache()
 
 
@@ -220,6 +350,112 @@ def on_save_offering_rule(instance: models.OfferingRule, **kwargs):
         instance.offering.clear_cache()
 
 
+def on_save_order_target_course_relation(instance, **kwargs):
+    """
+    Refresh the enrollment entitlements of the order of the target course relation
+    being saved if the order allows enrollment.
+    """
+    if instance.order.state in enums.ORDER_STATE_ALLOW_ENROLLMENT:
+        models.EnrollmentEntitlement.objects.refresh(instance.order)
+
+
+def on_delete_order_target_course_relation(instance, **kwargs):
+    """
+    Remove the enrollment entitlements granted by the target course relation being
+    deleted.
+    """
+    models.EnrollmentEntitlement.objects.filter(
+        order_id=instance.order_id, course_id=instance.course_id
+    ).delete()
+
+
+def on_change_order_enrollment_entitlements(action, instance, pk_set, **kwargs):
+    """
+    Refresh the enrollment entitlements of orders allowing enrollment of which target
+    courses or target course runs are changed.
+
+    Orders are not known anymore once target courses or target course runs are cleared
+    from the side of a course or a course run, their entitlements can be reconciled
+    with the `reconcile_enrollment_entitlements` command.
+    """
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+
+    if isinstance(instance, models.Order):
+        orders = [instance]
+    elif isinstance(instance, models.OrderTargetCourseRelation):
+        orders = [instance.order]
+    elif action == "post_clear":
+        return
+    elif isinstance(instance, models.Course):
+        orders = models.Order.objects.filter(pk__in=pk_set)
+    else:
+        orders = models.Order.objects.filter(offerings__in=pk_set).distinct()
+
+    for order in orders:
+        if order.state in enums.ORDER_STATE_ALLOW_ENROLLMENT:
+            models.EnrollmentEntitlement.objects.refresh(order)
+
+
+def on_change_order_offering_rules(action, instance, pk_set, **kwargs):
+    """
+    Update the number of used seats of offering rules when orders using a seat are
+    linked to or unlinked from them. Orders can not be linked to offering rules
+    without enough seats left.
+    """
+    if action not in ["post_add", "post_remove", "pre_clear"] or (
+        action != "pre_clear" and not pk_set
+    ):
+        return
+
+    # Instance can be an `Order` or an `OfferingRule` according to the side of the
+    # relation from which orders and offering rules are linked.
+    if isinstance(instance, models.Order):
+        if instance.state not in enums.ORDER_STATES_USING_SEAT:
+            return
+        nb_seats = 1
+        filters = {"orders": instance} if action == "pre_clear" else {"pk__in": pk_set}
+    else:
+        orders = models.Order.objects.filter(state__in=enums.ORDER_STATES_USING_SEAT)
+        if action == "pre_clear":
+            orders = orders.filter(offering_rules=instance)
+        else:
+            orders = orders.filter(pk__in=pk_set)
+        nb_seats = orders.count()
+        if not nb_seats:
+            return
+        filters = {"pk": instance.pk}
+
+    if action != "post_add":
+        models.OfferingRule.objects.release_seats(nb_seats, **filters)
+    elif not models.OfferingRule.objects.reserve_seats(nb_seats, **filters):
+        raise ValidationError(
+            {
+                "offering_rule": [
+                    "Not enough seats left on the offering rule for these orders."
+                ]
+            }
+        )
+
+
+def on_delete_order(instance, **kwargs):
+    """
+    Release the seat used by the order being deleted on its offering rules and
+    the order being counted on the order count of its organization.
+    """
+    if instance.state in enums.ORDER_STATES_USING_SEAT:
+        models.OfferingRule.objects.release_seats(orders=instance)
+
+    if (
+        instance.state in enums.ORDER_STATES_COUNTED_FOR_ORGANIZATION
+        and instance.course_id
+        and instance.organization_id
+    ):
+        models.OfferingOrganizationOrderCount.objects.update_nb_orders(
+            -1, instance.product_id, instance.course_id, instance.organization_id
+        )
+
+
 def on_save_product(instance, created, **kwargs):
     """
     Synchronize product or all ongoing and future course runs
@@ -231,6 +467,9 @@ def on_save_product(instance, created, **kwargs):
         return
 
     logger.debug("[SYNC] %s", instance)
-    synchronize_product_course_runs(instance)
+    if is_synchronization_debounced():
+        record_changes(product_ids=[instance.pk])
+    else:
+        synchronize_product_course_runs(instance)
     for offering in instance.offerings.all():
         offering.clear_cache()
@@ -9,6 +9,7 @@ from joanie.celery_app import app
 from joanie.core import helpers
 from joanie.core.utils.contract import update_signatories_for_contracts
 
+from .order_side_effects import *  # pylint: disable=unused-wildcard-import
 from .payment_schedule import *  # pylint: disable=unused-wildcard-import
 
 logger = getLogger(__name__)
@@ -0,0 +1,227 @@
+"""Celery tasks executing side effects of order transitions"""
+
+from logging import getLogger
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from sentry_sdk import capture_exception
+
+from joanie.celery_app import app
+from joanie.core import enums
+from joanie.core.utils.payment_schedule import is_installment_to_debit
+from joanie.payment import get_payment_backend
+from joanie.payment.backends.base import BasePaymentBackend
+
+logger = getLogger(__name__)
+
+
+def _send_subscription_confirmation(order, idempotency_key=None):  # pylint: disable=unused-argument
+    """Send an email to the owner of the order to confirm their subscription."""
+    # pylint: disable=protected-access
+    # ruff : noqa : SLF001
+    BasePaymentBackend._send_mail_subscription_success(order=order)
+
+
+def _debit_installment(order, installment_id, idempotency_key=None):
+    """
+    Debit the installment if it is still to be debited. The idempotency key is passed
+    to the payment provider so that the installment is not charged twice if the side
+    effect is executed again after the charge has been accepted.
+    """
+    installment = next(
+        (
+            installment
+            for installment in order.payment_schedule
+            if str(installment["id"]) == str(installment_id)
+        ),
+        None,
+    )
+    if (
+        installment is None
+        or not is_installment_to_debit(installment)
+        or not order.credit_card
+        or not order.credit_card.token
+    ):
+        return
+
+    payment_backend = get_payment_backend()
+    payment_backend.create_zero_click_payment(
+        order=order,
+        credit_card_token=order.credit_card.token,
+        installment=installment,
+        idempotency_key=idempotency_key,
+    )
+
+
+def _set_enrollments(order, idempotency_key=None):  # pylint: disable=unused-argument
+    """Set the active enrollments targeted by the order to the LMS."""
+    for enrollment in order.get_target_enrollments(is_active=True).select_related(
+        "course_run", "user"
+    ):
+        enrollment.set()
+
+
+def _enroll_user(order, idempotency_key=None):  # pylint: disable=unused-argument
+    """
+    Enroll the owner of the order to the course runs opened for enrollment. A failing
+    enrollment is only reported, it must not fail the side effect.
+    """
+    try:
+        order.enroll_user_to_course_run()
+    except Exception as error:  # noqa: BLE001 pylint: disable=broad-exception-caught
+        capture_exception(error)
+
+
+def _unenroll_user(order, idempotency_key=None):  # pylint: disable=unused-argument
+    """Unenroll the owner of the order from the course runs targeted by the order."""
+    order.unenroll_user_from_course_runs()
+
+
+def _delete_credit_card(order, credit_card_id, idempotency_key=None):  # pylint: disable=unused-argument
+    """Delete the credit card, and its token on the payment provider, if unused."""
+    CreditCard = apps.get_model("payment", "CreditCard")  # pylint: disable=invalid-name
+    credit_card = CreditCard.objects.filter(
+        pk=credit_card_id, orders__isnull=True
+    ).first()
+    if credit_card:
+        credit_card.delete()
+
+
+# Side effects are called with the order, the payload they were recorded with and,
+# when executed from the outbox, their idempotency key
+ORDER_SIDE_EFFECTS = {
+    enums.ORDER_SIDE_EFFECT_SEND_SUBSCRIPTION_CONFIRMATION: (
+        _send_subscription_confirmation
+    ),
+    enums.ORDER_SIDE_EFFECT_DEBIT_INSTALLMENT: _debit_installment,
+    enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS: _set_enrollments,
+    enums.ORDER_SIDE_EFFECT_ENROLL_USER: _enroll_user,
+    enums.ORDER_SIDE_EFFECT_UNENROLL_USER: _unenroll_user,
+    enums.ORDER_SIDE_EFFECT_DELETE_CREDIT_CARD: _delete_credit_card,
+}
+
+
+def _claim_order_side_effect(side_effect_id):
+    """
+    Mark the side effect as in progress and count the attempt, in a transaction of its
+    own, if it is still pending and not locked by another worker. Return the side
+    effect claimed or None.
+    """
+    OrderSideEffect = apps.get_model("core", "OrderSideEffect")  # pylint: disable=invalid-name
+    with transaction.atomic():
+        side_effect = (
+            OrderSideEffect.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("order")
+            .filter(pk=side_effect_id, state=enums.ORDER_SIDE_EFFECT_STATE_PENDING)
+            .first()
+        )
+        if side_effect is None:
+            return None
+
+        side_effect.state = enums.ORDER_SIDE_EFFECT_STATE_IN_PROGRESS
+        side_effect.attempts += 1
+        side_effect.save(update_fields=["state", "attempts", "updated_on"])
+    return side_effect
+
+
+@app.task(bind=True)
+def execute_order_side_effects(self, order_id):
+    """
+    Execute pending side effects of the order in the order they were recorded.
+
+    Each side effect is claimed, i.e. marked as in progress with its attempt counted,
+    and this is committed before it is executed, so no transaction is held open while
+    calling the payment provider, the LMS or the mail server. A worker which finds a
+    side effect claimed or executed by another one leaves the following ones to it.
+    When a side effect fails, the following ones are not executed and the task is
+    retried with an exponential backoff. After the maximum number of attempts, the side
+    effect is marked as failed and the following ones are executed.
+    """
+    OrderSideEffect = apps.get_model("core", "OrderSideEffect")  # pylint: disable=invalid-name
+    side_effect_ids = OrderSideEffect.objects.filter(
+        order_id=order_id,
+        state__in=[
+            enums.ORDER_SIDE_EFFECT_STATE_PENDING,
+            enums.ORDER_SIDE_EFFECT_STATE_IN_PROGRESS,
+        ],
+    ).values_list("pk", flat=True)
+
+    for side_effect_id in side_effect_ids:
+        side_effect = _claim_order_side_effect(side_effect_id)
+        if side_effect is None:
+            # Another worker is executing the side effects of the order
+            break
+
+        try:
+            ORDER_SIDE_EFFECTS[side_effect.effect](
+                side_effect.order,
+                idempotency_key=side_effect.idempotency_key,
+                **side_effect.payload,
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            is_failed = (
+                side_effect.attempts >= settings.JOANIE_ORDER_SIDE_EFFECTS_MAX_ATTEMPTS
+            )
+            side_effect.state = (
+                enums.ORDER_SIDE_EFFECT_STATE_FAILED
+                if is_failed
+                else enums.ORDER_SIDE_EFFECT_STATE_PENDING
+            )
+            side_effect.last_error = repr(error)
+            side_effect.save(update_fields=["state", "last_error", "updated_on"])
+            if is_failed:
+                logger.error(
+                    "Side effect %s of order %s failed after %s attempts.",
+                    side_effect.effect,
+                    order_id,
+                    side_effect.attempts,
+                    exc_info=error,
+                )
+                continue
+
+            logger.warning(
+                "Side effect %s of order %s failed, retrying.",
+                side_effect.effect,
+                order_id,
+                exc_info=error,
+            )
+            raise self.retry(
+                exc=error,
+                countdown=settings.JOANIE_ORDER_SIDE_EFFECTS_RETRY_DELAY
+                * 2 ** (side_effect.attempts - 1),
+                max_retries=None,
+            ) from error
+
+        side_effect.state = enums.ORDER_SIDE_EFFECT_STATE_DONE
+        side_effect.executed_on = timezone.now()
+        side_effect.save(update_fields=["state", "executed_on", "updated_on"])
+
+
+def dispatch_pending_order_side_effects(older_than):
+    """
+    Request the execution of side effects still pending since before the given date,
+    e.g. because their execution could not be requested when their transaction was
+    committed. Side effects in progress since before this date are considered left by
+    a worker which died and are made pending again. Return the number of orders of
+    which side effects are executed.
+    """
+    OrderSideEffect = apps.get_model("core", "OrderSideEffect")  # pylint: disable=invalid-name
+    OrderSideEffect.objects.filter(
+        state=enums.ORDER_SIDE_EFFECT_STATE_IN_PROGRESS, updated_on__lt=older_than
+    ).update(state=enums.ORDER_SIDE_EFFECT_STATE_PENDING)
+    order_ids = (
+        OrderSideEffect.objects.filter(
+            state=enums.ORDER_SIDE_EFFECT_STATE_PENDING, updated_on__lt=older_than
+        )
+        .order_by()
+        .values_list("order_id", flat=True)
+        .distinct()
+    )
+    count = 0
+    for order_id in order_ids:
+        execute_order_side_effects.delay(str(order_id))
+        count += 1
+    return count
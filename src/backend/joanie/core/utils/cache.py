@@ -0,0 +1,238 @@
+"""
+Two-tier cache used for hot keys (serialized resources, enrollment grades...).
+
+Values are stored in the shared Django cache and kept in a bounded in-process LRU
+cache for a short time, so each worker can serve hot keys without a network hop.
+
+Cache keys of resources change each time they are saved but some of them are
+explicitly cleared (e.g. when a related resource changes). Clearing keys bumps a
+generation counter stored in the shared cache and stores the cleared keys for this
+generation for a short time. Workers check this counter at most once per
+synchronization interval and drop the in-process entries of the keys cleared since
+their last check. They drop their whole in-process cache only if these keys are not
+known anymore (e.g. a worker which has not checked the counter for a long time) or if
+the counter itself is missing (e.g. the shared cache was cleared).
+
+In-process values are pickled, as in the shared cache, so callers can not alter the
+values served to other callers.
+"""
+
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache as shared_cache
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CACHE_KEY = "two_tier_cache_generation"
+INVALIDATION_CACHE_KEY = "two_tier_cache_invalidation:{generation:d}"
+# Workers lagging further behind drop their whole in-process tier
+MAX_REPLAYED_INVALIDATIONS = 100
+
+
+class TwoTierCache:
+    """
+    A bounded in-process LRU cache in front of the shared Django cache.
+
+    The in-process tier is configured with the JOANIE_CACHE_L1_MAX_SIZE,
+    JOANIE_CACHE_L1_TTL and JOANIE_CACHE_L1_SYNC_INTERVAL settings. Setting the
+    maximum size or the TTL to 0 disables it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = None
+        self._synchronized_at = 0
+
+    @property
+    def is_local_enabled(self):
+        """Return True if the in-process tier is enabled."""
+        return bool(settings.JOANIE_CACHE_L1_MAX_SIZE and settings.JOANIE_CACHE_L1_TTL)
+
+    def _synchronize(self):
+        """
+        Drop in-process entries of the keys cleared by other workers since the last
+        synchronization. Must be called with the lock held.
+        """
+        now = time.monotonic()
+        if now - self._synchronized_at < settings.JOANIE_CACHE_L1_SYNC_INTERVAL:
+            return
+
+        generation = shared_cache.get(GENERATION_CACHE_KEY)
+        if generation is None:
+            # Keys cleared since the last synchronization are unknown
+            self._entries.clear()
+            shared_cache.add(GENERATION_CACHE_KEY, 0, timeout=None)
+            self._generation = 0
+        elif generation != self._generation:
+            self._invalidate(generation)
+            self._generation = generation
+        self._synchronized_at = now
+
+    def _invalidate(self, generation):
+        """
+        Drop in-process entries of the keys cleared between the current generation
+        and the given one, or all entries if these keys are unknown. Must be called
+        with the lock held.
+        """
+        if (
+            self._generation is None
+            or not 0 < generation - self._generation <= MAX_REPLAYED_INVALIDATIONS
+        ):
+            self._entries.clear()
+            return
+
+        invalidation_keys = [
+            INVALIDATION_CACHE_KEY.format(generation=cleared_generation)
+            for cleared_generation in range(self._generation + 1, generation + 1)
+        ]
+        invalidations = shared_cache.get_many(invalidation_keys)
+        if len(invalidations) < len(invalidation_keys):
+            # Keys cleared by some generations have expired or are not stored yet
+            self._entries.clear()
+            return
+
+        for keys in invalidations.values():
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def _get_local(self, key):
+        """Return the in-process value of the key or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, pickled_value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return pickle.loads(pickled_value)  # noqa: S301
+
+    def _set_local(self, key, value, timeout):
+        """
+        Store the value in process for the in-process TTL, without outliving the
+        shared cache timeout, and evict least recently used entries beyond the
+        maximum size.
+        """
+        ttl = settings.JOANIE_CACHE_L1_TTL
+        if timeout is not None:
+            ttl = min(ttl, timeout)
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (
+            time.monotonic() + ttl,
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.JOANIE_CACHE_L1_MAX_SIZE:
+            self._entries.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Return the value of the key from the in-process tier or the shared cache."""
+        if not self.is_local_enabled:
+            return shared_cache.get(key, default)
+
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys):
+        """
+        Return a dictionary of the values found for the keys, only looking into the
+        shared cache for keys missing from the in-process tier.
+        """
+        if not self.is_local_enabled:
+            return shared_cache.get_many(keys)
+
+        values = {}
+        with self._lock:
+            self._synchronize()
+            for key in keys:
+                value = self._get_local(key)
+                if value is not None:
+                    values[key] = value
+
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            shared_values = shared_cache.get_many([*missing_keys, GENERATION_CACHE_KEY])
+            generation = shared_values.pop(GENERATION_CACHE_KEY, None)
+            with self._lock:
+                # Values read before the last synchronization may have been cleared
+                # since, they would not be dropped anymore
+                if generation == self._generation:
+                    for key, value in shared_values.items():
+                        self._set_local(key, value, settings.JOANIE_CACHE_L1_TTL)
+            values.update(shared_values)
+
+        return values
+
+    def set(self, key, value, timeout):
+        """Store the value in the shared cache and in the in-process tier."""
+        if not self.is_local_enabled:
+            shared_cache.set(key, value, timeout)
+            return
+
+        self.set_many({key: value}, timeout)
+
+    def set_many(self, data, timeout):
+        """Store the values in the shared cache and in the in-process tier."""
+        shared_cache.set_many(data, timeout)
+        if not self.is_local_enabled:
+            return
+
+        with self._lock:
+            self._synchronize()
+            for key, value in data.items():
+                self._set_local(key, value, timeout)
+
+    def delete(self, key):
+        """Delete the key from both tiers."""
+        if not self.is_local_enabled:
+            shared_cache.delete(key)
+            return
+
+        self.delete_many([key])
+
+    def delete_many(self, keys):
+        """
+        Delete the keys from both tiers and notify other workers that they have to
+        drop these keys from their in-process tier.
+        """
+        shared_cache.delete_many(keys)
+        if not self.is_local_enabled:
+            return
+
+        shared_cache.add(GENERATION_CACHE_KEY, 0, timeout=None)
+        generation = shared_cache.incr(GENERATION_CACHE_KEY)
+        # In-process entries of workers which did not synchronize during this
+        # timeout have expired anyway
+        shared_cache.set(
+            INVALIDATION_CACHE_KEY.format(generation=generation),
+            list(keys),
+            timeout=settings.JOANIE_CACHE_L1_TTL
+            + settings.JOANIE_CACHE_L1_SYNC_INTERVAL,
+        )
+        logger.debug("Two-tier cache generation bumped to %s", generation)
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            # Entries of this worker are up-to-date with the new generation
+            if self._generation == generation - 1:
+                self._generation = generation
+
+    def clear_local(self):
+        """Drop all entries of the in-process tier of the current worker."""
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+            self._synchronized_at = 0
+
+
+two_tier_cache = TwoTierCache()
@@ -0,0 +1,296 @@
+"""
+Debounced synchronization of the catalog with the remote web hooks.
+
+Instead of serializing and pushing course runs each time a signal is received, signal
+handlers record the course runs and products that changed. A single deduplicated
+synchronization is then flushed once the current transaction is committed or, when a
+coalescing window is configured, once the window is over, in order to also merge
+changes made by concurrent requests.
+"""
+
+import json
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Q
+
+from joanie.celery_app import app
+from joanie.core import enums
+from joanie.core.models import (
+    CourseProductRelation,
+    CourseRun,
+    Product,
+    ProductEquivalentCourseRun,
+)
+from joanie.core.utils import webhooks
+
+logger = logging.getLogger(__name__)
+
+PENDING_BATCHES_COUNTER_CACHE_KEY = "catalog_synchronization_batches_counter"
+PENDING_BATCHES_FLUSHED_CACHE_KEY = "catalog_synchronization_batches_flushed"
+PENDING_BATCH_CACHE_KEY = "catalog_synchronization_batch_{index:d}"
+MISSING_BATCH_CACHE_KEY = "catalog_synchronization_batch_{index:d}_missing"
+SCHEDULED_CACHE_KEY = "catalog_synchronization_scheduled"
+
+# Attribute of the database connection holding the changes of its current transaction
+PENDING_CONNECTION_ATTRIBUTE = "catalog_synchronization_pending"
+
+
+class PendingSynchronization:
+    """
+    Changes to synchronize with the remote web hooks once the current transaction
+    is committed.
+    """
+
+    def __init__(self):
+        self.course_run_ids = set()
+        self.product_ids = set()
+        self.offering_ids = set()
+        self.serialized_course_runs = []
+
+    def to_dict(self):
+        """Return the pending changes as a picklable dictionary."""
+        return {
+            "course_run_ids": list(self.course_run_ids),
+            "product_ids": list(self.product_ids),
+            "offering_ids": list(self.offering_ids),
+            "serialized_course_runs": self.serialized_course_runs,
+        }
+
+    def flush(self):
+        """
+        Synchronize pending changes right away or, if a coalescing window is
+        configured, defer them to merge them with changes of other requests.
+        """
+        if getattr(connection, PENDING_CONNECTION_ATTRIBUTE, None) is not self:
+            # Already flushed by a previous callback of the transaction
+            return
+        setattr(connection, PENDING_CONNECTION_ATTRIBUTE, None)
+
+        if settings.JOANIE_CATALOG_SYNCHRONIZATION_COALESCING_WINDOW:
+            defer_synchronization(self.to_dict())
+        else:
+            synchronize_catalog(**self.to_dict())
+
+
+def record_changes(
+    course_run_ids=(), product_ids=(), offering_ids=(), serialized_course_runs=()
+):
+    """
+    Record course runs, products and offerings whose synchronization is needed, as
+    well as course runs already serialized because they must reflect the state of
+    the database before the change (e.g. to hide them), and plan their
+    synchronization once the current transaction is committed.
+
+    The pending synchronization is held by the database connection until it is
+    flushed. One left outside of a transaction was not flushed because its
+    transaction was rolled back, it is discarded. Django does not notify rollbacks
+    though, so changes of a transaction rolled back are merged into the ones of the
+    next transaction if it records changes before leaving its atomic block.
+    """
+    pending = getattr(connection, PENDING_CONNECTION_ATTRIBUTE, None)
+    if pending is None or not connection.in_atomic_block:
+        pending = PendingSynchronization()
+        setattr(connection, PENDING_CONNECTION_ATTRIBUTE, pending)
+
+    pending.course_run_ids.update(course_run_ids)
+    pending.product_ids.update(product_ids)
+    pending.offering_ids.update(offering_ids)
+    pending.serialized_course_runs.extend(serialized_course_runs)
+
+    # The flush is planned for each change, as a flush planned within a savepoint is
+    # dropped if the savepoint is rolled back, and only executed once. Outside of a
+    # transaction, it is executed right away so it must be planned once changes have
+    # been recorded.
+    transaction.on_commit(pending.flush)
+
+
+def record_course_runs_changes(course_runs):
+    """
+    Refresh what depends on course runs written in bulk, without sending any
+    signal, and record them to be synchronized all together once the current
+    transaction is committed.
+    """
+    course_ids = {course_run.course_id for course_run in course_runs}
+    ProductEquivalentCourseRun.objects.refresh_products(
+        Product.objects.filter(target_courses__in=course_ids)
+    )
+    for offering in CourseProductRelation.objects.filter(course__in=course_ids):
+        offering.clear_cache()
+    record_changes(course_run_ids=[course_run.pk for course_run in course_runs])
+
+
+def deduplicate(serialized_course_runs):
+    """Remove identical payloads from a list of serialized course runs."""
+    fingerprints = set()
+    deduplicated_course_runs = []
+    for serialized_course_run in serialized_course_runs:
+        fingerprint = json.dumps(serialized_course_run, sort_keys=True, default=str)
+        if fingerprint in fingerprints:
+            continue
+        fingerprints.add(fingerprint)
+        deduplicated_course_runs.append(serialized_course_run)
+    return deduplicated_course_runs
+
+
+def synchronize_catalog(
+    course_run_ids=None,
+    product_ids=None,
+    offering_ids=None,
+    serialized_course_runs=None,
+):
+    """
+    Serialize the given course runs, products and offerings and push them with the
+    already serialized course runs to the remote web hooks in a single
+    synchronization.
+    """
+    serialized_course_runs = list(serialized_course_runs or [])
+    product_ids = set(product_ids or [])
+
+    # Serialize course runs for each product of their course
+    course_runs_products = []
+    course_runs = list(
+        CourseRun.objects.filter(pk__in=course_run_ids or [])
+        .select_related("course")
+        .prefetch_related("course__products")
+    )
+    for course_run in course_runs:
+        products = course_run.course.products.all()
+        course_runs_products.extend(
+            (course_run, product) for product in products or [None]
+        )
+    serialized_course_runs.extend(CourseRun.get_serialized_bulk(course_runs_products))
+
+    # Collect products for which the course runs are an equivalent course run
+    if course_runs:
+        product_ids.update(
+            Product.objects.filter(
+                Q(
+                    target_course_relations__course_runs__isnull=True,
+                    target_course_relations__course__in={
+                        course_run.course_id for course_run in course_runs
+                    },
+                )
+                | Q(target_course_relations__course_runs__in=course_runs)
+            ).values_list("pk", flat=True)
+        )
+
+    # Serialize the equivalent course run of products of offerings for the course
+    # of the offering only
+    offerings_products = defaultdict(list)
+    for offering in CourseProductRelation.objects.filter(
+        pk__in=offering_ids or []
+    ).select_related("course", "product"):
+        offerings_products[offering.course].append(offering.product)
+    for course, products in offerings_products.items():
+        serialized_course_runs.extend(
+            Product.get_equivalent_serialized_course_runs_for_products(
+                products, courses=[course]
+            )
+        )
+
+    products = list(Product.objects.filter(pk__in=product_ids))
+    for product in products:
+        if product.type == enums.PRODUCT_TYPE_CERTIFICATE:
+            serialized_course_runs.extend(
+                Product.get_serialized_certificated_course_runs([product])
+            )
+    serialized_course_runs.extend(
+        Product.get_equivalent_serialized_course_runs_for_products(
+            [
+                product
+                for product in products
+                if product.type != enums.PRODUCT_TYPE_CERTIFICATE
+            ]
+        )
+    )
+
+    serialized_course_runs = deduplicate(serialized_course_runs)
+    logger.debug("[SYNC] %s", serialized_course_runs)
+    if serialized_course_runs:
+        webhooks.synchronize_course_runs(serialized_course_runs)
+
+
+def schedule_pending_batches():
+    """
+    Schedule the synchronization of pending batches at the end of the coalescing
+    window if it is not already scheduled.
+    """
+    window = settings.JOANIE_CATALOG_SYNCHRONIZATION_COALESCING_WINDOW
+    if cache.add(SCHEDULED_CACHE_KEY, True, timeout=window):
+        synchronize_pending_batches.apply_async(countdown=window)
+
+
+def defer_synchronization(batch):
+    """
+    Store a batch of changes in cache and schedule their synchronization at the end
+    of the coalescing window.
+    """
+    cache.add(PENDING_BATCHES_COUNTER_CACHE_KEY, 0, timeout=None)
+    index = cache.incr(PENDING_BATCHES_COUNTER_CACHE_KEY)
+    cache.set(PENDING_BATCH_CACHE_KEY.format(index=index), batch, timeout=None)
+    schedule_pending_batches()
+
+
+@app.task
+def synchronize_pending_batches():
+    """
+    Synchronize all batches of changes deferred during the coalescing window at once.
+
+    Batches are only marked as flushed once synchronized, so they are synchronized
+    again by the next run if the synchronization fails. A batch missing from the
+    cache may still be being stored by a concurrent request: it is waited for until
+    the next run, then considered lost (e.g. evicted from the cache) and skipped.
+    """
+    # Batches stored from now on will schedule a new synchronization
+    cache.delete(SCHEDULED_CACHE_KEY)
+
+    flushed = cache.get(PENDING_BATCHES_FLUSHED_CACHE_KEY, 0)
+    counter = cache.get(PENDING_BATCHES_COUNTER_CACHE_KEY, 0)
+    indexes = range(flushed + 1, counter + 1)
+    keys = [PENDING_BATCH_CACHE_KEY.format(index=index) for index in indexes]
+    stored_batches = cache.get_many(keys)
+
+    batches = []
+    consumed_indexes = []
+    for index, key in zip(indexes, keys, strict=True):
+        if key in stored_batches:
+            batches.append(stored_batches[key])
+        elif cache.add(MISSING_BATCH_CACHE_KEY.format(index=index), True, timeout=None):
+            break
+        else:
+            logger.error("Batch %d of catalog changes was lost, skipping it", index)
+        consumed_indexes.append(index)
+
+    if batches:
+        logger.info("Synchronizing %s batches of catalog changes", len(batches))
+        synchronize_catalog(
+            course_run_ids={pk for batch in batches for pk in batch["course_run_ids"]},
+            product_ids={pk for batch in batches for pk in batch["product_ids"]},
+            offering_ids={pk for batch in batches for pk in batch["offering_ids"]},
+            serialized_course_runs=[
+                serialized_course_run
+                for batch in batches
+                for serialized_course_run in batch["serialized_course_runs"]
+            ],
+        )
+
+    if consumed_indexes:
+        cache.set(PENDING_BATCHES_FLUSHED_CACHE_KEY, consumed_indexes[-1], timeout=None)
+        cache.delete_many(
+            [
+                key
+                for index in consumed_indexes
+                for key in (
+                    PENDING_BATCH_CACHE_KEY.format(index=index),
+                    MISSING_BATCH_CACHE_KEY.format(index=index),
+                )
+            ]
+        )
+
+    if len(consumed_indexes) < len(keys):
+        # Wait for the missing batch until the next run
+        schedule_pending_batches()
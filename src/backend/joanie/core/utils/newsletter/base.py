@@ -1,6 +1,9 @@
 """Base Newsletter Client"""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +68,40 @@ class NewsletterClient:
         """
         raise NotImplementedError("This method should be implemented by the subclass.")
 
+    def has_unsubscribed_from_commercial_newsletter(self):
+        """
+        Check if a contact has unsubscribed from the commercial newsletter list.
+        """
+        raise NotImplementedError("This method should be implemented by the subclass.")
+
+    def get_unsubscribed_from_commercial_newsletter(self, emails):
+        """
+        Return the set of emails, among the given ones, whose contact has
+        unsubscribed from the commercial newsletter list.
+
+        Clients whose API allows to query the status of many contacts at once should
+        override this method. By default, contacts are checked concurrently one by
+        one with `has_unsubscribed_from_commercial_newsletter`.
+        """
+        emails = list(dict.fromkeys(emails))
+        if not emails:
+            return set()
+
+        with ThreadPoolExecutor(
+            max_workers=settings.JOANIE_NEWSLETTER_CLIENT_WORKERS
+        ) as executor:
+            statuses = executor.map(
+                lambda email: self.__class__(
+                    {"email": email}
+                ).has_unsubscribed_from_commercial_newsletter(),
+                emails,
+            )
+            return {
+                email
+                for email, has_unsubscribed in zip(emails, statuses, strict=True)
+                if has_unsubscribed
+            }
+
     def handle_notification(self, request):
         """
         Handle a notification from the newsletter client.
@@ -157,37 +157,49 @@ class Brevo(NewsletterClient):
         """
         Get the count of contacts in the commercial newsletter list.
         """
-        return self.get_contacts(limit=1)
+        response = self._list_contacts(limit=1, offset=0)
+        if not response.ok:
+            return None
+
+        return response.json().get("count")
 
     def get_contacts(self, limit=500, offset=0):
         """
         Get contacts from the commercial newsletter list.
-
-        If limit is 1, return the count of contacts.
         """
-        response = self._call_api(
-            self.list_contacts_url,
-            query_params={"limit": limit, "offset": offset, "sort": "desc"},
-        )
-
+        response = self._list_contacts(limit=limit, offset=offset)
         if not response.ok:
             return None
 
-        if limit == 1:
-            return response.json().get("count")
         return response.json().get("contacts")
 
+    def _list_contacts(self, limit, offset):
+        """
+        Call the API listing contacts of the commercial newsletter list.
+        """
+        return self._call_api(
+            self.list_contacts_url,
+            query_params={"limit": limit, "offset": offset, "sort": "desc"},
+        )
+
     def handle_notification(self, request):
         """
         Handle a notification from Brevo.
         """
-        emails_to_check = []
-        for event in request.data:
-            if (
-                settings.BREVO_COMMERCIAL_NEWSLETTER_LIST_ID in event["list_id"]
-                and event["event"] == "unsubscribe"
-                and User.objects.filter(email=event["email"]).exists()
-            ):
-                emails_to_check.append(event["email"])
+        emails_to_check = [
+            event["email"]
+            for event in request.data
+            if settings.BREVO_COMMERCIAL_NEWSLETTER_LIST_ID in event["list_id"]
+            and event["event"] == "unsubscribe"
+        ]
+        if emails_to_check:
+            known_emails = set(
+                User.objects.filter(email__in=emails_to_check).values_list(
+                    "email", flat=True
+                )
+            )
+            emails_to_check = [
+                email for email in emails_to_check if email in known_emails
+            ]
         if emails_to_check:
             check_commercial_newsletter_subscription_webhook.delay(emails_to_check)
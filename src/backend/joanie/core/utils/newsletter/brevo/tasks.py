@@ -1,9 +1,11 @@
 """Brevo tasks"""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 
 from joanie.celery_app import app
 
@@ -11,57 +13,109 @@ from . import Brevo
 
 logger = logging.getLogger(__name__)
 
+SYNCHRONIZATION_CURSOR_CACHE_KEY = "brevo_subscriptions_synchronization_cursor"
 
-@app.task
-def synchronize_brevo_subscriptions():
+
+def synchronize_contacts_page(contacts):
     """
-    Synchronize brevo subscriptions.
+    Synchronize the subscription status of the users matching a page of Brevo
+    contacts. Users are resolved in a single query and updated in a single
+    bulk update. Return the number of users updated.
     """
     list_id = settings.BREVO_COMMERCIAL_NEWSLETTER_LIST_ID
     User = apps.get_model("core", "User")  # pylint: disable=invalid-name
 
-    # get list of contacts with a limit of 1, just for getting the total count
-    brevo = Brevo()
-    contacts_count = brevo.get_contacts_count()
-    logger.info("Total contacts: %s", contacts_count)
-
-    users_to_update = []
-
-    for offset in range(0, contacts_count, 500):
-        contacts = brevo.get_contacts(limit=500, offset=offset)
-        logger.info(
-            "Processing contacts from %s to %s / %s",
-            offset,
-            offset + 500,
-            contacts_count,
-        )
-        for contact in contacts:
-            try:
-                user = User.objects.get(email=contact.get("email"))
-            except User.DoesNotExist:
-                continue
-
-            updating = False
+    users_by_email = {}
+    for user in User.objects.filter(
+        email__in={contact.get("email") for contact in contacts}
+    ).only("id", "email", "has_subscribed_to_commercial_newsletter"):
+        users_by_email.setdefault(user.email, []).append(user)
 
+    users_to_update = {}
+    for contact in contacts:
+        for user in users_by_email.get(contact.get("email"), []):
             if (
                 list_id in contact.get("listIds")
                 and not user.has_subscribed_to_commercial_newsletter
             ):
                 user.has_subscribed_to_commercial_newsletter = True
-                updating = True
             elif user.has_subscribed_to_commercial_newsletter:
                 user.has_subscribed_to_commercial_newsletter = False
-                updating = True
+            else:
+                continue
+
+            users_to_update[user.id] = user
+            logger.info(
+                "Updating user %s subscription status to %s",
+                user.id,
+                user.has_subscribed_to_commercial_newsletter,
+            )
+
+    if not users_to_update:
+        return 0
+
+    return User.objects.bulk_update(
+        users_to_update.values(), ["has_subscribed_to_commercial_newsletter"]
+    )
+
+
+@app.task
+def synchronize_brevo_subscriptions(restart=False):
+    """
+    Synchronize brevo subscriptions.
+
+    Contacts are processed page by page and the offset of the next page to process
+    is stored in cache, so an interrupted synchronization resumes where it stopped
+    unless `restart` is set.
+    """
+    page_size = settings.BREVO_SYNCHRONIZATION_PAGE_SIZE
+    workers = settings.BREVO_SYNCHRONIZATION_WORKERS
+
+    brevo = Brevo()
+    contacts_count = brevo.get_contacts_count()
+    logger.info("Total contacts: %s", contacts_count)
+    if contacts_count is None:
+        return
+
+    if restart:
+        cache.delete(SYNCHRONIZATION_CURSOR_CACHE_KEY)
+    start = cache.get(SYNCHRONIZATION_CURSOR_CACHE_KEY, 0)
+    if start:
+        logger.info("Resuming synchronization from contact %s", start)
+
+    users_updated_count = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Fetch at most `workers` pages ahead to keep memory usage bounded
+        for window_start in range(start, contacts_count, page_size * workers):
+            offsets = range(
+                window_start,
+                min(window_start + page_size * workers, contacts_count),
+                page_size,
+            )
+            pages = executor.map(
+                lambda offset: brevo.get_contacts(limit=page_size, offset=offset),
+                offsets,
+            )
+            for offset, contacts in zip(offsets, pages, strict=True):
+                if contacts is None:
+                    logger.error(
+                        "Synchronization interrupted at contact %s / %s",
+                        offset,
+                        contacts_count,
+                    )
+                    logger.info("Updated %s users", users_updated_count)
+                    return
 
-            if updating:
-                users_to_update.append(user)
                 logger.info(
-                    "Updating user %s subscription status to %s",
-                    user.id,
-                    user.has_subscribed_to_commercial_newsletter,
+                    "Processing contacts from %s to %s / %s",
+                    offset,
+                    offset + page_size,
+                    contacts_count,
+                )
+                users_updated_count += synchronize_contacts_page(contacts)
+                cache.set(
+                    SYNCHRONIZATION_CURSOR_CACHE_KEY, offset + page_size, timeout=None
                 )
 
-    users_updated_count = User.objects.bulk_update(
-        users_to_update, ["has_subscribed_to_commercial_newsletter"]
-    )
+    cache.delete(SYNCHRONIZATION_CURSOR_CACHE_KEY)
     logger.info("Updated %s users", users_updated_count)
@@ -46,16 +46,33 @@ def check_commercial_newsletter_subscription_webhook(emails):
 
     User = apps.get_model("core", "User")  # pylint: disable=invalid-name
 
-    for email in emails:
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
+    users = User.objects.filter(
+        email__in=emails, has_subscribed_to_commercial_newsletter=True
+    ).prefetch_related("groups", "user_permissions")
+    if not users:
+        return
+
+    client = newsletter_client()
+    unsubscribed_emails = client.get_unsubscribed_from_commercial_newsletter(
+        {user.email for user in users}
+    )
+
+    users_to_update = []
+    for user in users:
+        if user.email not in unsubscribed_emails:
             continue
 
-        client = newsletter_client(user.to_dict())
-        if client.has_unsubscribed_from_commercial_newsletter():
-            logger.info(
-                "User %s has unsubscribed from the commercial newsletter", user.email
-            )
-            user.has_subscribed_to_commercial_newsletter = False
-            user.save()
+        logger.info(
+            "User %s has unsubscribed from the commercial newsletter", user.email
+        )
+        user.has_subscribed_to_commercial_newsletter = False
+        user.last_has_subscribed_to_commercial_newsletter = False
+        users_to_update.append(user)
+
+    User.objects.bulk_update(
+        users_to_update, ["has_subscribed_to_commercial_newsletter"]
+    )
+
+    # `bulk_update` bypasses `User.save`, trigger the subscription update ourselves
+    for user in users_to_update:
+        set_commercial_newsletter_subscription.delay(user.to_dict())
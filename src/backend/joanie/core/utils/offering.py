@@ -2,13 +2,20 @@
 
 import logging
 import secrets
+from collections import defaultdict
 
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 
 from joanie.celery_app import app
 from joanie.core import enums
 from joanie.core.enums import ORDER_STATE_COMPLETED, PRODUCT_TYPE_CERTIFICATE_ALLOWED
-from joanie.core.models import Certificate, CourseProductRelation, OfferingRule, Order
+from joanie.core.models import (
+    Certificate,
+    CourseProductRelation,
+    CourseRun,
+    OfferingRule,
+    Order,
+)
 from joanie.core.utils import webhooks
 
 logger = logging.getLogger(__name__)
@@ -71,25 +78,34 @@ def get_deep_link(offering) -> str | None:
     return secrets.choice(activated_deep_links)
 
 
+def get_offering_serialization_params(offering):
+    """
+    Return the visibility and certifying flag used to serialize the course runs
+    of an offering when synchronizing it.
+    """
+    visibility = None
+    if offering.product.type == enums.PRODUCT_TYPE_CREDENTIAL:
+        visibility = enums.COURSE_AND_SEARCH
+    return visibility, offering.product.type == enums.PRODUCT_TYPE_CERTIFICATE
+
+
 def get_serialized_course_runs(offering, visibility=None):
     """
     Synchronize course runs related to an offering.
     """
     product = offering.product
     certifying = product.type == enums.PRODUCT_TYPE_CERTIFICATE
-    course = offering.course
-    course_runs = course.course_runs.all()
     serialized_course_runs = []
-    for course_run in course_runs:
-        if course_run.is_archived:
-            continue
-        if serialized_runs := course_run.get_serialized(
-            visibility=visibility,
-            certifying=certifying,
-            product=product,
-        ):
-            logger.debug("[SYNC] %s", serialized_runs)
-            serialized_course_runs.append(serialized_runs)
+    for serialized_runs in CourseRun.get_serialized_bulk(
+        [
+            (course_run, product)
+            for course_run in offering.course.course_runs.exclude_archived()
+        ],
+        visibility=visibility,
+        certifying=certifying,
+    ):
+        logger.debug("[SYNC] %s", serialized_runs)
+        serialized_course_runs.append(serialized_runs)
 
     if serialized_course_runs:
         return serialized_course_runs
@@ -101,6 +117,10 @@ def get_serialized_course_runs(offering, visibility=None):
 def synchronize_offerings():
     """
     Synchronize all offerings that have rules to synchronize.
+
+    Course runs of all offerings sharing the same serialization parameters are
+    serialized at once. Only course runs whose payload changed since their last
+    synchronization are sent to the webhooks.
     """
     offering_ids = (
         OfferingRule.objects.find_to_synchronize()
@@ -108,25 +128,50 @@ def synchronize_offerings():
         .distinct()
     )
 
-    offerings = (
+    offerings = list(
         CourseProductRelation.objects.filter(
             id__in=offering_ids,
         )
         .select_related("course", "product")
+        .prefetch_related(
+            Prefetch(
+                "course__course_runs",
+                queryset=CourseRun.objects.exclude_archived(),
+                to_attr="unarchived_course_runs",
+            )
+        )
         .distinct()
     )
 
-    logger.info("Synchronizing %s offerings", offerings.count())
+    logger.info("Synchronizing %s offerings", len(offerings))
+
+    # Group course runs to serialize by serialization parameters
+    course_runs_products = defaultdict(list)
+    for offering in offerings:
+        course_runs_products[get_offering_serialization_params(offering)].extend(
+            (course_run, offering.product)
+            for course_run in offering.course.unarchived_course_runs
+        )
+
+    serialized_course_runs = {
+        (visibility, certifying): iter(
+            CourseRun.get_serialized_bulk(
+                pairs, visibility=visibility, certifying=certifying
+            )
+        )
+        for (visibility, certifying), pairs in course_runs_products.items()
+    }
 
     course_runs = []
     for offering in offerings:
         logger.info("Get serialized course runs for offering %s", offering.id)
-        visibility = None
-        if offering.product.type == enums.PRODUCT_TYPE_CREDENTIAL:
-            visibility = enums.COURSE_AND_SEARCH
-        synchronized_course_runs = get_serialized_course_runs(
-            offering, visibility=visibility
-        )
+        serialized_offering_course_runs = serialized_course_runs[
+            get_offering_serialization_params(offering)
+        ]
+        synchronized_course_runs = [
+            next(serialized_offering_course_runs)
+            for _course_run in offering.course.unarchived_course_runs
+        ]
         if synchronized_course_runs:
             logger.info(
                 "  %s course runs serialized",
@@ -138,4 +183,4 @@ def synchronize_offerings():
 
     if course_runs:
         logger.info("Synchronizing %s course runs for offerings", len(course_runs))
-        webhooks.synchronize_course_runs(course_runs)
+        webhooks.synchronize_course_runs(course_runs, only_changed=True)
@@ -1,8 +1,20 @@
 """Util to manage the deletion of Order depending the state and the product type"""
 
+import logging
+import uuid
 from uuid import UUID
 
+from django.db.models import Q
+from django.utils import timezone
+
+from stockholm import Money
+
 from joanie.core import enums, models
+from joanie.core.utils.payment_schedule import generate_many as generate_schedules
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_SCHEDULES_BATCH_SIZE = 500
 
 
 def delete_stuck_signing_order(order: models.Order):
@@ -127,3 +139,190 @@ def extract_session_code(title: str) -> str:
     if len(parts) == 2:  # noqa : PLR2004
         return f"{parts[1].strip()}"
     return f"{parts[0].strip()}"
+
+
+# pylint: disable=too-many-locals
+def _get_orders_course_run_dates(orders, now):
+    """
+    Return, for each order, the earliest start and the latest end of its target course
+    runs which are not archived (see `Order.get_schedule_dates`).
+
+    Target course runs of all orders are retrieved with two queries and dates are
+    aggregated once per distinct set of target course runs, so orders of the same
+    product share the same aggregate.
+    """
+    relations = {order.id: {} for order in orders if not order.enrollment_id}
+    relations_course_runs = models.OrderTargetCourseRelation.objects.filter(
+        order_id__in=relations
+    ).values_list("order_id", "course_id", "course_runs")
+    for order_id, course_id, course_run_id in relations_course_runs:
+        course_run_ids = relations[order_id].setdefault(course_id, set())
+        if course_run_id:
+            course_run_ids.add(course_run_id)
+
+    # Target course runs of an order are identified by the ids of its eligible course
+    # runs and the ids of the courses of which all course runs are eligible.
+    signatures = {}
+    for order in orders:
+        if order.enrollment_id:
+            signatures[order.id] = (
+                frozenset([order.enrollment.course_run_id]),
+                frozenset(),
+            )
+            continue
+        courses = relations[order.id]
+        signatures[order.id] = (
+            frozenset().union(*courses.values()),
+            frozenset(
+                course_id
+                for course_id, course_run_ids in courses.items()
+                if not course_run_ids
+            ),
+        )
+
+    all_course_run_ids = set().union(
+        *(signature[0] for signature in signatures.values())
+    )
+    all_course_ids = set().union(*(signature[1] for signature in signatures.values()))
+    course_runs = {}
+    course_runs_by_course = {}
+    for course_run_id, course_id, start, end in models.CourseRun.objects.filter(
+        Q(pk__in=all_course_run_ids) | Q(course_id__in=all_course_ids),
+        end__gt=now,
+    ).values_list("pk", "course_id", "start", "end"):
+        course_runs[course_run_id] = (start, end)
+        course_runs_by_course.setdefault(course_id, set()).add(course_run_id)
+
+    dates = {}
+    for signature in set(signatures.values()):
+        course_run_ids, course_ids = signature
+        course_run_ids = course_run_ids.union(
+            *(course_runs_by_course.get(course_id, ()) for course_id in course_ids)
+        )
+        starts = [
+            course_runs[course_run_id][0]
+            for course_run_id in course_run_ids
+            if course_run_id in course_runs and course_runs[course_run_id][0]
+        ]
+        ends = [
+            course_runs[course_run_id][1]
+            for course_run_id in course_run_ids
+            if course_run_id in course_runs
+        ]
+        dates[signature] = (min(starts, default=None), max(ends, default=None))
+
+    return {order_id: dates[signature] for order_id, signature in signatures.items()}
+
+
+def _generate_orders_payment_schedules(orders, now):
+    """
+    Return the new payment schedule of each order, by order, and the ids of the
+    orders for which target course run dates are missing.
+    """
+    errors = []
+    credential_orders = [
+        order for order in orders if order.product.type == enums.PRODUCT_TYPE_CREDENTIAL
+    ]
+    course_run_dates = _get_orders_course_run_dates(credential_orders, now)
+
+    schedules = {}
+    for order in credential_orders:
+        start_date, end_date = course_run_dates[order.id]
+        if not start_date or not end_date:
+            logger.error(
+                "Cannot retrieve start or end date for order",
+                extra={"context": {"order": order.to_dict()}},
+            )
+            errors.append(order.id)
+            continue
+
+        if order.has_contract and order.contract.student_signed_on:
+            signing_date = order.contract.student_signed_on
+        else:
+            signing_date = now
+        schedules[order] = (order.total, signing_date, start_date, end_date)
+
+    new_payment_schedules = dict(
+        zip(schedules, generate_schedules(schedules.values()), strict=True)
+    )
+    for order in orders:
+        if order.product.type != enums.PRODUCT_TYPE_CREDENTIAL:
+            new_payment_schedules[order] = [
+                {
+                    "id": uuid.uuid4(),
+                    "due_date": now.date(),
+                    "amount": Money(order.total),
+                    "state": enums.PAYMENT_STATE_PENDING,
+                }
+            ]
+
+    return new_payment_schedules, errors
+
+
+def generate_payment_schedules(orders, dry_run=False):
+    """
+    Generate the payment schedule of many orders at once, as `Order.generate_schedule`
+    does for one order, and save them with a bulk update.
+
+    Orders for which an installment has already been processed (paid, refused...) and
+    free orders are skipped. Installments keep their id when the number of installments
+    does not change.
+
+    In dry run mode, nothing is saved. In both modes, a dict is returned with:
+    - changes: the previous and the new payment schedules of each order for which the
+      payment schedule changes, by order id,
+    - skipped: ids of the skipped orders,
+    - errors: ids of the orders for which target course run dates are missing.
+    """
+    now = timezone.now()
+    result = {"changes": {}, "skipped": [], "errors": []}
+
+    orders_to_generate = []
+    for order in orders.select_related("product", "contract", "enrollment"):
+        if order.is_free or any(
+            installment["state"] != enums.PAYMENT_STATE_PENDING
+            for installment in order.payment_schedule or []
+        ):
+            result["skipped"].append(order.id)
+        else:
+            orders_to_generate.append(order)
+
+    new_payment_schedules, result["errors"] = _generate_orders_payment_schedules(
+        orders_to_generate, now
+    )
+
+    orders_to_update = []
+    for order, payment_schedule in new_payment_schedules.items():
+        previous_payment_schedule = order.payment_schedule or []
+        if len(previous_payment_schedule) == len(payment_schedule):
+            for previous, installment in zip(
+                previous_payment_schedule, payment_schedule, strict=True
+            ):
+                installment["id"] = previous["id"]
+            if previous_payment_schedule == payment_schedule:
+                continue
+
+        result["changes"][order.id] = {
+            "previous": previous_payment_schedule,
+            "new": payment_schedule,
+        }
+        orders_to_update.append(order)
+
+    if not dry_run:
+        for order in orders_to_update:
+            order.payment_schedule = new_payment_schedules[order]
+            order.updated_on = now
+        models.Order.objects.bulk_update(
+            orders_to_update,
+            ["payment_schedule", "updated_on"],
+            batch_size=PAYMENT_SCHEDULES_BATCH_SIZE,
+        )
+
+    logger.info(
+        "%s payment schedules %s, %s orders skipped and %s in error.",
+        len(orders_to_update),
+        "to update" if dry_run else "updated",
+        len(result["skipped"]),
+        len(result["errors"]),
+    )
+    return result
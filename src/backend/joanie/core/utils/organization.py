@@ -1,6 +1,7 @@
 """Util to get the organization with the least binding orders count"""
 
-from django.db.models import Count, Exists, OuterRef, Q
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 from joanie.core import enums
 
@@ -21,18 +22,29 @@ def get_least_active_organization(product, course, enrollment=None):
     except models.CourseProductRelation.DoesNotExist:
         return None
 
-    order_count_filter = Q(order__product=product) & Q(
-        order__state__in=(*enums.ORDER_STATES_BINDING, enums.ORDER_STATE_TO_OWN)
-    )
-
     if enrollment:
-        order_count_filter &= Q(order__enrollment=enrollment)
+        order_count = Count(
+            "order",
+            filter=Q(order__product=product)
+            & Q(order__enrollment=enrollment)
+            & Q(order__state__in=enums.ORDER_STATES_COUNTED_FOR_ORGANIZATION),
+            distinct=True,
+        )
     else:
-        order_count_filter &= Q(order__course=course)
+        # Read the number of orders maintained per organization on the offering
+        # instead of counting all the orders of the offering
+        order_count = Coalesce(
+            Subquery(
+                models.OfferingOrganizationOrderCount.objects.filter(
+                    offering=course_relation, organization=OuterRef("pk")
+                ).values("nb_orders")[:1]
+            ),
+            0,
+        )
 
     try:
         organizations = course_relation.organizations.annotate(
-            order_count=Count("order", filter=order_count_filter, distinct=True),
+            order_count=order_count,
             is_author=Exists(
                 models.Organization.objects.filter(
                     pk=OuterRef("pk"), courses__id=course_id
@@ -19,7 +19,7 @@ from stockholm.exceptions import ConversionError
 from joanie.core import enums
 from joanie.core.exceptions import InvalidConversionError
 from joanie.core.utils.emails import prepare_context_for_upcoming_installment, send
-from joanie.payment import get_country_calendar
+from joanie.payment import get_working_days_calendar
 from joanie.payment.models import Invoice, Transaction
 
 logger = logging.getLogger(__name__)
@@ -59,19 +59,30 @@ def _withdrawal_limit_date(signed_contract_date, course_start_date):
     date is set to the signed contract date to allow the user to starts the course
     immediately.
     """
-    calendar = get_country_calendar()
-    withdrawal_date = signed_contract_date + timedelta(
-        days=settings.JOANIE_WITHDRAWAL_PERIOD_DAYS
-    )
+    return _withdrawal_limit_dates([(signed_contract_date, course_start_date)])[0]
 
-    if not calendar.is_working_day(withdrawal_date):
-        withdrawal_date = calendar.add_working_days(
-            withdrawal_date, 1, keep_datetime=True
-        )
 
-    return (
-        withdrawal_date if withdrawal_date < course_start_date else signed_contract_date
-    )
+def _withdrawal_limit_dates(dates):
+    """
+    Return the withdrawal limit date for each couple of signed contract date and
+    course start date of the iterable. All dates are computed with the same working
+    days calendar, see `_withdrawal_limit_date`.
+    """
+    calendar = get_working_days_calendar()
+    withdrawal_period = timedelta(days=settings.JOANIE_WITHDRAWAL_PERIOD_DAYS)
+
+    withdrawal_dates = []
+    for signed_contract_date, course_start_date in dates:
+        withdrawal_date = signed_contract_date + withdrawal_period
+        if not calendar.is_working_day(withdrawal_date):
+            withdrawal_date = calendar.add_working_days(withdrawal_date, 1)
+
+        withdrawal_dates.append(
+            withdrawal_date
+            if withdrawal_date < course_start_date
+            else signed_contract_date
+        )
+    return withdrawal_dates
 
 
 def _calculate_due_dates(
@@ -130,19 +141,37 @@ def generate(total, beginning_contract_date, course_start_date, course_end_date)
     """
     Generate payment schedule for the order.
     """
-    withdrawal_date = _withdrawal_limit_date(
-        beginning_contract_date.date(), course_start_date.date()
-    )
-    percentages = _get_installments_percentages(total)
-    due_dates = _calculate_due_dates(
-        withdrawal_date,
-        course_start_date.date(),
-        course_end_date.date(),
-        len(percentages),
+    return generate_many(
+        [(total, beginning_contract_date, course_start_date, course_end_date)]
+    )[0]
+
+
+def generate_many(schedules):
+    """
+    Generate a payment schedule for each tuple (total, beginning contract date, course
+    start date, course end date) of the iterable. Withdrawal limit dates of all
+    schedules are computed in one pass with the same working days calendar.
+    """
+    schedules = list(schedules)
+    withdrawal_dates = _withdrawal_limit_dates(
+        (beginning_contract_date.date(), course_start_date.date())
+        for _total, beginning_contract_date, course_start_date, _end in schedules
     )
-    installments = _calculate_installments(total, due_dates, percentages)
 
-    return installments
+    payment_schedules = []
+    for (total, _beginning, course_start_date, course_end_date), withdrawal_date in zip(
+        schedules, withdrawal_dates, strict=True
+    ):
+        percentages = _get_installments_percentages(total)
+        due_dates = _calculate_due_dates(
+            withdrawal_date,
+            course_start_date.date(),
+            course_end_date.date(),
+            len(percentages),
+        )
+        payment_schedules.append(_calculate_installments(total, due_dates, percentages))
+
+    return payment_schedules
 
 
 def has_withdrawal_period(signed_contract_date, course_start_date):
@@ -0,0 +1,34 @@
+"""Utils to search resources by text through trigram indexes"""
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models import Q, TextField
+from django.db.models.functions import Cast, Upper
+
+
+def trigram_index(field_name, name):
+    """
+    Return a GIN trigram index on a text field.
+
+    The index is built on the same expression as the one PostgreSQL is queried with
+    for `icontains` lookups (`UPPER("field"::text)`), so these lookups can use it
+    instead of scanning the whole table.
+    """
+    return GinIndex(
+        OpClass(Upper(Cast(field_name, output_field=TextField())), name="gin_trgm_ops"),
+        name=name,
+    )
+
+
+def search(model, value):
+    """
+    Return a subquery of the primary keys of the instances of a model with one of
+    their `search_fields` containing the value.
+
+    Each searchable field being indexed, this subquery can be used to filter another
+    resource on a relation (e.g. `Q(owner__in=search(User, value))`) without joining
+    the related tables and deduplicating the results.
+    """
+    query = Q()
+    for field_name in model.search_fields:
+        query |= Q(**{f"{field_name}__icontains": value})
+    return model.objects.filter(query).values("pk")
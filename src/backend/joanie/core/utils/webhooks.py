@@ -8,6 +8,7 @@ import json
 import logging
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.serializers.json import DjangoJSONEncoder
 
 import requests
@@ -29,8 +30,68 @@ session.mount("http://", adapter)
 session.mount("https://", adapter)
 
 
-def synchronize_course_runs(serialized_course_runs):
-    """webhook to synchronize data"""
+def get_course_run_fingerprint(serialized_course_run):
+    """Return a hash of the payload of a serialized course run."""
+    return hashlib.sha256(
+        json.dumps(serialized_course_run, cls=DjangoJSONEncoder, sort_keys=True).encode(
+            "utf-8"
+        )
+    ).hexdigest()
+
+
+def get_course_run_fingerprint_cache_key(webhook, resource_link):
+    """
+    Return the cache key under which is stored the fingerprint of the last payload
+    successfully sent to a webhook for a course run.
+    """
+    digest = hashlib.sha256(f"{webhook['url']}|{resource_link}".encode()).hexdigest()
+    return f"course_run_sync_fingerprint-{digest}"
+
+
+def get_changed_course_runs(webhook, serialized_course_runs):
+    """
+    Return the serialized course runs whose payload differs from the last one
+    successfully sent to the webhook. When a course run is serialized several times,
+    only its last occurrence is kept as it is the one the webhook would retain.
+    """
+    course_runs = {
+        course_run["resource_link"]: course_run for course_run in serialized_course_runs
+    }
+    cache_keys = {
+        resource_link: get_course_run_fingerprint_cache_key(webhook, resource_link)
+        for resource_link in course_runs
+    }
+    sent_fingerprints = cache.get_many(cache_keys.values())
+
+    return [
+        course_run
+        for resource_link, course_run in course_runs.items()
+        if sent_fingerprints.get(cache_keys[resource_link])
+        != get_course_run_fingerprint(course_run)
+    ]
+
+
+def remember_synchronized_course_runs(webhook, serialized_course_runs):
+    """Store the fingerprint of course runs successfully sent to a webhook."""
+    cache.set_many(
+        {
+            get_course_run_fingerprint_cache_key(
+                webhook, course_run["resource_link"]
+            ): get_course_run_fingerprint(course_run)
+            for course_run in serialized_course_runs
+        },
+        timeout=settings.JOANIE_COURSE_RUN_SYNC_FINGERPRINT_TTL,
+    )
+
+
+def synchronize_course_runs(serialized_course_runs, only_changed=False):
+    """
+    webhook to synchronize data
+
+    The fingerprint of each course run successfully sent to a webhook is stored so
+    that, with `only_changed`, course runs whose payload did not change since the last
+    synchronization are not sent again to this webhook.
+    """
     if not settings.COURSE_WEB_HOOKS or not serialized_course_runs:
         return
 
@@ -41,51 +102,70 @@ def synchronize_course_runs(serialized_course_runs):
     logger.info("[SYNC] payload %s", json_course_runs)
 
     for webhook in settings.COURSE_WEB_HOOKS:
-        signature = hmac.new(
-            str(webhook["secret"]).encode("utf-8"),
-            msg=json_course_runs,
-            digestmod=hashlib.sha256,
-        ).hexdigest()
-
-        try:
-            response = session.post(
-                webhook["url"],
-                data=json_course_runs,
-                headers={
-                    "Authorization": f"SIG-HMAC-SHA256 {signature:s}",
-                    "Content-Type": "application/json",
-                },
-                verify=bool(webhook.get("verify", True)),
-                timeout=3,
-            )
+        course_runs = serialized_course_runs
+        payload = json_course_runs
+        if only_changed:
+            course_runs = get_changed_course_runs(webhook, serialized_course_runs)
+            if not course_runs:
+                logger.info(
+                    "[SYNC] No course run changed since last synchronization with %s",
+                    webhook["url"],
+                )
+                continue
+            if len(course_runs) != len(serialized_course_runs):
+                payload = json.dumps(course_runs, cls=DjangoJSONEncoder).encode("utf-8")
 
-        except requests.exceptions.RetryError as exc:
-            logger.error(
-                "[SYNC] Synchronization failed due to max retries exceeded with url %s",
+        _send_course_runs(webhook, payload, course_runs)
+
+
+def _send_course_runs(webhook, json_course_runs, course_runs):
+    """Post course runs to a webhook and remember them if it succeeded."""
+    signature = hmac.new(
+        str(webhook["secret"]).encode("utf-8"),
+        msg=json_course_runs,
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+
+    try:
+        response = session.post(
+            webhook["url"],
+            data=json_course_runs,
+            headers={
+                "Authorization": f"SIG-HMAC-SHA256 {signature:s}",
+                "Content-Type": "application/json",
+            },
+            verify=bool(webhook.get("verify", True)),
+            timeout=3,
+        )
+
+    except requests.exceptions.RetryError as exc:
+        logger.error(
+            "[SYNC] Synchronization failed due to max retries exceeded with url %s",
+            webhook["url"],
+            exc_info=exc,
+        )
+    except requests.exceptions.RequestException as exc:
+        logger.error(
+            "[SYNC] Synchronization failed with %s.",
+            webhook["url"],
+            exc_info=exc,
+        )
+    else:
+        extra = {
+            "sent": json_course_runs,
+            "response": response.content,
+        }
+        # pylint: disable=no-member
+        if response.status_code == requests.codes.ok:
+            logger.info(
+                "[SYNC] Synchronization succeeded with %s",
                 webhook["url"],
-                exc_info=exc,
+                extra=extra,
             )
-        except requests.exceptions.RequestException as exc:
+            remember_synchronized_course_runs(webhook, course_runs)
+        else:
             logger.error(
-                "[SYNC] Synchronization failed with %s.",
+                "[SYNC] Synchronization failed with %s",
                 webhook["url"],
-                exc_info=exc,
+                extra=extra,
             )
-        else:
-            extra = {
-                "sent": json_course_runs,
-                "response": response.content,
-            }
-            # pylint: disable=no-member
-            if response.status_code == requests.codes.ok:
-                logger.info(
-                    "[SYNC] Synchronization succeeded with %s",
-                    webhook["url"],
-                    extra=extra,
-                )
-            else:
-                logger.error(
-                    "[SYNC] Synchronization failed with %s",
-                    webhook["url"],
-                    extra=extra,
-                )
@@ -1,45 +1,111 @@
 """Certificate views for the Joanie core app."""
 
-import base64
+import hashlib
 
 from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from django.views.generic import TemplateView
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.clickjacking import xframe_options_sameorigin
+from django.views.generic import TemplateView, View
 
 from joanie.core import models
 from joanie.core.enums import VERIFIABLE_CERTIFICATES
 from joanie.core.utils import issuers
 
 
-class CertificateVerificationView(TemplateView):
-    """A view to verify that a certificate is authentic."""
+class CertificateSnapshotMixin:
+    """
+    Serve a snapshot of a verifiable certificate rendered once per version of the
+    certificate and its definition. Responses carry ETag and Last-Modified headers
+    so clients revalidating an unchanged certificate get a 304 response.
+    """
 
-    template_name = "certificate/verify.html"
+    snapshot_prefix = None
+    content_type = None
 
-    def get_context_data(self, **kwargs):
+    def get_certificate(self):
+        """Return the verifiable certificate targeted by the url or raise a 404."""
+        return get_object_or_404(
+            models.Certificate.objects.select_related("certificate_definition"),
+            id=self.kwargs.get("certificate_id"),
+            certificate_definition__template__in=VERIFIABLE_CERTIFICATES,
+        )
+
+    def get_snapshot_cache_key(self, certificate):
         """
-        Try to get the certificate from the certificate id url parameter. If it exists
-        bind the certificate context and the generated PDF to the context.
+        Return the cache key of the certificate snapshot. It changes each time the
+        certificate or its definition are modified.
         """
-        context = super().get_context_data(**kwargs)
+        definition = certificate.certificate_definition
+        return certificate.get_cache_key(
+            prefix=f"{self.snapshot_prefix}-{definition.get_cache_key()}",
+            is_language_sensitive=True,
+        )
 
-        certificate_id = kwargs.get("certificate_id")
-        certificate = get_object_or_404(
-            models.Certificate,
-            id=certificate_id,
-            certificate_definition__template__in=VERIFIABLE_CERTIFICATES,
+    def render_snapshot(self, certificate):
+        """Return the content of the certificate snapshot."""
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        """
+        Return a 304 response if the client already has the current snapshot,
+        otherwise the snapshot rendered from cache if available.
+        """
+        certificate = self.get_certificate()
+        cache_key = self.get_snapshot_cache_key(certificate)
+        etag = quote_etag(hashlib.sha256(cache_key.encode("utf-8")).hexdigest())
+        last_modified = int(
+            max(
+                certificate.updated_on, certificate.certificate_definition.updated_on
+            ).timestamp()
         )
 
-        certificate_context = certificate.get_document_context()
-        document = issuers.generate_document(
-            name=certificate.certificate_definition.template,
-            context=certificate_context,
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
         )
+        if response is None:
+            content = cache.get(cache_key)
+            if content is None:
+                content = self.render_snapshot(certificate)
+                cache.set(
+                    cache_key,
+                    content,
+                    settings.JOANIE_CERTIFICATE_VERIFICATION_CACHE_TTL,
+                )
+            response = HttpResponse(content, content_type=self.content_type)
+
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=settings.JOANIE_CERTIFICATE_VERIFICATION_CACHE_MAX_AGE,
+        )
+        return response
+
+
+class CertificateVerificationView(CertificateSnapshotMixin, TemplateView):
+    """A view to verify that a certificate is authentic."""
+
+    template_name = "certificate/verify.html"
+    snapshot_prefix = "certificate-verification"
+    content_type = "text/html; charset=utf-8"
+
+    def get_context_data(self, **kwargs):
+        """
+        Bind the certificate context to the context. The generated PDF is loaded
+        by the page from the certificate document view.
+        """
+        context = super().get_context_data(**kwargs)
+        certificate = kwargs["certificate"]
 
         context.update(
             {
-                "certificate_context": certificate_context,
-                "base64_pdf": base64.b64encode(document).decode("utf-8"),
+                "certificate_context": certificate.get_document_context(),
                 "site": {
                     "name": settings.JOANIE_CATALOG_NAME,
                     "hostname": settings.JOANIE_CATALOG_BASE_URL,
@@ -48,3 +114,31 @@ class CertificateVerificationView(TemplateView):
         )
 
         return context
+
+    def render_snapshot(self, certificate):
+        """Render the verification page of the certificate."""
+        response = self.render_to_response(
+            self.get_context_data(certificate=certificate, **self.kwargs)
+        )
+        return response.render().content
+
+
+@method_decorator(xframe_options_sameorigin, name="dispatch")
+class CertificateVerificationDocumentView(CertificateSnapshotMixin, View):
+    """A view to get the PDF document of a verifiable certificate."""
+
+    snapshot_prefix = "certificate-verification-document"
+    content_type = "application/pdf"
+
+    def render_snapshot(self, certificate):
+        """Generate the PDF document of the certificate."""
+        return issuers.generate_document(
+            name=certificate.certificate_definition.template,
+            context=certificate.get_document_context(),
+        )
+
+    def get(self, request, *args, **kwargs):
+        """Serve the document inline so it can be embedded in the verification page."""
+        response = super().get(request, *args, **kwargs)
+        response.headers["Content-Disposition"] = "inline"
+        return response
@@ -1,15 +1,26 @@
 """Module to connect to Open edX mongodb and extract data"""
 
+from functools import lru_cache
+
 from django.conf import settings
 
 from pymongo import MongoClient
 
 from joanie.lms_handler.backends.openedx import split_course_key
 
+STRUCTURE_SIGNATORIES_PROJECTION = {
+    "blocks": {"$elemMatch": {"block_type": "course"}},
+    "blocks.fields.certificates.certificates.signatories": 1,
+}
 
-def get_signatory_from_course_id(course_id):
-    """Get signatory from course id"""
-    client = MongoClient(
+
+@lru_cache
+def get_client():
+    """
+    Instantiate the Open edX mongodb client once per process so its connection pool
+    is shared by all the queries instead of connecting and authenticating each time.
+    """
+    return MongoClient(
         host=settings.EDX_MONGODB_HOST,
         port=settings.EDX_MONGODB_PORT,
         username=settings.EDX_MONGODB_USER,
@@ -18,7 +29,33 @@ def get_signatory_from_course_id(course_id):
         readPreference=settings.EDX_MONGODB_READPREFERENCE,
         replicaSet=settings.EDX_MONGODB_REPLICASET,
     )
-    db = client.edxapp
+
+
+def _get_published_branch(mongo_course):
+    """Get the id of the published structure of a course active version"""
+    try:
+        return mongo_course.get("versions").get("published-branch")
+    except (AttributeError, IndexError):
+        return None
+
+
+def _get_signatory_from_structure(structure):
+    """Get the first signatory of the certificates of a course structure"""
+    try:
+        return (
+            structure.get("blocks")[0]
+            .get("fields")
+            .get("certificates")
+            .get("certificates")[0]
+            .get("signatories")[0]
+        )
+    except (AttributeError, IndexError):
+        return None
+
+
+def get_signatory_from_course_id(course_id):
+    """Get signatory from course id"""
+    db = get_client().edxapp
     (org, course, run) = split_course_key(course_id)
     mongo_course = db.modulestore.active_versions.find_one(
         {
@@ -29,28 +66,68 @@ def get_signatory_from_course_id(course_id):
         {"versions.published-branch": 1},
     )
 
-    try:
-        structure_id = mongo_course.get("versions").get("published-branch")
-    except (AttributeError, IndexError):
+    structure_id = _get_published_branch(mongo_course)
+    if structure_id is None:
         return None
 
     structure = db.modulestore.structures.find_one(
-        {"_id": structure_id},
+        {"_id": structure_id}, STRUCTURE_SIGNATORIES_PROJECTION
+    )
+
+    return _get_signatory_from_structure(structure)
+
+
+def get_signatories_from_course_ids(course_ids):
+    """
+    Get signatories of several courses at once, with one query on active versions
+    and one query on structures whatever the number of courses.
+    Return a dict mapping each course id to its signatory, or None if not found.
+    """
+    signatories = {}
+    course_keys = {}
+    for course_id in course_ids:
+        signatories[course_id] = None
+        try:
+            course_keys[split_course_key(course_id)] = course_id
+        except ValueError:
+            continue
+
+    if not course_keys:
+        return signatories
+
+    db = get_client().edxapp
+    mongo_courses = db.modulestore.active_versions.find(
         {
-            "blocks": {"$elemMatch": {"block_type": "course"}},
-            "blocks.fields.certificates.certificates.signatories": 1,
+            "$or": [
+                {"org": org, "course": course, "run": run}
+                for (org, course, run) in course_keys
+            ]
         },
+        {"org": 1, "course": 1, "run": 1, "versions.published-branch": 1},
     )
 
-    try:
-        signatory = (
-            structure.get("blocks")[0]
-            .get("fields")
-            .get("certificates")
-            .get("certificates")[0]
-            .get("signatories")[0]
+    structure_course_ids = {}
+    for mongo_course in mongo_courses:
+        course_id = course_keys.get(
+            (
+                mongo_course.get("org"),
+                mongo_course.get("course"),
+                mongo_course.get("run"),
+            )
         )
-    except (AttributeError, IndexError):
-        signatory = None
+        structure_id = _get_published_branch(mongo_course)
+        if course_id is not None and structure_id is not None:
+            structure_course_ids.setdefault(structure_id, []).append(course_id)
+
+    if not structure_course_ids:
+        return signatories
+
+    structures = db.modulestore.structures.find(
+        {"_id": {"$in": list(structure_course_ids)}}, STRUCTURE_SIGNATORIES_PROJECTION
+    )
+    for structure in structures:
+        signatory = _get_signatory_from_structure(structure)
+        for course_id in structure_course_ids.get(structure.get("_id"), []):
+            signatories[course_id] = signatory
 
-    return signatory
+    return signatories
@@ -17,6 +17,7 @@ from joanie.edx_imports import edx_mongodb
 from joanie.edx_imports.edx_database import OpenEdxDB
 from joanie.edx_imports.utils import (
     download_signature_image,
+    download_signature_images,
     extract_course_id,
     extract_organization_code,
     format_percent,
@@ -85,6 +86,15 @@ def import_certificates_batch(
     hashids = Hashids(salt=settings.EDX_SECRET)
     certificates = db.get_certificates(batch_offset, batch_size, course_id=course_id)
     certificates_to_create = []
+    # Resolve signatories of all the courses of the batch at once
+    signatories = edx_mongodb.get_signatories_from_course_ids(
+        {
+            edx_certificate.course_id
+            for edx_certificate in certificates
+            if edx_certificate.mode == OPENEDX_MODE_VERIFIED
+        }
+    )
+    certificates_signatories = []
 
     for edx_certificate in certificates:
         try:
@@ -170,37 +180,29 @@ def import_certificates_batch(
                 }
 
             certificate_template = CERTIFICATE
+            signatory = None
 
             if edx_certificate.mode == OPENEDX_MODE_VERIFIED:
                 certificate_template = DEGREE
-                signatory = edx_mongodb.get_signatory_from_course_id(
-                    edx_certificate.course_id
-                )
+                signatory = signatories.get(edx_certificate.course_id)
 
                 if signatory:
-                    signature_image_path = signatory.get("signature_image_path")
-                    signature, _ = download_signature_image(signature_image_path)
-                    if signature:
-                        signatory["signature_id"] = str(signature.id)
                     certificate_context["signatory"] = signatory
 
-                    certificate_context = update_context_signatory(
-                        certificate_context, signatory
-                    )
-
-            certificates_to_create.append(
-                models.Certificate(
-                    certificate_definition=models.CertificateDefinition.objects.filter(
-                        template=certificate_template
-                    )
-                    .order_by("created_on")
-                    .first(),
-                    organization=organization,
-                    enrollment=enrollment,
-                    issued_on=make_date_aware(edx_certificate.created_date),
-                    localized_context=certificate_context,
+            certificate = models.Certificate(
+                certificate_definition=models.CertificateDefinition.objects.filter(
+                    template=certificate_template
                 )
+                .order_by("created_on")
+                .first(),
+                organization=organization,
+                enrollment=enrollment,
+                issued_on=make_date_aware(edx_certificate.created_date),
+                localized_context=certificate_context,
             )
+            certificates_to_create.append(certificate)
+            if signatory:
+                certificates_signatories.append((certificate, signatory))
         except Exception as e:
             report["certificates"][_STATE_ERRORS] += 1
             logger.error(
@@ -215,6 +217,28 @@ def import_certificates_batch(
             )
             continue
 
+    # Download and store each distinct signature image of the batch only once
+    signature_images = download_signature_images(
+        signatory.get("signature_image_path")
+        for _context, signatory in certificates_signatories
+    )
+    for certificate, signatory in certificates_signatories:
+        signature_image_path = signatory.get("signature_image_path")
+        if signature_image_path and signature_image_path not in signature_images:
+            report["certificates"][_STATE_ERRORS] += 1
+            logger.error(
+                "Error creating Certificate: signature image %s failed to be stored",
+                signature_image_path,
+                extra={"context": {"enrollment_id": certificate.enrollment_id}},
+            )
+            certificates_to_create.remove(certificate)
+            continue
+
+        signature = signature_images.get(signature_image_path)
+        if signature:
+            signatory["signature_id"] = str(signature.id)
+        update_context_signatory(certificate.localized_context, signatory)
+
     import_string = "%s %s/%s : %s certificates created, %s skipped, %s errors"
     if not dry_run:
         certificate_issued_on_field = models.Certificate._meta.get_field("issued_on")
@@ -299,10 +323,14 @@ def populate_signatory_certificates(certificate_id=None, course_id=None):
     certificates = Certificate.objects.filter(**queryset).select_related("organization")
 
     report["total"] = certificates.count()
+    # Signature images already downloaded during this run indexed by their path
+    signature_images = {}
 
     for certificate in certificates.iterator():
         try:
-            state = _populate_signatory_certificate(certificate, course_id=course_id)
+            state = _populate_signatory_certificate(
+                certificate, course_id=course_id, signature_images=signature_images
+            )
             report[state] += 1
         except Exception as e:
             report[_STATE_ERRORS] += 1
@@ -356,8 +384,13 @@ def _populate_signatory_certificate(certificate, **kwargs):
         return _STATE_SKIPPED
 
     if signatory := edx_mongodb.get_signatory_from_course_id(key):
+        signature_images = kwargs.get("signature_images", {})
         signature_image_path = signatory.get("signature_image_path")
-        signature, _ = download_signature_image(signature_image_path)
+        if signature_image_path not in signature_images:
+            signature_images[signature_image_path], _ = download_signature_image(
+                signature_image_path
+            )
+        signature = signature_images[signature_image_path]
         if signature:
             signatory["signature_id"] = str(signature.id)
         localized_context["signatory"] = signatory
@@ -3,6 +3,7 @@
 import re
 
 # pylint: disable=too-many-statements,not-callable,too-many-locals
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http import HTTPStatus
 from logging import getLogger
@@ -119,26 +120,72 @@ def set_certificate_images(certificate):
     certificate.images.set(images_set)
 
 
-def download_signature_image(path):
-    """Download signature image from OpenEdX then store it"""
-    created = False
-    signature = None
+def _download_signature_image_file(path):
+    """
+    Download signature image from OpenEdX, store it then return its stored path
+    and its checksum, or None if the image failed to be downloaded or hashed.
+    """
     signature_image_path = path
 
     if signature_image_path.startswith("/"):
         signature_image_path = signature_image_path[1:]
 
-    signature_path = download_and_store(signature_image_path)
-
-    if signature_path:
-        signature_file = default_storage.open(signature_path)
-        signature_checksum = file_checksum(signature_file)
-        (signature, created) = DocumentImage.objects.get_or_create(
-            checksum=signature_checksum,
-            defaults={"file": signature_path},
+    try:
+        signature_path = download_and_store(signature_image_path)
+
+        if not signature_path:
+            return None, None
+
+        with default_storage.open(signature_path) as signature_file:
+            return signature_path, file_checksum(signature_file)
+    except Exception as error:  # noqa: BLE001 pylint: disable=broad-exception-caught
+        logger.error(
+            "Unable to store signature image %s: %s",
+            path,
+            error,
+            extra={"context": {"exception": error}},
         )
+        return None
+
 
-    return signature, created
+def _get_or_create_signature_image(signature_path, signature_checksum):
+    """Get or create the document image of a stored signature image"""
+    if not signature_path:
+        return None, False
+
+    return DocumentImage.objects.get_or_create(
+        checksum=signature_checksum,
+        defaults={"file": signature_path},
+    )
+
+
+def download_signature_image(path):
+    """Download signature image from OpenEdX then store it"""
+    return _get_or_create_signature_image(
+        *(_download_signature_image_file(path) or (None, None))
+    )
+
+
+def download_signature_images(paths):
+    """
+    Download distinct signature images from OpenEdX concurrently then store them.
+    Files are downloaded and hashed by a pool of threads while document images are
+    created from the calling thread, which owns the database connection.
+    Return a dict mapping each path to its document image, or None if the image
+    was not found. Paths of images which failed to be downloaded or hashed are left
+    out of the dict.
+    """
+    paths = list(dict.fromkeys(path for path in paths if path))
+    if not paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=settings.EDX_DOWNLOAD_WORKERS) as executor:
+        signature_files = executor.map(_download_signature_image_file, paths)
+        return {
+            path: _get_or_create_signature_image(*signature_file)[0]
+            for path, signature_file in zip(paths, signature_files, strict=True)
+            if signature_file is not None
+        }
 
 
 def update_context_signatory(context, signatory):
@@ -4,13 +4,19 @@ API endpoints
 
 from http import HTTPStatus
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.utils import timezone
+
 from rest_framework import exceptions
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
 from joanie.core import models, utils
+from joanie.core.utils.catalog_synchronization import record_course_runs_changes
 from joanie.core.utils.signature import check_signature
 from joanie.lms_handler import LMSHandler
+from joanie.lms_handler.serializers import SyncCourseRunSerializer
 
 
 def detect_lms_from_resource_link(resource_link):
@@ -82,3 +88,171 @@ def course_runs_sync(request):
         models.CourseRun.objects.create(**serializer.validated_data, course=course)
 
     return Response({"success": True})
+
+
+def prepare_new_course_runs(new_items, set_errors):
+    """
+    Return the new course runs that are valid and can be created in bulk, attached
+    to their course. Courses that do not exist yet are only created once all the
+    course runs are validated, for the ones of valid course runs.
+
+    Errors of invalid course runs are reported with the `set_errors` callback.
+    """
+    course_runs_to_create = {}
+    for index, course_run, course_number, title in new_items:
+        try:
+            course_run.full_clean(exclude=["course"], validate_unique=False)
+        except DjangoValidationError as error:
+            set_errors(index, error.message_dict)
+            continue
+        course_runs_to_create.setdefault(course_run.resource_link, []).append(
+            (index, course_run, course_number, title)
+        )
+
+    # Resource links are normalized when course runs are cleaned so they may
+    # collide with each other or with the ones of other course runs
+    existing_resource_links = set(
+        models.CourseRun.objects.filter(
+            resource_link__in=course_runs_to_create
+        ).values_list("resource_link", flat=True)
+    )
+    valid_items = []
+    for resource_link, items in course_runs_to_create.items():
+        if resource_link in existing_resource_links or len(items) > 1:
+            for index, *_item in items:
+                set_errors(
+                    index,
+                    {
+                        "resource_link": [
+                            "Course run with this resource link already exists."
+                        ]
+                    },
+                )
+            continue
+        valid_items.append(items[0])
+
+    # Look for the courses targeted by the resource links of new course runs
+    courses = models.Course.objects.only("pk", "code").in_bulk(
+        {course_number for _index, _course_run, course_number, _title in valid_items},
+        field_name="code",
+    )
+    new_course_runs = []
+    for _index, course_run, course_number, title in valid_items:
+        if course_number not in courses:
+            courses[course_number] = models.Course.objects.create(
+                code=course_number, title=title
+            )
+        course_run.course = courses[course_number]
+        new_course_runs.append(course_run)
+
+    return new_course_runs
+
+
+@api_view(["POST"])
+def course_runs_sync_bulk(request):
+    """View for the web hook to create or update many course runs at once based on their
+    resource link, e.g. when an LMS republishes its whole catalog.
+
+    - Existing course runs and courses are retrieved all together
+    - Course runs are created or updated in bulk in a single transaction and synchronized
+      all together once it is committed
+    - An invalid course run is reported without preventing the others from being
+      created or updated
+
+    Parameters
+    ----------
+    request : Type[django.http.request.HttpRequest]
+        The request on the API endpoint, it should contain a payload with a list of
+        course runs.
+
+    Returns
+    -------
+    Type[rest_framework.response.Response]
+        HttpResponse acknowledging the success or failure of the synchronization of
+        each course run, in the order of the payload.
+    """
+    check_signature(request, "JOANIE_COURSE_RUN_SYNC_SECRETS")
+
+    if not isinstance(request.data, list):
+        raise exceptions.ValidationError(
+            {"non_field_errors": ["Expected a list of course runs."]}
+        )
+
+    results = [{"success": True} for _item in request.data]
+
+    def set_errors(index, errors):
+        results[index] = {"success": False, "errors": errors}
+
+    # Select LMS from resource links
+    items_by_resource_link = {}
+    for index, data in enumerate(request.data):
+        resource_link = data.get("resource_link") if isinstance(data, dict) else None
+        try:
+            lms = detect_lms_from_resource_link(resource_link)
+        except exceptions.ValidationError as error:
+            set_errors(index, error.detail)
+            continue
+
+        if resource_link in items_by_resource_link:
+            set_errors(
+                index,
+                {
+                    "resource_link": [
+                        "A single item is expected for each resource link."
+                    ]
+                },
+            )
+            continue
+        items_by_resource_link[resource_link] = (index, lms, data)
+
+    with transaction.atomic():
+        target_course_runs = (
+            models.CourseRun.objects.select_for_update()
+            .only("pk", "course", *SyncCourseRunSerializer.Meta.fields)
+            .in_bulk(items_by_resource_link, field_name="resource_link")
+        )
+
+        course_runs_to_update = []
+        update_fields = set()
+        new_items = []
+        for resource_link, (index, lms, data) in items_by_resource_link.items():
+            target_course_run = target_course_runs.get(resource_link)
+            serializer = lms.get_course_run_serializer(
+                data, partial=bool(target_course_run)
+            )
+            if serializer.is_valid() is not True:
+                set_errors(index, serializer.errors)
+                continue
+
+            if target_course_run:
+                # Remove protected fields before update
+                cleaned_data = lms.clean_course_run_data(serializer.validated_data)
+                for field, value in cleaned_data.items():
+                    setattr(target_course_run, field, value)
+                update_fields.update(cleaned_data)
+                course_runs_to_update.append(target_course_run)
+            else:
+                course_number = utils.normalize_code(lms.extract_course_number(data))
+                new_items.append(
+                    (
+                        index,
+                        models.CourseRun(**serializer.validated_data),
+                        course_number,
+                        data.get("title", course_number),
+                    )
+                )
+
+        new_course_runs = prepare_new_course_runs(new_items, set_errors)
+        models.CourseRun.objects.bulk_create(new_course_runs)
+        if course_runs_to_update:
+            now = timezone.now()
+            for course_run in course_runs_to_update:
+                course_run.updated_on = now
+            models.CourseRun.objects.bulk_update(
+                course_runs_to_update, fields=[*update_fields, "updated_on"]
+            )
+
+        if synchronized_course_runs := new_course_runs + course_runs_to_update:
+            record_course_runs_changes(synchronized_course_runs)
+
+    return Response(results)
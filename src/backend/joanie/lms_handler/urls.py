@@ -6,10 +6,15 @@ from django.urls import re_path
 
 from rest_framework import routers
 
-from joanie.lms_handler.api import course_runs_sync
+from joanie.lms_handler.api import course_runs_sync, course_runs_sync_bulk
 
 ROUTER = routers.SimpleRouter()
 
 urlpatterns = ROUTER.urls + [
     re_path("course-runs-sync/?$", course_runs_sync, name="course-runs-sync"),
+    re_path(
+        "course-runs-sync/bulk/?$",
+        course_runs_sync_bulk,
+        name="course-runs-sync-bulk",
+    ),
 ]
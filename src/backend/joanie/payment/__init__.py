@@ -1,9 +1,13 @@
 """Payment"""
 
+from functools import lru_cache
+
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.module_loading import import_string
 
+from joanie.payment.working_days import WorkingDaysCalendar
+
 
 def get_payment_backend():
     """Instantiate a payment backend through `JOANIE_PAYMENT_BACKEND` setting."""
@@ -19,16 +23,39 @@ def get_payment_backend():
         ) from error
 
 
+@lru_cache
+def _get_calendar(calendar_path):
+    """
+    Instantiate the calendar once per process so holidays it computes for each year
+    are kept in memory.
+    """
+    return import_string(calendar_path)()
+
+
 def get_country_calendar():
     """
     Instantiate the contract's calendar through `JOANIE_CONTRACT_COUNTRY_CALENDAR` setting.
     """
     try:
         calendar_path = settings.JOANIE_CALENDAR
-        return import_string(calendar_path)()
+        return _get_calendar(calendar_path)
     except (AttributeError, ImportError) as error:
         raise ImproperlyConfigured(
             "Cannot instantiate a calendar. "
             f'`JOANIE_CONTRACT_COUNTRY_CALENDAR="{calendar_path}"` configuration seems not valid. '
             "Check your settings.py"
         ) from error
+
+
+@lru_cache
+def _get_working_days_calendar(calendar):
+    """Build the working days tables of a calendar once per process."""
+    return WorkingDaysCalendar(calendar)
+
+
+def get_working_days_calendar():
+    """
+    Return the working days calendar service of the country calendar, answering
+    working day queries from tables computed once per year.
+    """
+    return _get_working_days_calendar(get_country_calendar())
@@ -354,9 +354,13 @@ class BasePaymentBackend:
             "subclasses of BasePaymentBackend must provide a create_one_click_payment() method."
         )
 
-    def create_zero_click_payment(self, order, installment, credit_card_token):
+    def create_zero_click_payment(
+        self, order, installment, credit_card_token, idempotency_key=None
+    ):
         """
         Method used to create a zero click payment from the payment provider.
+        When an idempotency key is given, the payment provider must not charge the
+        installment again if a payment with the same key has already been accepted.
         """
         raise NotImplementedError(
             "subclasses of BasePaymentBackend must provide a create_zero_click_payment() method."
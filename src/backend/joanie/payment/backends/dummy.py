@@ -236,7 +236,9 @@ class DummyPaymentBackend(BasePaymentBackend):
             "is_paid": True,
         }
 
-    def create_zero_click_payment(self, order, installment, credit_card_token):
+    def create_zero_click_payment(  # pylint: disable=unused-argument
+        self, order, installment, credit_card_token, idempotency_key=None
+    ):
         """
         Call create_payment method and bind a `is_paid` property to payment information.
         """
@@ -265,18 +265,28 @@ class LyraBackend(BasePaymentBackend):
 
         return self._get_payment_info(url, payload)
 
-    def create_zero_click_payment(self, order, installment, credit_card_token):
+    def create_zero_click_payment(
+        self, order, installment, credit_card_token, idempotency_key=None
+    ):
         """
         Create a zero click payment object for a given order
 
+        Lyra does not deduplicate payment requests, so when an idempotency key is
+        given, it is recorded in the metadata of the payment and the transactions of
+        the order are checked first to not charge an installment already paid.
+
         https://docs.lyra.com/fr/rest/V4.0/api/kb/zero_click_payment.html
         https://docs.lyra.com/fr/rest/V4.0/api/playground/Charge/CreatePayment
         """
+        if idempotency_key and self.is_already_paid(order, installment):
+            return True
 
         url = f"{self.api_url}Charge/CreatePayment"
         payload = self._get_common_payload_data(order, installment)
         payload["formAction"] = "SILENT"
         payload["paymentMethodToken"] = credit_card_token
+        if idempotency_key:
+            payload["metadata"]["idempotency_key"] = idempotency_key
 
         credit_card = CreditCard.objects.get(token=credit_card_token)
         if (
@@ -194,7 +194,9 @@ class PayplugBackend(BasePaymentBackend):
             "is_paid": payment.is_paid,
         }
 
-    def create_zero_click_payment(self, order, installment, credit_card_token):
+    def create_zero_click_payment(
+        self, order, installment, credit_card_token, idempotency_key=None
+    ):
         """
         Method used to create a zero click payment from payplug.
         """
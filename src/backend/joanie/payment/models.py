@@ -2,12 +2,16 @@
 Declare and configure models for the payment part
 """
 
+import hashlib
+import json
 import logging
 from decimal import Decimal as D
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -22,7 +26,7 @@ from parler.utils.context import switch_language
 
 from joanie.core import enums
 from joanie.core.models.base import BaseModel
-from joanie.core.utils import get_default_currency_symbol, merge_dict
+from joanie.core.utils import get_default_currency_symbol, issuers, merge_dict
 from joanie.payment import enums as payment_enums
 from joanie.payment import get_payment_backend
 from joanie.payment.exceptions import PaymentProviderAPIException
@@ -253,6 +257,48 @@ class Invoice(BaseModel):
 
         return merge_dict(base_context, localized_context)
 
+    def get_document(self, language_code=None):
+        """
+        Return the invoice document for the given language as a file opened in
+        binary mode.
+
+        An issued invoice does not change so its document is only rendered the first
+        time it is requested, then it is stored under a name built from the invoice
+        reference, the language and a hash of its context. The issue date is left out
+        of this hash as it changes each time the invoice is saved. The document is
+        rendered again only if its context changes, the documents previously rendered
+        in the same language being deleted.
+        """
+        language = get_language_settings(language_code or get_language())["code"]
+        context = self.get_document_context(language_code=language)
+        context_hash = hashlib.sha256(
+            json.dumps(
+                {**context, "metadata": {**context["metadata"], "issued_on": None}},
+                cls=DjangoJSONEncoder,
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        storage = storages["invoices"]
+        document_name = f"{self.reference}/{language}_{context_hash}.pdf"
+
+        if not storage.exists(document_name):
+            document_name = storage.save(
+                document_name,
+                ContentFile(
+                    issuers.generate_document(
+                        name=payment_enums.INVOICE_TYPE_INVOICE, context=context
+                    )
+                ),
+            )
+            _directories, documents = storage.listdir(self.reference)
+            for document in documents:
+                if document.startswith(f"{language}_") and (
+                    f"{self.reference}/{document}" != document_name
+                ):
+                    storage.delete(f"{self.reference}/{document}")
+
+        return storage.open(document_name, mode="rb")
+
     def normalize_reference(self):
         """
         Generate a normalized reference related to the date
@@ -0,0 +1,81 @@
+"""
+Working days calendar service.
+
+Workalendar calendars recompute whether a day is a working day each time they are
+asked. This service precomputes, once per year and per process, the table of working
+days of a calendar so working day queries are answered with a lookup.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+
+class WorkingDaysCalendar:
+    """
+    Answer working day queries of a workalendar calendar from tables of the
+    ordinals of its working days, computed once per year.
+    """
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self._lock = threading.Lock()
+        self._working_ordinals = {}
+        self._working_ordinals_sets = {}
+
+    def get_working_ordinals(self, year):
+        """Return the sorted list of the ordinals of the working days of the year."""
+        try:
+            return self._working_ordinals[year]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if year not in self._working_ordinals:
+                first_day = date(year, 1, 1)
+                working_ordinals = [
+                    day.toordinal()
+                    for day in (
+                        first_day + timedelta(days=offset)
+                        for offset in range((date(year + 1, 1, 1) - first_day).days)
+                    )
+                    if self.calendar.is_working_day(day)
+                ]
+                self._working_ordinals_sets[year] = frozenset(working_ordinals)
+                self._working_ordinals[year] = working_ordinals
+
+        return self._working_ordinals[year]
+
+    def is_working_day(self, day):
+        """Return True if the day (a date or a datetime) is a working day."""
+        self.get_working_ordinals(day.year)
+        return day.toordinal() in self._working_ordinals_sets[day.year]
+
+    def add_working_days(self, day, delta):
+        """
+        Return the day (a date or a datetime) shifted by `delta` working days. As
+        workalendar does, the day itself is never counted and a datetime keeps its
+        time.
+        """
+        if delta == 0:
+            return day
+
+        origin = ordinal = day.toordinal()
+        year = day.year
+        remaining = abs(delta)
+        while True:
+            working_ordinals = self.get_working_ordinals(year)
+            if delta > 0:
+                index = bisect_right(working_ordinals, ordinal) + remaining - 1
+                if index < len(working_ordinals):
+                    return day + timedelta(days=working_ordinals[index] - origin)
+                remaining = index - len(working_ordinals) + 1
+                year += 1
+                ordinal = date(year, 1, 1).toordinal() - 1
+            else:
+                index = bisect_left(working_ordinals, ordinal) - remaining
+                if index >= 0:
+                    return day + timedelta(days=working_ordinals[index] - origin)
+                remaining = -index
+                year -= 1
+                ordinal = date(year + 1, 1, 1).toordinal()
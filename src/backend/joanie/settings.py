@@ -126,6 +126,13 @@ class Base(Configuration):
                 "base_url": "/contracts/",
             },
         },
+        "invoices": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {
+                "location": os.path.join(DATA_DIR, "invoices"),
+                "base_url": "/invoices/",
+            },
+        },
     }
 
     # Internationalization
@@ -289,6 +296,26 @@ class Base(Configuration):
     JOANIE_ENROLLMENT_GRADE_CACHE_TTL = values.PositiveIntegerValue(
         600, environ_prefix=None
     )  # 10 minutes
+    JOANIE_CERTIFICATE_VERIFICATION_CACHE_TTL = values.PositiveIntegerValue(
+        86400, environ_prefix=None
+    )  # 1 day
+    JOANIE_CERTIFICATE_VERIFICATION_CACHE_MAX_AGE = values.PositiveIntegerValue(
+        3600, environ_prefix=None
+    )  # 1 hour
+    # Payment plans previewed on offerings are also cached per day
+    JOANIE_PAYMENT_PLAN_CACHE_TTL = values.PositiveIntegerValue(
+        600, environ_prefix=None
+    )  # 10 minutes
+    # In-process cache kept in front of the shared cache for hot keys (serialized
+    # resources, enrollment grades). Setting its size or TTL to 0 disables it.
+    JOANIE_CACHE_L1_MAX_SIZE = values.PositiveIntegerValue(1000, environ_prefix=None)
+    JOANIE_CACHE_L1_TTL = values.PositiveIntegerValue(
+        10, environ_prefix=None
+    )  # 10 seconds
+    # Minimum delay between two checks of keys cleared by other workers
+    JOANIE_CACHE_L1_SYNC_INTERVAL = values.PositiveIntegerValue(
+        1, environ_prefix=None
+    )  # 1 second
 
     REST_FRAMEWORK = {
         "DEFAULT_AUTHENTICATION_CLASSES": (
@@ -469,6 +496,27 @@ class Base(Configuration):
         environ_name="JOANIE_INSTALLMENT_REMINDER_DAYS_BEFORE",
         environ_prefix=None,
     )
+    # Record side effects of order transitions (emails, payments, LMS enrollments...)
+    # in an outbox within the transaction and execute them in Celery workers once it
+    # is committed instead of executing them during the request. Disabled by default
+    # until it is rolled out.
+    JOANIE_ORDER_SIDE_EFFECTS_OUTBOX = values.BooleanValue(
+        False,
+        environ_name="JOANIE_ORDER_SIDE_EFFECTS_OUTBOX",
+        environ_prefix=None,
+    )
+    # Maximum number of attempts to execute an order side effect before it is marked
+    # as failed, retries being delayed exponentially from the base delay (in seconds)
+    JOANIE_ORDER_SIDE_EFFECTS_MAX_ATTEMPTS = values.PositiveIntegerValue(
+        5,
+        environ_name="JOANIE_ORDER_SIDE_EFFECTS_MAX_ATTEMPTS",
+        environ_prefix=None,
+    )
+    JOANIE_ORDER_SIDE_EFFECTS_RETRY_DELAY = values.PositiveIntegerValue(
+        30,
+        environ_name="JOANIE_ORDER_SIDE_EFFECTS_RETRY_DELAY",
+        environ_prefix=None,
+    )
     # Link to the microcertification terms of service which is used
     # at a first place in the Unicamp certificate template
     JOANIE_DEGREE_MICROCERTIFICATION_TERMS_URL = values.Value(
@@ -504,6 +552,27 @@ class Base(Configuration):
     # e.g:
     # DJANGO_COURSE_WEB_HOOKS=[{"url": "http://example.com", "secret": "secret", "verify": true}]
     COURSE_WEB_HOOKS = JSONValue([])
+    # Time during which the fingerprint of the last payload sent for a course run to
+    # a webhook is kept, after that the course run is considered changed again.
+    JOANIE_COURSE_RUN_SYNC_FINGERPRINT_TTL = values.PositiveIntegerValue(
+        7 * 24 * 60 * 60,  # 7 days
+        environ_name="JOANIE_COURSE_RUN_SYNC_FINGERPRINT_TTL",
+        environ_prefix=None,
+    )
+    # Record catalog changes notified by signals and synchronize them at once when the
+    # transaction is committed instead of synchronizing each change right away.
+    JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE = values.BooleanValue(
+        True,
+        environ_name="JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE",
+        environ_prefix=None,
+    )
+    # Number of seconds during which debounced catalog changes of all requests are
+    # gathered before being synchronized. If 0, changes are synchronized on commit.
+    JOANIE_CATALOG_SYNCHRONIZATION_COALESCING_WINDOW = values.PositiveIntegerValue(
+        0,
+        environ_name="JOANIE_CATALOG_SYNCHRONIZATION_COALESCING_WINDOW",
+        environ_prefix=None,
+    )
 
     JOANIE_ACTIVITY_LOG_SECRETS = values.ListValue(
         [],
@@ -590,6 +659,10 @@ class Base(Configuration):
         environ_name="JOANIE_NEWSLETTER_CLIENT",
         environ_prefix=None,
     )
+    # Number of contacts whose status is checked concurrently by newsletter clients
+    JOANIE_NEWSLETTER_CLIENT_WORKERS = values.PositiveIntegerValue(
+        4, environ_name="JOANIE_NEWSLETTER_CLIENT_WORKERS", environ_prefix=None
+    )
     BREVO_API_URL = values.Value(
         "https://api.brevo.com/v3/", environ_name="BREVO_API_URL", environ_prefix=None
     )
@@ -602,6 +675,13 @@ class Base(Configuration):
     BREVO_WEBHOOK_TOKEN = values.Value(
         None, environ_name="BREVO_WEBHOOK_TOKEN", environ_prefix=None
     )
+    BREVO_SYNCHRONIZATION_PAGE_SIZE = values.PositiveIntegerValue(
+        500, environ_name="BREVO_SYNCHRONIZATION_PAGE_SIZE", environ_prefix=None
+    )
+    # Number of contact pages fetched concurrently from the Brevo API
+    BREVO_SYNCHRONIZATION_WORKERS = values.PositiveIntegerValue(
+        1, environ_name="BREVO_SYNCHRONIZATION_WORKERS", environ_prefix=None
+    )
 
     SARBACANE_API_URL = values.Value(
         "https://sarbacaneapis.com/v1",
@@ -682,6 +762,10 @@ class Base(Configuration):
         None, environ_name="EDX_TIME_ZONE", environ_prefix=None
     )
     EDX_SECRET = values.Value(None, environ_name="EDX_SECRET", environ_prefix=None)
+    # Number of files downloaded concurrently from Open edX by import tasks
+    EDX_DOWNLOAD_WORKERS = values.PositiveIntegerValue(
+        4, environ_name="EDX_DOWNLOAD_WORKERS", environ_prefix=None
+    )
 
     # pylint: disable=invalid-name
     @property
@@ -840,6 +924,10 @@ class Test(Base):
     JOANIE_LMS_MOODLE_STUDENT_ROLE_ID = "5"
 
     COURSE_WEB_HOOKS = []
+    # Signals tests expect the catalog to be synchronized right away
+    JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE = False
+    # Tests clearing the shared cache expect in-process values to be dropped at once
+    JOANIE_CACHE_L1_SYNC_INTERVAL = 0
 
     JOANIE_PAYMENT_BACKEND = {
         "backend": "joanie.payment.backends.dummy.DummyPaymentBackend",
@@ -905,6 +993,13 @@ class Test(Base):
                 "base_url": "/contracts/",
             },
         },
+        "invoices": {
+            "BACKEND": "django.core.files.storage.InMemoryStorage",
+            "OPTIONS": {
+                "location": os.path.join(DATA_DIR, "invoices"),
+                "base_url": "/invoices/",
+            },
+        },
     }
 
     CELERY_TASK_ALWAYS_EAGER = values.BooleanValue(True)
@@ -1013,6 +1108,16 @@ class Production(Base):
                 "location": "contracts",
             },
         },
+        "invoices": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {
+                "bucket_name": values.Value(
+                    "tf-default-joanie-invoices-storage",
+                    environ_name="INVOICES_AWS_STORAGE_BUCKET_NAME",
+                ),
+                "location": "invoices",
+            },
+        },
     }
 
     # Cache
@@ -0,0 +1,153 @@
+"""
+Base test case to benchmark API endpoints.
+
+Each benchmarked endpoint is seeded with a number of rows then its request is played
+several times against a cold cache, and again once as many rows have been seeded.
+The number of database queries must not grow with the number of rows (or only by a
+small constant per row) so N+1 query patterns make the benchmarks fail. The 95th
+percentile of the duration of the request on the largest volume is compared to the
+latency budget of the endpoint.
+
+Benchmarks are marked with the `benchmark` marker and excluded from the default test
+run, run them with `make benchmark-back`. Their behavior can be tuned with
+environment variables:
+
+- JOANIE_BENCHMARK_REPEAT: number of runs per volume (default: 5),
+- JOANIE_BENCHMARK_LATENCY_FACTOR: factor applied to latency budgets to adapt them
+  to the speed of the host running the benchmarks, 0 disables latency checks
+  (default: 1),
+- JOANIE_BENCHMARK_REPORT: path of a JSON file in which results are written.
+"""
+
+import json
+import logging
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from joanie.tests.base import BaseAPITestCase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    """Queries and latency percentiles recorded for an endpoint."""
+
+    name: str
+    nb_rows: int
+    runs: int
+    queries: int
+    queries_on_half_rows: int
+    p50: float
+    p95: float
+
+
+class BenchmarkTestCase(BaseAPITestCase):
+    """Base test case to check query and latency budgets of API endpoints."""
+
+    repeat = int(os.environ.get("JOANIE_BENCHMARK_REPEAT", "5"))
+    latency_factor = float(os.environ.get("JOANIE_BENCHMARK_LATENCY_FACTOR", "1"))
+    report_path = os.environ.get("JOANIE_BENCHMARK_REPORT")
+
+    def play(self, name, request):
+        """
+        Play the request once to warm it up then several times against a cold cache.
+        Return the maximum number of queries of a run and the duration (in seconds) of
+        each run.
+
+        `request` is a callable performing the request and returning the response.
+        """
+        # Warm up the endpoint so values computed and stored on first read are not
+        # recorded in queries and durations
+        cache.clear()
+        response = request()
+        if response.streaming:
+            b"".join(response.streaming_content)
+
+        queries = []
+        durations = []
+        for _ in range(max(self.repeat, 2)):
+            cache.clear()
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = request()
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                durations.append(time.perf_counter() - start)
+            self.assertLess(response.status_code, 400, name)
+            queries.append(len(context.captured_queries))
+        return max(queries), durations
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def benchmark(  # noqa: PLR0913
+        self, name, request, seed, nb_rows, max_latency, max_queries_per_row=0
+    ):
+        """
+        Seed `nb_rows` rows and play the request, then seed as many rows and play it
+        again. The number of queries must not grow by more than `max_queries_per_row`
+        per seeded row and the 95th percentile of the duration of the request on all
+        the rows must stay within `max_latency` seconds.
+
+        `seed` is a callable seeding the given number of rows.
+        """
+        seed(nb_rows)
+        queries_on_half_rows, _durations = self.play(name, request)
+        seed(nb_rows)
+        queries, durations = self.play(name, request)
+
+        percentiles = statistics.quantiles(durations, n=100, method="inclusive")
+        result = BenchmarkResult(
+            name=name,
+            nb_rows=2 * nb_rows,
+            runs=len(durations),
+            queries=queries,
+            queries_on_half_rows=queries_on_half_rows,
+            p50=percentiles[49],
+            p95=percentiles[94],
+        )
+        self.report(result)
+
+        self.assertLessEqual(
+            queries - queries_on_half_rows,
+            max_queries_per_row * nb_rows,
+            f"{name} runs {queries_on_half_rows} queries on {nb_rows} rows and "
+            f"{queries} queries on {2 * nb_rows} rows, its budget is "
+            f"{max_queries_per_row} queries per row.",
+        )
+        if self.latency_factor:
+            self.assertLessEqual(
+                result.p95,
+                max_latency * self.latency_factor,
+                f"{name} exceeds its p95 latency budget of {max_latency}s.",
+            )
+        return result
+
+    def report(self, result):
+        """Log the result and append it to the JSON report if one is configured."""
+        logger.info(
+            "[BENCHMARK] %s: %s queries on %s rows (%s on half of them), "
+            "p50 %.1fms, p95 %.1fms",
+            result.name,
+            result.queries,
+            result.nb_rows,
+            result.queries_on_half_rows,
+            result.p50 * 1000,
+            result.p95 * 1000,
+        )
+        if not self.report_path:
+            return
+
+        try:
+            with open(self.report_path, encoding="utf-8") as report_file:
+                results = json.load(report_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            results = {}
+        results[result.name] = asdict(result)
+        with open(self.report_path, "w", encoding="utf-8") as report_file:
+            json.dump(results, report_file, indent=2)
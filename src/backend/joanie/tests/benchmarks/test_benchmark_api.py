@@ -0,0 +1,193 @@
+"""
+Query and latency budgets of the hot API endpoints.
+
+Endpoints are seeded with the Demo generator. The number of queries of an endpoint
+must not depend on the number of rows it serves, apart from the small constant per
+row allowed by its budget. A test failing here means a change introduced new queries
+(e.g. an N+1 pattern) or slowed down an endpoint: check the change before raising a
+budget.
+"""
+
+import hashlib
+import hmac
+import json
+
+from django.test import override_settings
+
+import pytest
+
+from joanie.core import enums, factories
+from joanie.tests.benchmarks.base import BenchmarkTestCase
+from joanie.tests.testing_utils import Demo
+
+pytestmark = pytest.mark.benchmark
+
+# Number of rows seeded twice per endpoint, maximum number of queries per seeded row
+# and 95th percentile latency (in seconds) on all the rows per endpoint. Query
+# budgets per row are the queries endpoints run today for each of their rows, so
+# that any new query per row makes them fail. Latency budgets are about twice the
+# latencies measured when they were set.
+BUDGETS = {
+    "orders-list": (50, 12, 10.0),
+    "enrollments-list": (50, 12, 12.0),
+    "offerings-retrieve": (10, 1, 1.5),
+    "courses-list": (50, 3, 3.0),
+    "admin-orders-list": (50, 2, 1.5),
+    "admin-orders-export": (50, 10, 6.5),
+    "course-runs-sync": (20, 0, 0.5),
+}
+
+
+class APIBenchmarkTestCase(BenchmarkTestCase):
+    """Benchmark hot API endpoints on volumes seeded with the Demo generator."""
+
+    def setUp(self):
+        super().setUp()
+        self.demo = Demo()
+        self.user = factories.UserFactory()
+        self.admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.course_user = factories.UserFactory()
+        self.organization = factories.OrganizationFactory()
+
+    def seed_orders(self, nb_orders):
+        """Seed orders of the user on certificate and credential products."""
+        for index in range(nb_orders):
+            self.demo.create_product_purchased(
+                self.user,
+                self.course_user,
+                self.organization,
+                enums.PRODUCT_TYPE_CERTIFICATE
+                if index % 2
+                else enums.PRODUCT_TYPE_CREDENTIAL,
+            )
+
+    def get_user_client_get(self, user, url):
+        """Return a callable performing a GET request authenticated as the user."""
+        token = self.generate_token_from_user(user)
+        return lambda: self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def assertWithinBudget(self, name, request, seed):
+        """Benchmark the request against the budget of the endpoint."""
+        nb_rows, max_queries_per_row, max_latency = BUDGETS[name]
+        self.benchmark(
+            name,
+            request,
+            seed,
+            nb_rows,
+            max_latency,
+            max_queries_per_row=max_queries_per_row,
+        )
+
+    def test_benchmark_api_orders_list(self):
+        """Listing orders of a user should stay within its budget."""
+        self.assertWithinBudget(
+            "orders-list",
+            self.get_user_client_get(self.user, "/api/v1.0/orders/?page_size=100"),
+            self.seed_orders,
+        )
+
+    def test_benchmark_api_enrollments_list(self):
+        """Listing enrollments of a user should stay within its budget."""
+        self.assertWithinBudget(
+            "enrollments-list",
+            self.get_user_client_get(self.user, "/api/v1.0/enrollments/?page_size=100"),
+            lambda nb_enrollments: [
+                self.demo.create_product_certificate_enrollment(
+                    self.user, self.course_user, self.organization
+                )
+                for _ in range(nb_enrollments)
+            ],
+        )
+
+    def test_benchmark_api_offerings_retrieve(self):
+        """Retrieving an offering anonymously should stay within its budget."""
+        product = self.demo.create_product_credential(
+            self.course_user, self.organization
+        )
+        offering = product.offerings.get()
+        url = f"/api/v1.0/courses/{offering.course.code}/products/{product.id}/"
+
+        def seed_target_courses(nb_courses):
+            for course in self.demo.create_course(
+                self.course_user, self.organization, nb_courses, True
+            ):
+                factories.ProductTargetCourseRelationFactory(
+                    product=product, course=course
+                )
+
+        self.assertWithinBudget(
+            "offerings-retrieve", lambda: self.client.get(url), seed_target_courses
+        )
+
+    def test_benchmark_api_courses_list(self):
+        """Listing courses a user has access to should stay within its budget."""
+        self.assertWithinBudget(
+            "courses-list",
+            self.get_user_client_get(self.user, "/api/v1.0/courses/?page_size=100"),
+            lambda nb_courses: self.demo.create_course(
+                self.user, self.organization, nb_courses, True
+            ),
+        )
+
+    def test_benchmark_api_admin_orders_list(self):
+        """Listing orders in the back office should stay within its budget."""
+        self.client.force_login(self.admin)
+        self.assertWithinBudget(
+            "admin-orders-list",
+            lambda: self.client.get("/api/v1.0/admin/orders/?page_size=100"),
+            self.seed_orders,
+        )
+
+    def test_benchmark_api_admin_orders_export(self):
+        """Exporting orders in the back office should stay within its budget."""
+        self.client.force_login(self.admin)
+        self.assertWithinBudget(
+            "admin-orders-export",
+            lambda: self.client.get("/api/v1.0/admin/orders/export/"),
+            self.seed_orders,
+        )
+
+    @override_settings(
+        JOANIE_COURSE_RUN_SYNC_SECRETS=["shared secret"],
+        JOANIE_LMS_BACKENDS=[
+            {
+                "BASE_URL": "http://localhost:8073",
+                "BACKEND": "joanie.lms_handler.backends.openedx.OpenEdXLMSBackend",
+                "COURSE_REGEX": r"^.*/courses/(?P<course_id>.*)/course/?$",
+                "JS_BACKEND": "base",
+                "JS_COURSE_REGEX": r"^.*/courses/(?<course_id>.*)/course/?$",
+            }
+        ],
+    )
+    def test_benchmark_api_course_runs_sync(self):
+        """Synchronizing a course run from the LMS should stay within its budget."""
+        course = factories.CourseFactory(code="DemoX")
+        body = json.dumps(
+            {
+                "resource_link": (
+                    "http://example.edx:8073/courses/course-v1:edX+DemoX+01/course/"
+                ),
+                "start": "2020-12-09T09:31:59.417817Z",
+                "end": "2021-03-14T09:31:59.417895Z",
+                "enrollment_start": "2020-11-09T09:31:59.417936Z",
+                "enrollment_end": "2020-12-24T09:31:59.417972Z",
+                "languages": ["en", "fr"],
+            }
+        )
+        signature = hmac.new(
+            b"shared secret", msg=body.encode("utf-8"), digestmod=hashlib.sha256
+        ).hexdigest()
+
+        self.assertWithinBudget(
+            "course-runs-sync",
+            lambda: self.client.post(
+                "/api/v1.0/course-runs-sync",
+                body,
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"SIG-HMAC-SHA256 {signature}",
+            ),
+            # Products of the course are synchronized with the course run
+            lambda nb_products: factories.ProductFactory.create_batch(
+                nb_products, courses=[course]
+            ),
+        )
@@ -0,0 +1,168 @@
+"""Test suite for the admin vouchers API bulk endpoint."""
+
+from http import HTTPStatus
+
+from joanie.core import factories, models
+from joanie.tests.base import BaseAPITestCase
+
+
+class VouchersAdminApiBulkTestCase(BaseAPITestCase):
+    """Test suite for the admin vouchers API bulk endpoint."""
+
+    maxDiff = None
+
+    def test_api_admin_vouchers_bulk_anonymous(self):
+        """Anonymous users should not be able to create vouchers in bulk."""
+        response = self.client.post(
+            "/api/v1.0/admin/vouchers/bulk/", content_type="application/json", data=[]
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.UNAUTHORIZED)
+
+    def test_api_admin_vouchers_bulk_authenticated_with_staff_user(self):
+        """Staff users should not be able to create vouchers in bulk."""
+        user = factories.UserFactory(is_staff=True, is_superuser=False)
+        self.client.login(username=user.username, password="password")
+
+        response = self.client.post(
+            "/api/v1.0/admin/vouchers/bulk/", content_type="application/json", data=[]
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.FORBIDDEN)
+
+    def test_api_admin_vouchers_bulk_create(self):
+        """Admin users should be able to create many vouchers at once."""
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        discount = factories.DiscountFactory()
+
+        response = self.client.post(
+            "/api/v1.0/admin/vouchers/bulk/",
+            content_type="application/json",
+            data=[
+                {"code": "VOUCHER_1", "discount_id": str(discount.id)},
+                {"code": "", "discount_id": str(discount.id), "multiple_use": True},
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.CREATED)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(models.Voucher.objects.filter(discount=discount).count(), 2)
+        voucher = models.Voucher.objects.get(code="VOUCHER_1")
+        self.assertFalse(voucher.multiple_use)
+        # A code is generated when none is given
+        voucher = models.Voucher.objects.exclude(code="VOUCHER_1").get()
+        self.assertTrue(voucher.multiple_use)
+        self.assertNotEqual(voucher.code, "")
+
+    def test_api_admin_vouchers_bulk_create_duplicated_code(self):
+        """Vouchers should not be created in bulk if a code is given twice."""
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        discount = factories.DiscountFactory()
+
+        response = self.client.post(
+            "/api/v1.0/admin/vouchers/bulk/",
+            content_type="application/json",
+            data=[
+                {"code": "VOUCHER", "discount_id": str(discount.id)},
+                {"code": "OTHER_VOUCHER", "discount_id": str(discount.id)},
+                {"code": "VOUCHER", "discount_id": str(discount.id)},
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        message = ["Voucher with this code already exists."]
+        self.assertEqual(response.json(), [{"code": message}, {}, {"code": message}])
+        self.assertFalse(models.Voucher.objects.exists())
+
+    def test_api_admin_vouchers_bulk_partially_update(self):
+        """Admin users should be able to partially update many vouchers at once."""
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        vouchers = factories.VoucherFactory.create_batch(3, is_active=True)
+
+        response = self.client.patch(
+            "/api/v1.0/admin/vouchers/bulk/",
+            content_type="application/json",
+            data=[
+                {"id": str(voucher.id), "is_active": False} for voucher in vouchers[:2]
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        self.assertEqual(
+            list(models.Voucher.objects.filter(is_active=False).order_by("code")),
+            sorted(vouchers[:2], key=lambda voucher: voucher.code),
+        )
+        vouchers[2].refresh_from_db()
+        self.assertTrue(vouchers[2].is_active)
+
+    def test_api_admin_vouchers_bulk_update_code_of_another_voucher(self):
+        """A voucher should not be updated in bulk with the code of another one."""
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        voucher, other_voucher = factories.VoucherFactory.create_batch(2)
+
+        response = self.client.patch(
+            "/api/v1.0/admin/vouchers/bulk/",
+            content_type="application/json",
+            data=[
+                {"id": str(voucher.id), "code": voucher.code},
+                {"id": str(other_voucher.id), "code": voucher.code},
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        message = ["Voucher with this code already exists."]
+        self.assertEqual(response.json(), [{"code": message}, {"code": message}])
+
+    def test_api_admin_vouchers_bulk_update_invalid_id(self):
+        """
+        Vouchers should not be updated in bulk if the id of an item is missing or
+        invalid, the error being reported for this item.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        voucher = factories.VoucherFactory(is_active=True)
+
+        response = self.client.patch(
+            "/api/v1.0/admin/vouchers/bulk/",
+            content_type="application/json",
+            data=[
+                {"id": str(voucher.id), "is_active": False},
+                {"id": "invalid", "is_active": False},
+                {"is_active": False},
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            [
+                {},
+                {"id": ["Must be a valid UUID."]},
+                {"id": ["This field is required."]},
+            ],
+        )
+        voucher.refresh_from_db()
+        self.assertTrue(voucher.is_active)
+
+    def test_api_admin_vouchers_bulk_create_too_many_items(self):
+        """Vouchers should not be created in bulk beyond the maximum number of items."""
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        discount = factories.DiscountFactory()
+
+        response = self.client.post(
+            "/api/v1.0/admin/vouchers/bulk/",
+            content_type="application/json",
+            data=[{"discount_id": str(discount.id)}] * 101,
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"non_field_errors": ["Ensure this field has no more than 100 elements."]},
+        )
+        self.assertFalse(models.Voucher.objects.exists())
@@ -2,12 +2,14 @@
 
 from http import HTTPStatus
 from io import BytesIO
+from unittest import mock
 
 from django.core.cache import cache
 
 from pdfminer.high_level import extract_text as pdf_extract_text
 
 from joanie.core import factories
+from joanie.core.utils import issuers
 from joanie.payment.factories import InvoiceFactory
 from joanie.tests.base import BaseAPITestCase
 
@@ -132,5 +134,30 @@ class OrderInvoiceApiTest(BaseAPITestCase):
             f"attachment; filename={invoice.reference}.pdf;",
         )
 
-        document_text = pdf_extract_text(BytesIO(response.content)).replace("\n", "")
+        document_text = pdf_extract_text(
+            BytesIO(b"".join(response.streaming_content))
+        ).replace("\n", "")
         self.assertRegex(document_text, r"INVOICE")
+
+    def test_api_order_get_invoice_authenticated_owner_rendered_once(self):
+        """
+        The invoice document should only be rendered on first download, then served
+        from storage.
+        """
+        invoice = InvoiceFactory()
+        token = self.generate_token_from_user(invoice.order.owner)
+        url = (
+            f"/api/v1.0/orders/{invoice.order.id}/invoice/"
+            f"?reference={invoice.reference}"
+        )
+
+        with mock.patch.object(
+            issuers, "generate_document", return_value=b"invoice"
+        ) as mock_generate_document:
+            for _ in range(2):
+                response = self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+                self.assertStatusCodeEqual(response, HTTPStatus.OK)
+                self.assertEqual(b"".join(response.streaming_content), b"invoice")
+
+        mock_generate_document.assert_called_once()
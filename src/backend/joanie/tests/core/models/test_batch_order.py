@@ -13,7 +13,7 @@ from django.test import override_settings
 from django.utils import timezone as django_timezone
 
 from joanie.core import enums, factories, models
-from joanie.core.utils import contract_definition
+from joanie.core.utils import contract_definition, issuers
 from joanie.core.utils.batch_order import validate_success_payment
 from joanie.core.utils.billing_address import CompanyBillingAddress
 from joanie.payment.models import Invoice
@@ -214,6 +214,42 @@ class BatchOrderModelsTestCase(LoggingTestCase):
             ],
         )
 
+    @override_settings(
+        JOANIE_SIGNATURE_VALIDITY_PERIOD_IN_SECONDS=60 * 60 * 24 * 15,
+        JOANIE_SIGNATURE_BACKEND="joanie.signature.backends.dummy.DummySignatureBackend",
+    )
+    def test_models_batch_order_submit_for_signature_same_context_and_still_valid(
+        self,
+    ):
+        """
+        When the resubmitting a contract whose context has not changed and which is still
+        in the range of validity period, it should return an invitation link without
+        rendering the document nor updating the contract fields.
+        """
+        batch_order = factories.BatchOrderFactory(state=enums.BATCH_ORDER_STATE_TO_SIGN)
+        context = contract_definition.generate_document_context(
+            contract_definition=batch_order.offering.product.contract_definition_batch_order,
+            user=batch_order.owner,
+            batch_order=batch_order,
+        )
+        contract = batch_order.contract
+        contract.context = context
+        contract.definition_checksum = "fake_dummy_file_hash_1"
+        contract.signature_backend_reference = "wfl_fake_dummy_id_1"
+        contract.submitted_for_signature_on = django_timezone.now()
+        contract.save()
+
+        batch_order.refresh_from_db()
+
+        with mock.patch.object(issuers, "generate_document") as mock_generate_document:
+            invitation_url = batch_order.submit_for_signature()
+
+        mock_generate_document.assert_not_called()
+        contract.refresh_from_db()
+        self.assertIn("https://dummysignaturebackend.fr/?reference=", invitation_url)
+        self.assertEqual(contract.definition_checksum, "fake_dummy_file_hash_1")
+        self.assertEqual(contract.signature_backend_reference, "wfl_fake_dummy_id_1")
+
     @override_settings(
         JOANIE_SIGNATURE_VALIDITY_PERIOD_IN_SECONDS=60 * 60 * 24 * 15,
         JOANIE_SIGNATURE_BACKEND="joanie.signature.backends.dummy.DummySignatureBackend",
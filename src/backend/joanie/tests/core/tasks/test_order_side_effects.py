@@ -0,0 +1,369 @@
+"""
+Test suite for the outbox of side effects of order transitions.
+"""
+
+from datetime import date, timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from joanie.core import enums, factories, models
+from joanie.core.models import CourseState
+from joanie.core.tasks import order_side_effects
+from joanie.core.tasks.order_side_effects import execute_order_side_effects
+from joanie.payment.backends.dummy import DummyPaymentBackend
+from joanie.payment.factories import CreditCardFactory
+
+
+@override_settings(
+    JOANIE_ORDER_SIDE_EFFECTS_OUTBOX=True,
+    JOANIE_ORDER_SIDE_EFFECTS_MAX_ATTEMPTS=2,
+)
+class OrderSideEffectsTestCase(TestCase):
+    """Test suite for the outbox of side effects of order transitions."""
+
+    def create_order_to_confirm(self):
+        """Create an order whose next transition sends a subscription confirmation."""
+        return factories.OrderFactory(
+            owner=factories.UserFactory(language="en-us"),
+            state=enums.ORDER_STATE_TO_SAVE_PAYMENT_METHOD,
+            credit_card=CreditCardFactory(),
+            product=factories.ProductFactory(
+                price="100.00",
+                target_courses=factories.CourseFactory.create_batch(
+                    1,
+                    course_runs=factories.CourseRunFactory.create_batch(
+                        1, state=CourseState.FUTURE_OPEN
+                    ),
+                ),
+            ),
+        )
+
+    def test_tasks_order_side_effects_recorded_then_executed_on_commit(self):
+        """
+        Side effects of a transition should be recorded within its transaction and
+        only executed once the transaction is committed.
+        """
+        order = self.create_order_to_confirm()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            order.flow.pending()
+
+        self.assertEqual(order.state, enums.ORDER_STATE_PENDING)
+        self.assertEqual(len(mail.outbox), 0)
+        side_effect = order.side_effects.get()
+        self.assertEqual(
+            side_effect.effect, enums.ORDER_SIDE_EFFECT_SEND_SUBSCRIPTION_CONFIRMATION
+        )
+        self.assertEqual(side_effect.state, enums.ORDER_SIDE_EFFECT_STATE_PENDING)
+        self.assertEqual(len(callbacks), 1)
+
+        callbacks[0]()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "Subscription confirmed!")
+        side_effect.refresh_from_db()
+        self.assertEqual(side_effect.state, enums.ORDER_SIDE_EFFECT_STATE_DONE)
+        self.assertEqual(side_effect.attempts, 1)
+        self.assertIsNotNone(side_effect.executed_on)
+
+    def test_tasks_order_side_effects_executed_once(self):
+        """
+        Side effects should be recorded only once per idempotency key and executed
+        only once, even if their execution is requested several times.
+        """
+        order = self.create_order_to_confirm()
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(2):
+                order.flow._apply_side_effect(  # pylint: disable=protected-access
+                    enums.ORDER_SIDE_EFFECT_SEND_SUBSCRIPTION_CONFIRMATION,
+                    idempotency_key="confirmation",
+                )
+            order.flow._dispatch_side_effects()  # pylint: disable=protected-access
+
+        execute_order_side_effects.run(str(order.id))
+
+        self.assertEqual(order.side_effects.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def create_order_to_pay(self):
+        """Create an order whose first installment is paid and of which the owner is
+        enrolled to the course run once it starts being paid."""
+        course_run = factories.CourseRunFactory(state=CourseState.ONGOING_OPEN)
+        return factories.OrderFactory(
+            state=enums.ORDER_STATE_PENDING,
+            product=factories.ProductFactory(
+                price="100.00", target_courses=[course_run.course]
+            ),
+            payment_schedule=[
+                {
+                    "amount": "50.00",
+                    "due_date": "2024-01-17",
+                    "state": enums.PAYMENT_STATE_PAID,
+                },
+                {
+                    "amount": "50.00",
+                    "due_date": "2024-02-17",
+                    "state": enums.PAYMENT_STATE_PENDING,
+                },
+            ],
+        )
+
+    def test_tasks_order_side_effects_enroll_user(self):
+        """
+        The owner of an order should be enrolled by the worker once the transition
+        is committed.
+        """
+        order = self.create_order_to_pay()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order.flow.pending_payment()
+
+            self.assertFalse(models.Enrollment.objects.exists())
+
+        enrollment = models.Enrollment.objects.get()
+        self.assertEqual(enrollment.user, order.owner)
+        self.assertTrue(enrollment.is_active)
+        self.assertFalse(
+            order.side_effects.exclude(
+                state=enums.ORDER_SIDE_EFFECT_STATE_DONE
+            ).exists()
+        )
+
+    @mock.patch.object(order_side_effects, "capture_exception")
+    def test_tasks_order_side_effects_enroll_user_failure(self, mock_capture_exception):
+        """
+        A failing enrollment of the owner of the order should be reported without
+        failing the side effect, as it is when executed during the transition.
+        """
+        order = self.create_order_to_pay()
+        error = OSError("LMS unavailable")
+
+        with (
+            mock.patch.object(
+                models.Order, "enroll_user_to_course_run", side_effect=error
+            ),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            order.flow.pending_payment()
+
+        mock_capture_exception.assert_called_once_with(error)
+        side_effect = order.side_effects.get(effect=enums.ORDER_SIDE_EFFECT_ENROLL_USER)
+        self.assertEqual(side_effect.state, enums.ORDER_SIDE_EFFECT_STATE_DONE)
+
+    def test_tasks_order_side_effects_same_transition_twice(self):
+        """
+        Side effects of a transition should be recorded once even if the transition is
+        applied twice, e.g. on concurrent notifications of the payment provider.
+        """
+        order = self.create_order_to_pay()
+        concurrent_order = models.Order.objects.get(pk=order.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order.flow.pending_payment()
+            concurrent_order.flow.pending_payment()
+
+        self.assertEqual(
+            order.side_effects.filter(
+                effect=enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS
+            ).count(),
+            1,
+        )
+        self.assertEqual(
+            order.side_effects.filter(
+                effect=enums.ORDER_SIDE_EFFECT_ENROLL_USER
+            ).count(),
+            1,
+        )
+
+    def test_tasks_order_side_effects_same_transition_again(self):
+        """
+        Side effects of a transition should be recorded again if the order goes
+        through the same transition again after the payment of another installment.
+        """
+        order = self.create_order_to_pay()
+        order.payment_schedule.append(
+            {
+                "amount": "50.00",
+                "due_date": "2024-03-17",
+                "state": enums.PAYMENT_STATE_PENDING,
+            }
+        )
+        order.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            order.flow.pending_payment()
+
+        order.payment_schedule[1]["state"] = enums.PAYMENT_STATE_PAID
+        order.state = enums.ORDER_STATE_NO_PAYMENT
+        order.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            order.flow.pending_payment()
+
+        self.assertEqual(
+            order.side_effects.filter(
+                effect=enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS,
+                state=enums.ORDER_SIDE_EFFECT_STATE_DONE,
+            ).count(),
+            2,
+        )
+
+    def test_tasks_order_side_effects_claimed_before_execution(self):
+        """
+        A side effect should be marked as in progress, with its attempt counted, before
+        it is executed, so that no transaction is held open while it is executed.
+        """
+        order = factories.OrderFactory(state=enums.ORDER_STATE_PENDING)
+        side_effect = models.OrderSideEffect.objects.create(
+            order=order,
+            effect=enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS,
+            idempotency_key=f"{order.id}:set_enrollments",
+        )
+        claimed_side_effects = []
+
+        def set_enrollments(order, idempotency_key=None):  # pylint: disable=unused-argument
+            claimed_side_effects.append(
+                models.OrderSideEffect.objects.values_list("state", "attempts").get(
+                    pk=side_effect.pk
+                )
+            )
+            # A worker running concurrently leaves the side effect claimed
+            execute_order_side_effects.run(str(order.id))
+
+        with mock.patch.dict(
+            order_side_effects.ORDER_SIDE_EFFECTS,
+            {enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS: set_enrollments},
+        ):
+            execute_order_side_effects.run(str(order.id))
+
+        self.assertEqual(
+            claimed_side_effects, [(enums.ORDER_SIDE_EFFECT_STATE_IN_PROGRESS, 1)]
+        )
+        side_effect.refresh_from_db()
+        self.assertEqual(side_effect.state, enums.ORDER_SIDE_EFFECT_STATE_DONE)
+        self.assertEqual(side_effect.attempts, 1)
+
+    @mock.patch.object(DummyPaymentBackend, "create_zero_click_payment")
+    def test_tasks_order_side_effects_debit_installment_idempotency_key(
+        self, mock_create_zero_click_payment
+    ):
+        """
+        The idempotency key of the side effect debiting an installment should be
+        passed to the payment provider so it is not charged twice.
+        """
+        order = self.create_order_to_pay()
+        order.payment_schedule[0]["id"] = "fa17d7b8-3b86-4755-ac78-bc039018d696"
+        installment = order.payment_schedule[1]
+        installment["id"] = "d9356dd7-19a6-4695-b18e-ad93af41424a"
+        order.credit_card = CreditCardFactory(owners=[order.owner])
+        order.save()
+        side_effect = models.OrderSideEffect.objects.create(
+            order=order,
+            effect=enums.ORDER_SIDE_EFFECT_DEBIT_INSTALLMENT,
+            payload={"installment_id": installment["id"]},
+            idempotency_key=f"{order.id}:debit_installment:{installment['id']}",
+        )
+
+        with mock.patch(
+            "django.utils.timezone.localdate", return_value=date(2024, 2, 17)
+        ):
+            execute_order_side_effects.run(str(order.id))
+
+        mock_create_zero_click_payment.assert_called_once()
+        self.assertEqual(
+            mock_create_zero_click_payment.call_args.kwargs["idempotency_key"],
+            side_effect.idempotency_key,
+        )
+
+    def test_tasks_order_side_effects_retry_then_failed(self):
+        """
+        A failing side effect should be retried and stop the execution of the
+        following ones, then be marked as failed after the maximum number of attempts.
+        """
+        order = factories.OrderFactory(state=enums.ORDER_STATE_PENDING)
+        first, second = (
+            models.OrderSideEffect.objects.create(
+                order=order,
+                effect=effect,
+                idempotency_key=f"{order.id}:{effect}",
+            )
+            for effect in [
+                enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS,
+                enums.ORDER_SIDE_EFFECT_SEND_SUBSCRIPTION_CONFIRMATION,
+            ]
+        )
+
+        with (
+            mock.patch.dict(
+                order_side_effects.ORDER_SIDE_EFFECTS,
+                {
+                    enums.ORDER_SIDE_EFFECT_SET_ENROLLMENTS: mock.Mock(
+                        side_effect=OSError
+                    )
+                },
+            ),
+            mock.patch.object(
+                execute_order_side_effects, "retry", return_value=Exception("retry")
+            ) as mock_retry,
+        ):
+            with self.assertRaisesMessage(Exception, "retry"):
+                execute_order_side_effects.run(str(order.id))
+
+            first.refresh_from_db()
+            second.refresh_from_db()
+            self.assertEqual(first.state, enums.ORDER_SIDE_EFFECT_STATE_PENDING)
+            self.assertEqual(first.attempts, 1)
+            self.assertIn("OSError", first.last_error)
+            self.assertEqual(second.state, enums.ORDER_SIDE_EFFECT_STATE_PENDING)
+            self.assertEqual(mock_retry.call_args.kwargs["countdown"], 30)
+
+            execute_order_side_effects.run(str(order.id))
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.state, enums.ORDER_SIDE_EFFECT_STATE_FAILED)
+        self.assertEqual(first.attempts, 2)
+        self.assertEqual(second.state, enums.ORDER_SIDE_EFFECT_STATE_DONE)
+        self.assertEqual(len(mail.outbox), 1)
+
+    @mock.patch.object(execute_order_side_effects, "delay")
+    def test_tasks_order_side_effects_process_pending_command(self, mock_delay):
+        """
+        The command should request the execution of side effects pending for a while
+        and of side effects left in progress by a worker for a while.
+        """
+        order, recent_order, done_order, left_order = (
+            factories.OrderFactory.create_batch(4)
+        )
+        for side_effect_order, state, updated_on in [
+            (order, enums.ORDER_SIDE_EFFECT_STATE_PENDING, timedelta(minutes=20)),
+            (recent_order, enums.ORDER_SIDE_EFFECT_STATE_PENDING, timedelta(0)),
+            (done_order, enums.ORDER_SIDE_EFFECT_STATE_DONE, timedelta(minutes=20)),
+            (
+                left_order,
+                enums.ORDER_SIDE_EFFECT_STATE_IN_PROGRESS,
+                timedelta(minutes=20),
+            ),
+        ]:
+            side_effect = models.OrderSideEffect.objects.create(
+                order=side_effect_order,
+                effect=enums.ORDER_SIDE_EFFECT_UNENROLL_USER,
+                idempotency_key=f"{side_effect_order.id}:unenroll",
+                state=state,
+            )
+            models.OrderSideEffect.objects.filter(pk=side_effect.pk).update(
+                updated_on=timezone.now() - updated_on
+            )
+
+        call_command("process_order_side_effects")
+
+        self.assertCountEqual(
+            [call.args[0] for call in mock_delay.call_args_list],
+            [str(order.id), str(left_order.id)],
+        )
+        self.assertEqual(
+            left_order.side_effects.get().state, enums.ORDER_SIDE_EFFECT_STATE_PENDING
+        )
@@ -1,3 +1,4 @@
+# pylint: disable=too-many-public-methods
 """
 Test suite for Course run Admin API.
 """
@@ -6,9 +7,11 @@ import random
 import uuid
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
+from unittest import mock
 
 from joanie.core import factories, models
 from joanie.core.models import CourseRun
+from joanie.core.utils import webhooks
 from joanie.tests import format_date
 from joanie.tests.base import BaseAPITestCase
 
@@ -615,3 +618,150 @@ class CourseRunAdminApiTestCase(BaseAPITestCase):
         self.assertStatusCodeEqual(response, HTTPStatus.OK)
         content = response.json()
         self.assertEqual(content["count"], 0)
+
+    @mock.patch.object(webhooks, "synchronize_course_runs")
+    def test_admin_api_course_runs_bulk_create(self, mock_sync):
+        """
+        Staff user should be able to create many course runs at once, the catalog
+        being synchronized once for all of them.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        course = factories.CourseFactory()
+        data = [
+            {
+                "title": f"Run 00{index}",
+                "languages": ["fr"],
+                "resource_link": f"https://my-lms.org/course-001/run-00{index}",
+                "course_id": str(course.id),
+                "start": "2023-01-03T00:00:00Z",
+            }
+            for index in range(1, 4)
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1.0/admin/course-runs/bulk/",
+                content_type="application/json",
+                data=data,
+            )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.CREATED)
+        content = response.json()
+        self.assertEqual(len(content), 3)
+        self.assertEqual(
+            [item["title"] for item in content], ["Run 001", "Run 002", "Run 003"]
+        )
+        course_runs = CourseRun.objects.filter(course=course).order_by("resource_link")
+        self.assertEqual(
+            [course_run.title for course_run in course_runs],
+            ["Run 001", "Run 002", "Run 003"],
+        )
+        # The catalog is synchronized once with the Joanie uri of all course runs
+        mock_sync.assert_called_once()
+        self.assertCountEqual(
+            [
+                serialized_course_run["resource_link"]
+                for serialized_course_run in mock_sync.call_args[0][0]
+            ],
+            [course_run.uri for course_run in course_runs],
+        )
+
+    def test_admin_api_course_runs_bulk_create_duplicated_resource_link(self):
+        """
+        Course runs should not be created in bulk if one of them has a resource link
+        already used.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        course = factories.CourseFactory()
+        course_run = factories.CourseRunFactory(
+            resource_link="https://my-lms.org/course-001/run-001"
+        )
+        data = [
+            {
+                "title": "Run 002",
+                "languages": ["fr"],
+                "resource_link": "https://my-lms.org/course-001/run-002",
+                "course_id": str(course.id),
+            },
+            {
+                "title": "Run 001",
+                "languages": ["fr"],
+                "resource_link": course_run.resource_link,
+                "course_id": str(course.id),
+            },
+        ]
+
+        response = self.client.post(
+            "/api/v1.0/admin/course-runs/bulk/",
+            content_type="application/json",
+            data=data,
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            [
+                {},
+                {
+                    "resource_link": [
+                        "Course run with this resource link already exists."
+                    ]
+                },
+            ],
+        )
+        self.assertFalse(CourseRun.objects.filter(course=course).exists())
+
+    def test_admin_api_course_runs_bulk_partially_update(self):
+        """
+        Staff user should be able to partially update many course runs at once.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        course_runs = factories.CourseRunFactory.create_batch(2, languages=["fr"])
+
+        response = self.client.patch(
+            "/api/v1.0/admin/course-runs/bulk/",
+            content_type="application/json",
+            data=[
+                {
+                    "id": str(course_run.id),
+                    "title": f"Updated run {index}",
+                    "languages": ["en"],
+                }
+                for index, course_run in enumerate(course_runs)
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        for index, course_run in enumerate(course_runs):
+            updated_course_run = CourseRun.objects.get(pk=course_run.pk)
+            self.assertEqual(updated_course_run.title, f"Updated run {index}")
+            self.assertEqual(updated_course_run.languages, ["en"])
+
+    def test_admin_api_course_runs_bulk_update_unknown_course_run(self):
+        """
+        Course runs should not be updated in bulk if one of the items does not match
+        a course run.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        course_run = factories.CourseRunFactory(title="Run 001")
+
+        response = self.client.patch(
+            "/api/v1.0/admin/course-runs/bulk/",
+            content_type="application/json",
+            data=[
+                {"id": str(course_run.id), "title": "Updated run"},
+                {"id": str(uuid.uuid4()), "title": "Unknown run"},
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            [{}, {"id": ["A single item is expected for each resource."]}],
+        )
+        course_run.refresh_from_db()
+        self.assertEqual(course_run.title, "Run 001")
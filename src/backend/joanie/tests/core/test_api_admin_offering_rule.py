@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 """
 Test suite for OfferingRule Admin API.
 """
@@ -975,3 +976,108 @@ class OfferingRuleAdminApiTest(BaseAPITestCase):
         )
 
         self.assertStatusCodeEqual(response, HTTPStatus.NOT_FOUND)
+
+    def test_api_admin_offering_rule_bulk_create(self):
+        """
+        Admin authenticated user should be able to create many offering rules of an
+        offering at once, positioned after the existing ones.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        offering = factories.OfferingFactory()
+        factories.OfferingRuleFactory(course_product_relation=offering)
+        other_offering = factories.OfferingFactory()
+        discount = factories.DiscountFactory()
+
+        response = self.client.post(
+            f"{self.base_url}/{offering.id}/offering-rules/bulk/",
+            content_type="application/json",
+            data=[
+                {"nb_seats": 5, "discount_id": str(discount.id)},
+                # The offering is the one of the URL
+                {"nb_seats": 10, "offering": str(other_offering.id)},
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.CREATED)
+        self.assertEqual(
+            [item["nb_seats"] for item in response.json()],
+            [5, 10],
+        )
+        self.assertFalse(other_offering.offering_rules.exists())
+        offering_rules = offering.offering_rules.order_by("position")
+        self.assertEqual(
+            [
+                (offering_rule.position, offering_rule.nb_seats, offering_rule.discount)
+                for offering_rule in offering_rules[1:]
+            ],
+            [(1, 5, discount), (2, 10, None)],
+        )
+
+    def test_api_admin_offering_rule_bulk_create_with_fake_discount(self):
+        """
+        Offering rules should not be created in bulk if one of them has a discount
+        that does not exist.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        offering = factories.OfferingFactory()
+
+        response = self.client.post(
+            f"{self.base_url}/{offering.id}/offering-rules/bulk/",
+            content_type="application/json",
+            data=[{"nb_seats": 5}, {"discount_id": "fake_discount_id"}],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            [{}, {"discount_id": ["Resource fake_discount_id does not exist."]}],
+        )
+        self.assertFalse(offering.offering_rules.exists())
+
+    def test_api_admin_offering_rule_bulk_partially_update(self):
+        """
+        Admin authenticated user should be able to update many offering rules of an
+        offering at once.
+        """
+        admin = factories.UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=admin.username, password="password")
+        offering = factories.OfferingFactory()
+        offering_rules = factories.OfferingRuleFactory.create_batch(
+            2, course_product_relation=offering, nb_seats=5, is_active=True
+        )
+        other_offering_rule = factories.OfferingRuleFactory(nb_seats=5)
+
+        response = self.client.patch(
+            f"{self.base_url}/{offering.id}/offering-rules/bulk/",
+            content_type="application/json",
+            data=[
+                {"id": str(offering_rule.id), "nb_seats": 20, "is_active": False}
+                for offering_rule in [*offering_rules, other_offering_rule]
+            ],
+        )
+
+        # Offering rules of another offering can not be updated
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            [{}, {}, {"id": ["A single item is expected for each resource."]}],
+        )
+
+        response = self.client.patch(
+            f"{self.base_url}/{offering.id}/offering-rules/bulk/",
+            content_type="application/json",
+            data=[
+                {"id": str(offering_rule.id), "nb_seats": 20, "is_active": False}
+                for offering_rule in offering_rules
+            ],
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        for offering_rule in offering_rules:
+            offering_rule.refresh_from_db()
+            self.assertEqual(offering_rule.nb_seats, 20)
+            self.assertFalse(offering_rule.is_active)
+        other_offering_rule.refresh_from_db()
+        self.assertEqual(other_offering_rule.nb_seats, 5)
@@ -15,8 +15,10 @@ from django.test import override_settings
 from django.utils import timezone
 
 from joanie.core import enums, factories, models
+from joanie.core.api.client import ValidateVoucherThrottle
 from joanie.core.serializers import fields
 from joanie.core.utils import get_default_currency_symbol
+from joanie.core.utils.payment_schedule import generate as generate_payment_schedule
 from joanie.tests.base import BaseAPITestCase
 
 
@@ -820,7 +822,7 @@ class OfferingApiTest(BaseAPITestCase):
                 state=random.choice(enums.ORDER_STATES_BINDING),
             )
         for state, _label in enums.ORDER_STATE_CHOICES:
-            if state in (*enums.ORDER_STATES_BINDING, enums.ORDER_STATE_TO_OWN):
+            if state in enums.ORDER_STATES_USING_SEAT:
                 continue
             factories.OrderFactory(
                 course=course,
@@ -828,6 +830,7 @@ class OfferingApiTest(BaseAPITestCase):
                 offering_rules=[offering_rule],
                 state=state,
             )
+        offering_rule.refresh_from_db(fields=["nb_used_seats"])
 
         with self.record_performance():
             self.client.get(
@@ -2772,6 +2775,68 @@ class OfferingApiTest(BaseAPITestCase):
             url=f"/api/v1.0/offerings/{offering.id}/payment-plan/?voucher_code=invalid_code"
         )
 
+    # More requests than the throttle rate allows are made
+    @mock.patch.object(ValidateVoucherThrottle, "allow_request", return_value=True)
+    def test_api_offering_payment_plan_cached(self, _mock_throttle):
+        """
+        The payment plan of an offering should be computed once per day, price and
+        discount then served from cache.
+        """
+        course_run = factories.CourseRunFactory(
+            enrollment_start=datetime(2025, 1, 1, 14, tzinfo=ZoneInfo("UTC")),
+            start=datetime(2025, 3, 1, 14, tzinfo=ZoneInfo("UTC")),
+            end=datetime(2025, 5, 1, 14, tzinfo=ZoneInfo("UTC")),
+        )
+        product = factories.ProductFactory(
+            price=10,
+            type=enums.PRODUCT_TYPE_CREDENTIAL,
+            target_courses=[course_run.course],
+        )
+        offering = factories.OfferingFactory(course=course_run.course, product=product)
+        voucher = factories.VoucherFactory(discount=factories.DiscountFactory(rate=0.1))
+        url = f"/api/v1.0/offerings/{offering.id}/payment-plan/"
+
+        with mock.patch(
+            "joanie.core.api.client.generate_payment_schedule",
+            wraps=generate_payment_schedule,
+        ) as mock_generate:
+            with mock.patch(
+                "django.utils.timezone.now",
+                return_value=datetime(2025, 1, 1, 8, tzinfo=ZoneInfo("UTC")),
+            ):
+                response = self.client.get(url)
+                cached_response = self.client.get(
+                    f"/api/v1.0/offerings/{offering.id}/payment-schedule/"
+                )
+                self.assertEqual(mock_generate.call_count, 1)
+
+                # A voucher changes the price so the plan is computed again
+                self.client.get(url, data={"voucher_code": voucher.code})
+                self.assertEqual(mock_generate.call_count, 2)
+
+            # And so does the next day
+            with mock.patch(
+                "django.utils.timezone.now",
+                return_value=datetime(2025, 1, 2, 8, tzinfo=ZoneInfo("UTC")),
+            ):
+                self.client.get(url)
+                self.assertEqual(mock_generate.call_count, 3)
+
+            # Or an update of the product
+            product.price = 20
+            product.save()
+            with mock.patch(
+                "django.utils.timezone.now",
+                return_value=datetime(2025, 1, 2, 8, tzinfo=ZoneInfo("UTC")),
+            ):
+                response_updated = self.client.get(url)
+                self.assertEqual(mock_generate.call_count, 4)
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        self.assertStatusCodeEqual(cached_response, HTTPStatus.OK)
+        self.assertEqual(cached_response.json(), response.json()["payment_schedule"])
+        self.assertEqual(response_updated.json()["price"], 20.00)
+
     @override_settings(
         JOANIE_PAYMENT_SCHEDULE_LIMITS={
             100: (100,),
@@ -0,0 +1,73 @@
+"""Test suite for the management command `generate_payment_schedules`."""
+
+from datetime import datetime
+from io import StringIO
+from zoneinfo import ZoneInfo
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from joanie.core import enums, factories
+
+
+@override_settings(JOANIE_PAYMENT_SCHEDULE_LIMITS={5: (30, 70)})
+class GeneratePaymentSchedulesTestCase(TestCase):
+    """Test case for the management command `generate_payment_schedules`."""
+
+    def test_commands_generate_payment_schedules_without_filters(self):
+        """Orders should be restricted to courses, products or orders."""
+        with self.assertRaises(CommandError):
+            call_command("generate_payment_schedules")
+
+    def test_commands_generate_payment_schedules_dry_run(self):
+        """
+        With the --dry-run option, payment schedule changes should be displayed
+        without being saved.
+        """
+        course_run = factories.CourseRunFactory(
+            start=datetime(2100, 3, 1, 14, tzinfo=ZoneInfo("UTC")),
+            end=datetime(2100, 5, 1, 14, tzinfo=ZoneInfo("UTC")),
+        )
+        order = factories.OrderFactory(
+            product__price=3,
+            product__type=enums.PRODUCT_TYPE_CREDENTIAL,
+            product__target_courses=[course_run.course],
+            state=enums.ORDER_STATE_PENDING,
+        )
+
+        output = StringIO()
+        call_command(
+            "generate_payment_schedules",
+            "--product",
+            str(order.product_id),
+            "--dry-run",
+            stdout=output,
+        )
+
+        self.assertIn(f"Order {order.id}:", output.getvalue())
+        self.assertIn("new: ", output.getvalue())
+        self.assertIn("2100-03-01: 2.10", output.getvalue())
+        order.refresh_from_db()
+        self.assertEqual(order.payment_schedule, [])
+
+    def test_commands_generate_payment_schedules(self):
+        """Payment schedules of the selected orders should be saved."""
+        course_run = factories.CourseRunFactory(
+            start=datetime(2100, 3, 1, 14, tzinfo=ZoneInfo("UTC")),
+            end=datetime(2100, 5, 1, 14, tzinfo=ZoneInfo("UTC")),
+        )
+        order, other_order = factories.OrderFactory.create_batch(
+            2,
+            product__price=3,
+            product__type=enums.PRODUCT_TYPE_CREDENTIAL,
+            product__target_courses=[course_run.course],
+            state=enums.ORDER_STATE_PENDING,
+        )
+
+        call_command("generate_payment_schedules", "--order", str(order.id))
+
+        order.refresh_from_db()
+        other_order.refresh_from_db()
+        self.assertEqual(len(order.payment_schedule), 2)
+        self.assertEqual(other_order.payment_schedule, [])
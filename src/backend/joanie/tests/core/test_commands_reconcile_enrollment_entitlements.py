@@ -0,0 +1,66 @@
+"""Test suite for the management command `reconcile_enrollment_entitlements`"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from joanie.core import enums, factories, models
+
+
+class ReconcileEnrollmentEntitlementsTestCase(TestCase):
+    """Test case for the management command `reconcile_enrollment_entitlements`"""
+
+    def test_commands_reconcile_enrollment_entitlements(self):
+        """
+        The command should compute the enrollment entitlements of orders and fix the
+        ones which drifted.
+        """
+        course = factories.CourseFactory()
+        product = factories.ProductFactory(target_courses=[course])
+        order, other_order = factories.OrderFactory.create_batch(
+            2, product=product, state=enums.ORDER_STATE_COMPLETED
+        )
+        canceled_order = factories.OrderFactory(
+            product=product, state=enums.ORDER_STATE_CANCELED
+        )
+        models.EnrollmentEntitlement.objects.filter(order=order).delete()
+        models.EnrollmentEntitlement.objects.create(
+            order=canceled_order, user=canceled_order.owner, course=course
+        )
+
+        stdout = StringIO()
+        call_command("reconcile_enrollment_entitlements", stdout=stdout)
+
+        for completed_order in [order, other_order]:
+            self.assertEqual(
+                list(
+                    completed_order.enrollment_entitlements.values_list(
+                        "user", "course", "course_run"
+                    )
+                ),
+                [(completed_order.owner_id, course.id, None)],
+            )
+        self.assertFalse(canceled_order.enrollment_entitlements.exists())
+        self.assertCountEqual(
+            stdout.getvalue().splitlines(),
+            [
+                f"Order {order.id}: enrollment entitlements reconciled",
+                f"Order {canceled_order.id}: enrollment entitlements reconciled",
+            ],
+        )
+
+    def test_commands_reconcile_enrollment_entitlements_restricted(self):
+        """
+        The command should only reconcile the given orders.
+        """
+        product = factories.ProductFactory(target_courses=[factories.CourseFactory()])
+        order, other_order = factories.OrderFactory.create_batch(
+            2, product=product, state=enums.ORDER_STATE_COMPLETED
+        )
+        models.EnrollmentEntitlement.objects.all().delete()
+
+        call_command("reconcile_enrollment_entitlements", "-o", str(order.id))
+
+        self.assertTrue(order.enrollment_entitlements.exists())
+        self.assertFalse(other_order.enrollment_entitlements.exists())
@@ -0,0 +1,70 @@
+"""Test suite for the management command `reconcile_offering_organizations_orders`"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from joanie.core import enums, factories, models
+
+
+class ReconcileOfferingOrganizationsOrdersTestCase(TestCase):
+    """Test case for the management command `reconcile_offering_organizations_orders`"""
+
+    def test_commands_reconcile_offering_organizations_orders(self):
+        """
+        The command should count orders using a seat of offerings per organization
+        and fix the order counts which drifted.
+        """
+        organization, other_organization = factories.OrganizationFactory.create_batch(2)
+        offering = factories.OfferingFactory(
+            organizations=[organization, other_organization]
+        )
+        for state in [enums.ORDER_STATE_COMPLETED, enums.ORDER_STATE_TO_OWN]:
+            factories.OrderFactory(
+                state=state,
+                product=offering.product,
+                course=offering.course,
+                organization=organization,
+            )
+        models.OfferingOrganizationOrderCount.objects.filter(
+            organization=organization
+        ).update(nb_orders=7)
+        models.OfferingOrganizationOrderCount.objects.create(
+            offering=offering, organization=other_organization, nb_orders=3
+        )
+
+        stdout = StringIO()
+        call_command("reconcile_offering_organizations_orders", stdout=stdout)
+
+        self.assertEqual(
+            dict(
+                offering.organization_order_counts.values_list(
+                    "organization_id", "nb_orders"
+                )
+            ),
+            {organization.id: 2, other_organization.id: 0},
+        )
+        self.assertEqual(
+            stdout.getvalue(),
+            f"Offering {offering.id}: 2 organization order counts reconciled\n",
+        )
+
+    def test_commands_reconcile_offering_organizations_orders_restricted(self):
+        """
+        The command should only reconcile the given offerings.
+        """
+        offering, other_offering = factories.OfferingFactory.create_batch(2)
+        organization = factories.OrganizationFactory()
+        for counted_offering in [offering, other_offering]:
+            models.OfferingOrganizationOrderCount.objects.create(
+                offering=counted_offering, organization=organization, nb_orders=3
+            )
+
+        call_command("reconcile_offering_organizations_orders", "-o", str(offering.id))
+
+        self.assertEqual(
+            offering.organization_order_counts.get().nb_orders,
+            0,
+        )
+        self.assertEqual(other_offering.organization_order_counts.get().nb_orders, 3)
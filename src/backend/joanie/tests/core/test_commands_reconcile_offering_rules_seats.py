@@ -0,0 +1,58 @@
+"""Test suite for the management command `reconcile_offering_rules_seats`"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from joanie.core import enums, factories, models
+
+
+class ReconcileOfferingRulesSeatsTestCase(TestCase):
+    """Test case for the management command `reconcile_offering_rules_seats`"""
+
+    def test_commands_reconcile_offering_rules_seats(self):
+        """
+        The command should count seats used by orders of offering rules and fix the
+        number of used seats of offering rules which drifted.
+        """
+        offering = factories.OfferingFactory()
+        offering_rule, other_offering_rule = factories.OfferingRuleFactory.create_batch(
+            2, course_product_relation=offering, nb_seats=10
+        )
+        for state in [enums.ORDER_STATE_COMPLETED, enums.ORDER_STATE_TO_OWN]:
+            factories.OrderFactory(
+                state=state,
+                product=offering.product,
+                course=offering.course,
+                offering_rules=[offering_rule, other_offering_rule],
+            )
+        models.OfferingRule.objects.filter(pk=offering_rule.pk).update(nb_used_seats=7)
+
+        stdout = StringIO()
+        call_command("reconcile_offering_rules_seats", stdout=stdout)
+
+        offering_rule.refresh_from_db()
+        other_offering_rule.refresh_from_db()
+        self.assertEqual(offering_rule.nb_used_seats, 2)
+        self.assertEqual(other_offering_rule.nb_used_seats, 2)
+        self.assertEqual(
+            stdout.getvalue(),
+            f"Offering rule {offering_rule.id}: 7 -> 2 used seats\n",
+        )
+
+    def test_commands_reconcile_offering_rules_seats_restricted(self):
+        """
+        The command should only reconcile the given offering rules.
+        """
+        offering_rule, other_offering_rule = factories.OfferingRuleFactory.create_batch(
+            2, nb_seats=10
+        )
+        models.OfferingRule.objects.update(nb_used_seats=3)
+
+        call_command("reconcile_offering_rules_seats", "-r", str(offering_rule.id))
+
+        offering_rule.refresh_from_db()
+        other_offering_rule.refresh_from_db()
+        self.assertEqual(offering_rule.nb_used_seats, 0)
+        self.assertEqual(other_offering_rule.nb_used_seats, 3)
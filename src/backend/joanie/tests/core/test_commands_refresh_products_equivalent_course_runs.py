@@ -0,0 +1,51 @@
+"""Test suite for the management command `refresh_products_equivalent_course_runs`"""
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from joanie.core import factories, models
+
+
+class RefreshProductsEquivalentCourseRunsTestCase(TestCase):
+    """Test case for the management command `refresh_products_equivalent_course_runs`"""
+
+    def test_commands_refresh_products_equivalent_course_runs(self):
+        """
+        The command should store the equivalent course runs of products, computed from
+        their target course runs.
+        """
+        course_run = factories.CourseRunFactory(languages=["fr"])
+        product, other_product = factories.ProductFactory.create_batch(
+            2, target_courses=[course_run.course]
+        )
+        models.ProductEquivalentCourseRun.objects.all().delete()
+        # Course runs updated directly in the database are not taken into account
+        models.CourseRun.objects.update(languages=["en"])
+
+        call_command("refresh_products_equivalent_course_runs")
+
+        for refreshed_product in [product, other_product]:
+            self.assertEqual(
+                models.ProductEquivalentCourseRun.objects.get(
+                    product=refreshed_product
+                ).languages,
+                ["en"],
+            )
+
+    def test_commands_refresh_products_equivalent_course_runs_restricted(self):
+        """
+        The command should only refresh the equivalent course runs of the given
+        products.
+        """
+        course_run = factories.CourseRunFactory(languages=["fr"])
+        product, other_product = factories.ProductFactory.create_batch(
+            2, target_courses=[course_run.course]
+        )
+        models.CourseRun.objects.update(languages=["en"])
+
+        call_command("refresh_products_equivalent_course_runs", "-p", str(product.id))
+
+        product.equivalent_course_run.refresh_from_db()
+        other_product.equivalent_course_run.refresh_from_db()
+        self.assertEqual(product.equivalent_course_run.languages, ["en"])
+        self.assertEqual(other_product.equivalent_course_run.languages, ["fr"])
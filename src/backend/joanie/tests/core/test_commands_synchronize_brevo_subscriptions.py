@@ -25,5 +25,21 @@ class SynchronizeBrevoSubscriptionsCommandTestCase(LoggingTestCase):
         with self.assertLogs() as logger:
             call_command("synchronize_brevo_subscriptions")
 
-        mock_synchronize_brevo_subscriptions.delay.assert_called_once()
+        mock_synchronize_brevo_subscriptions.delay.assert_called_once_with(
+            restart=False
+        )
         self.assertLogsContains(logger, "Synchronizing brevo subscriptions")
+
+    @patch(
+        "joanie.core.management.commands.synchronize_brevo_subscriptions"
+        ".synchronize_brevo_subscriptions"
+    )
+    def test_commands_synchronize_brevo_subscriptions_restart(
+        self, mock_synchronize_brevo_subscriptions
+    ):
+        """
+        The restart option should be forwarded to the task.
+        """
+        call_command("synchronize_brevo_subscriptions", "--restart")
+
+        mock_synchronize_brevo_subscriptions.delay.assert_called_once_with(restart=True)
@@ -1678,6 +1678,7 @@ class OrderFlowsTestCase(LoggingTestCase):
                 "due_date": date(2024, 3, 17),
                 "state": enums.PAYMENT_STATE_PENDING,
             },
+            idempotency_key=None,
         )
 
         self.assertEqual(order.state, enums.ORDER_STATE_PENDING)
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 from unittest import mock
 from zoneinfo import ZoneInfo
 
+from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 from django.utils import timezone as django_timezone
@@ -550,6 +551,75 @@ class CourseRunModelsTestCase(TestCase):
                 ),
             )
 
+    def test_model_course_run_get_serialized_bulk(self):
+        """
+        The get_serialized_bulk method should return the same payloads as calling
+        get_serialized on each (course run, product) pair.
+        """
+        course = factories.CourseFactory()
+        course_runs = factories.CourseRunFactory.create_batch(3, course=course)
+        credential = factories.ProductFactory(
+            courses=[course], type=enums.PRODUCT_TYPE_CREDENTIAL
+        )
+        certificate = factories.ProductFactory(
+            courses=[course], type=enums.PRODUCT_TYPE_CERTIFICATE
+        )
+        factories.OfferingRuleFactory(
+            course_product_relation=credential.offerings.get(),
+            discount=factories.DiscountFactory(rate=0.1),
+            is_active=True,
+        )
+        course_runs_products = [
+            (course_run, product)
+            for course_run in course_runs
+            for product in [credential, certificate, None]
+        ]
+
+        for certifying in [True, False]:
+            self.assertEqual(
+                CourseRun.get_serialized_bulk(
+                    course_runs_products, visibility="hidden", certifying=certifying
+                ),
+                [
+                    course_run.get_serialized(
+                        visibility="hidden", certifying=certifying, product=product
+                    )
+                    for course_run, product in course_runs_products
+                ],
+            )
+
+    def test_model_course_run_get_serialized_bulk_num_queries(self):
+        """
+        The number of queries made by get_serialized_bulk should not depend on
+        the number of course runs to serialize.
+        """
+        course = factories.CourseFactory()
+        product = factories.ProductFactory(
+            courses=[course], type=enums.PRODUCT_TYPE_CERTIFICATE
+        )
+        course_runs = factories.CourseRunFactory.create_batch(5, course=course)
+        for course_run in course_runs:
+            course_run.refresh_from_db()
+        course_runs_products = [(course_run, product) for course_run in course_runs]
+        # Warm up the current site cache used to build resource links
+        Site.objects.get_current()
+
+        # courses, offerings, offering rules, certificate prices
+        with self.assertNumQueries(4):
+            CourseRun.get_serialized_bulk(course_runs_products[:1])
+
+        for course_run in course_runs:
+            course_run.refresh_from_db()
+        with self.assertNumQueries(4):
+            CourseRun.get_serialized_bulk(course_runs_products)
+
+        self.assertEqual(CourseRun.get_serialized_bulk([]), [])
+
+        with self.assertRaises(ValueError):
+            CourseRun.get_serialized_bulk(
+                course_runs_products, visibility="invalid_visibility"
+            )
+
     def test_models_course_run_user_can_not_enroll_because_is_already_enrolled_to_the_course(
         self,
     ):
@@ -695,3 +765,49 @@ class CourseRunModelsTestCase(TestCase):
             price=42.00,
         )
         self.assertEqual(course_run.get_certificate_offer(), enums.COURSE_OFFER_PAID)
+
+    def test_models_course_run_queryset_annotate_state_priority(self):
+        """
+        The state priority of course runs computed in the database should match the
+        state computed for each course run, including course runs without end dates.
+        """
+        course_runs = [
+            factories.CourseRunFactory(state=priority)
+            for priority in CourseState.STATE_TEXTS
+        ]
+        course_runs += [
+            factories.CourseRunFactory(
+                start=self.now - timedelta(days=1),
+                enrollment_start=self.now - timedelta(days=2),
+                end=end,
+                enrollment_end=None,
+            )
+            for end in [None, self.now - timedelta(hours=1)]
+        ]
+
+        with self.assertNumQueries(1):
+            state_priorities = dict(
+                CourseRun.objects.annotate_state_priority().values_list(
+                    "pk", "state_priority"
+                )
+            )
+
+        for course_run in course_runs:
+            with self.subTest(state=course_run.state["priority"]):
+                self.assertEqual(
+                    state_priorities[course_run.pk], course_run.state["priority"]
+                )
+
+    def test_models_course_run_queryset_exclude_archived(self):
+        """
+        Archived course runs should be excluded in the database.
+        """
+        course_runs = [
+            factories.CourseRunFactory(state=priority)
+            for priority in CourseState.STATE_TEXTS
+        ]
+
+        self.assertCountEqual(
+            CourseRun.objects.exclude_archived(),
+            [course_run for course_run in course_runs if not course_run.is_archived],
+        )
@@ -219,6 +219,45 @@ class EnrollmentModelsTestCase(TestCase):
             course_run=course_run, user=user, was_created_by_order=True
         )
 
+    @mock.patch.object(OpenEdXLMSBackend, "set_enrollment")
+    def test_models_enrollment_entitlement_validated_in_advance(self, _mock_set):
+        """
+        The entitlement of the user to enroll to a non listed course run can be
+        validated in advance, e.g. for many enrollments at once, so it is not looked
+        up again when the enrollment is saved.
+        """
+        user = factories.UserFactory()
+        course_run = factories.CourseRunFactory(
+            state=CourseState.ONGOING_OPEN,
+            is_listed=False,
+        )
+        factories.ProductFactory(target_courses=[course_run.course])
+        enrollment = Enrollment(
+            course_run=course_run,
+            user=user,
+            was_created_by_order=True,
+            is_active=True,
+        )
+
+        enrollment.is_entitled = False
+        with self.assertRaises(ValidationError) as context:
+            enrollment.save()
+
+        self.assertEqual(
+            (
+                f"{{'__all__': ['Course run \"{course_run.id!s}\" "
+                "requires a valid order to enroll.']}"
+            ),
+            str(context.exception),
+        )
+
+        enrollment.is_entitled = True
+        enrollment.save()
+
+        self.assertEqual(user.enrollments.get(), enrollment)
+        # The entitlement is only used for one validation
+        self.assertIsNone(enrollment.is_entitled)
+
     def test_models_enrollment_set_existing(self):
         """Calling the set method is only allowed on an existing enrollment"""
         user = factories.UserFactory()
@@ -0,0 +1,141 @@
+"""
+Test suite for enrollment entitlement models
+"""
+
+from django.test import TestCase
+from django.utils import timezone
+
+from joanie.core import enums, factories
+from joanie.core.models import EnrollmentEntitlement
+
+
+class EnrollmentEntitlementModelsTestCase(TestCase):
+    """Test suite for the EnrollmentEntitlement model."""
+
+    def test_models_enrollment_entitlement_order_allowing_enrollment(self):
+        """
+        An order should entitle its owner to enroll to its target course runs as long as
+        it allows enrollment, to all the course runs of a target course unless it is
+        restricted to some course runs.
+        """
+        user = factories.UserFactory()
+        course, restricted_course = factories.CourseFactory.create_batch(2)
+        course_run = factories.CourseRunFactory(course=restricted_course)
+        factories.CourseRunFactory(course=restricted_course)
+        product = factories.ProductFactory(
+            target_courses=[course, restricted_course], price="0.00"
+        )
+        product.target_course_relations.get(course=restricted_course).course_runs.set(
+            [course_run]
+        )
+
+        order = factories.OrderFactory(owner=user, product=product)
+        self.assertFalse(EnrollmentEntitlement.objects.exists())
+
+        order.init_flow()
+
+        self.assertEqual(order.state, enums.ORDER_STATE_COMPLETED)
+        self.assertCountEqual(
+            order.enrollment_entitlements.values_list("user", "course", "course_run"),
+            [
+                (user.id, course.id, None),
+                (user.id, restricted_course.id, course_run.id),
+            ],
+        )
+
+        order.flow.cancel()
+
+        self.assertEqual(order.state, enums.ORDER_STATE_CANCELED)
+        self.assertFalse(EnrollmentEntitlement.objects.exists())
+
+    def test_models_enrollment_entitlement_order_target_course_runs_changed(self):
+        """
+        Entitlements of an order allowing enrollment should follow the changes of its
+        target course runs.
+        """
+        course = factories.CourseFactory()
+        course_run, other_course_run = factories.CourseRunFactory.create_batch(
+            2, course=course
+        )
+        product = factories.ProductFactory(target_courses=[course], price="0.00")
+        order = factories.OrderFactory(
+            product=product, state=enums.ORDER_STATE_COMPLETED
+        )
+        self.assertEqual(
+            list(order.enrollment_entitlements.values_list("course", "course_run")),
+            [(course.id, None)],
+        )
+
+        relation = order.offerings.get(course=course)
+        relation.course_runs.set([course_run, other_course_run])
+        self.assertCountEqual(
+            order.enrollment_entitlements.values_list("course", "course_run"),
+            [(course.id, course_run.id), (course.id, other_course_run.id)],
+        )
+
+        relation.course_runs.remove(other_course_run)
+        self.assertEqual(
+            list(order.enrollment_entitlements.values_list("course", "course_run")),
+            [(course.id, course_run.id)],
+        )
+
+        relation.delete()
+        self.assertFalse(order.enrollment_entitlements.exists())
+
+    def test_models_enrollment_entitlement_get_entitled_course_run_ids(self):
+        """
+        Course runs entitled to a user should be returned for many course runs at once,
+        only if the order granting them is valid.
+        """
+        course, restricted_course, other_course = factories.CourseFactory.create_batch(
+            3
+        )
+        course_runs = factories.CourseRunFactory.create_batch(2, course=course)
+        restricted_course_run, other_course_run = (
+            factories.CourseRunFactory.create_batch(2, course=restricted_course)
+        )
+        course_runs.extend(
+            [
+                restricted_course_run,
+                other_course_run,
+                factories.CourseRunFactory(course=other_course),
+            ]
+        )
+        product = factories.ProductFactory(
+            target_courses=[course, restricted_course],
+            contract_definition_order=factories.ContractDefinitionFactory(),
+            price="0.00",
+        )
+        product.target_course_relations.get(course=restricted_course).course_runs.set(
+            [restricted_course_run]
+        )
+        order = factories.OrderFactory(
+            product=product, state=enums.ORDER_STATE_COMPLETED
+        )
+        entitlements = order.owner.enrollment_entitlements
+
+        # The contract of the order is not signed yet
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                entitlements.get_entitled_course_run_ids(course_runs), set()
+            )
+
+        factories.ContractFactory(
+            order=order,
+            definition=product.contract_definition_order,
+            submitted_for_signature_on=timezone.now(),
+            student_signed_on=timezone.now(),
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                entitlements.get_entitled_course_run_ids(course_runs),
+                {course_runs[0].id, course_runs[1].id, restricted_course_run.id},
+            )
+        # Other users are not entitled
+        self.assertEqual(
+            factories.UserFactory().enrollment_entitlements.get_entitled_course_run_ids(
+                course_runs
+            ),
+            set(),
+        )
@@ -2,18 +2,21 @@
 Test suite for OfferingRule model
 """
 
+import threading
 from datetime import datetime, timedelta
 from unittest import mock
 from zoneinfo import ZoneInfo
 
-from django.db import IntegrityError
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase
 from django.utils import timezone
 
+import pytest
 from parler.utils.context import switch_language
 
 from joanie.core import enums, factories
-from joanie.core.models import OfferingRule
+from joanie.core.models import OfferingRule, Order
 
 
 class OfferingRuleModelTestCase(TestCase):
@@ -311,17 +314,18 @@ class OfferingRuleModelTestCase(TestCase):
     def test_model_offering_rule_available_seat_property(self):
         """
         The property `available_seats` should return the count of seats available on the order
-        group. It should take in account the orders in binding states and the state `to_own`.
+        group. It should take in account the orders in checkout and binding states and the
+        state `to_own`.
         """
         offering = factories.OfferingFactory()
         offering_rule = factories.OfferingRuleFactory(
-            course_product_relation=offering, nb_seats=10
+            course_product_relation=offering, nb_seats=12
         )
 
         ignored_states = [
             state
             for [state, _] in enums.ORDER_STATE_CHOICES
-            if state not in (*enums.ORDER_STATES_BINDING, enums.ORDER_STATE_TO_OWN)
+            if state not in enums.ORDER_STATES_USING_SEAT
         ]
         for state in ignored_states:
             factories.OrderFactory(
@@ -331,8 +335,10 @@ class OfferingRuleModelTestCase(TestCase):
                 offering_rules=[offering_rule],
             )
 
-        # There are 5 states that are considered 'binding'
-        for state in enums.ORDER_STATES_BINDING:
+        # There are 4 checkout states and 5 states that are considered 'binding'
+        for state in enums.ORDER_STATES_USING_SEAT:
+            if state == enums.ORDER_STATE_TO_OWN:
+                continue
             factories.OrderFactory(
                 state=state,
                 product=offering.product,
@@ -348,11 +354,185 @@ class OfferingRuleModelTestCase(TestCase):
             offering_rules=[offering_rule],
         )
 
-        # There should be only 4 seats left available
-        self.assertEqual(offering_rule.available_seats, 4)
+        # There should be only 2 seats left available
+        offering_rule.refresh_from_db(fields=["nb_used_seats"])
+        self.assertEqual(offering_rule.available_seats, 2)
         self.assertEqual(offering_rule.get_nb_binding_orders(), 5)
         self.assertEqual(offering_rule.get_nb_to_own_orders(), 1)
 
+    def test_model_offering_rule_nb_used_seats_order_transitions(self):
+        """
+        The number of used seats should be updated when an order linked to the offering
+        rule starts or stops using a seat, and be read without query once loaded.
+        """
+        offering = factories.OfferingFactory()
+        offering_rule = factories.OfferingRuleFactory(
+            course_product_relation=offering, nb_seats=2
+        )
+        order = factories.OrderFactory(
+            state=enums.ORDER_STATE_PENDING,
+            product=offering.product,
+            course=offering.course,
+            offering_rules=[offering_rule],
+        )
+
+        offering_rule = OfferingRule.objects.get(pk=offering_rule.pk)
+        self.assertEqual(offering_rule.nb_used_seats, 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(offering_rule.available_seats, 1)
+
+        order.flow.cancel()
+
+        offering_rule = OfferingRule.objects.get(pk=offering_rule.pk)
+        self.assertEqual(offering_rule.nb_used_seats, 0)
+        self.assertEqual(offering_rule.available_seats, 2)
+
+    def test_model_offering_rule_nb_used_seats_order_links(self):
+        """
+        The number of used seats should be updated when orders using a seat are
+        linked to or unlinked from the offering rule from both sides of the relation.
+        """
+        offering = factories.OfferingFactory()
+        offering_rule = factories.OfferingRuleFactory(
+            course_product_relation=offering, nb_seats=5
+        )
+        order, other_order = factories.OrderFactory.create_batch(
+            2,
+            state=enums.ORDER_STATE_COMPLETED,
+            product=offering.product,
+            course=offering.course,
+            offering_rules=[offering_rule],
+        )
+        factories.OrderFactory(
+            state=enums.ORDER_STATE_CANCELED,
+            product=offering.product,
+            course=offering.course,
+            offering_rules=[offering_rule],
+        )
+        offering_rule.refresh_from_db(fields=["nb_used_seats"])
+        self.assertEqual(offering_rule.available_seats, 3)
+
+        order.offering_rules.remove(offering_rule)
+        offering_rule.refresh_from_db(fields=["nb_used_seats"])
+        self.assertEqual(offering_rule.available_seats, 4)
+
+        offering_rule.orders.add(order)
+        offering_rule.refresh_from_db(fields=["nb_used_seats"])
+        self.assertEqual(offering_rule.available_seats, 3)
+
+        other_order.offering_rules.clear()
+        offering_rule.refresh_from_db(fields=["nb_used_seats"])
+        self.assertEqual(offering_rule.available_seats, 4)
+
+        offering_rule.orders.clear()
+        offering_rule.refresh_from_db(fields=["nb_used_seats"])
+        self.assertEqual(offering_rule.available_seats, 5)
+
+        # Saving an offering rule loaded before orders used seats keeps the counter
+        offering_rule = OfferingRule.objects.get(pk=offering_rule.pk)
+        offering_rule.orders.add(order, other_order)
+        offering_rule.save()
+        offering_rule.refresh_from_db()
+        self.assertEqual(offering_rule.nb_used_seats, 2)
+
+    def test_model_offering_rule_nb_used_seats_no_seat_left(self):
+        """
+        An order should not start using a seat if one of its offering rules has no
+        seat left, without using a seat of its other offering rules.
+        """
+        offering = factories.OfferingFactory()
+        offering_rule = factories.OfferingRuleFactory(
+            course_product_relation=offering, nb_seats=1
+        )
+        unlimited_offering_rule = factories.OfferingRuleFactory(
+            course_product_relation=offering, nb_seats=None
+        )
+        factories.OrderFactory(
+            state=enums.ORDER_STATE_PENDING,
+            product=offering.product,
+            course=offering.course,
+            offering_rules=[offering_rule],
+        )
+        order = factories.OrderFactory(
+            state=enums.ORDER_STATE_DRAFT,
+            product=offering.product,
+            course=offering.course,
+            offering_rules=[offering_rule, unlimited_offering_rule],
+        )
+
+        order.state = enums.ORDER_STATE_ASSIGNED
+        with self.assertRaises(ValidationError) as context:
+            order.save()
+
+        self.assertEqual(
+            context.exception.message_dict,
+            {
+                "offering_rule": [
+                    "Maximum number of orders reached for product "
+                    f"{offering.product.title}"
+                ]
+            },
+        )
+        self.assertEqual(order.state, enums.ORDER_STATE_DRAFT)
+        order.refresh_from_db()
+        self.assertEqual(order.state, enums.ORDER_STATE_DRAFT)
+        offering_rule.refresh_from_db()
+        self.assertEqual(offering_rule.nb_used_seats, 1)
+        unlimited_offering_rule.refresh_from_db()
+        self.assertEqual(unlimited_offering_rule.nb_used_seats, 0)
+
+    def test_model_offering_rule_nb_used_seats_order_links_no_seat_left(self):
+        """
+        Orders using a seat should not be linked to an offering rule without enough
+        seats left, from both sides of the relation.
+        """
+        offering = factories.OfferingFactory()
+        offering_rule = factories.OfferingRuleFactory(
+            course_product_relation=offering, nb_seats=2
+        )
+        order, *other_orders = factories.OrderFactory.create_batch(
+            3,
+            state=enums.ORDER_STATE_COMPLETED,
+            product=offering.product,
+            course=offering.course,
+        )
+        order.offering_rules.add(offering_rule)
+
+        with self.assertRaises(ValidationError), transaction.atomic():
+            offering_rule.orders.add(*other_orders)
+
+        offering_rule.orders.add(other_orders[0])
+        with self.assertRaises(ValidationError), transaction.atomic():
+            other_orders[1].offering_rules.add(offering_rule)
+
+        offering_rule.refresh_from_db()
+        self.assertEqual(offering_rule.nb_used_seats, 2)
+        self.assertCountEqual(offering_rule.orders.all(), [order, other_orders[0]])
+
+    def test_model_offering_rule_nb_used_seats_drifted(self):
+        """
+        An offering rule using less seats than released should be left untouched and
+        logged so its number of used seats can be reconciled.
+        """
+        offering = factories.OfferingFactory()
+        offering_rule = factories.OfferingRuleFactory(
+            course_product_relation=offering, nb_seats=2
+        )
+        order = factories.OrderFactory(
+            state=enums.ORDER_STATE_PENDING,
+            product=offering.product,
+            course=offering.course,
+            offering_rules=[offering_rule],
+        )
+        OfferingRule.objects.filter(pk=offering_rule.pk).update(nb_used_seats=0)
+
+        with self.assertLogs("joanie.core.models.products", "ERROR") as logs:
+            order.flow.cancel()
+
+        self.assertIn("reconcile_offering_rules_seats", logs.output[0])
+        offering_rule.refresh_from_db()
+        self.assertEqual(offering_rule.nb_used_seats, 0)
+
     def test_model_offering_rule_translatable_description_field(self):
         """
         Simple test to check if the translatable description field works as expected.
@@ -446,3 +626,54 @@ class OfferingRuleModelTestCase(TestCase):
                     offering_rule_ends_in_62_min,
                 ],
             )
+
+
+# pylint:disable=unused-argument
+@pytest.mark.django_db(transaction=True)
+def test_models_offering_rule_nb_used_seats_concurrent_orders(transactional_db):
+    """
+    When orders concurrently try to use the last seat of an offering rule, only one
+    of them should get it, the other one being rejected.
+    """
+    offering = factories.OfferingFactory()
+    offering_rule = factories.OfferingRuleFactory(
+        course_product_relation=offering, nb_seats=1
+    )
+    orders = factories.OrderFactory.create_batch(
+        2,
+        state=enums.ORDER_STATE_DRAFT,
+        product=offering.product,
+        course=offering.course,
+        offering_rules=[offering_rule],
+    )
+    barrier = threading.Barrier(len(orders))
+    results = []
+
+    def use_seat(order_id):
+        order = Order.objects.get(pk=order_id)
+        order.state = enums.ORDER_STATE_ASSIGNED
+        barrier.wait()
+        try:
+            with transaction.atomic():
+                order.save()
+        except ValidationError:
+            results.append(False)
+        else:
+            results.append(True)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=use_seat, args=(order.pk,)) for order in orders]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [False, True]
+    offering_rule.refresh_from_db()
+    assert offering_rule.nb_used_seats == 1
+    assert list(
+        Order.objects.filter(state=enums.ORDER_STATE_ASSIGNED).values_list(
+            "pk", flat=True
+        )
+    ) in [[order.pk] for order in orders]
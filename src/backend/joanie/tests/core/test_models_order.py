@@ -18,7 +18,7 @@ from joanie.core import enums, factories
 from joanie.core.enums import PAYMENT_STATE_PENDING
 from joanie.core.factories import CourseRunFactory
 from joanie.core.models import Contract, CourseState, Order
-from joanie.core.utils import contract_definition
+from joanie.core.utils import contract_definition, issuers
 from joanie.payment.factories import (
     BillingAddressDictFactory,
     CreditCardFactory,
@@ -795,8 +795,11 @@ class OrderModelsTestCase(LoggingTestCase):
         contract.context = context
         contract.save()
 
-        invitation_url = order.submit_for_signature(user=order.owner)
+        with mock.patch.object(issuers, "generate_document") as mock_generate_document:
+            invitation_url = order.submit_for_signature(user=order.owner)
 
+        # The document does not need to be rendered as it is not resubmitted
+        mock_generate_document.assert_not_called()
         contract.refresh_from_db()
         self.assertEqual(
             contract.context, json.loads(DjangoJSONEncoder().encode(context))
@@ -3,11 +3,12 @@ Test suite the `enroll_user_to_course_run` method on Order model
 """
 
 import random
+from unittest import mock
 
 from django.test import TestCase
 
 from joanie.core import enums, factories
-from joanie.core.models import CourseState, Enrollment
+from joanie.core.models import CourseRun, CourseState, Enrollment
 
 
 # pylint: disable=too-many-public-methods
@@ -228,3 +229,38 @@ class EnrollUserToCourseRunOrderModelsTestCase(TestCase):
         )
 
         self.assertEqual(Enrollment.objects.count(), 0)
+
+    def test_models_order_enroll_user_to_course_run_created_concurrently(self):
+        """
+        If the enrollment is created concurrently once enrollments of the user have
+        been fetched, the existing enrollment should be activated instead of failing
+        on the unique constraint.
+        """
+        [course, target_course] = factories.CourseFactory.create_batch(2)
+        product = factories.ProductFactory(courses=[course], price=0)
+        course_run = factories.CourseRunFactory(
+            course=target_course, state=CourseState.ONGOING_OPEN
+        )
+        factories.ProductTargetCourseRelationFactory(
+            product=product, course=target_course
+        )
+        order = factories.OrderFactory(product=product, course=course)
+
+        def create_enrollment(instance, user):
+            factories.EnrollmentFactory(
+                course_run=instance,
+                user=user,
+                is_active=False,
+                was_created_by_order=True,
+            )
+            return True
+
+        with mock.patch.object(
+            CourseRun, "can_enroll", autospec=True, side_effect=create_enrollment
+        ):
+            order.init_flow()
+
+        self.assertEqual(order.state, enums.ORDER_STATE_COMPLETED)
+        enrollment = Enrollment.objects.get()
+        self.assertEqual(enrollment.course_run, course_run)
+        self.assertTrue(enrollment.is_active)
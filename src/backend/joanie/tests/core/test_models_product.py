@@ -6,6 +6,7 @@ Test suite for products models
 import random
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal as D
+from unittest import mock
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -279,6 +280,88 @@ class ProductModelsTestCase(BaseAPITestCase):
             },
         )
 
+    def test_models_product_get_equivalent_course_run_stored(self):
+        """
+        The equivalent course run of a product should be stored each time a target
+        course run changes then read from the database.
+        """
+        course_run = factories.CourseRunFactory(
+            start=django_timezone.now() - timedelta(days=1),
+            languages=["fr"],
+        )
+        product = factories.ProductFactory(target_courses=[course_run.course])
+        self.assertEqual(product.equivalent_course_run.languages, ["fr"])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                product.get_equivalent_course_run_dates()["start"], course_run.start
+            )
+
+        # Updating a target course run computes it again once committed, only once
+        # whatever the number of updates
+        with (
+            mock.patch.object(
+                models.ProductEquivalentCourseRun.objects,
+                "refresh",
+                wraps=models.ProductEquivalentCourseRun.objects.refresh,
+            ) as mock_refresh,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            course_run.languages = ["en"]
+            course_run.save()
+            self.assertEqual(product.get_equivalent_course_run_languages(), ["en"])
+            course_run.languages = ["en", "fr"]
+            course_run.save()
+        mock_refresh.assert_called_once()
+        self.assertEqual(
+            models.ProductEquivalentCourseRun.objects.get(product=product).languages,
+            ["en", "fr"],
+        )
+
+        # Removing a target course computes it again once committed
+        with self.captureOnCommitCallbacks(execute=True):
+            product.target_course_relations.get().delete()
+            self.assertEqual(product.get_equivalent_course_run_languages(), [])
+        self.assertEqual(
+            models.ProductEquivalentCourseRun.objects.get(product=product).languages,
+            [],
+        )
+
+    def test_models_product_get_equivalent_course_run_not_stored(self):
+        """
+        Reading the equivalent course run of a product should compute it without
+        storing it if it is missing.
+        """
+        course_run = factories.CourseRunFactory(languages=["fr"])
+        product = factories.ProductFactory(target_courses=[course_run.course])
+        models.ProductEquivalentCourseRun.objects.all().delete()
+
+        self.assertEqual(product.get_equivalent_course_run_languages(), ["fr"])
+        self.assertEqual(
+            models.ProductEquivalentCourseRun.objects.get_for_products([product])[
+                product.pk
+            ].languages,
+            ["fr"],
+        )
+        self.assertFalse(models.ProductEquivalentCourseRun.objects.exists())
+
+    def test_models_product_get_equivalent_course_run_for_products(self):
+        """
+        The stored equivalent course runs of several products should be read at once.
+        """
+        products = factories.ProductFactory.create_batch(
+            3, target_courses=[factories.CourseRunFactory().course]
+        )
+        self.assertEqual(models.ProductEquivalentCourseRun.objects.count(), 3)
+
+        with self.assertNumQueries(1):
+            equivalent_course_runs = (
+                models.ProductEquivalentCourseRun.objects.get_for_products(products)
+            )
+        self.assertCountEqual(
+            equivalent_course_runs.keys(), [product.pk for product in products]
+        )
+
     def test_models_product_get_equivalent_course_run_offer_free(self):
         """
         Check that product offer is processed according to its type and price.
@@ -1,11 +1,18 @@
 """Tests for the CachedModelSerializer class."""
 
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 
 from rest_framework import serializers
 
 from joanie.core import factories, models
-from joanie.core.serializers.base import CachedModelSerializer
+from joanie.core.serializers.base import (
+    CachedListSerializer,
+    CachedModelSerializer,
+)
 
 
 class TestCachedModelSerializer(TestCase):
@@ -169,3 +176,76 @@ class TestCachedModelSerializer(TestCase):
         address.title = "Work"
         serializer = AddressCachedSerializer(address)
         self.assertEqual(serializer.data, {"title": "Work"})
+
+    def test_serializers_cached_model_serializer_many_batched(self):
+        """
+        A list of resources should be serialized by a CachedListSerializer which
+        fetches cached representations at once and only serializes missing ones.
+        """
+
+        class AddressCachedSerializer(CachedModelSerializer):
+            """A Test Serializer based on Address Model."""
+
+            class Meta:
+                model = models.Address
+                fields = ("title",)
+
+        addresses = factories.UserAddressFactory.create_batch(3)
+        # - Cache the representation of the first address only
+        cached_title = addresses[0].title
+        self.assertEqual(
+            AddressCachedSerializer(addresses[0]).data, {"title": cached_title}
+        )
+        addresses[0].title = "Outdated"
+
+        serializer = AddressCachedSerializer(addresses, many=True)
+        self.assertIsInstance(serializer, CachedListSerializer)
+
+        with (
+            mock.patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many,
+            mock.patch.object(cache, "set_many", wraps=cache.set_many) as mock_set_many,
+            self.assertLogs("joanie.core.serializers.base", "DEBUG") as logs,
+        ):
+            data = serializer.data
+
+        self.assertEqual(
+            data,
+            [
+                {"title": cached_title},
+                {"title": addresses[1].title},
+                {"title": addresses[2].title},
+            ],
+        )
+        # Cached representations of the whole list are fetched at once
+        mock_get_many.assert_called_once()
+        self.assertEqual(len(mock_get_many.call_args[0][0]), 3)
+        mock_set_many.assert_called_once()
+        self.assertEqual(len(mock_set_many.call_args[0][0]), 2)
+        self.assertIn(
+            "Cache hits for AddressCachedSerializer: 1/3 "
+            f"(cache_ttl={settings.JOANIE_SERIALIZER_DEFAULT_CACHE_TTL})",
+            logs.output[0],
+        )
+
+        # - All representations are now cached
+        with mock.patch.object(cache, "set_many") as mock_set_many:
+            data = AddressCachedSerializer(addresses, many=True).data
+
+        self.assertEqual(data[0], {"title": cached_title})
+        mock_set_many.assert_not_called()
+
+    def test_serializers_cached_model_serializer_many_custom_list_serializer(self):
+        """
+        A list serializer class declared in the Meta of the serializer should be used.
+        """
+
+        class AddressCachedSerializer(CachedModelSerializer):
+            """A Test Serializer based on Address Model."""
+
+            class Meta:
+                list_serializer_class = serializers.ListSerializer
+                model = models.Address
+                fields = ("title",)
+
+        serializer = AddressCachedSerializer([], many=True)
+        self.assertNotIsInstance(serializer, CachedListSerializer)
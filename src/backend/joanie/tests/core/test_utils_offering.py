@@ -208,6 +208,7 @@ class UtilsCourseProductRelationTestCase(LoggingTestCase):
             synchronize_offerings.run()
 
         synchronized_course_runs = mock_sync.call_args_list[0][0][0]
+        self.assertEqual(mock_sync.call_args_list[0][1], {"only_changed": True})
 
         self.assertLogsEquals(
             logger.records,
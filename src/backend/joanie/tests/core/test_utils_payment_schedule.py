@@ -130,6 +130,28 @@ class PaymentScheduleUtilsTestCase(LoggingTestCase):
             date(2023, 12, 14),
         )
 
+    def test_utils_payment_schedule_withdrawal_limit_dates(self):
+        """
+        Withdrawal limit dates of many contracts should be computed at once and be
+        the same as if they were computed one by one.
+        """
+        dates = [
+            (date(2024, 1, 1), date(2024, 3, 1)),
+            (date(2024, 2, 1), date(2024, 3, 1)),
+            (date(2023, 12, 14), date(2024, 3, 1)),
+            (date(2024, 1, 1), date(2024, 1, 10)),
+        ]
+
+        self.assertEqual(
+            payment_schedule._withdrawal_limit_dates(dates),
+            [
+                date(2024, 1, 17),
+                date(2024, 2, 19),
+                date(2024, 1, 2),
+                date(2024, 1, 1),
+            ],
+        )
+
     def test_utils_payment_schedule_get_installments_percentages(self):
         """
         Check that the correct payment limits are returned for different amounts
@@ -400,6 +422,43 @@ class PaymentScheduleUtilsTestCase(LoggingTestCase):
             ],
         )
 
+    def test_utils_payment_schedule_generate_many(self):
+        """
+        Payment schedules of many orders should be generated at once and be the same
+        as if they were generated one by one.
+        """
+        course_start_date = datetime(2024, 3, 1, 14, tzinfo=ZoneInfo("UTC"))
+        course_end_date = datetime(2024, 5, 1, 14, tzinfo=ZoneInfo("UTC"))
+        schedules = [
+            (3, datetime(2024, 1, 1, 14, tzinfo=ZoneInfo("UTC"))),
+            (10, datetime(2024, 1, 1, 14, tzinfo=ZoneInfo("UTC"))),
+            (3, datetime(2024, 2, 20, 14, tzinfo=ZoneInfo("UTC"))),
+        ]
+
+        def without_ids(payment_schedules):
+            return [
+                [
+                    {key: value for key, value in installment.items() if key != "id"}
+                    for installment in installments
+                ]
+                for installments in payment_schedules
+            ]
+
+        self.assertEqual(
+            without_ids(
+                payment_schedule.generate_many(
+                    (total, signed_contract_date, course_start_date, course_end_date)
+                    for total, signed_contract_date in schedules
+                )
+            ),
+            without_ids(
+                payment_schedule.generate(
+                    total, signed_contract_date, course_start_date, course_end_date
+                )
+                for total, signed_contract_date in schedules
+            ),
+        )
+
     def test_utils_payment_schedule_generate_3_parts(self):
         """
         Check that order's schedule is correctly set for 3 parts
@@ -4,13 +4,17 @@
 import random
 import uuid
 from http import HTTPStatus
+from unittest import mock
 
+from django.core.cache import cache
 from django.test import override_settings
 from django.urls import reverse
+from django.utils.http import http_date
 
 import lxml
 
-from joanie.core import enums, factories
+from joanie.core import enums, factories, models
+from joanie.core.utils import issuers
 from joanie.tests.base import BaseAPITestCase
 
 
@@ -19,6 +23,10 @@ class CertificateVerificationViewTestCase(BaseAPITestCase):
     The CertificateVerificationView test suite.
     """
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_views_certificate_verification_view_with_unknown_id(self):
         """
         CertificateVerificationView should return a 404 if the certificate id is unknown.
@@ -114,5 +122,108 @@ class CertificateVerificationViewTestCase(BaseAPITestCase):
         self.assertIn("https://richie.education", footer_link[0].text)
 
         pdf_overview = html.cssselect("iframe")
-        self.assertRegex(pdf_overview[0].attrib["src"], "^data:application/pdf;base64,")
+        self.assertEqual(
+            pdf_overview[0].attrib["src"],
+            reverse(
+                "certificate-verification-document",
+                kwargs={"certificate_id": certificate.id},
+            ),
+        )
         self.assertRegex(pdf_overview[0].attrib["type"], "application/pdf")
+
+    def test_views_certificate_verification_view_conditional_get(self):
+        """
+        CertificateVerificationView should return validators for conditional requests,
+        serve the page from cache and return a 304 if the client has the current
+        version of the page.
+        """
+        certificate = factories.OrderCertificateFactory(
+            order__product__certificate_definition=(
+                factories.CertificateDefinitionFactory(
+                    template=random.choice(enums.VERIFIABLE_CERTIFICATES)
+                )
+            ),
+        )
+        url = reverse(
+            "certificate-verification", kwargs={"certificate_id": certificate.id}
+        )
+
+        response = self.client.get(url)
+
+        certificate.refresh_from_db()
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        etag = response.headers["ETag"]
+        self.assertEqual(response.headers["Cache-Control"], "public, max-age=3600")
+        self.assertEqual(
+            response.headers["Last-Modified"],
+            http_date(int(certificate.updated_on.timestamp())),
+        )
+
+        with mock.patch.object(
+            models.Certificate, "get_document_context"
+        ) as mock_context:
+            cached_response = self.client.get(url)
+            not_modified_response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        mock_context.assert_not_called()
+        self.assertStatusCodeEqual(cached_response, HTTPStatus.OK)
+        self.assertEqual(cached_response.content, response.content)
+        self.assertStatusCodeEqual(not_modified_response, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(not_modified_response.content, b"")
+
+        # Once the certificate has been modified, the page is rendered again
+        certificate.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_views_certificate_verification_document_view(self):
+        """
+        CertificateVerificationDocumentView should serve the certificate document
+        inline, generate it once per version of the certificate and return a 304
+        if the client has the current version of the document.
+        """
+        certificate = factories.OrderCertificateFactory(
+            order__product__certificate_definition=(
+                factories.CertificateDefinitionFactory(
+                    template=random.choice(enums.VERIFIABLE_CERTIFICATES)
+                )
+            ),
+        )
+        url = reverse(
+            "certificate-verification-document",
+            kwargs={"certificate_id": certificate.id},
+        )
+
+        with mock.patch.object(
+            issuers, "generate_document", return_value=b"%PDF-1.4 certificate"
+        ) as mock_generate_document:
+            response = self.client.get(url)
+            cached_response = self.client.get(url)
+            not_modified_response = self.client.get(
+                url, HTTP_IF_NONE_MATCH=response.headers["ETag"]
+            )
+
+        mock_generate_document.assert_called_once()
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        self.assertEqual(response.headers["Content-Type"], "application/pdf")
+        self.assertEqual(response.headers["Content-Disposition"], "inline")
+        self.assertEqual(response.headers["X-Frame-Options"], "SAMEORIGIN")
+        self.assertEqual(response.content, b"%PDF-1.4 certificate")
+        self.assertEqual(cached_response.content, b"%PDF-1.4 certificate")
+        self.assertStatusCodeEqual(not_modified_response, HTTPStatus.NOT_MODIFIED)
+
+    def test_views_certificate_verification_document_view_with_unknown_id(self):
+        """
+        CertificateVerificationDocumentView should return a 404 if the certificate
+        id is unknown.
+        """
+        url = reverse(
+            "certificate-verification-document",
+            kwargs={"certificate_id": uuid.uuid4()},
+        )
+
+        response = self.client.get(url)
+
+        self.assertStatusCodeEqual(response, HTTPStatus.NOT_FOUND)
@@ -505,6 +505,38 @@ class BrevoTestCase(LoggingTestCase):
 
         self.assertTrue(response)
 
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_get_unsubscribed_from_commercial_newsletter(self):
+        """
+        Test the unsubscription status of many contacts at once, only emails of
+        contacts who have unsubscribed from the commercial newsletter list should
+        be returned.
+        """
+        list_unsubscribed = {
+            "unsubscribed@example.com": [settings.BREVO_COMMERCIAL_NEWSLETTER_LIST_ID],
+            "other-list@example.com": [1],
+            "subscribed@example.com": [],
+        }
+        for email, unsubscribed in list_unsubscribed.items():
+            responses.add(
+                responses.GET,
+                f"{self.create_contact_url}/{quote_plus(email)}",
+                status=200,
+                json={"email": email, "listUnsubscribed": unsubscribed},
+            )
+        responses.add(
+            responses.GET,
+            f"{self.create_contact_url}/{quote_plus('unknown@example.com')}",
+            status=404,
+            json={"code": "document_not_found"},
+        )
+
+        response = Brevo().get_unsubscribed_from_commercial_newsletter(
+            [*list_unsubscribed.keys(), "unknown@example.com"]
+        )
+
+        self.assertEqual(response, {"unsubscribed@example.com"})
+
     @responses.activate(assert_all_requests_are_fired=True)
     def test_create_webhook(self):
         """
@@ -644,3 +676,29 @@ class BrevoTestCase(LoggingTestCase):
         response = brevo.get_contacts(limit=50, offset=50)
 
         self.assertEqual(BREVO_CONTACTS_LIST.get("contacts"), response)
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_get_contacts_limit_one(self):
+        """
+        Test list retrieving a page of a single contact in the commercial newsletter
+        list returns contacts and not their count.
+        """
+        responses.add(
+            responses.GET,
+            self.list_contacts_url,
+            headers={
+                "Content-Type": "application/json",
+            },
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"limit": "1", "offset": "1", "sort": "desc"}
+                ),
+            ],
+            status=200,
+            json=BREVO_CONTACTS_LIST,
+        )
+
+        brevo = Brevo()
+        response = brevo.get_contacts(limit=1, offset=1)
+
+        self.assertEqual(BREVO_CONTACTS_LIST.get("contacts"), response)
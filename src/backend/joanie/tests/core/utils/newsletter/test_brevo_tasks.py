@@ -0,0 +1,153 @@
+# pylint: disable=unexpected-keyword-arg,no-value-for-parameter
+"""
+Brevo tasks test module.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+
+import responses
+
+from joanie.core.factories import UserFactory
+from joanie.core.utils.newsletter.brevo.tasks import (
+    SYNCHRONIZATION_CURSOR_CACHE_KEY,
+    synchronize_brevo_subscriptions,
+)
+from joanie.tests.base import LoggingTestCase
+
+CONTACTS = [
+    {"email": "user_1@example.com", "listIds": [444]},
+    {"email": "user_2@example.com", "listIds": []},
+    {"email": "user_3@example.com", "listIds": [152]},
+    {"email": "unknown@example.com", "listIds": [444]},
+]
+
+
+@override_settings(
+    BREVO_API_KEY="api-key",
+    BREVO_COMMERCIAL_NEWSLETTER_LIST_ID=444,
+    BREVO_SYNCHRONIZATION_PAGE_SIZE=2,
+)
+class BrevoTasksTestCase(LoggingTestCase):
+    """
+    Brevo tasks test case.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.list_contacts_url = (
+            f"{settings.BREVO_API_URL}contacts/lists/"
+            f"{settings.BREVO_COMMERCIAL_NEWSLETTER_LIST_ID}/contacts"
+        )
+        self.user_1 = UserFactory(
+            email="user_1@example.com", has_subscribed_to_commercial_newsletter=False
+        )
+        self.user_2 = UserFactory(
+            email="user_2@example.com", has_subscribed_to_commercial_newsletter=True
+        )
+        self.user_3 = UserFactory(
+            email="user_3@example.com", has_subscribed_to_commercial_newsletter=False
+        )
+
+    def _mock_contacts_page(self, limit, offset, contacts, status=200):
+        """Mock a call to the Brevo API listing contacts."""
+        responses.add(
+            responses.GET,
+            self.list_contacts_url,
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"limit": str(limit), "offset": str(offset), "sort": "desc"}
+                ),
+            ],
+            status=status,
+            json={"contacts": contacts, "count": len(CONTACTS)},
+        )
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_synchronize_brevo_subscriptions(self):
+        """
+        Users should be resolved with one query per page of contacts and only
+        users whose subscription status changed should be updated.
+        """
+        self._mock_contacts_page(1, 0, [])
+        self._mock_contacts_page(2, 0, CONTACTS[:2])
+        self._mock_contacts_page(2, 2, CONTACTS[2:])
+
+        # 1st page: select users + bulk update
+        # 2nd page: select users only, nothing changed
+        with self.assertNumQueries(3):
+            synchronize_brevo_subscriptions()
+
+        for user in [self.user_1, self.user_2, self.user_3]:
+            user.refresh_from_db()
+        self.assertTrue(self.user_1.has_subscribed_to_commercial_newsletter)
+        self.assertFalse(self.user_2.has_subscribed_to_commercial_newsletter)
+        self.assertFalse(self.user_3.has_subscribed_to_commercial_newsletter)
+        self.assertIsNone(cache.get(SYNCHRONIZATION_CURSOR_CACHE_KEY))
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    @override_settings(BREVO_SYNCHRONIZATION_WORKERS=2)
+    def test_synchronize_brevo_subscriptions_parallel(self):
+        """
+        Pages of contacts can be fetched concurrently from the Brevo API.
+        """
+        self._mock_contacts_page(1, 0, [])
+        self._mock_contacts_page(2, 0, CONTACTS[:2])
+        self._mock_contacts_page(2, 2, CONTACTS[2:])
+
+        synchronize_brevo_subscriptions()
+
+        for user in [self.user_1, self.user_2, self.user_3]:
+            user.refresh_from_db()
+        self.assertTrue(self.user_1.has_subscribed_to_commercial_newsletter)
+        self.assertFalse(self.user_2.has_subscribed_to_commercial_newsletter)
+        self.assertFalse(self.user_3.has_subscribed_to_commercial_newsletter)
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_synchronize_brevo_subscriptions_interrupted_and_resumed(self):
+        """
+        When a page cannot be fetched, the synchronization should stop and the
+        next run should resume from the failing page.
+        """
+        self._mock_contacts_page(1, 0, [])
+        self._mock_contacts_page(2, 0, CONTACTS[:2])
+        self._mock_contacts_page(2, 2, [], status=500)
+
+        with self.assertLogs() as logger:
+            synchronize_brevo_subscriptions()
+
+        self.assertLogsContains(
+            logger, ["Synchronization interrupted at contact 2 / 4"]
+        )
+        self.assertEqual(cache.get(SYNCHRONIZATION_CURSOR_CACHE_KEY), 2)
+        self.user_1.refresh_from_db()
+        self.assertTrue(self.user_1.has_subscribed_to_commercial_newsletter)
+
+        responses.reset()
+        self._mock_contacts_page(1, 0, [])
+        self._mock_contacts_page(
+            2, 2, [{"email": "user_3@example.com", "listIds": [444]}]
+        )
+
+        synchronize_brevo_subscriptions()
+
+        self.user_3.refresh_from_db()
+        self.assertTrue(self.user_3.has_subscribed_to_commercial_newsletter)
+        self.assertIsNone(cache.get(SYNCHRONIZATION_CURSOR_CACHE_KEY))
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_synchronize_brevo_subscriptions_restart(self):
+        """
+        The restart flag should ignore the stored cursor.
+        """
+        cache.set(SYNCHRONIZATION_CURSOR_CACHE_KEY, 2)
+        self._mock_contacts_page(1, 0, [])
+        self._mock_contacts_page(2, 0, CONTACTS[:2])
+        self._mock_contacts_page(2, 2, CONTACTS[2:])
+
+        synchronize_brevo_subscriptions(restart=True)
+
+        self.user_1.refresh_from_db()
+        self.assertTrue(self.user_1.has_subscribed_to_commercial_newsletter)
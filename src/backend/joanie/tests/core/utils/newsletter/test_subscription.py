@@ -53,54 +53,123 @@ class UtilsNewsletterSubscriptionTestCase(LoggingTestCase):
         mock_brevo().unsubscribe_from_commercial_list.assert_called_once()
 
     @patch("joanie.core.models.accounts.set_commercial_newsletter_subscription")
+    @patch(
+        "joanie.core.utils.newsletter.subscription.set_commercial_newsletter_subscription"
+    )
     @patch("joanie.core.utils.newsletter.brevo.Brevo")
     def test_check_commercial_newsletter_subscription_webhook(
-        self, mock_brevo, mock_set_commercial_newsletter_subscription
+        self,
+        mock_brevo,
+        mock_set_subscription_webhook,
+        mock_set_commercial_newsletter_subscription,
     ):
         """
         If the contact has unsubscribed from the commercial newsletter list,
         its subscription status will be updated in our database,
         triggering the removal from the list.
         """
-        mock_brevo().has_unsubscribed_from_commercial_newsletter.return_value = True
         user = UserFactory(
             has_subscribed_to_commercial_newsletter=True,
             email="user@example.com",
         )
+        mock_brevo().get_unsubscribed_from_commercial_newsletter.return_value = {
+            user.email
+        }
         mock_set_commercial_newsletter_subscription.delay.assert_called_once()
         mock_set_commercial_newsletter_subscription.reset_mock()
 
         check_commercial_newsletter_subscription_webhook.run([user.email])
 
-        mock_brevo().has_unsubscribed_from_commercial_newsletter.assert_called_once()
+        mock_brevo().get_unsubscribed_from_commercial_newsletter.assert_called_once_with(
+            {user.email}
+        )
         user.refresh_from_db()
         self.assertFalse(user.has_subscribed_to_commercial_newsletter)
-        mock_set_commercial_newsletter_subscription.delay.assert_called_once()
+        mock_set_subscription_webhook.delay.assert_called_once()
 
     @patch("joanie.core.models.accounts.set_commercial_newsletter_subscription")
+    @patch(
+        "joanie.core.utils.newsletter.subscription.set_commercial_newsletter_subscription"
+    )
     @patch("joanie.core.utils.newsletter.brevo.Brevo")
     def test_check_commercial_newsletter_subscription_webhook_no_user(
-        self, mock_brevo, mock_set_commercial_newsletter_subscription
+        self,
+        mock_brevo,
+        mock_set_subscription_webhook,
+        mock_set_commercial_newsletter_subscription,
     ):
         """
         If the contact has unsubscribed from the commercial newsletter list,
         its subscription status will be updated in our database,
         triggering the removal from the list.
         """
-        mock_brevo().has_unsubscribed_from_commercial_newsletter.return_value = True
         user = UserFactory(
             has_subscribed_to_commercial_newsletter=True,
             email="user@example.com",
         )
+        mock_brevo().get_unsubscribed_from_commercial_newsletter.return_value = {
+            user.email
+        }
         mock_set_commercial_newsletter_subscription.delay.assert_called_once()
         mock_set_commercial_newsletter_subscription.reset_mock()
 
         check_commercial_newsletter_subscription_webhook.run([user.email])
 
-        mock_brevo().has_unsubscribed_from_commercial_newsletter.assert_called_once()
+        mock_brevo().get_unsubscribed_from_commercial_newsletter.assert_called_once_with(
+            {user.email}
+        )
         user.refresh_from_db()
         self.assertFalse(user.has_subscribed_to_commercial_newsletter)
-        mock_set_commercial_newsletter_subscription.delay.assert_called_once()
+        mock_set_subscription_webhook.delay.assert_called_once()
+
+    @patch("joanie.core.models.accounts.set_commercial_newsletter_subscription")
+    @patch(
+        "joanie.core.utils.newsletter.subscription.set_commercial_newsletter_subscription"
+    )
+    @patch("joanie.core.utils.newsletter.brevo.Brevo")
+    def test_check_commercial_newsletter_subscription_webhook_batch(
+        self, mock_brevo, mock_set_subscription, _mock_set_subscription_on_save
+    ):
+        """
+        Users should be resolved in one query, their status checked with a single
+        bulk call to the newsletter client and updated with a single bulk update.
+        """
+        users = UserFactory.create_batch(
+            4, has_subscribed_to_commercial_newsletter=True
+        )
+        not_subscribed_user = UserFactory(has_subscribed_to_commercial_newsletter=False)
+        mock_brevo().get_unsubscribed_from_commercial_newsletter.return_value = {
+            users[0].email,
+            users[2].email,
+        }
+
+        # select users, prefetch groups and permissions, bulk update
+        with self.assertNumQueries(4):
+            check_commercial_newsletter_subscription_webhook.run(
+                [
+                    *[user.email for user in users],
+                    not_subscribed_user.email,
+                    "unknown@example.com",
+                ]
+            )
+
+        mock_brevo().get_unsubscribed_from_commercial_newsletter.assert_called_once_with(
+            {user.email for user in users}
+        )
+        for user in users:
+            user.refresh_from_db()
+        self.assertEqual(
+            [user.has_subscribed_to_commercial_newsletter for user in users],
+            [False, True, False, True],
+        )
+        self.assertEqual(mock_set_subscription.delay.call_count, 2)
+        for call, user in zip(
+            mock_set_subscription.delay.call_args_list,
+            [users[0], users[2]],
+            strict=True,
+        ):
+            self.assertEqual(call.args[0]["id"], user.id)
+            self.assertFalse(call.args[0]["has_subscribed_to_commercial_newsletter"])
 
     @patch("joanie.core.utils.newsletter.brevo.tasks.Brevo")
     def test_synchronize_brevo_subscriptions(self, mock_brevo):
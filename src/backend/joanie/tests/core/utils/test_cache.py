@@ -0,0 +1,203 @@
+"""
+Test suite for the two-tier cache.
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from joanie.core import factories
+from joanie.core.utils.cache import (
+    GENERATION_CACHE_KEY,
+    INVALIDATION_CACHE_KEY,
+    TwoTierCache,
+    two_tier_cache,
+)
+
+
+@override_settings(
+    JOANIE_CACHE_L1_MAX_SIZE=2,
+    JOANIE_CACHE_L1_TTL=10,
+    JOANIE_CACHE_L1_SYNC_INTERVAL=0,
+)
+class TwoTierCacheTestCase(TestCase):
+    """Test suite for the two-tier cache."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        two_tier_cache.clear_local()
+
+    def test_utils_cache_two_tier_local_hit(self):
+        """
+        Values should be served by the in-process tier without querying the shared
+        cache for them.
+        """
+        two_tier_cache.set("key", "value", 60)
+        self.assertEqual(cache.get("key"), "value")
+
+        with mock.patch.object(cache, "get_many") as mock_get_many:
+            self.assertEqual(two_tier_cache.get("key"), "value")
+
+        mock_get_many.assert_not_called()
+
+    def test_utils_cache_two_tier_get_many(self):
+        """
+        Only keys missing from the in-process tier should be fetched from the shared
+        cache, then kept in process.
+        """
+        two_tier_cache.set("local", "local value", 60)
+        cache.set("shared", "shared value", 60)
+
+        with mock.patch.object(cache, "get_many", wraps=cache.get_many) as mock_get:
+            self.assertEqual(
+                two_tier_cache.get_many(["local", "shared", "missing"]),
+                {"local": "local value", "shared": "shared value"},
+            )
+
+        mock_get.assert_called_once_with(["shared", "missing", GENERATION_CACHE_KEY])
+
+        cache.delete("shared")
+        self.assertEqual(two_tier_cache.get("shared"), "shared value")
+
+    def test_utils_cache_two_tier_lru_eviction(self):
+        """Least recently used entries should be evicted beyond the maximum size."""
+        two_tier_cache.set("first", 1, 60)
+        two_tier_cache.set("second", 2, 60)
+        two_tier_cache.get("first")
+        two_tier_cache.set("third", 3, 60)
+        cache.delete_many(["first", "second", "third"])
+
+        self.assertEqual(
+            two_tier_cache.get_many(["first", "second", "third"]),
+            {"first": 1, "third": 3},
+        )
+
+    def test_utils_cache_two_tier_ttl(self):
+        """
+        In-process entries should expire after the in-process TTL and never outlive
+        the timeout of the shared cache.
+        """
+        with mock.patch("joanie.core.utils.cache.time.monotonic", return_value=0):
+            two_tier_cache.set("long", "long value", 60)
+            two_tier_cache.set("short", "short value", 5)
+            two_tier_cache.set("zero", "zero value", 0)
+        cache.delete_many(["long", "short", "zero"])
+
+        with mock.patch("joanie.core.utils.cache.time.monotonic", return_value=6):
+            self.assertEqual(
+                two_tier_cache.get_many(["long", "short", "zero"]),
+                {"long": "long value"},
+            )
+
+        with mock.patch("joanie.core.utils.cache.time.monotonic", return_value=11):
+            self.assertIsNone(two_tier_cache.get("long"))
+
+    def test_utils_cache_two_tier_delete_broadcast(self):
+        """
+        Deleting keys should drop them from both tiers and make other workers drop
+        them from their in-process tier.
+        """
+        other_worker_cache = TwoTierCache()
+        two_tier_cache.set("key", "value", 60)
+        two_tier_cache.set("other", "other value", 60)
+        self.assertEqual(
+            other_worker_cache.get_many(["key", "other"]),
+            {"key": "value", "other": "other value"},
+        )
+
+        two_tier_cache.delete_many(["key"])
+
+        self.assertIsNone(cache.get("key"))
+        self.assertIsNone(two_tier_cache.get("key"))
+        # Entries which have not been deleted are kept by all workers
+        cache.delete("other")
+        self.assertEqual(two_tier_cache.get("other"), "other value")
+        self.assertEqual(other_worker_cache.get("other"), "other value")
+        # But other workers drop the deleted keys
+        self.assertIsNone(other_worker_cache.get("key"))
+
+    def test_utils_cache_two_tier_delete_broadcast_expired(self):
+        """
+        Other workers should drop their whole in-process tier if the keys deleted
+        since their last synchronization are not known anymore.
+        """
+        other_worker_cache = TwoTierCache()
+        two_tier_cache.set("key", "value", 60)
+        two_tier_cache.set("other", "other value", 60)
+        self.assertEqual(other_worker_cache.get("other"), "other value")
+
+        two_tier_cache.delete_many(["key"])
+        cache.delete(INVALIDATION_CACHE_KEY.format(generation=1))
+
+        cache.delete("other")
+        self.assertEqual(two_tier_cache.get("other"), "other value")
+        self.assertIsNone(other_worker_cache.get("other"))
+
+    def test_utils_cache_two_tier_shared_cache_cleared(self):
+        """
+        Workers should drop their whole in-process tier once the shared cache has
+        been cleared.
+        """
+        two_tier_cache.set("key", "value", 60)
+        self.assertEqual(two_tier_cache.get("key"), "value")
+
+        cache.clear()
+
+        self.assertIsNone(two_tier_cache.get("key"))
+
+    def test_utils_cache_two_tier_copy(self):
+        """
+        Altering a value returned by the in-process tier should not alter the value
+        served to the next callers.
+        """
+        two_tier_cache.set("key", {"values": [1]}, 60)
+
+        two_tier_cache.get("key")["values"].append(2)
+
+        self.assertEqual(two_tier_cache.get("key"), {"values": [1]})
+
+    def test_utils_cache_two_tier_get_many_cleared_meanwhile(self):
+        """
+        Values read from the shared cache on an older generation than the one the
+        worker is synchronized with should not be kept in process, they may have
+        been cleared meanwhile.
+        """
+        two_tier_cache.delete_many(["other"])
+        cache.set("key", "stale value", 60)
+
+        with mock.patch.object(
+            cache,
+            "get_many",
+            return_value={"key": "stale value", GENERATION_CACHE_KEY: 0},
+        ):
+            self.assertEqual(two_tier_cache.get("key"), "stale value")
+
+        cache.set("key", "value", 60)
+        self.assertEqual(two_tier_cache.get("key"), "value")
+
+    @override_settings(JOANIE_CACHE_L1_MAX_SIZE=0)
+    def test_utils_cache_two_tier_disabled(self):
+        """
+        When the in-process tier is disabled, the shared cache should be used
+        directly.
+        """
+        two_tier_cache.set("key", "value", 60)
+        cache.delete("key")
+
+        self.assertIsNone(two_tier_cache.get("key"))
+
+    def test_utils_cache_two_tier_model_clear_cache(self):
+        """
+        Clearing the cache of a resource should drop its cached values from the
+        in-process tier.
+        """
+        offering = factories.OfferingFactory()
+        cache_key = offering.get_cache_key(language="en-us")
+        two_tier_cache.set(cache_key, "representation", 60)
+
+        offering.clear_cache()
+
+        self.assertIsNone(two_tier_cache.get(cache_key))
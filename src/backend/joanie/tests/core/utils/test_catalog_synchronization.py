@@ -0,0 +1,326 @@
+"""
+Test suite for the debounced catalog synchronization.
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from joanie.core import enums, factories
+from joanie.core.utils import catalog_synchronization, webhooks
+from joanie.settings import Base
+
+
+@mock.patch.object(webhooks, "synchronize_course_runs")
+class CatalogSynchronizationTestCase(TestCase):
+    """Test suite for the debounced catalog synchronization."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def tearDown(self):
+        super().tearDown()
+        # Changes of transactions rolled back are not flushed
+        setattr(connection, catalog_synchronization.PENDING_CONNECTION_ATTRIBUTE, None)
+
+    def test_utils_catalog_synchronization_debounced_by_default(self, mock_sync):
+        """
+        The synchronization should be debounced by default, changes being
+        synchronized once when the transaction is committed.
+        """
+        self.assertTrue(Base.JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE)
+        course_run = factories.CourseRunFactory()
+        mock_sync.reset_mock()
+
+        with (
+            override_settings(
+                JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=(
+                    Base.JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE
+                )
+            ),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            course_run.save()
+            course_run.save()
+
+            mock_sync.assert_not_called()
+
+        mock_sync.assert_called_once_with([course_run.get_serialized()])
+
+    def test_utils_catalog_synchronization_debounced_on_commit(self, mock_sync):
+        """
+        Changes notified by signals during a transaction should be synchronized once,
+        deduplicated, when the transaction is committed.
+        """
+        course = factories.CourseFactory()
+        course_run = factories.CourseRunFactory(course=course)
+        product = factories.ProductFactory(courses=[course])
+        factories.ProductTargetCourseRelationFactory(product=product, course=course)
+        mock_sync.reset_mock()
+
+        with (
+            override_settings(JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=True),
+            self.captureOnCommitCallbacks(execute=True) as callbacks,
+        ):
+            for _ in range(3):
+                course_run.save()
+                product.save()
+
+            mock_sync.assert_not_called()
+
+        # The flush is planned for each change but only executed once
+        self.assertGreater(len(callbacks), 1)
+        mock_sync.assert_called_once()
+        synchronized_course_runs = mock_sync.call_args[0][0]
+        self.assertEqual(
+            synchronized_course_runs,
+            [
+                course_run.get_serialized(product=product),
+                *product.get_equivalent_serialized_course_runs_for_products([product]),
+            ],
+        )
+
+    def test_utils_catalog_synchronization_debounced_rollback(self, mock_sync):
+        """
+        Changes of a transaction that is not committed should not be synchronized.
+        """
+        course_run = factories.CourseRunFactory()
+        mock_sync.reset_mock()
+
+        with (
+            override_settings(JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=True),
+            self.captureOnCommitCallbacks(execute=False) as callbacks,
+        ):
+            course_run.save()
+
+        self.assertEqual(len(callbacks), 1)
+        mock_sync.assert_not_called()
+
+    def test_utils_catalog_synchronization_debounced_hidden(self, mock_sync):
+        """
+        Course runs that must be hidden should be serialized before the change and
+        synchronized on commit.
+        """
+        course = factories.CourseFactory()
+        product = factories.ProductFactory(
+            courses=[course], type=enums.PRODUCT_TYPE_CREDENTIAL
+        )
+        factories.ProductTargetCourseRelationFactory(product=product, course=course)
+        factories.CourseRunFactory(course=course)
+        hidden_course_runs = product.get_equivalent_serialized_course_runs_for_products(
+            [product], visibility=enums.HIDDEN
+        )
+        mock_sync.reset_mock()
+
+        with (
+            override_settings(JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=True),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            product.courses.clear()
+
+        mock_sync.assert_called_once_with(hidden_course_runs)
+
+    def test_utils_catalog_synchronization_debounced_course_products_added(
+        self, mock_sync
+    ):
+        """
+        Products added to a course should only be synchronized for this course and
+        certificate products should not be synchronized, as without debounce.
+        """
+        course, other_course = factories.CourseFactory.create_batch(2)
+        product = factories.ProductFactory(
+            courses=[other_course], type=enums.PRODUCT_TYPE_CREDENTIAL
+        )
+        factories.ProductTargetCourseRelationFactory(product=product, course=course)
+        factories.CourseRunFactory(course=course)
+        certificate_product = factories.ProductFactory(
+            courses=[], type=enums.PRODUCT_TYPE_CERTIFICATE
+        )
+        factories.CourseRunFactory(course=course, is_listed=True)
+        mock_sync.reset_mock()
+
+        with (
+            override_settings(JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=True),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            course.products.add(product, certificate_product)
+
+        mock_sync.assert_called_once()
+        synchronized_course_runs = mock_sync.call_args[0][0]
+        self.assertEqual(len(synchronized_course_runs), 1)
+        self.assertEqual(
+            synchronized_course_runs,
+            product.get_equivalent_serialized_course_runs_for_products(
+                [product, certificate_product], courses=[course]
+            ),
+        )
+
+    def test_utils_catalog_synchronization_course_runs_queries(self, mock_sync):
+        """
+        The number of queries to synchronize course runs should not depend on the
+        number of course runs.
+        """
+        course_runs = factories.CourseRunFactory.create_batch(3)
+        mock_sync.reset_mock()
+
+        with CaptureQueriesContext(connection) as single_course_run_queries:
+            catalog_synchronization.synchronize_catalog(
+                course_run_ids=[course_runs[0].pk]
+            )
+        with CaptureQueriesContext(connection) as course_runs_queries:
+            catalog_synchronization.synchronize_catalog(
+                course_run_ids=[course_run.pk for course_run in course_runs]
+            )
+
+        self.assertEqual(
+            len(course_runs_queries.captured_queries),
+            len(single_course_run_queries.captured_queries),
+        )
+        self.assertEqual(len(mock_sync.call_args[0][0]), 3)
+
+    @override_settings(
+        JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=True,
+        JOANIE_CATALOG_SYNCHRONIZATION_COALESCING_WINDOW=60,
+    )
+    def test_utils_catalog_synchronization_coalescing_window(self, mock_sync):
+        """
+        With a coalescing window, changes committed by several transactions should
+        be synchronized at once at the end of the window.
+        """
+        with override_settings(JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=False):
+            course_runs = factories.CourseRunFactory.create_batch(2)
+        mock_sync.reset_mock()
+
+        with mock.patch.object(
+            catalog_synchronization.synchronize_pending_batches, "apply_async"
+        ) as mock_apply_async:
+            for course_run in course_runs:
+                with self.captureOnCommitCallbacks(execute=True):
+                    course_run.save()
+
+        mock_apply_async.assert_called_once_with(countdown=60)
+        mock_sync.assert_not_called()
+
+        catalog_synchronization.synchronize_pending_batches.run()
+
+        mock_sync.assert_called_once()
+        self.assertCountEqual(
+            mock_sync.call_args[0][0],
+            [course_run.get_serialized() for course_run in course_runs],
+        )
+
+        # Batches are consumed
+        mock_sync.reset_mock()
+        catalog_synchronization.synchronize_pending_batches.run()
+        mock_sync.assert_not_called()
+
+    def test_utils_catalog_synchronization_deduplicate(self, _mock_sync):
+        """Identical payloads should only be kept once."""
+        self.assertEqual(
+            catalog_synchronization.deduplicate(
+                [{"a": 1, "b": 2}, {"b": 2, "a": 1}, {"a": 1, "b": 3}]
+            ),
+            [{"a": 1, "b": 2}, {"a": 1, "b": 3}],
+        )
+
+    @override_settings(
+        JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=True,
+        JOANIE_CATALOG_SYNCHRONIZATION_COALESCING_WINDOW=60,
+    )
+    def test_utils_catalog_synchronization_coalescing_window_failure(self, mock_sync):
+        """
+        Batches should not be consumed if their synchronization fails, so they are
+        synchronized by the next run.
+        """
+        course_run = factories.CourseRunFactory()
+        with mock.patch.object(
+            catalog_synchronization.synchronize_pending_batches, "apply_async"
+        ):
+            catalog_synchronization.defer_synchronization(
+                {
+                    "course_run_ids": [course_run.pk],
+                    "product_ids": [],
+                    "offering_ids": [],
+                    "serialized_course_runs": [],
+                }
+            )
+        mock_sync.reset_mock()
+        mock_sync.side_effect = ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            catalog_synchronization.synchronize_pending_batches.run()
+
+        self.assertIsNone(
+            cache.get(catalog_synchronization.PENDING_BATCHES_FLUSHED_CACHE_KEY)
+        )
+
+        mock_sync.reset_mock()
+        mock_sync.side_effect = None
+        catalog_synchronization.synchronize_pending_batches.run()
+
+        mock_sync.assert_called_once_with([course_run.get_serialized()])
+        self.assertEqual(
+            cache.get(catalog_synchronization.PENDING_BATCHES_FLUSHED_CACHE_KEY), 1
+        )
+
+    @override_settings(
+        JOANIE_CATALOG_SYNCHRONIZATION_DEBOUNCE=True,
+        JOANIE_CATALOG_SYNCHRONIZATION_COALESCING_WINDOW=60,
+    )
+    def test_utils_catalog_synchronization_coalescing_window_missing_batch(
+        self, mock_sync
+    ):
+        """
+        A missing batch should be waited for until the next run, then skipped so it
+        does not stall the synchronization of the following batches.
+        """
+        course_runs = factories.CourseRunFactory.create_batch(2)
+        mock_sync.reset_mock()
+        cache.set(catalog_synchronization.PENDING_BATCHES_COUNTER_CACHE_KEY, 3)
+        for index, course_run in ((1, course_runs[0]), (3, course_runs[1])):
+            cache.set(
+                catalog_synchronization.PENDING_BATCH_CACHE_KEY.format(index=index),
+                {
+                    "course_run_ids": [course_run.pk],
+                    "product_ids": [],
+                    "offering_ids": [],
+                    "serialized_course_runs": [],
+                },
+            )
+
+        with mock.patch.object(
+            catalog_synchronization.synchronize_pending_batches, "apply_async"
+        ) as mock_apply_async:
+            catalog_synchronization.synchronize_pending_batches.run()
+
+        mock_apply_async.assert_called_once_with(countdown=60)
+        mock_sync.assert_called_once_with([course_runs[0].get_serialized()])
+        self.assertEqual(
+            cache.get(catalog_synchronization.PENDING_BATCHES_FLUSHED_CACHE_KEY), 1
+        )
+
+        mock_sync.reset_mock()
+        with (
+            mock.patch.object(
+                catalog_synchronization.synchronize_pending_batches, "apply_async"
+            ) as mock_apply_async,
+            self.assertLogs(catalog_synchronization.logger, "ERROR") as logs,
+        ):
+            catalog_synchronization.synchronize_pending_batches.run()
+
+        mock_apply_async.assert_not_called()
+        mock_sync.assert_called_once_with([course_runs[1].get_serialized()])
+        self.assertEqual(
+            logs.output,
+            [
+                f"ERROR:{catalog_synchronization.__name__}:"
+                "Batch 2 of catalog changes was lost, skipping it"
+            ],
+        )
+        self.assertEqual(
+            cache.get(catalog_synchronization.PENDING_BATCHES_FLUSHED_CACHE_KEY), 3
+        )
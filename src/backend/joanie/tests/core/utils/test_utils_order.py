@@ -1,10 +1,15 @@
 """Test suite for utils order methods"""
 
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 from unittest import mock
+from zoneinfo import ZoneInfo
 
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from stockholm import Money
 
 from joanie.core import enums, factories, models
 from joanie.core.models import CourseState
@@ -13,6 +18,7 @@ from joanie.core.utils.order import (
     delete_stuck_orders,
     delete_stuck_signing_order,
     extract_session_code,
+    generate_payment_schedules,
     get_course_run_session,
     get_prepaid_order,
     verify_voucher,
@@ -298,3 +304,174 @@ class UtilsOrderTestCase(TestCase):
             results.append(extract_session_code(course_run_title))
 
         self.assertEqual(results, expected_output)
+
+    @override_settings(JOANIE_PAYMENT_SCHEDULE_LIMITS={5: (30, 70)})
+    def test_utils_order_generate_payment_schedules(self):
+        """
+        Payment schedules of many orders should be generated as `generate_schedule`
+        does for each order, with a number of queries which does not depend on the
+        number of orders.
+        """
+        mocked_now = datetime(2024, 1, 1, 14, tzinfo=ZoneInfo("UTC"))
+        course_run = factories.CourseRunFactory(
+            start=datetime(2024, 3, 1, 14, tzinfo=ZoneInfo("UTC")),
+            end=datetime(2024, 5, 1, 14, tzinfo=ZoneInfo("UTC")),
+        )
+        product = factories.ProductFactory(
+            price=3,
+            type=enums.PRODUCT_TYPE_CREDENTIAL,
+            target_courses=[course_run.course],
+        )
+        orders = factories.OrderFactory.create_batch(
+            3, product=product, state=enums.ORDER_STATE_PENDING
+        )
+        signed_order = factories.ContractFactory(
+            definition=factories.ContractDefinitionFactory(),
+            student_signed_on=datetime(2024, 2, 20, 14, tzinfo=ZoneInfo("UTC")),
+            submitted_for_signature_on=datetime(
+                2024, 2, 20, 14, tzinfo=ZoneInfo("UTC")
+            ),
+            order__product=product,
+            order__state=enums.ORDER_STATE_PENDING,
+        ).order
+        enrollment = factories.EnrollmentFactory()
+        certificate_order = factories.OrderFactory(
+            product=factories.ProductFactory(
+                price=10,
+                type=enums.PRODUCT_TYPE_CERTIFICATE,
+                courses=[enrollment.course_run.course],
+            ),
+            enrollment=enrollment,
+            course=None,
+            state=enums.ORDER_STATE_PENDING,
+        )
+
+        with mock.patch("django.utils.timezone.now", return_value=mocked_now):
+            with CaptureQueriesContext(connection) as few_orders_queries:
+                generate_payment_schedules(models.Order.objects.filter(pk=orders[0].pk))
+            with CaptureQueriesContext(connection) as many_orders_queries:
+                result = generate_payment_schedules(models.Order.objects.all())
+
+        self.assertEqual(
+            len(many_orders_queries.captured_queries),
+            len(few_orders_queries.captured_queries),
+        )
+        self.assertEqual(result["skipped"], [])
+        self.assertEqual(result["errors"], [])
+        # The first order has already been generated by the first call
+        self.assertEqual(len(result["changes"]), 4)
+
+        for order in orders:
+            order.refresh_from_db()
+            self.assertEqual(
+                [
+                    (installment["due_date"], installment["amount"])
+                    for installment in order.payment_schedule
+                ],
+                [(date(2024, 1, 17), Money("0.90")), (date(2024, 3, 1), Money("2.10"))],
+            )
+        signed_order.refresh_from_db()
+        self.assertEqual(
+            [
+                (installment["due_date"], installment["amount"])
+                for installment in signed_order.payment_schedule
+            ],
+            # The withdrawal period ends after the course start
+            [(date(2024, 2, 20), Money("0.90")), (date(2024, 3, 1), Money("2.10"))],
+        )
+        certificate_order.refresh_from_db()
+        self.assertEqual(
+            [
+                (installment["due_date"], installment["amount"], installment["state"])
+                for installment in certificate_order.payment_schedule
+            ],
+            [(date(2024, 1, 1), Money("10.00"), enums.PAYMENT_STATE_PENDING)],
+        )
+
+    @override_settings(JOANIE_PAYMENT_SCHEDULE_LIMITS={5: (30, 70)})
+    def test_utils_order_generate_payment_schedules_dry_run(self):
+        """
+        In dry run mode, changes of payment schedules should be returned without being
+        saved. Ids of installments should be kept and unchanged payment schedules
+        should not be reported.
+        """
+        course_run = factories.CourseRunFactory(
+            start=datetime(2024, 3, 1, 14, tzinfo=ZoneInfo("UTC")),
+            end=datetime(2024, 5, 1, 14, tzinfo=ZoneInfo("UTC")),
+        )
+        product = factories.ProductFactory(
+            price=3,
+            type=enums.PRODUCT_TYPE_CREDENTIAL,
+            target_courses=[course_run.course],
+        )
+        order, unchanged_order = factories.OrderFactory.create_batch(
+            2, product=product, state=enums.ORDER_STATE_PENDING
+        )
+        with mock.patch(
+            "django.utils.timezone.now",
+            return_value=datetime(2024, 1, 1, 14, tzinfo=ZoneInfo("UTC")),
+        ):
+            order.generate_schedule()
+            unchanged_order.generate_schedule()
+            course_run.start = datetime(2024, 4, 1, 14, tzinfo=ZoneInfo("UTC"))
+            course_run.save()
+            unchanged_order.offerings.get().course_runs.set(
+                [
+                    factories.CourseRunFactory(
+                        start=datetime(2024, 3, 1, 14, tzinfo=ZoneInfo("UTC")),
+                        end=datetime(2024, 5, 1, 14, tzinfo=ZoneInfo("UTC")),
+                    )
+                ]
+            )
+            order.refresh_from_db()
+            previous_payment_schedule = order.payment_schedule
+
+            result = generate_payment_schedules(
+                models.Order.objects.all(), dry_run=True
+            )
+
+        self.assertEqual(list(result["changes"]), [order.id])
+        change = result["changes"][order.id]
+        self.assertEqual(change["previous"], previous_payment_schedule)
+        self.assertEqual(
+            [installment["id"] for installment in change["new"]],
+            [installment["id"] for installment in previous_payment_schedule],
+        )
+        self.assertEqual(
+            [installment["due_date"] for installment in change["new"]],
+            [date(2024, 1, 17), date(2024, 4, 1)],
+        )
+        order.refresh_from_db()
+        self.assertEqual(order.payment_schedule, previous_payment_schedule)
+
+    def test_utils_order_generate_payment_schedules_skipped_and_errors(self):
+        """
+        Free orders and orders with processed installments should be skipped. Orders
+        without course run dates should be reported as errors.
+        """
+        paid_order = factories.OrderGeneratorFactory(
+            state=enums.ORDER_STATE_PENDING_PAYMENT,
+            product__type=enums.PRODUCT_TYPE_CREDENTIAL,
+        )
+        free_order = factories.OrderFactory(
+            product__price=0, state=enums.ORDER_STATE_COMPLETED
+        )
+        archived_course_run = factories.CourseRunFactory(
+            state=CourseState.ARCHIVED_CLOSED
+        )
+        error_order = factories.OrderFactory(
+            product__type=enums.PRODUCT_TYPE_CREDENTIAL,
+            product__target_courses=[archived_course_run.course],
+            state=enums.ORDER_STATE_PENDING,
+        )
+        paid_order.refresh_from_db()
+        paid_payment_schedule = paid_order.payment_schedule
+
+        with self.assertLogs("joanie.core.utils.order", level="ERROR"):
+            result = generate_payment_schedules(models.Order.objects.all())
+
+        self.assertEqual(result["changes"], {})
+        self.assertCountEqual(result["skipped"], [paid_order.id, free_order.id])
+        self.assertEqual(result["errors"], [error_order.id])
+        paid_order.refresh_from_db()
+        self.assertEqual(paid_order.payment_schedule, paid_payment_schedule)
@@ -2,7 +2,7 @@
 
 from django.test import TestCase
 
-from joanie.core import enums, factories
+from joanie.core import enums, factories, models
 from joanie.core.utils.organization import get_least_active_organization
 
 
@@ -88,3 +88,68 @@ class UtilsOrganizationTestCase(TestCase):
                     self.assertEqual(selected_organization, self.organization_1)
                 else:
                     self.assertEqual(selected_organization, self.organization_2)
+
+    def test_utils_organization_get_least_active_organization_order_counts(self):
+        """
+        The number of orders of each organization should be read from the order
+        counts maintained on the offering instead of counting orders.
+        """
+        self.organization_1.courses.add(self.course)
+        models.OfferingOrganizationOrderCount.objects.create(
+            offering=self.offering, organization=self.organization_1, nb_orders=2
+        )
+        models.OfferingOrganizationOrderCount.objects.create(
+            offering=self.offering, organization=self.organization_2, nb_orders=1
+        )
+
+        with self.assertNumQueries(2):
+            selected_organization = get_least_active_organization(
+                self.product, self.course
+            )
+
+        self.assertEqual(selected_organization, self.organization_2)
+
+    def test_utils_organization_order_counts_updated_on_order_transitions(self):
+        """
+        The order count of an organization on an offering should be updated when
+        its orders start or stop using a seat, move to another organization or are
+        deleted.
+        """
+
+        def get_nb_orders(organization):
+            return (
+                models.OfferingOrganizationOrderCount.objects.filter(
+                    offering=self.offering, organization=organization
+                )
+                .values_list("nb_orders", flat=True)
+                .first()
+            )
+
+        order = factories.OrderFactory(
+            product=self.product,
+            course=self.course,
+            organization=self.organization_1,
+            state=enums.ORDER_STATE_DRAFT,
+        )
+        self.assertIsNone(get_nb_orders(self.organization_1))
+
+        order.state = enums.ORDER_STATE_COMPLETED
+        order.save()
+        self.assertEqual(get_nb_orders(self.organization_1), 1)
+        self.assertIsNone(get_nb_orders(self.organization_2))
+
+        order.organization = self.organization_2
+        order.save()
+        self.assertEqual(get_nb_orders(self.organization_1), 0)
+        self.assertEqual(get_nb_orders(self.organization_2), 1)
+
+        order.state = enums.ORDER_STATE_CANCELED
+        order.save()
+        self.assertEqual(get_nb_orders(self.organization_2), 0)
+
+        order.state = enums.ORDER_STATE_PENDING
+        order.save()
+        self.assertEqual(get_nb_orders(self.organization_2), 1)
+
+        order.delete()
+        self.assertEqual(get_nb_orders(self.organization_2), 0)
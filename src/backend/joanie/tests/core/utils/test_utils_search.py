@@ -0,0 +1,63 @@
+"""Test suite for utils search methods"""
+
+from django.db import connection
+from django.test import TestCase
+
+from joanie.core import factories, models
+from joanie.core.utils.search import search
+
+
+class UtilsSearchTestCase(TestCase):
+    """Test suite for utils search methods"""
+
+    def test_utils_search_fields(self):
+        """
+        Instances with one of their search fields containing the value whatever its
+        case should be returned.
+        """
+        user = factories.UserFactory(
+            username="jdoe", first_name="John", last_name="Doe", email="j@example.com"
+        )
+        factories.UserFactory(
+            username="other", first_name="Other", last_name="User", email="o@fun.org"
+        )
+
+        for value in ["JDO", "john", "doe", "EXAMPLE"]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    list(models.User.objects.filter(pk__in=search(models.User, value))),
+                    [user],
+                )
+
+    def test_utils_search_translated_fields(self):
+        """
+        Instances with one of their translations containing the value should be
+        returned once.
+        """
+        course = factories.CourseFactory(code="PY0001", title="Python for beginners")
+        course.translations.create(language_code="fr-fr", title="Python débutant")
+        factories.CourseFactory(code="RS0002", title="Rust")
+
+        self.assertEqual(
+            list(models.Course.objects.filter(pk__in=search(models.Course, "python"))),
+            [course],
+        )
+        self.assertEqual(
+            list(models.Course.objects.filter(pk__in=search(models.Course, "0001"))),
+            [course],
+        )
+
+    def test_utils_search_trigram_indexes(self):
+        """
+        Search fields should be indexed with trigram indexes matching `icontains`
+        lookups.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE indexname = %s",
+                ["user_email_trgm_idx"],
+            )
+            (index_definition,) = cursor.fetchone()
+
+        self.assertIn("gin", index_definition)
+        self.assertIn("upper((email)::text) gin_trgm_ops", index_definition)
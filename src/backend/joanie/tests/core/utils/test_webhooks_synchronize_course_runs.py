@@ -9,6 +9,7 @@ from http import HTTPStatus
 from logging import Logger
 from unittest import mock
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.test.utils import override_settings
 
@@ -323,3 +324,63 @@ class SynchronizeCourseRunsUtilsTestCase(TestCase):
                     "http://richie.education/webhook",
                 ),
             )
+
+    def test_utils_synchronize_course_runs_only_changed(self):
+        """
+        With `only_changed`, course runs which did not change since their last
+        successful synchronization with a webhook should not be sent again to it.
+        """
+        cache.clear()
+        course_run_1 = self._get_serialized_course_run(1)
+        course_run_2 = self._get_serialized_course_run(2)
+
+        with (
+            override_settings(
+                COURSE_WEB_HOOKS=[
+                    {"url": "http://richie.education/webhook1", "secret": "abc"},
+                    {"url": "http://richie.education/webhook2", "secret": "abc"},
+                ]
+            ),
+            responses.RequestsMock(assert_all_requests_are_fired=False) as rsps,
+        ):
+            rsps.post("http://richie.education/webhook1", status=HTTPStatus.OK)
+            rsps.post(
+                "http://richie.education/webhook2",
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+            # First synchronization, everything is sent
+            webhooks.synchronize_course_runs(
+                [course_run_1, course_run_2], only_changed=True
+            )
+            self.assertEqual(len(rsps.calls), 2)
+
+            # Nothing changed, only the webhook which failed is called again
+            webhooks.synchronize_course_runs(
+                [course_run_1, course_run_2], only_changed=True
+            )
+            self.assertEqual(len(rsps.calls), 3)
+            self.assertEqual(
+                rsps.calls[2].request.url, "http://richie.education/webhook2"
+            )
+            self.assertCountEqual(
+                json.loads(rsps.calls[2].request.body), [course_run_1, course_run_2]
+            )
+
+            # Only the course run which changed is sent
+            course_run_2 = {**course_run_2, "catalog_visibility": "hidden"}
+            webhooks.synchronize_course_runs(
+                [course_run_1, course_run_2], only_changed=True
+            )
+            self.assertEqual(len(rsps.calls), 5)
+            self.assertEqual(
+                rsps.calls[3].request.url, "http://richie.education/webhook1"
+            )
+            self.assertEqual(json.loads(rsps.calls[3].request.body), [course_run_2])
+
+            # Without `only_changed`, everything is sent
+            webhooks.synchronize_course_runs([course_run_1, course_run_2])
+            self.assertEqual(len(rsps.calls), 7)
+            self.assertCountEqual(
+                json.loads(rsps.calls[5].request.body), [course_run_1, course_run_2]
+            )
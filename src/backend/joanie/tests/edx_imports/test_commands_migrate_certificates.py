@@ -53,7 +53,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         factories.CertificateDefinitionFactory.create(template=DEGREE)
         factories.CertificateDefinitionFactory.create(template=CERTIFICATE)
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @patch("joanie.core.models.Enrollment.set")
@@ -63,7 +63,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         _,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are created from the edx certificates.
@@ -105,10 +105,10 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
 
         mock_get_certificates.return_value = edx_certificates
         mock_get_certificates_count.return_value = len(edx_certificates)
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates
-        ]
+        }
 
         with self.assertLogs() as logger:
             call_command("migrate_edx", "--skip-check", "--certificates")
@@ -122,7 +122,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         ]
         self.assertLogsContains(logger, expected)
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @patch("joanie.core.models.Enrollment.set")
@@ -131,7 +131,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         _,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are updated from the edx certificates.
@@ -169,10 +169,10 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
 
         mock_get_certificates.return_value = edx_certificates
         mock_get_certificates_count.return_value = len(edx_certificates)
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates
-        ]
+        }
 
         with self.assertLogs() as logger:
             call_command("migrate_edx", "--skip-check", "--certificates")
@@ -186,7 +186,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         ]
         self.assertLogsContains(logger, expected)
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @patch("joanie.core.models.Enrollment.set")
@@ -196,7 +196,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         _,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are not created from the edx certificates if the enrollment
@@ -249,10 +249,10 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
 
         mock_get_certificates.return_value = edx_certificates
         mock_get_certificates_count.return_value = len(edx_certificates)
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates_with_joanie_enrollments
-        ]
+        }
 
         with self.assertLogs() as logger:
             call_command("migrate_edx", "--skip-check", "--certificates")
@@ -269,7 +269,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         ]
         self.assertLogsContains(logger, expected)
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @patch("joanie.core.models.Enrollment.set")
@@ -279,7 +279,7 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         _,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are created from the edx certificates.
@@ -329,10 +329,10 @@ class MigrateOpenEdxCertificatesTestCase(MigrateOpenEdxBaseTestCase):
         mock_get_certificates.side_effect = get_edx_certificates
         mock_get_certificates_count.return_value = 10
 
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates
-        ]
+        }
 
         with self.assertLogs() as logger:
             call_command(
@@ -10,6 +10,11 @@ from joanie.edx_imports import edx_mongodb
 class TestGetEnrollment(TestCase):
     """Tests for the edx_mongodb module."""
 
+    def setUp(self):
+        """Reset the Open edX mongodb client shared by the process."""
+        super().setUp()
+        edx_mongodb.get_client.cache_clear()
+
     @patch("joanie.edx_imports.edx_mongodb.MongoClient")
     def test_edx_mongodb_get_signatory_from_course_id(self, mock_mongo_client):
         """Test the get_signatory_from_course_id method."""
@@ -107,3 +112,95 @@ class TestGetEnrollment(TestCase):
         result = edx_mongodb.get_signatory_from_course_id(course_id)
 
         self.assertEqual(result, None)
+
+    @patch("joanie.edx_imports.edx_mongodb.MongoClient")
+    def test_edx_mongodb_get_signatory_from_course_id_shared_client(
+        self, mock_mongo_client
+    ):
+        """The mongodb client should be instantiated once per process."""
+        mock_mongo_client.return_value.edxapp.modulestore.active_versions.find_one.return_value = None  # pylint: disable=line-too-long
+
+        edx_mongodb.get_signatory_from_course_id("course-v1:fun+101+run01")
+        edx_mongodb.get_signatory_from_course_id("course-v1:fun+102+run01")
+
+        mock_mongo_client.assert_called_once()
+
+    @patch("joanie.edx_imports.edx_mongodb.MongoClient")
+    def test_edx_mongodb_get_signatories_from_course_ids(self, mock_mongo_client):
+        """
+        The get_signatories_from_course_ids method should resolve signatories of all
+        the courses with one query on active versions and one on structures.
+        """
+        modulestore = mock_mongo_client.return_value.edxapp.modulestore
+        modulestore.active_versions.find.return_value = [
+            {
+                "org": "fun",
+                "course": "101",
+                "run": "run01",
+                "versions": {"published-branch": "branch_101"},
+            },
+            {
+                "org": "fun",
+                "course": "102",
+                "run": "run01",
+                "versions": {"published-branch": "branch_102"},
+            },
+        ]
+        modulestore.structures.find.return_value = [
+            {
+                "_id": "branch_101",
+                "blocks": [
+                    {
+                        "block_type": "course",
+                        "fields": {
+                            "certificates": {
+                                "certificates": [{"signatories": ["signatory_101"]}]
+                            }
+                        },
+                    }
+                ],
+            },
+            {"_id": "branch_102", "blocks": []},
+        ]
+
+        result = edx_mongodb.get_signatories_from_course_ids(
+            [
+                "course-v1:fun+101+run01",
+                "fun/102/run01",
+                "course-v1:fun+103+run01",
+                "invalid",
+            ]
+        )
+
+        self.assertEqual(
+            result,
+            {
+                "course-v1:fun+101+run01": "signatory_101",
+                "fun/102/run01": None,
+                "course-v1:fun+103+run01": None,
+                "invalid": None,
+            },
+        )
+        modulestore.active_versions.find.assert_called_once()
+        self.assertEqual(
+            modulestore.active_versions.find.call_args.args[0],
+            {
+                "$or": [
+                    {"org": "fun", "course": "101", "run": "run01"},
+                    {"org": "fun", "course": "102", "run": "run01"},
+                    {"org": "fun", "course": "103", "run": "run01"},
+                ]
+            },
+        )
+        modulestore.structures.find.assert_called_once()
+        self.assertEqual(
+            modulestore.structures.find.call_args.args[0],
+            {"_id": {"$in": ["branch_101", "branch_102"]}},
+        )
+
+    @patch("joanie.edx_imports.edx_mongodb.MongoClient")
+    def test_edx_mongodb_get_signatories_from_course_ids_empty(self, mock_mongo_client):
+        """No query should be made when there is no course to resolve."""
+        self.assertEqual(edx_mongodb.get_signatories_from_course_ids([]), {})
+
+        mock_mongo_client.assert_not_called()
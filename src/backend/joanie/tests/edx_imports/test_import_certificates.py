@@ -2,6 +2,7 @@
 
 # pylint: disable=unexpected-keyword-arg,no-value-for-parameter,too-many-locals
 import os
+import uuid
 from os.path import dirname, join, realpath
 from unittest.mock import patch
 
@@ -10,6 +11,7 @@ from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.test import TestCase, override_settings
 
+import requests
 import responses
 from hashids import Hashids
 
@@ -63,7 +65,7 @@ class EdxImportCertificatesTestCase(TestCase):
         """Tear down the test case."""
         edx_factories.session.rollback()
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @responses.activate(assert_all_requests_are_fired=True)
@@ -71,7 +73,7 @@ class EdxImportCertificatesTestCase(TestCase):
         self,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are created from the edx certificates.
@@ -114,10 +116,10 @@ class EdxImportCertificatesTestCase(TestCase):
 
         mock_get_certificates.return_value = edx_certificates
         mock_get_certificates_count.return_value = len(edx_certificates)
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates
-        ]
+        }
 
         import_certificates()
 
@@ -211,14 +213,14 @@ class EdxImportCertificatesTestCase(TestCase):
 
             self.assertEqual(certificate.images.count(), 2 if has_signatory else 1)
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     def test_import_certificates_update(
         self,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are updated from the edx certificates.
@@ -259,10 +261,10 @@ class EdxImportCertificatesTestCase(TestCase):
 
         mock_get_certificates.return_value = edx_certificates
         mock_get_certificates_count.return_value = len(edx_certificates)
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates
-        ]
+        }
 
         import_certificates()
 
@@ -288,7 +290,7 @@ class EdxImportCertificatesTestCase(TestCase):
                 certificate.issued_on, make_date_aware(edx_certificate.created_date)
             )
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @responses.activate(assert_all_requests_are_fired=True)
@@ -296,7 +298,7 @@ class EdxImportCertificatesTestCase(TestCase):
         self,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are not created from the edx certificates if the enrollment
@@ -346,10 +348,10 @@ class EdxImportCertificatesTestCase(TestCase):
 
         mock_get_certificates.return_value = edx_certificates
         mock_get_certificates_count.return_value = len(edx_certificates)
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates_with_joanie_enrollments
-        ]
+        }
 
         import_certificates()
 
@@ -367,7 +369,7 @@ class EdxImportCertificatesTestCase(TestCase):
                 ).exists()
             )
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @responses.activate(assert_all_requests_are_fired=True)
@@ -375,7 +377,7 @@ class EdxImportCertificatesTestCase(TestCase):
         self,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that certificates are created from the edx certificates with missing signatory.
@@ -423,10 +425,10 @@ class EdxImportCertificatesTestCase(TestCase):
 
         mock_get_certificates.return_value = edx_certificates
         mock_get_certificates_count.return_value = len(edx_certificates)
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
             for edx_certificate in edx_certificates
-        ]
+        }
 
         import_certificates()
 
@@ -515,7 +517,7 @@ class EdxImportCertificatesTestCase(TestCase):
                 },
             )
 
-    @patch("joanie.edx_imports.edx_mongodb.get_signatory_from_course_id")
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
     @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
     @responses.activate(assert_all_requests_are_fired=True)
@@ -523,7 +525,7 @@ class EdxImportCertificatesTestCase(TestCase):
         self,
         mock_get_certificates,
         mock_get_certificates_count,
-        mock_get_signatory_from_course_id,
+        mock_get_signatories_from_course_ids,
     ):
         """
         Test that signatures are not stored if the signature is not found.
@@ -562,9 +564,9 @@ class EdxImportCertificatesTestCase(TestCase):
 
         mock_get_certificates.return_value = [edx_certificate]
         mock_get_certificates_count.return_value = 1
-        mock_get_signatory_from_course_id.side_effect = [
-            mongo_enrollments[edx_certificate.id]
-        ]
+        mock_get_signatories_from_course_ids.return_value = {
+            edx_certificate.course_id: mongo_enrollments[edx_certificate.id]
+        }
 
         import_certificates()
 
@@ -648,3 +650,159 @@ class EdxImportCertificatesTestCase(TestCase):
                 )[1:]
             )
         )
+
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
+    @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
+    @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_import_certificates_shared_signature_image(
+        self,
+        mock_get_certificates,
+        mock_get_certificates_count,
+        mock_get_signatories_from_course_ids,
+    ):
+        """
+        A signature image shared by the signatories of several courses should be
+        downloaded and stored only once per batch.
+        """
+        edx_certificates = edx_factories.EdxGeneratedCertificateFactory.create_batch(
+            3, mode=OPENEDX_MODE_VERIFIED
+        )
+        signature_image_path = f"/{uuid.uuid4()}/{SIGNATURE_NAME}"
+        signatories = {}
+        for edx_certificate in edx_certificates:
+            course = factories.CourseFactory.create(
+                code=extract_course_number(edx_certificate.course_id),
+                organizations=[
+                    factories.OrganizationFactory.create(
+                        logo=None,
+                        code=extract_organization_code(edx_certificate.course_id),
+                    )
+                ],
+            )
+            factories.EnrollmentFactory.create(
+                user__username=edx_certificate.user.username,
+                course_run=factories.CourseRunFactory.create(
+                    course=course,
+                    state=models.CourseState.ONGOING_OPEN,
+                    resource_link=(
+                        "http://openedx.test/courses/"
+                        f"{edx_certificate.course_id}/course/"
+                    ),
+                    is_listed=True,
+                ),
+                was_created_by_order=False,
+            )
+            signatories[edx_certificate.course_id] = (
+                edx_factories.EdxMongoSignatoryFactory(
+                    signature_image_path=signature_image_path
+                )
+            )
+
+        responses.add(
+            responses.GET,
+            f"https://{settings.EDX_DOMAIN}{signature_image_path}",
+            body=SIGNATURE_CONTENT,
+        )
+        mock_get_certificates.return_value = edx_certificates
+        mock_get_certificates_count.return_value = len(edx_certificates)
+        mock_get_signatories_from_course_ids.return_value = signatories
+
+        import_certificates()
+
+        self.assertEqual(len(responses.calls), 1)
+        signature = DocumentImage.objects.get(checksum=SIGNATURE_CHECKSUM)
+        self.assertEqual(models.Certificate.objects.count(), 3)
+        for certificate in models.Certificate.objects.all():
+            self.assertEqual(
+                certificate.localized_context["signatory"]["signature_id"],
+                str(signature.id),
+            )
+            self.assertTrue(certificate.images.filter(pk=signature.pk).exists())
+
+    @patch("joanie.edx_imports.edx_mongodb.get_signatories_from_course_ids")
+    @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates_count")
+    @patch("joanie.edx_imports.edx_database.OpenEdxDB.get_certificates")
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_import_certificates_signature_image_failing_download(
+        self,
+        mock_get_certificates,
+        mock_get_certificates_count,
+        mock_get_signatories_from_course_ids,
+    ):
+        """
+        A signature image failing to be downloaded should only prevent the
+        certificates using it from being created, not the whole batch.
+        """
+        edx_certificates = edx_factories.EdxGeneratedCertificateFactory.create_batch(
+            2, mode=OPENEDX_MODE_VERIFIED
+        )
+        signatories = {}
+        for edx_certificate in edx_certificates:
+            course = factories.CourseFactory.create(
+                code=extract_course_number(edx_certificate.course_id),
+                organizations=[
+                    factories.OrganizationFactory.create(
+                        logo=None,
+                        code=extract_organization_code(edx_certificate.course_id),
+                    )
+                ],
+            )
+            factories.EnrollmentFactory.create(
+                user__username=edx_certificate.user.username,
+                course_run=factories.CourseRunFactory.create(
+                    course=course,
+                    state=models.CourseState.ONGOING_OPEN,
+                    resource_link=(
+                        "http://openedx.test/courses/"
+                        f"{edx_certificate.course_id}/course/"
+                    ),
+                    is_listed=True,
+                ),
+                was_created_by_order=False,
+            )
+            signatories[edx_certificate.course_id] = (
+                edx_factories.EdxMongoSignatoryFactory(
+                    signature_image_path=f"/{uuid.uuid4()}/{SIGNATURE_NAME}"
+                )
+            )
+
+        failing_certificate, succeeding_certificate = edx_certificates
+        responses.add(
+            responses.GET,
+            f"https://{settings.EDX_DOMAIN}"
+            f"{signatories[failing_certificate.course_id]['signature_image_path']}",
+            body=requests.exceptions.ConnectionError("Connection refused"),
+        )
+        responses.add(
+            responses.GET,
+            f"https://{settings.EDX_DOMAIN}"
+            f"{signatories[succeeding_certificate.course_id]['signature_image_path']}",
+            body=SIGNATURE_CONTENT,
+        )
+        mock_get_certificates.return_value = edx_certificates
+        mock_get_certificates_count.return_value = len(edx_certificates)
+        mock_get_signatories_from_course_ids.return_value = signatories
+
+        with self.assertLogs("joanie.edx_imports") as logs:
+            import_certificates()
+
+        self.assertIn(
+            "Error creating Certificate: signature image "
+            f"{signatories[failing_certificate.course_id]['signature_image_path']} "
+            "failed to be stored",
+            "\n".join(logs.output),
+        )
+        self.assertIn(
+            "1 certificates created, 0 skipped, 1 errors", "\n".join(logs.output)
+        )
+        certificate = models.Certificate.objects.get()
+        self.assertEqual(
+            certificate.enrollment.user.username,
+            succeeding_certificate.user.username,
+        )
+        signature = DocumentImage.objects.get(checksum=SIGNATURE_CHECKSUM)
+        self.assertEqual(
+            certificate.localized_context["signatory"]["signature_id"],
+            str(signature.id),
+        )
@@ -0,0 +1,315 @@
+"""
+Tests for the CourseRun bulk web hook.
+"""
+
+from http import HTTPStatus
+from unittest import mock
+
+from django.test import override_settings
+
+from joanie.core.factories import CourseFactory, CourseRunFactory
+from joanie.core.models import Course, CourseRun
+from joanie.core.utils import webhooks
+from joanie.lms_handler.serializers import SyncCourseRunSerializer
+from joanie.tests.base import BaseAPITestCase
+
+
+@override_settings(
+    JOANIE_COURSE_RUN_SYNC_SECRETS=["shared secret"],
+    JOANIE_LMS_BACKENDS=[
+        {
+            "BASE_URL": "http://localhost:8073",
+            "BACKEND": "joanie.lms_handler.backends.openedx.OpenEdXLMSBackend",
+            "COURSE_REGEX": r"^.*/courses/(?P<course_id>.*)/course/?$",
+            "JS_BACKEND": "base",
+            "JS_COURSE_REGEX": r"^.*/courses/(?<course_id>.*)/course/?$",
+        }
+    ],
+    TIME_ZONE="UTC",
+)
+class SyncCourseRunBulkApiTestCase(BaseAPITestCase):
+    """Test calls to sync many course runs at once via API endpoint."""
+
+    def test_api_course_run_sync_bulk_missing_signature(self):
+        """The course runs bulk synchronization API endpoint requires a signature."""
+        data = [
+            {
+                "resource_link": (
+                    "http://example.edx:8073/courses/course-v1:edX+DemoX+01/course/"
+                ),
+                "languages": ["en", "fr"],
+            }
+        ]
+
+        response = self.client.post(
+            "/api/v1.0/course-runs-sync/bulk", data, content_type="application/json"
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.FORBIDDEN)
+        self.assertEqual(response.json(), {"detail": "Missing authentication."})
+        self.assertEqual(CourseRun.objects.count(), 0)
+        self.assertEqual(Course.objects.count(), 0)
+
+    def test_api_course_run_sync_bulk_not_a_list(self):
+        """
+        If the data submitted is not a list of course runs, it should return a 400 error.
+        """
+        data = {
+            "resource_link": (
+                "http://example.edx:8073/courses/course-v1:edX+DemoX+01/course/"
+            ),
+            "languages": ["en", "fr"],
+        }
+
+        response = self.client.post(
+            "/api/v1.0/course-runs-sync/bulk",
+            data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=(
+                "SIG-HMAC-SHA256 0562e446598fe2950eb91267426a37718e6408cb1f6b515df9ce575f97bcb599"
+            ),
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {"non_field_errors": ["Expected a list of course runs."]}
+        )
+        self.assertEqual(CourseRun.objects.count(), 0)
+
+    @mock.patch.object(webhooks, "synchronize_course_runs")
+    def test_api_course_run_sync_bulk(self, mock_sync):
+        """
+        Course runs should be created or updated according to their resource link,
+        invalid course runs being reported without preventing the others from being
+        synchronized, and the catalog should be synchronized once for all of them.
+        """
+        link = "http://example.edx:8073/courses/course-v1:edX+DemoX+01/course/"
+        new_link = "http://example.edx:8073/courses/course-v1:edX+DemoX+02/course/"
+        new_course_link = (
+            "http://example.edx:8073/courses/course-v1:edX+DemoY+01/course/"
+        )
+        course = CourseFactory(code="DemoX")
+        course_run = CourseRunFactory(course=course, resource_link=link)
+        origin_data = SyncCourseRunSerializer(instance=course_run).data
+        data = [
+            {"resource_link": link, "end": "2021-03-14T09:31:59.417895Z"},
+            {
+                "resource_link": new_link,
+                "start": "2020-12-09T09:31:59.417817Z",
+                "languages": ["fr"],
+            },
+            {
+                "resource_link": new_course_link,
+                "languages": ["en"],
+                "title": "Demo Y",
+            },
+            {
+                "resource_link": (
+                    "http://example.edx:8073/courses/course-v1:edX+DemoX+03/course/"
+                ),
+                "start": 1,
+                "languages": ["en"],
+            },
+            {"languages": ["en"]},
+            {"resource_link": new_link, "languages": ["en"]},
+        ]
+
+        signature = "e7c78f1ca67ebde3b812fd3206ec585fd8699195e33e0dd6075dacbb9855e891"
+        # Ignore the synchronization of the course run created above
+        mock_sync.reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1.0/course-runs-sync/bulk",
+                data,
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"SIG-HMAC-SHA256 {signature}",
+            )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {"success": True},
+                {"success": True},
+                {"success": True},
+                {
+                    "success": False,
+                    "errors": {
+                        "start": [
+                            (
+                                "Datetime has wrong format. Use one of these formats "
+                                "instead: YYYY-MM-DDThh:mm[:ss[.uuuuuu]][+HH:MM|-HH:MM|Z]."
+                            )
+                        ]
+                    },
+                },
+                {
+                    "success": False,
+                    "errors": {"resource_link": ["This field is required."]},
+                },
+                {
+                    "success": False,
+                    "errors": {
+                        "resource_link": [
+                            "A single item is expected for each resource link."
+                        ]
+                    },
+                },
+            ],
+        )
+        self.assertEqual(CourseRun.objects.count(), 3)
+
+        # The existing course run has been partially updated
+        course_run.refresh_from_db()
+        serialized_course_run = SyncCourseRunSerializer(instance=course_run).data
+        self.assertEqual(serialized_course_run["end"], data[0]["end"])
+        for field in serialized_course_run:
+            if field != "end":
+                self.assertEqual(serialized_course_run[field], origin_data[field])
+
+        # A new course run has been created in the existing course
+        new_course_run = CourseRun.objects.get(resource_link=new_link)
+        self.assertEqual(new_course_run.course, course)
+        self.assertEqual(
+            new_course_run.start.isoformat(), "2020-12-09T09:31:59.417817+00:00"
+        )
+        self.assertEqual(new_course_run.languages, ["fr"])
+
+        # A new course run has been created in a new course
+        new_course = Course.objects.get(code="DEMOY")
+        self.assertEqual(new_course.title, "Demo Y")
+        self.assertTrue(
+            CourseRun.objects.filter(
+                course=new_course, resource_link=new_course_link
+            ).exists()
+        )
+
+        # Created and updated course runs are synchronized all together with their
+        # Joanie uri
+        mock_sync.assert_called_once()
+        self.assertCountEqual(
+            [
+                serialized_course_run["resource_link"]
+                for serialized_course_run in mock_sync.call_args[0][0]
+            ],
+            [
+                course_run.uri,
+                new_course_run.uri,
+                CourseRun.objects.get(resource_link=new_course_link).uri,
+            ],
+        )
+
+    def test_api_course_run_sync_bulk_colliding_resource_links(self):
+        """
+        New course runs with resource links colliding once normalized should be
+        rejected without creating their course.
+        """
+        data = [
+            {
+                "resource_link": (
+                    "http://example.edx:8073/courses/course-v1:edX+DemoZ+01/course/"
+                ),
+                "languages": ["en"],
+            },
+            {
+                "resource_link": (
+                    "HTTP://EXAMPLE.edx:8073/courses/course-v1:edX+DemoZ+01/course/"
+                ),
+                "languages": ["en"],
+            },
+            {
+                "resource_link": (
+                    "http://example.edx:8073/courses/course-v1:edX+DemoY+01/course/"
+                ),
+                "languages": ["en"],
+            },
+        ]
+        signature = "219e9c2cedbb2fb0a991752ce7a06bbb96f835cdd2d49bf2e3c1404215f59721"
+
+        response = self.client.post(
+            "/api/v1.0/course-runs-sync/bulk",
+            data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"SIG-HMAC-SHA256 {signature}",
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        error = {
+            "success": False,
+            "errors": {
+                "resource_link": ["Course run with this resource link already exists."]
+            },
+        }
+        self.assertEqual(response.json(), [error, error, {"success": True}])
+        self.assertEqual(
+            list(CourseRun.objects.values_list("resource_link", flat=True)),
+            [data[2]["resource_link"]],
+        )
+        self.assertEqual(list(Course.objects.values_list("code", flat=True)), ["DEMOY"])
+
+    @override_settings(
+        JOANIE_LMS_BACKENDS=[
+            {
+                "BASE_URL": "http://localhost:8073",
+                "BACKEND": "joanie.lms_handler.backends.openedx.OpenEdXLMSBackend",
+                "COURSE_RUN_SYNC_NO_UPDATE_FIELDS": ["languages", "start"],
+                "COURSE_REGEX": r"^.*/courses/(?P<course_id>.*)/course/?$",
+                "JS_BACKEND": "base",
+                "JS_COURSE_REGEX": r"^.*/courses/(?<course_id>.*)/course/?$",
+            }
+        ],
+    )
+    def test_api_course_run_sync_bulk_with_no_update_fields(self):
+        """
+        If course runs exist and LMS Backend has course run protected fields,
+        these fields should not be updated.
+        """
+        links = [
+            f"http://example.edx:8073/courses/course-v1:edX+DemoX+0{index}/course/"
+            for index in range(1, 3)
+        ]
+        course = CourseFactory(code="DemoX")
+        course_runs = [
+            CourseRunFactory(course=course, resource_link=link) for link in links
+        ]
+        origin_data = [
+            SyncCourseRunSerializer(instance=course_run).data
+            for course_run in course_runs
+        ]
+        data = [
+            {
+                "resource_link": link,
+                "start": "2020-12-09T09:31:59.417817Z",
+                "end": "2021-03-14T09:31:59.417895Z",
+                "enrollment_start": "2020-11-09T09:31:59.417936Z",
+                "enrollment_end": "2020-12-24T09:31:59.417972Z",
+                "languages": ["en", "fr"],
+            }
+            for link in links
+        ]
+
+        response = self.client.post(
+            "/api/v1.0/course-runs-sync/bulk",
+            data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=(
+                "SIG-HMAC-SHA256 94dcb236e3b6c9d55377f1011bddada65ec1c1ccf8d65e8e3b031feabe1801f9"
+            ),
+        )
+
+        self.assertStatusCodeEqual(response, HTTPStatus.OK)
+        self.assertEqual(response.json(), [{"success": True}, {"success": True}])
+        self.assertEqual(CourseRun.objects.count(), 2)
+
+        # Course runs were updated except protected fields
+        for course_run, item, origin_item in zip(
+            course_runs, data, origin_data, strict=True
+        ):
+            course_run.refresh_from_db()
+            serializer = SyncCourseRunSerializer(instance=course_run)
+            for field in serializer.fields:
+                if field in ["languages", "start"]:
+                    self.assertEqual(serializer.data[field], origin_item[field])
+                else:
+                    self.assertEqual(serializer.data[field], item[field])
@@ -968,6 +968,124 @@ class LyraBackendTestCase(BasePaymentTestCase, LoggingTestCase):
         email_content = " ".join(mail.outbox[0].body.split())
         self.assertIn("Product 1", email_content)
 
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_payment_backend_lyra_create_zero_click_payment_idempotency_key(self):
+        """
+        When an idempotency key is given, the backend should check the installment has
+        not already been paid then record the key in the metadata of the payment.
+        """
+        backend = LyraBackend(self.configuration)
+        owner = UserFactory(email="john.doe@acme.org", language="en-us")
+        order = OrderGeneratorFactory(state=ORDER_STATE_PENDING, owner=owner)
+        installment = order.payment_schedule[0]
+        installment["id"] = "d9356dd7-19a6-4695-b18e-ad93af41424a"
+        order.save()
+        credit_card = order.credit_card
+
+        with self.open("lyra/responses/is_already_paid.json") as file:
+            order_json_response = json.loads(file.read())
+        order_json_response["answer"]["transactions"] = []
+        responses.add(
+            responses.POST,
+            "https://api.lyra.com/api-payment/V4/Order/Get",
+            match=[responses.matchers.json_params_matcher({"orderId": str(order.id)})],
+            status=200,
+            json=order_json_response,
+        )
+
+        with self.open("lyra/responses/create_zero_click_payment.json") as file:
+            json_response = json.loads(file.read())
+        json_response["answer"]["orderDetails"]["orderTotalAmount"] = int(
+            installment["amount"].sub_units
+        )
+        responses.add(
+            responses.POST,
+            "https://api.lyra.com/api-payment/V4/Charge/CreatePayment",
+            match=[
+                responses.matchers.json_params_matcher(
+                    {
+                        "metadata": {
+                            "installment_id": installment["id"],
+                            "idempotency_key": "order:debit_installment:installment",
+                        },
+                    },
+                    strict_match=False,
+                )
+            ],
+            status=200,
+            json=json_response,
+        )
+
+        self.assertTrue(
+            backend.create_zero_click_payment(
+                order,
+                installment,
+                credit_card.token,
+                idempotency_key="order:debit_installment:installment",
+            )
+        )
+
+        order.refresh_from_db()
+        self.assertEqual(order.payment_schedule[0]["state"], PAYMENT_STATE_PAID)
+
+    @responses.activate(assert_all_requests_are_fired=True)
+    def test_payment_backend_lyra_create_zero_click_payment_idempotency_key_paid(
+        self,
+    ):
+        """
+        When an idempotency key is given and the installment has already been paid,
+        e.g. by a request the response of which has been lost, the backend should not
+        charge it again.
+        """
+        backend = LyraBackend(self.configuration)
+        owner = UserFactory(email="john.doe@acme.org")
+        UserAddressFactory(owner=owner)
+        order = OrderFactory(
+            id="2f3f527a-9f47-4a45-94d5-ad3ef0dbd437",
+            state=ORDER_STATE_PENDING,
+            owner=owner,
+            main_invoice=InvoiceFactory(),
+            credit_card=CreditCardFactory(),
+            payment_schedule=[
+                {
+                    "id": "d9356dd7-19a6-4695-b18e-ad93af41424a",
+                    "amount": "200.00",
+                    "due_date": "2024-01-17",
+                    "state": PAYMENT_STATE_PAID,
+                },
+                {
+                    "id": "fa17d7b8-3b86-4755-ac78-bc039018d696",
+                    "amount": "120.00",
+                    "due_date": "2024-02-17",
+                    "state": PAYMENT_STATE_PENDING,
+                },
+            ],
+        )
+
+        with self.open("lyra/responses/is_already_paid.json") as file:
+            json_response = json.loads(file.read())
+        responses.add(
+            responses.POST,
+            "https://api.lyra.com/api-payment/V4/Order/Get",
+            match=[responses.matchers.json_params_matcher({"orderId": str(order.id)})],
+            status=200,
+            json=json_response,
+        )
+
+        self.assertTrue(
+            backend.create_zero_click_payment(
+                order,
+                order.payment_schedule[1],
+                order.credit_card.token,
+                idempotency_key="order:debit_installment:installment",
+            )
+        )
+
+        # No payment has been created, the installment is marked as paid
+        order.refresh_from_db()
+        self.assertEqual(order.payment_schedule[1]["state"], PAYMENT_STATE_PAID)
+        self.assertEqual(order.state, ORDER_STATE_COMPLETED)
+
     @responses.activate(assert_all_requests_are_fired=True)
     def test_payment_backend_lyra_delete_credit_card(self):
         """
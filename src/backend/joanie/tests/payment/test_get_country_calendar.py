@@ -1,5 +1,7 @@
 """get_country_calendar() test suite"""
 
+from unittest import mock
+
 from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
 from django.test.utils import override_settings
@@ -63,3 +65,22 @@ class GetCountryCalendarTestSuite(TestCase):
 
         self.assertIsInstance(calendar, France)
         self.assertEqual(calendar.name, "France")
+
+    @override_settings(
+        JOANIE_CALENDAR="workalendar.europe.France",
+    )
+    def test_get_country_calendar_memoized(self):
+        """
+        The calendar should be instantiated once per process so the holidays it
+        computes for each year are kept in memory.
+        """
+        calendar = get_country_calendar()
+        calendar.holidays(2025)
+
+        with mock.patch.object(
+            France, "get_calendar_holidays"
+        ) as mock_get_calendar_holidays:
+            self.assertIs(get_country_calendar(), calendar)
+            get_country_calendar().holidays(2025)
+
+        mock_get_calendar_holidays.assert_not_called()
@@ -2,13 +2,16 @@
 
 import re
 from decimal import Decimal as D
+from unittest import mock
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.files.storage import storages
 from django.db import IntegrityError
 from django.db.models import ProtectedError
 
 from joanie.core.factories import OrderFactory, ProductFactory
+from joanie.core.utils import issuers
 from joanie.payment.factories import InvoiceFactory, TransactionFactory
 from joanie.payment.models import Invoice
 from joanie.tests.base import BaseAPITestCase
@@ -284,3 +287,36 @@ class InvoiceModelTestCase(BaseAPITestCase):
         self.assertEqual(
             context["order"]["product"]["description"], "Product 1 description"
         )
+
+    def test_models_invoice_get_document(self):
+        """
+        The invoice document should be rendered once then served from the invoices
+        storage until the invoice document context changes, the previous document
+        being deleted then.
+        """
+        invoice = InvoiceFactory()
+        storage = storages["invoices"]
+
+        with mock.patch.object(
+            issuers, "generate_document", side_effect=[b"invoice", b"updated invoice"]
+        ) as mock_generate_document:
+            with invoice.get_document() as document:
+                self.assertEqual(document.read(), b"invoice")
+            with invoice.get_document() as document:
+                self.assertEqual(document.read(), b"invoice")
+
+            # Saving the invoice only changes its issue date
+            invoice.save()
+            with invoice.get_document() as document:
+                self.assertEqual(document.read(), b"invoice")
+
+            mock_generate_document.assert_called_once()
+
+            invoice.recipient_address.first_name = "Updated"
+            invoice.recipient_address.save()
+            invoice.refresh_from_db()
+            with invoice.get_document() as document:
+                self.assertEqual(document.read(), b"updated invoice")
+
+        self.assertEqual(mock_generate_document.call_count, 2)
+        self.assertEqual(len(storage.listdir(invoice.reference)[1]), 1)
@@ -0,0 +1,74 @@
+"""Test suite for the working days calendar service."""
+
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from workalendar.europe import France
+
+from joanie.payment import get_country_calendar, get_working_days_calendar
+from joanie.payment.working_days import WorkingDaysCalendar
+
+
+class WorkingDaysCalendarTestCase(TestCase):
+    """Test suite for the WorkingDaysCalendar class."""
+
+    def test_working_days_calendar_same_as_workalendar(self):
+        """
+        Working day queries should be answered as the workalendar calendar does,
+        including across years.
+        """
+        calendar = France()
+        working_days_calendar = WorkingDaysCalendar(calendar)
+
+        for offset in range(0, 800, 3):
+            day = date(2023, 11, 1) + timedelta(days=offset)
+            self.assertEqual(
+                working_days_calendar.is_working_day(day),
+                calendar.is_working_day(day),
+            )
+            for delta in (1, 5, 300, -1, -5, -300):
+                self.assertEqual(
+                    working_days_calendar.add_working_days(day, delta),
+                    calendar.add_working_days(day, delta),
+                )
+
+    def test_working_days_calendar_keep_datetime(self):
+        """Adding working days to a datetime should keep its time."""
+        working_days_calendar = WorkingDaysCalendar(France())
+
+        # The 1st of January is a holiday in France
+        self.assertEqual(
+            working_days_calendar.add_working_days(datetime(2025, 12, 31, 15, 30), 1),
+            datetime(2026, 1, 2, 15, 30),
+        )
+
+    def test_working_days_calendar_tables_computed_once_per_year(self):
+        """The calendar should only be asked once for each day of a year."""
+        calendar = France()
+        working_days_calendar = WorkingDaysCalendar(calendar)
+
+        with mock.patch.object(
+            calendar, "is_working_day", wraps=calendar.is_working_day
+        ) as mock_is_working_day:
+            for day in [date(2024, 1, 1), date(2024, 5, 1), date(2024, 12, 25)]:
+                working_days_calendar.is_working_day(day)
+            for day in [date(2024, 7, 14), date(2024, 8, 15)]:
+                working_days_calendar.add_working_days(day, 14)
+
+        # 2024 is a leap year
+        self.assertEqual(mock_is_working_day.call_count, 366)
+
+    @override_settings(JOANIE_CALENDAR="workalendar.europe.France")
+    def test_get_working_days_calendar(self):
+        """
+        The working days calendar service should be shared by the whole process
+        and use the country calendar.
+        """
+        working_days_calendar = get_working_days_calendar()
+
+        self.assertIsInstance(working_days_calendar, WorkingDaysCalendar)
+        self.assertIs(working_days_calendar.calendar, get_country_calendar())
+        self.assertIs(get_working_days_calendar(), working_days_calendar)
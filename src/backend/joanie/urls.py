@@ -30,6 +30,7 @@ from drf_spectacular.views import (
 from joanie import admin_urls, client_urls, remote_endpoints_urls
 from joanie.core.views import (
     BackOfficeRedirectView,
+    CertificateVerificationDocumentView,
     CertificateVerificationView,
 )
 from joanie.debug import urls as debug_urls
@@ -62,6 +63,11 @@ urlpatterns += i18n_patterns(
         CertificateVerificationView.as_view(),
         name="certificate-verification",
     ),
+    path(
+        "certificates/<uuid:certificate_id>/document",
+        CertificateVerificationDocumentView.as_view(),
+        name="certificate-verification-document",
+    ),
 )
 
 if settings.DEBUG:
@@ -5,3 +5,7 @@ output "objectstorage_bucket_name" {
 output "contracts_objectstorage_bucket_name" {
   value = openstack_objectstorage_container_v1.joanie_contracts_storage.name
 }
+
+output "invoices_objectstorage_bucket_name" {
+  value = openstack_objectstorage_container_v1.joanie_invoices_storage.name
+}